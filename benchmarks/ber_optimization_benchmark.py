@@ -27,7 +27,7 @@ from teleparser.decoders.ericsson import ericsson_voz_decoder, ericsson_voz_deco
 
 # Import our new two-phase decoder
 try:
-    from teleparser.decoders.ericsson.ber_two_phase import ericsson_voz_decoder_two_phase
+    from teleparser.decoders.ericsson import ericsson_voz_decoder_two_phase
     HAS_TWO_PHASE = True
 except ImportError as e:
     print(f"Warning: Two-phase decoder not available: {e}")
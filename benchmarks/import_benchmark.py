@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""Import time benchmark of the teleparser modules.
+
+Every worker process imports the decoders, so their import cost adds up to the
+startup latency of the pool. Each module is imported in fresh interpreters with
+`python -X importtime` and the median self and cumulative times are reported.
+With `--max-ms` the script exits with an error when a module takes longer, to
+catch regressions such as a large literal table being imported eagerly again.
+"""
+
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+from statistics import median
+from typing import Dict, List, Tuple
+
+SRC = Path(__file__).parent.parent / "src"
+
+MODULES = [
+    "teleparser.prestadoras",
+    "teleparser.decoders.sbc",
+    "teleparser.decoders.ericsson.modules",
+    "teleparser.decoders.ericsson",
+    "teleparser.main",
+]
+
+IMPORTTIME = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|\s+(\S+)")
+
+
+def import_times(module: str) -> Dict[str, Tuple[int, int]]:
+    """(self, cumulative) import time in µs of every module loaded by one import"""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": str(SRC)},
+    )
+    times = {}
+    for self_us, cumulative_us, name in IMPORTTIME.findall(completed.stderr):
+        # A submodule shows up again, with ~0 µs, when its parent package was
+        # imported first; the first line is the real import
+        times.setdefault(name, (int(self_us), int(cumulative_us)))
+    return times
+
+
+def benchmark(modules: List[str], runs: int) -> Dict[str, Tuple[float, float]]:
+    """Median (self, cumulative) import time in ms of each module"""
+    results = {}
+    for module in modules:
+        times = [import_times(module)[module] for _ in range(runs)]
+        results[module] = (
+            median(t[0] for t in times) / 1000,
+            median(t[1] for t in times) / 1000,
+        )
+    return results
+
+
+def main():
+    """Main benchmark execution."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark teleparser import times")
+    parser.add_argument("modules", nargs="*", default=MODULES, help="Modules to import")
+    parser.add_argument("--runs", type=int, default=5, help="Number of benchmark runs")
+    parser.add_argument(
+        "--max-ms",
+        type=float,
+        help="Fail if the self import time of a module exceeds this limit",
+    )
+
+    args = parser.parse_args()
+
+    # Warm the bytecode cache so the runs measure imports, not compilation
+    import_times(", ".join(args.modules))
+
+    print("Import Time Benchmark")
+    print("=" * 50)
+    print(f"Test runs: {args.runs}")
+    print(f"{'module':<40} {'self ms':>8} {'total ms':>9}")
+
+    results = benchmark(args.modules, args.runs)
+    slow = []
+    for module, (self_ms, cumulative_ms) in results.items():
+        print(f"{module:<40} {self_ms:>8.2f} {cumulative_ms:>9.2f}")
+        if args.max_ms is not None and self_ms > args.max_ms:
+            slow.append(module)
+
+    if slow:
+        print(f"Modules over {args.max_ms} ms: {', '.join(slow)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -70,6 +70,14 @@ except ImportError as e:
     print(f"Warning: Final optimized decoder not available: {e}")
     HAS_FINAL = False
 
+try:
+    from teleparser.decoders.ericsson.volte_engine import VolteEngine
+
+    HAS_ENGINE = True
+except ImportError as e:
+    print(f"Warning: VoLTE engine not available: {e}")
+    HAS_ENGINE = False
+
 
 @dataclass
 class BenchmarkResult:
@@ -466,6 +474,29 @@ def main():
             ("Final Optimized", lambda buffer: EricssonVolteFinal(buffer))
         )
 
+    if HAS_ENGINE:
+        decoder_configs.extend(
+            [
+                (
+                    "Engine (serial)",
+                    lambda buffer: VolteEngine(buffer, execution="serial"),
+                ),
+                (
+                    "Engine (threaded, 2 workers)",
+                    lambda buffer: VolteEngine(
+                        buffer, execution="threaded", n_workers=2
+                    ),
+                ),
+                (
+                    "Engine (processes, 2 workers)",
+                    lambda buffer: VolteEngine(
+                        buffer, execution="processes", n_workers=2
+                    ),
+                ),
+                ("Engine (auto)", lambda buffer: VolteEngine(buffer)),
+            ]
+        )
+
     # Run benchmarks
     results = runner.run_comprehensive_benchmark(
         decoder_configs=decoder_configs,
@@ -3,14 +3,11 @@
 Example: Using teleparser with DuckDB without pandas dependency
 
 This example demonstrates how to process CDR files and query them
-directly with DuckDB using Python dictionaries, without needing
-pandas as a dependency.
+directly with DuckDB using Arrow tables, without needing pandas as
+a dependency.
 """
 
 from pathlib import Path
-from teleparser.main import CDRFileManager
-from teleparser.decoders.ericsson import ericsson_voz_decoder
-
 try:
     import duckdb
 except ImportError:
@@ -21,33 +18,63 @@ except ImportError:
 
 def process_cdr_to_memory(file_path: Path):
     """
-    Process a single CDR file and return the blocks (list of dictionaries).
-    
+    Process a single CDR file and return its records as an Arrow table.
+
+    A single file is decoded in the current process, with the same result
+    shape ("table") as the parallel processing of a folder.
+
     Args:
         file_path: Path to the CDR .gz file
-        
+
     Returns:
-        list: List of dictionaries containing CDR records
+        pyarrow.Table: The CDR records
     """
-    result = CDRFileManager.decode_file(
-        file_path=file_path,
-        decoder=ericsson_voz_decoder,
+    from teleparser.main import main
+
+    results = main(
+        input_path=file_path,
         output_path=None,  # Don't save to disk
-        show_progress=True,
+        cdr_type="ericsson_voz_optimized",
+        workers=1,
     )
-    
-    if result["status"] == "failed":
-        raise RuntimeError(f"Failed to process file: {result.get('error')}")
-    
-    return result["blocks"]
+    if failed := [r for r in results if r["status"] == "failed"]:
+        raise RuntimeError(f"Failed to process file: {failed[0].get('error')}")
+
+    return results[0]["table"]
+
+
+def process_cdr_folder_to_arrow(folder: Path, workers: int = 4):
+    """
+    Process a folder of CDR files in parallel and return a single Arrow table.
+
+    Each worker process hands its records over as a memory-mapped Arrow IPC
+    file, so nothing is pickled back and the tables are attached zero-copy.
+
+    Args:
+        folder: Folder with the CDR .gz files
+        workers: Number of worker processes
+
+    Returns:
+        pyarrow.Table: All the CDR records
+    """
+    import pyarrow as pa
+    from teleparser.main import main
+
+    results = main(
+        input_path=folder,
+        output_path=None,  # Don't save to disk
+        cdr_type="ericsson_voz_optimized",
+        workers=workers,
+    )
+    return pa.concat_tables(r["table"] for r in results if "table" in r)
 
 
-def query_cdr_with_duckdb(blocks: list):
+def query_cdr_with_duckdb(table):
     """
-    Query the blocks using DuckDB without loading into pandas.
+    Query the records using DuckDB without loading into pandas.
     
     Args:
-        blocks: List of dictionaries containing CDR records
+        table: Arrow table containing CDR records
         
     Returns:
         DuckDB result set
@@ -55,14 +82,14 @@ def query_cdr_with_duckdb(blocks: list):
     # Create an in-memory DuckDB connection
     conn = duckdb.connect(":memory:")
     
-    # DuckDB can directly query Python lists of dictionaries
+    # DuckDB scans Arrow tables directly, without converting them
     result = conn.execute(
         """
         SELECT 
             CallModule,
             COUNT(*) as call_count,
             COUNT(DISTINCT "callingSubscriberIMSI.msin") as unique_callers
-        FROM blocks
+        FROM "table"
         WHERE CallModule IS NOT NULL
         GROUP BY CallModule
         ORDER BY call_count DESC
@@ -88,13 +115,13 @@ def example_basic_query():
         return
     
     print(f"Processing: {cdr_file.name}")
-    blocks = process_cdr_to_memory(cdr_file)
+    table = process_cdr_to_memory(cdr_file)
     
-    print(f"Records loaded: {len(blocks):,}\n")
+    print(f"Records loaded: {table.num_rows:,}\n")
     
     # Query the data
     print("Querying call statistics by module...\n")
-    results = query_cdr_with_duckdb(blocks)
+    results = query_cdr_with_duckdb(table)
     
     print("Call Module | Count | Unique Callers")
     print("-" * 50)
@@ -115,13 +142,13 @@ def example_advanced_query():
         return
     
     print(f"Processing: {cdr_file.name}")
-    blocks = process_cdr_to_memory(cdr_file)
+    table = process_cdr_to_memory(cdr_file)
     
     # Create DuckDB connection
     conn = duckdb.connect(":memory:")
     
     # More complex query with multiple aggregations
-    # DuckDB can directly query the blocks variable
+    # DuckDB can directly query the table variable
     query = """
     SELECT 
         "callingSubscriberIMSI.pais" as country,
@@ -130,7 +157,7 @@ def example_advanced_query():
         AVG(CAST(chargeableDuration AS INTEGER)) as avg_duration_seconds,
         SUM(CASE WHEN disconnectingParty = 'callingPartyRelease' THEN 1 ELSE 0 END) as caller_initiated,
         SUM(CASE WHEN disconnectingParty = 'networkRelease' THEN 1 ELSE 0 END) as network_released
-    FROM blocks
+    FROM "table"
     WHERE "callingSubscriberIMSI.pais" IS NOT NULL
     GROUP BY "callingSubscriberIMSI.pais"
     ORDER BY total_calls DESC
@@ -149,9 +176,39 @@ def example_advanced_query():
         )
 
 
+def example_parallel_arrow():
+    """Example 3: Parallel processing handing Arrow tables to DuckDB"""
+    print("\n=== Example 3: Parallel Processing with Arrow ===\n")
+
+    cdr_folder = Path("data/input/ericsson_voz")
+
+    if not cdr_folder.exists():
+        print(f"Folder not found: {cdr_folder}")
+        return
+
+    print(f"Processing: {cdr_folder}")
+    table = process_cdr_folder_to_arrow(cdr_folder)
+    print(f"Records loaded: {table.num_rows:,}\n")
+
+    # DuckDB scans Arrow tables directly, without converting them
+    conn = duckdb.connect(":memory:")
+    results = conn.execute(
+        """
+        SELECT CallModule, COUNT(*) as call_count
+        FROM "table"
+        GROUP BY CallModule
+        ORDER BY call_count DESC
+    """
+    ).fetchall()
+    conn.close()
+
+    for row in results:
+        print(f"{row[0]:<12} | {row[1]:>8}")
+
+
 def example_query_sample_data():
-    """Example 3: Querying sample data directly"""
-    print("\n=== Example 3: Query Sample Data ===\n")
+    """Example 4: Querying sample data directly"""
+    print("\n=== Example 4: Query Sample Data ===\n")
     
     # Simulate processing blocks
     sample_blocks = [
@@ -181,8 +238,8 @@ def example_query_sample_data():
 
 
 def example_export_to_parquet():
-    """Example 4: Export query results to Parquet"""
-    print("\n=== Example 4: Export to Parquet ===\n")
+    """Example 5: Export query results to Parquet"""
+    print("\n=== Example 5: Export to Parquet ===\n")
     
     sample_blocks = [
         {"id": 1, "value": "test1", "score": 100},
@@ -238,6 +295,11 @@ if __name__ == "__main__":
     except Exception as e:
         print(f"Example 2 error: {e}")
 
+    try:
+        example_parallel_arrow()
+    except Exception as e:
+        print(f"Example 3 error: {e}")
+
     example_query_sample_data()
     example_export_to_parquet()
 
@@ -246,7 +308,7 @@ if __name__ == "__main__":
     print("\nKey Benefits:")
     print("  ✓ No pandas dependency required")
     print("  ✓ Process CDR files entirely in memory")
-    print("  ✓ Query Python dictionaries directly with SQL using DuckDB")
+    print("  ✓ Query Arrow tables directly with SQL using DuckDB")
     print("  ✓ Save to disk only when needed")
     print("  ✓ Export to Parquet, CSV, or other formats")
     print("  ✓ Efficient for streaming/pipeline architectures")
@@ -1 +1 @@
-uv run python -m nuitka --onefile --output-dir=build --output-filename=teleparser --lto=yes --jobs=8 ./src/teleparser/main.py
\ No newline at end of file
+uv run python -m nuitka --onefile --output-dir=build --output-filename=teleparser --lto=yes --jobs=8 --include-package-data=teleparser ./src/teleparser/main.py
\ No newline at end of file
@@ -21,6 +21,7 @@ podman run --rm -it \
       --lto=yes \
       --jobs=8 \
       --assume-yes-for-downloads \
+      --include-package-data=teleparser \
       ./src/teleparser/main.py
 
     # Fix permissions
@@ -41,6 +41,7 @@ docker run --rm \
       --lto=yes \
       --jobs=8 \
       --assume-yes-for-downloads \
+      --include-package-data=teleparser \
       /app/src/teleparser/main.py
     
     echo "Compilation complete!"
@@ -1,24 +1,157 @@
 import gzip
+import hashlib
+import io
+import logging
+import mmap
+import os
+import queue
+import shutil
+import threading
+import zlib
 from pathlib import Path
-from contextlib import contextmanager
+from contextlib import contextmanager, suppress
 from typing import Optional
 
+logger = logging.getLogger("teleparser")
+
+
+# Size of the compressed blocks read by the inflate thread
+INFLATE_BLOCK_SIZE = 1024 * 1024
+# Maximum number of decompressed chunks waiting to be consumed
+INFLATE_QUEUE_SIZE = 16
+
+
+class ThreadedGzipReader(io.RawIOBase):
+    """Raw reader of a gzip file inflated by a background thread.
+
+    The thread reads compressed blocks, inflates them with zlib (which releases the
+    GIL) and feeds a bounded queue, so decompression overlaps with the decoding done
+    by the consumer. Multi-member files are inflated member after member. Wrap it in
+    io.BufferedReader (see `open_gzip`) for cheap small reads.
+    """
+
+    _END = object()
+
+    def __init__(
+        self,
+        file_path: Path,
+        block_size: int = INFLATE_BLOCK_SIZE,
+        queue_size: int = INFLATE_QUEUE_SIZE,
+    ):
+        super().__init__()
+        self.file_path = file_path
+        self.block_size = block_size
+        self._queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self._stop = threading.Event()
+        self._chunk = memoryview(b"")
+        self._done = False
+        self._thread = threading.Thread(
+            target=self._inflate, name=f"inflate-{Path(file_path).name}", daemon=True
+        )
+        self._thread.start()
+
+    def _put(self, item) -> bool:
+        """Put an item in the queue unless the reader was closed"""
+        while not self._stop.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _inflate(self):
+        try:
+            with open(self.file_path, "rb") as f:
+                inflater = None
+                while block := f.read(self.block_size):
+                    while block:
+                        if inflater is None:
+                            # Members can be padded with zeros, like gzip accepts
+                            if not (block := block.lstrip(b"\x00")):
+                                break
+                            inflater = zlib.decompressobj(wbits=31)
+                        if (data := inflater.decompress(block)) and not self._put(data):
+                            return
+                        if not inflater.eof:
+                            break
+                        # Next gzip member, if any
+                        block = inflater.unused_data
+                        inflater = None
+                if inflater is not None:
+                    raise EOFError(
+                        "Compressed file ended before the end-of-stream marker was reached"
+                    )
+            self._put(self._END)
+        except BaseException as e:
+            self._put(e)
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        while not self._chunk:
+            if self._done:
+                return 0
+            item = self._queue.get()
+            if item is self._END:
+                self._done = True
+                return 0
+            if isinstance(item, BaseException):
+                self._done = True
+                raise item
+            self._chunk = memoryview(item)
+        size = min(len(buffer), len(self._chunk))
+        buffer[:size] = self._chunk[:size]
+        self._chunk = self._chunk[size:]
+        return size
+
+    def close(self):
+        if not self.closed:
+            self._stop.set()
+            # Unblock the thread if it is waiting for room in the queue
+            with suppress(queue.Empty):
+                while True:
+                    self._queue.get_nowait()
+            self._thread.join()
+        super().close()
+
+
+def open_gzip(file_path: Path, threaded: bool = False):
+    """Open a gzip file for reading, inflating it in a background thread if threaded"""
+    if threaded:
+        return io.BufferedReader(ThreadedGzipReader(file_path), INFLATE_BLOCK_SIZE)
+    return gzip.open(file_path, "rb")
+
 
 class BufferManager:
     """Manages CDR file buffer reading and file conversion"""
 
-    def __init__(self, file_path: Path):
+    def __init__(
+        self,
+        file_path: Path,
+        cache: "DecompressedCache | None" = None,
+        threaded: bool = False,
+    ):
         self.file_path = file_path
+        self.cache = cache
+        self.threaded = threaded
         self.file_handle: Optional[gzip.GzipFile] = None
 
+    def _open(self):
+        if self.cache is not None:
+            # Read the cached decompressed copy, skipping the decompression
+            return open(self.cache.get(self.file_path), "rb")
+        return open_gzip(self.file_path, self.threaded)
+
     @contextmanager
     def open(self):
-        with gzip.open(self.file_path, "rb") as self.file_handle:
+        with self._open() as self.file_handle:
             yield self
 
     def open_file(self):
         """Opens the gzip file directly"""
-        self.file_handle = gzip.open(self.file_path, "rb")
+        self.file_handle = self._open()
         return self
 
     def close(self):
@@ -40,8 +173,9 @@ class MemoryBufferManager:
     efficient access through memoryview objects, eliminating repetitive disk I/O.
     """
 
-    def __init__(self, file_path: Path):
+    def __init__(self, file_path: Path, threaded: bool = False):
         self.file_path = file_path
+        self.threaded = threaded
         self._data: Optional[bytes] = None
         self._memoryview: Optional[memoryview] = None
         self._position: int = 0
@@ -49,7 +183,7 @@ class MemoryBufferManager:
     def load(self) -> memoryview:
         """Load the entire file into memory and return a memoryview."""
         if self._data is None:
-            with gzip.open(self.file_path, "rb") as f:
+            with open_gzip(self.file_path, self.threaded) as f:
                 self._data = f.read()
             self._memoryview = memoryview(self._data)
             self._position = 0
@@ -107,3 +241,164 @@ class MemoryBufferManager:
         result = self._data[self._position : self._position + size]
         self._position += len(result)
         return result
+
+
+def decompress_to(file_path: Path, raw_file: Path, threaded: bool = False) -> int:
+    """Decompress a gzip file to disk, returning the decompressed size.
+
+    The data is written to a temporary name first, so a partially written file is
+    never mistaken for a complete one.
+    """
+    temp_file = raw_file.with_name(f".{raw_file.name}.{os.getpid()}.tmp")
+    try:
+        with open_gzip(file_path, threaded) as src, open(temp_file, "wb") as dst:
+            shutil.copyfileobj(src, dst, 1 << 20)
+        temp_file.replace(raw_file)
+    except BaseException:
+        temp_file.unlink(missing_ok=True)
+        raise
+    return raw_file.stat().st_size
+
+
+class MappedBufferManager:
+    """Memory-mapped access to a byte range of an already decompressed file.
+
+    Same interface as MemoryBufferManager, but the data is mapped read-only from
+    disk instead of being read into the process memory, so several processes can
+    decode different ranges of the same file sharing the OS page cache.
+    """
+
+    def __init__(self, file_path: Path, start: int = 0, stop: int | None = None):
+        self.file_path = file_path
+        self.start = start
+        self.stop = stop
+        self._mmap: Optional[mmap.mmap] = None
+        self._memoryview: Optional[memoryview] = None
+        self._position: int = 0
+
+    def load(self) -> memoryview:
+        """Map the file and return a memoryview of the byte range."""
+        if self._memoryview is None:
+            with open(self.file_path, "rb") as f:
+                if f.seek(0, 2) == 0:
+                    # Empty files can't be mapped
+                    self._memoryview = memoryview(b"")
+                    return self._memoryview
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            self._memoryview = memoryview(self._mmap)[self.start : self.stop]
+            self._position = 0
+        return self._memoryview
+
+    def get_memoryview(self) -> memoryview:
+        """Get the memoryview of the mapped range."""
+        if self._memoryview is None:
+            return self.load()
+        return self._memoryview
+
+    def get_size(self) -> int:
+        """Get the size of the mapped range."""
+        return len(self.get_memoryview())
+
+    @contextmanager
+    def open(self):
+        """Context manager that maps the data and yields self."""
+        self.load()
+        yield self
+
+    def close(self):
+        """Release the memoryview and unmap the file."""
+        if self._memoryview is not None:
+            self._memoryview.release()
+            self._memoryview = None
+        if self._mmap is not None:
+            try:
+                self._mmap.close()
+            except BufferError:
+                # A slice of the data is still referenced, unmapped when collected
+                pass
+            self._mmap = None
+        self._position = 0
+
+    def has_data(self) -> bool:
+        """Check if the data is mapped."""
+        return self._memoryview is not None
+
+    def read(self, size: int | None = -1):
+        """Read from the mapped range, without copying the data.
+
+        Args:
+            size: Number of bytes to read, or -1 to read all data
+
+        Returns:
+            A memoryview of the range from the current position
+        """
+        data = self.get_memoryview()
+
+        if size == -1 or size is None:
+            return data
+
+        result = data[self._position : self._position + size]
+        self._position += len(result)
+        return result
+
+
+class DecompressedCache:
+    """Opt-in directory of decompressed copies of the gzip inputs.
+
+    Inputs that are processed many times are decompressed only once. The entries
+    are keyed by the resolved path, size and modification time of the gzip file
+    and by its trailer (CRC32 and size of the uncompressed data), so a changed
+    input never reuses a stale copy. Entries are written atomically and can be
+    memory mapped read-only by any number of processes.
+    """
+
+    def __init__(self, cache_dir: Path, threaded: bool = False):
+        self.cache_dir = Path(cache_dir)
+        self.threaded = threaded
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def _digest(text: str, size: int) -> str:
+        return hashlib.sha256(text.encode()).hexdigest()[:size]
+
+    def path(self, file_path: Path) -> Path:
+        """Location of the decompressed copy of the current version of file_path"""
+        file_path = Path(file_path).resolve()
+        stat = file_path.stat()
+        with open(file_path, "rb") as f:
+            f.seek(max(stat.st_size - 8, 0))
+            trailer = f.read(8).hex()
+        source = self._digest(str(file_path), 8)
+        version = self._digest(f"{stat.st_size}:{stat.st_mtime_ns}:{trailer}", 16)
+        return self.cache_dir / f"{file_path.stem}-{source}-{version}.raw"
+
+    def get(self, file_path: Path) -> Path:
+        """Decompressed copy of file_path, created on the first access"""
+        raw_file = self.path(file_path)
+        if raw_file.exists():
+            logger.debug(f"Using cached decompressed file {raw_file}")
+            return raw_file
+
+        # Drop the copies of previous versions of the same input
+        prefix = raw_file.name.rsplit("-", 1)[0]
+        for stale in self.cache_dir.glob(f"{prefix}-*.raw"):
+            stale.unlink(missing_ok=True)
+
+        decompress_to(file_path, raw_file, self.threaded)
+        logger.debug(f"Cached decompressed {file_path} at {raw_file}")
+        return raw_file
+
+
+def memory_buffer(buffer_manager):
+    """Convert a BufferManager to a buffer manager giving a memoryview of the data.
+
+    With a cache, the decompressed copy is memory mapped read-only, otherwise the
+    file is decompressed into memory. Other buffer managers are returned as is.
+    """
+    if isinstance(buffer_manager, BufferManager):
+        if buffer_manager.cache is not None:
+            return MappedBufferManager(
+                buffer_manager.cache.get(buffer_manager.file_path)
+            )
+        return MemoryBufferManager(buffer_manager.file_path, buffer_manager.threaded)
+    return buffer_manager
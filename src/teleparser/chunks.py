@@ -0,0 +1,81 @@
+"""Split a single large CDR file into chunks decoded in parallel.
+
+The file is decompressed once to disk and indexed by a cheap first pass over the
+record headers (`record_boundaries` of the decoder). The record offsets are then
+grouped into byte ranges of roughly `chunk_size` bytes, each decoded by a worker
+over a memory map of the decompressed file (see `MappedBufferManager`) and saved
+as an ordered part file. The parts of a file are only moved to the final output
+directory when all of them succeed.
+"""
+
+import multiprocessing
+import os
+import shutil
+from bisect import bisect_left
+from pathlib import Path
+from typing import List, NamedTuple, Sequence, Tuple
+
+# Default size in bytes of the decompressed data decoded by each worker
+CHUNK_SIZE = 64 * 1024 * 1024
+
+# Files whose compressed size is smaller than chunk_size // MIN_COMPRESSION_RATIO
+# rarely span more than one chunk and are decoded as a whole
+MIN_COMPRESSION_RATIO = 4
+
+
+class Chunk(NamedTuple):
+    """A byte range of a decompressed file and the part file it is saved to"""
+
+    file: Path
+    raw_file: Path
+    index: int
+    start: int
+    stop: int
+    output_file: Path
+
+
+def split_ranges(offsets: Sequence[int], chunk_size: int) -> List[Tuple[int, int]]:
+    """Group record offsets into contiguous ranges of at least `chunk_size` bytes.
+
+    Args:
+        offsets: Sorted record start offsets, the last one being the end of the data
+        chunk_size: Target size of each range, the last range may be smaller
+
+    Returns:
+        List of (start, stop) ranges cut at record boundaries
+    """
+    ranges = []
+    if len(offsets) < 2:
+        return ranges
+    start, end = offsets[0], offsets[-1]
+    while start < end:
+        i = bisect_left(offsets, start + chunk_size)
+        stop = offsets[min(i, len(offsets) - 1)]
+        ranges.append((start, stop))
+        start = stop
+    return ranges
+
+
+def pool_workers(limit: int | None = None) -> int:
+    """Number of workers for the own process pool of a decoder.
+
+    The worker processes of the file manager already keep the cores busy with the
+    files and chunks, a decoder running in one of them gets a single worker rather
+    than a nested pool per file. Otherwise it gets the cores, at most `limit`, the
+    number of workers asked for on the command line.
+    """
+    if multiprocessing.parent_process() is not None:
+        return 1
+    cores = os.cpu_count() or 1
+    return max(1, min(cores, limit)) if limit else cores
+
+
+def part_name(index: int, suffix: str) -> str:
+    return f"part-{index:05d}{suffix}"
+
+
+def finalize_parts(temp_dir: Path, output_dir: Path):
+    """Move the complete set of part files to their final directory"""
+    if output_dir.exists():
+        shutil.rmtree(output_dir)
+    temp_dir.replace(output_dir)
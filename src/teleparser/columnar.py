@@ -0,0 +1,189 @@
+"""Columnar sink for decoded CDR values.
+
+Instead of building one dictionary per TLV/AVP and merging them into one
+dictionary per record, the decoders append each decoded value straight into a
+per-column buffer. Columns are indexed by their position in the output schema
+(the sorted decoder FIELDNAMES), are only allocated when a field is first seen
+and are padded with nulls lazily, so finishing a row is a single counter
+increment. The buffers are converted to Arrow arrays without further copies
+of the records.
+
+A decoder may also post-process whole columns before they are written, with
+`get_column` and `set_column`, reading extra columns which are buffered for it
+but not part of the output.
+
+The columns are dictionary encoded strings, except the `integer_fields` of the
+schema, given by the decoders whose values are integers to be kept as such.
+"""
+
+import logging
+from itertools import repeat
+from typing import Any, Dict, Iterable, Iterator, List, Set
+
+logger = logging.getLogger("teleparser")
+
+
+def arrow_type():
+    """Arrow type of the output columns: a dictionary encoded string"""
+    import pyarrow as pa
+
+    return pa.dictionary(pa.int32(), pa.string())
+
+
+def arrow_schema(fieldnames: List[str], integer_fields: Iterable[str] = ()):
+    """Arrow schema of the output files for the given column order.
+
+    The integer_fields are int64 columns, the others dictionary encoded strings.
+    """
+    import pyarrow as pa
+
+    value_type = arrow_type()
+    integer_fields = set(integer_fields)
+    return pa.schema(
+        [
+            pa.field(name, pa.int64() if name in integer_fields else value_type)
+            for name in fieldnames
+        ]
+    )
+
+
+class ColumnarBuilder:
+    """Accumulate decoded values in per-column lists.
+
+    Decoders call `add(name, value)` for each decoded field and `end_row()` when
+    a record is complete. A field set twice in the same row keeps the last value,
+    the same semantics of merging dictionaries with `update`. The `extra` fields
+    are buffered after the schema columns without being output. Any other field
+    outside of the schema is dropped and collected in `unknown`, for the writer
+    to log, so an unexpected tag doesn't fail the whole file.
+    """
+
+    def __init__(self, fieldnames: List[str], extra: Iterable[str] = ()):
+        self.fieldnames = fieldnames
+        self.index: Dict[str, int] = {name: i for i, name in enumerate(fieldnames)}
+        for name in extra:
+            self.index.setdefault(name, len(self.index))
+        self.unknown: Set[str] = set()
+        self.clear()
+
+    def clear(self):
+        """Discard the buffered rows, keeping the schema"""
+        self.columns: List[list | None] = [None] * len(self.index)
+        self.n_rows = 0
+
+    def __len__(self) -> int:
+        return self.n_rows
+
+    def add(self, name: str, value: Any):
+        """Set the value of a field in the current row"""
+        if value is None:
+            return
+        if (i := self.index.get(name)) is None:
+            self.unknown.add(name)
+            return
+        if (column := self.columns[i]) is None:
+            column = self.columns[i] = []
+        if (missing := self.n_rows - len(column)) > 0:
+            column.extend(repeat(None, missing))
+        elif missing < 0:
+            # Field repeated in the same row, the last value wins
+            column[-1] = value
+            return
+        column.append(value)
+
+    def add_record(self, record: Dict[str, Any]):
+        """Append a whole record given as a dictionary"""
+        add = self.add
+        for name, value in record.items():
+            add(name, value)
+        self.n_rows += 1
+
+    def extend(self, records: Iterable[Dict[str, Any]]):
+        for record in records:
+            self.add_record(record)
+
+    def end_row(self):
+        """Finish the current row, missing fields are filled with nulls lazily"""
+        self.n_rows += 1
+
+    def discard_row(self):
+        """Drop the values set in the current, unfinished row"""
+        row = self.n_rows
+        for column in self.columns:
+            if column is not None and len(column) > row:
+                del column[row:]
+
+    def column(self, i: int) -> list | None:
+        """Column values padded to the number of rows, or None if never set"""
+        if (column := self.columns[i]) is None:
+            return None
+        if (missing := self.n_rows - len(column)) > 0:
+            column.extend(repeat(None, missing))
+        return column
+
+    def get_column(self, name: str) -> list | None:
+        """Values of a field, schema or extra, padded to the number of rows"""
+        return self.column(self.index[name])
+
+    def set_column(self, name: str, values: list | None):
+        """Replace all the values of a field, None for a column of nulls"""
+        if values is not None and len(values) != self.n_rows:
+            raise ValueError(
+                f"Column {name} has {len(values)} values for {self.n_rows} rows"
+            )
+        self.columns[self.index[name]] = values
+
+    def rows(self) -> Iterator[Dict[str, Any]]:
+        """Yield the buffered rows as dictionaries, without the null fields"""
+        present = [
+            (name, column)
+            for i, name in enumerate(self.fieldnames)
+            if (column := self.column(i)) is not None
+        ]
+        for row in range(self.n_rows):
+            yield {
+                name: value
+                for name, column in present
+                if (value := column[row]) is not None
+            }
+
+    def to_arrays(self, schema=None) -> list:
+        """Convert the buffered columns to Arrow arrays of the schema types.
+
+        Columns are dictionary encoded strings by default. In the int64 columns of
+        the schema, the values which aren't integers (such as the hex fallback of
+        a value of unexpected size) are nulls, counted and logged per column.
+        """
+        import pyarrow as pa
+
+        if schema is None:
+            schema = arrow_schema(self.fieldnames)
+        arrays = []
+        for i, field in enumerate(schema):
+            if (column := self.column(i)) is None:
+                arrays.append(pa.nulls(self.n_rows, type=field.type))
+            elif pa.types.is_integer(field.type):
+                values = [value if type(value) is int else None for value in column]
+                if invalid := [
+                    v for v in column if v is not None and type(v) is not int
+                ]:
+                    logger.warning(
+                        f"{len(invalid)} values of the integer column {field.name} "
+                        f"written as nulls, such as {invalid[0]!r}"
+                    )
+                arrays.append(pa.array(values, type=field.type))
+            else:
+                values = [
+                    value if value is None or isinstance(value, str) else str(value)
+                    for value in column
+                ]
+                arrays.append(pa.array(values, type=pa.string()).dictionary_encode())
+        return arrays
+
+    def to_table(self, schema=None):
+        """Convert the buffered columns to an Arrow table"""
+        import pyarrow as pa
+
+        if schema is None:
+            schema = arrow_schema(self.fieldnames)
+        return pa.Table.from_arrays(self.to_arrays(schema), schema=schema)
@@ -1,11 +1,13 @@
 from .voz import EricssonVoz
 from .ber import BerDecoder
 from .ber_optimized import BerDecoderOptimized
-
-# from .ber_two_phase import BerDecoderTwoPhase
+from .ber_windowed import BerDecoderWindowed
+from .ber_two_phase import BerDecoderTwoPhase
 from .volte import EricssonVolte
-from .volte_final import EricssonVolteFinal
-from teleparser.buffer import BufferManager, MemoryBufferManager
+from .volte_final import TIME_EPOCH
+from .volte_engine import AUTO, SERIAL, VolteEngine
+from teleparser.buffer import memory_buffer
+from teleparser.chunks import pool_workers
 
 
 def ericsson_voz_decoder(buffer_manager):
@@ -20,22 +22,30 @@ def ericsson_voz_decoder_optimized(buffer_manager):
     for efficient byte access, eliminating repetitive disk I/O operations.
     Significantly faster for files that fit in memory.
     """
-    # Convert BufferManager to MemoryBufferManager if needed
-    if isinstance(buffer_manager, BufferManager):
-        memory_buffer = MemoryBufferManager(buffer_manager.file_path)
-    else:
-        memory_buffer = buffer_manager
-    return BerDecoderOptimized(EricssonVoz, memory_buffer)
+    # Convert BufferManager to a memory (or cached memory-mapped) buffer if needed
+    return BerDecoderOptimized(EricssonVoz, memory_buffer(buffer_manager))
+
+
+def ericsson_voz_decoder_windowed(buffer_manager):
+    """Stream decoder over a bounded window of the decompressed data.
+
+    Decodes the records with memoryview slicing like the optimized decoder, but
+    keeps only a few megabytes of the file in memory at a time.
+    """
+    return BerDecoderWindowed(EricssonVoz, buffer_manager)
+
 
+def ericsson_voz_decoder_two_phase(buffer_manager, n_workers: int | None = None):
+    """Two-phase decoder for Ericsson VOZ.
 
-# def ericsson_voz_decoder_two_phase(buffer_manager):
-#     """Two-phase decoder for Ericsson VOZ."""
-#     # Convert BufferManager to MemoryBufferManager if needed
-#     if isinstance(buffer_manager, BufferManager):
-#         memory_buffer = MemoryBufferManager(buffer_manager.file_path)
-#     else:
-#         memory_buffer = buffer_manager
-#     return BerDecoderTwoPhase(EricssonVoz, memory_buffer)
+    Lists the TLVs of the whole file in memory first, then interprets the records
+    in a process pool over ranges of records, with the same output as the
+    optimized decoder. The pool has at most `n_workers` processes, and in a worker
+    of the file manager it runs in process.
+    """
+    return BerDecoderTwoPhase(
+        EricssonVoz, memory_buffer(buffer_manager), n_workers=pool_workers(n_workers)
+    )
 
 
 def ericsson_volte_decoder(buffer_manager):
@@ -43,4 +53,31 @@ def ericsson_volte_decoder(buffer_manager):
 
 
 def ericsson_volte_decoder_optimized(buffer_manager):
-    return EricssonVolteFinal(buffer_manager)
+    """VoLTE engine with the strict AVP walk, in the current process.
+
+    The files (and chunks of large files) are already spread over the cores by
+    the file manager.
+    """
+    return VolteEngine(memory_buffer(buffer_manager), execution=SERIAL)
+
+
+def ericsson_volte_decoder_epoch(buffer_manager):
+    """VoLTE decoder giving the Time AVPs as Unix epoch seconds instead of text"""
+    return VolteEngine(
+        memory_buffer(buffer_manager), time_format=TIME_EPOCH, execution=SERIAL
+    )
+
+
+def ericsson_volte_decoder_auto(buffer_manager, n_workers: int | None = None):
+    """VoLTE engine choosing its execution from the file size and the cores.
+
+    Large files are decoded in a pool of at most `n_workers` processes over spans
+    of messages, with the same output as `ericsson_volte_decoder_optimized`.
+    Inside a worker of the file manager there is a single worker, so the file is
+    decoded serially.
+    """
+    return VolteEngine(
+        memory_buffer(buffer_manager),
+        execution=AUTO,
+        n_workers=pool_workers(n_workers),
+    )
@@ -4,7 +4,7 @@ from typing import Optional, Tuple, Callable
 from io import BufferedReader, BytesIO
 from tqdm.auto import tqdm  # Use standard tqdm for compatibility with nesting
 from teleparser.buffer import BufferManager
-from teleparser.decoders.ericsson.fieldnames import ERICSSON_VOZ_FIELDS
+from teleparser.decoders.ericsson.modules import CALL_DATA_RECORD_FIELDS
 
 # Basic ASN.1 Reference
 # https://luca.ntop.org/Teaching/Appunti/asn1.html
@@ -50,7 +50,7 @@ class BerDecoder:
         self._data: Optional[memoryview] = None
         self._size: int = 0
         if self.FIELDNAMES is None:
-            self.FIELDNAMES = ERICSSON_VOZ_FIELDS
+            self.FIELDNAMES = CALL_DATA_RECORD_FIELDS
 
     @staticmethod
     def read_tag(stream: BerStream) -> Optional[bytes]:
@@ -176,26 +176,32 @@ class BerDecoder:
                 record, _ = tlv
                 yield record
 
-    def process(self, pbar_position=None, show_progress=True):
-        """Process the BER data and return a list of parsed blocks.
+    def stream(self, pbar_position=None, show_progress=True):
+        """Lazily yield the parsed blocks of the BER data, one record at a time.
 
         Args:
             pbar_position: Position for nested progress bar (for hierarchical display)
             show_progress: Whether to show progress bar
         """
         if show_progress:
-            return list(
-                tqdm(
-                    self.parse_blocks(),
-                    desc="  ↳ Parsing TLVs",
-                    unit=" block",
-                    leave=False,
-                    position=pbar_position,
-                    colour="blue",
-                )
+            return tqdm(
+                self.parse_blocks(),
+                desc="  ↳ Parsing TLVs",
+                unit=" block",
+                leave=False,
+                position=pbar_position,
+                colour="blue",
             )
-        else:
-            return list(self.parse_blocks())
+        return self.parse_blocks()
+
+    def process(self, pbar_position=None, show_progress=True):
+        """Process the BER data and return a list of parsed blocks.
+
+        Args:
+            pbar_position: Position for nested progress bar (for hierarchical display)
+            show_progress: Whether to show progress bar
+        """
+        return list(self.stream(pbar_position, show_progress))
 
     @property
     def transform_func(self):  # Just a placeholder for compatibility
@@ -1,9 +1,10 @@
+from array import array
 from dataclasses import dataclass
 from collections import namedtuple
 from typing import Optional, Tuple, Callable
 from tqdm.auto import tqdm
 from teleparser.buffer import MemoryBufferManager
-from teleparser.decoders.ericsson.fieldnames import ERICSSON_VOZ_FIELDS
+from teleparser.decoders.ericsson.modules import CALL_DATA_RECORD_FIELDS
 
 # Basic ASN.1 Reference
 # https://luca.ntop.org/Teaching/Appunti/asn1.html
@@ -19,6 +20,7 @@ SHIFT_7 = 7
 HIGH_CLASS_NUM = 31
 MASK_BIT8 = 128
 SHIFT_8 = 8
+CONSTRUCTED_BIT = 32
 
 
 # BerClass
@@ -34,6 +36,10 @@ EOC = {(0, False, 0, 0), (2, True, 1, 0)}
 BerTag = namedtuple("BerTag", ["tag_class", "constructed", "number"])
 
 
+class TruncatedDataError(ValueError):
+    """The data ends inside a TLV, its tag, length or value"""
+
+
 @dataclass
 class BerDecoderOptimized:
     """Optimized Basic Encoding Rules decoder using memory-mapped data.
@@ -50,8 +56,11 @@ class BerDecoderOptimized:
         """Initialize the memory buffer after dataclass initialization."""
         self._data: Optional[memoryview] = None
         self._size: int = 0
+        # Offset of the first record that could not be decoded, where parsing
+        # stopped, None while the data is decoded to its end
+        self.stopped_at: Optional[int] = None
         if self.FIELDNAMES is None:
-            self.FIELDNAMES = ERICSSON_VOZ_FIELDS
+            self.FIELDNAMES = CALL_DATA_RECORD_FIELDS
 
     @staticmethod
     def read_tag(data: memoryview, position: int) -> Tuple[Optional[bytes], int]:
@@ -63,22 +72,34 @@ class BerDecoderOptimized:
         if position >= len(data):
             return None, 0
 
-        first_byte = data[position]
-        tag_bytes = bytes([first_byte])
-        bytes_read = 1
+        if data[position] & HIGH_CLASS_NUM != HIGH_CLASS_NUM:
+            return bytes(data[position : position + 1]), 1
 
-        if first_byte & HIGH_CLASS_NUM == HIGH_CLASS_NUM:
-            # Multi-byte tag
-            while position + bytes_read < len(data):
-                b = data[position + bytes_read]
-                tag_bytes += bytes([b])
-                bytes_read += 1
-                if b & MASK_BIT8 == 0:
-                    break
-            else:
-                raise ValueError("Unexpected end of tag")
+        _, bytes_read = BerDecoderOptimized.read_tag_number(data, position)
+        return bytes(data[position : position + bytes_read]), bytes_read
+
+    @staticmethod
+    def read_tag_number(data: memoryview, position: int) -> Tuple[int, int]:
+        """Read the number of the BER tag at position, without building its bytes.
+
+        Returns:
+            Tuple of (tag_number, bytes_read)
+        """
+        number = data[position] & CLASSNUM_MASK
+        if number != HIGH_CLASS_NUM:
+            return number, 1
 
-        return tag_bytes, bytes_read
+        # Multi-byte tag
+        number = 0
+        end = len(data)
+        bytes_read = 1
+        while position + bytes_read < end:
+            b = data[position + bytes_read]
+            number = (number << SHIFT_7) | (b & MASK_BIT7)
+            bytes_read += 1
+            if b & MASK_BIT8 == 0:
+                return number, bytes_read
+        raise TruncatedDataError("Unexpected end of tag")
 
     @staticmethod
     def decode_tag(tag_bytes: bytes) -> BerTag:
@@ -106,7 +127,7 @@ class BerDecoderOptimized:
             Tuple of (length_value, bytes_read)
         """
         if position >= len(data):
-            raise ValueError("Unexpected end of data while reading length")
+            raise TruncatedDataError("Unexpected end of data while reading length")
 
         first_byte = data[position]
 
@@ -123,7 +144,7 @@ class BerDecoderOptimized:
 
         # Check if we have enough data
         if position + 1 + length_size > len(data):
-            raise ValueError("Unexpected end of length")
+            raise TruncatedDataError("Unexpected end of length")
 
         # Definite long form
         for i in range(length_size):
@@ -143,67 +164,19 @@ class BerDecoderOptimized:
         depth: int = 0,
         schema: dict | None = None,
     ) -> Tuple[Optional[dict], int]:
-        """Decode BER data from memoryview starting at position.
+        """Decode BER data from memoryview starting at position into a flat dict.
+
+        The fields are collected by `decode_into`, the nesting depth is kept for
+        compatibility only.
 
         Returns:
             Tuple of (decoded_data, bytes_consumed) or (None, 0) if EOF
         """
-        # Read tag
-        tag_bytes, tag_bytes_read = BerDecoderOptimized.read_tag(data, position)
-        if tag_bytes is None:
-            return None, 0
-
-        position += tag_bytes_read
-        tag: BerTag = BerDecoderOptimized.decode_tag(tag_bytes)
-
-        # Read length
-        length, length_bytes_read = BerDecoderOptimized.read_length(data, position)
-        position += length_bytes_read
-
-        total_bytes_read = tag_bytes_read + length_bytes_read
-
-        # Handle EOC or zero-length
-        if BerDecoderOptimized.reached_eoc(tag, length) or length == 0:
-            result = self.decode(data, position, depth, schema)
-            if result[0] is not None:
-                return result[0], total_bytes_read + result[1]
-            return None, total_bytes_read
-
-        # Check if we have enough data for the value
-        if position + length > len(data):
-            raise ValueError(
-                f"Unexpected end of data: need {length} bytes at position {position}, but only {len(data) - position} available"
-            )
-
-        # Read value
-        value = bytes(data[position : position + length])
-        total_bytes_read += length
-
-        # Unravel the TLV
-        decoded_tlv = self.unravel_decoded_tlv(tag.number, value, schema)
-        if decoded_tlv is None:
-            return None, total_bytes_read
-
-        decoded_data, schema = decoded_tlv
-
-        # Parse constructed types recursively
-        if tag.constructed:
-            child_position = position
-            end_position = position + length
-
-            while child_position < end_position:
-                child_result = self.decode(data, child_position, depth + 1, schema)
-                child_data, child_bytes = child_result
-                
-                # Always advance position, even if decode returned None
-                # (e.g., unknown tags that were still valid TLV structures)
-                child_position += child_bytes
-                
-                # Only update decoded_data if we got actual data
-                if child_data is not None:
-                    decoded_data.update(child_data)
-
-        return decoded_data, total_bytes_read
+        record = {}
+        decoded, bytes_read = self.decode_into(
+            data, position, record.__setitem__, schema
+        )
+        return (record if decoded else None), bytes_read
 
     def unravel_decoded_tlv(
         self, tag_number: int, value: bytes, schema: dict | None
@@ -225,6 +198,178 @@ class BerDecoderOptimized:
 
         return output, tlv.schema
 
+    def decode_into(
+        self,
+        data: memoryview,
+        position: int,
+        add: Callable,
+        schema: dict | None = None,
+    ) -> Tuple[bool, int]:
+        """Decode the TLV at position, sending each field to `add(name, value)`.
+
+        The TLVs are walked in a single pass, without recursion: the constructed
+        TLVs whose children are being read are kept on a stack with their end and
+        the schema of their parent. The fields are handed to the sink in pre-order,
+        so later fields override earlier ones just like merging dictionaries with
+        `update`. A zero-length or End-of-Content header has no field, and before a
+        record it belongs to that record. An unknown tag, or a TLV without value, is
+        skipped with its children.
+
+        Returns:
+            Tuple of (decoded, bytes_consumed), decoded is False for EOF or an unknown
+            tag, bytes_consumed is 0 for EOF only
+        """
+        parser = self.parser
+        read_tag_number = BerDecoderOptimized.read_tag_number
+        read_length = BerDecoderOptimized.read_length
+        size = len(data)
+        start = position
+        # (end, parent schema) of the constructed TLVs being decoded
+        stack = []
+
+        while True:
+            if position < size:
+                first_byte = data[position]
+                if first_byte & HIGH_CLASS_NUM != HIGH_CLASS_NUM:
+                    tag_number = first_byte & CLASSNUM_MASK
+                    position += 1
+                else:
+                    tag_number, tag_bytes_read = read_tag_number(data, position)
+                    position += tag_bytes_read
+
+                if position < size and data[position] < MASK_BIT8:
+                    # Short form, the usual case
+                    length = data[position]
+                    position += 1
+                else:
+                    length, length_bytes_read = read_length(data, position)
+                    position += length_bytes_read
+
+                if length == 0:
+                    # EOC or zero-length (EOC always has a zero length)
+                    if not stack:
+                        # Before a record, which it belongs to
+                        continue
+                else:
+                    end = position + length
+                    if end > size:
+                        raise TruncatedDataError(
+                            f"Unexpected end of data: need {length} bytes at position {position}, but only {size - position} available"
+                        )
+
+                    constructed = first_byte & CONSTRUCTED_BIT
+                    # The parser copies the value to bytes only for the entries with a
+                    # decode function, the constructed ones just get a view
+                    try:
+                        tlv = parser(tag_number, data[position:end], schema)
+                    except KeyError:
+                        # Unknown tag in schema
+                        tlv = None
+
+                    if tlv is None or tlv.value is None:
+                        if not stack:
+                            return False, end - start
+                        position = end
+                    else:
+                        if isinstance(tlv.value, dict):
+                            for k, v in tlv.value.items():
+                                add(f"{tlv.name}.{k}", v)
+                        else:
+                            add(tlv.name, tlv.value)
+
+                        if constructed:
+                            # Read the children next
+                            stack.append((end, schema))
+                            schema = tlv.schema
+                            continue
+                        position = end
+            elif not stack:
+                # EOF, trailing zero-length headers aren't a record
+                return False, 0
+
+            # Close the constructed TLVs whose children have all been read
+            while stack and position >= stack[-1][0]:
+                position, schema = stack.pop()
+            if not stack:
+                return True, position - start
+
+    def parse_columns(self, sink):
+        """Parse all blocks into a columnar sink, yielding once per finished row.
+
+        The caller may flush and clear the sink between rows.
+        """
+        with self.buffer_manager.open():
+            data = self.buffer_manager.get_memoryview()
+            data_size = len(data)
+            position = 0
+            add = sink.add
+
+            while position < data_size:
+                try:
+                    decoded, bytes_read = self.decode_into(data, position, add)
+                except Exception:
+                    sink.discard_row()
+                    raise
+                if not decoded:
+                    # No more valid data
+                    sink.discard_row()
+                    if bytes_read:
+                        self.stopped_at = position
+                    break
+                position += bytes_read
+                sink.end_row()
+                yield sink.n_rows
+
+    def stream_columns(self, sink, pbar_position=None, show_progress=True):
+        """Progress-bar wrapped `parse_columns`, see `stream`"""
+        if show_progress:
+            return tqdm(
+                self.parse_columns(sink),
+                desc="  ↳ Parsing TLVs",
+                unit=" block",
+                leave=False,
+                position=pbar_position,
+                colour="blue",
+            )
+        return self.parse_columns(sink)
+
+    def record_boundaries(self) -> array:
+        """Offsets of the top-level records, scanning only their tags and lengths.
+
+        This first pass doesn't decode the values, it just jumps from one record to
+        the next. Zero-length or End-of-Content headers are kept with the record that
+        follows them, as `decode` does. The last offset is the end of the data.
+
+        Returns:
+            array of offsets: record i spans [offsets[i], offsets[i + 1])
+        """
+        with self.buffer_manager.open():
+            data = self.buffer_manager.get_memoryview()
+            data_size = len(data)
+            read_tag_number = BerDecoderOptimized.read_tag_number
+            read_length = BerDecoderOptimized.read_length
+            offsets = array("Q", [0])
+            position = 0
+
+            while position < data_size:
+                _, tag_bytes_read = read_tag_number(data, position)
+                length, length_bytes_read = read_length(data, position + tag_bytes_read)
+                position += tag_bytes_read + length_bytes_read
+                if length == 0:
+                    # EOC or zero-length, belongs to the next record
+                    continue
+                if position + length > data_size:
+                    raise TruncatedDataError(
+                        f"Unexpected end of data: need {length} bytes at position {position}, but only {data_size - position} available"
+                    )
+                position += length
+                offsets.append(position)
+
+            if offsets[-1] != data_size:
+                # Trailing padding without a record
+                offsets.append(data_size)
+            return offsets
+
     def parse_blocks(self):
         """Parse all blocks from the memory-mapped data."""
         # Load data into memory once
@@ -241,28 +386,36 @@ class BerDecoderOptimized:
                     yield record
                 else:
                     # No more valid data
+                    if result[1]:
+                        self.stopped_at = position
                     break
 
-    def process(self, pbar_position=None, show_progress=True):
-        """Process the BER data and return a list of parsed blocks.
+    def stream(self, pbar_position=None, show_progress=True):
+        """Lazily yield the parsed blocks of the BER data, one record at a time.
 
         Args:
             pbar_position: Position for nested progress bar (for hierarchical display)
             show_progress: Whether to show progress bar
         """
         if show_progress:
-            return list(
-                tqdm(
-                    self.parse_blocks(),
-                    desc="  ↳ Parsing TLVs",
-                    unit=" block",
-                    leave=False,
-                    position=pbar_position,
-                    colour="blue",
-                )
+            return tqdm(
+                self.parse_blocks(),
+                desc="  ↳ Parsing TLVs",
+                unit=" block",
+                leave=False,
+                position=pbar_position,
+                colour="blue",
             )
-        else:
-            return list(self.parse_blocks())
+        return self.parse_blocks()
+
+    def process(self, pbar_position=None, show_progress=True):
+        """Process the BER data and return a list of parsed blocks.
+
+        Args:
+            pbar_position: Position for nested progress bar (for hierarchical display)
+            show_progress: Whether to show progress bar
+        """
+        return list(self.stream(pbar_position, show_progress))
 
     @property
     def transform_func(self):
@@ -1,36 +1,38 @@
-"""Two-Phase BER Decoder - Prototype Implementation
+"""Two-Phase BER Decoder
 
 This module implements a two-phase approach to BER decoding:
 1. Phase 1: Extract TLV structure without interpretation (fast)
-2. Phase 2: Interpret values (parallelizable)
+2. Phase 2: Interpret values, record by record (parallelizable)
+
+Phase 1 lists the TLVs in pre-order with the index of their parent, in a compact
+`TLVIndex`, so phase 2 resolves the schema of every TLV from its parent chain and
+the records can be interpreted independently, in a process pool over ranges of
+records. The output is the same as `BerDecoderOptimized`.
 """
 
+from collections import deque
+from concurrent.futures import Future
 from dataclasses import dataclass
-from collections import namedtuple
-from typing import Optional, Tuple, Callable, List
-from concurrent.futures import ThreadPoolExecutor
-from functools import partial
-import time
+from itertools import islice
+from typing import Optional, Callable, Iterator, List
+from concurrent.futures import ProcessPoolExecutor
 
 from tqdm.auto import tqdm
 from teleparser.buffer import MemoryBufferManager
-from teleparser.decoders.ericsson.fieldnames import ERICSSON_VOZ_FIELDS
+from teleparser.index import ArrayIndex
+from teleparser.decoders.ericsson.modules import CALL_DATA_RECORD_FIELDS
 from teleparser.decoders.ericsson.ber_optimized import (
     BerDecoderOptimized,
-    BerTag,
-    EOC,
     CLASS_SHIFT,
-    TWO_BIT_MASK,
-    ENCODE_SHIFT,
-    MODULO_2,
-    CLASSNUM_MASK,
-    MASK_BIT7,
-    SHIFT_7,
-    HIGH_CLASS_NUM,
+    CONSTRUCTED_BIT,
     MASK_BIT8,
-    SHIFT_8,
 )
 
+# Length of the TLVs whose header or value couldn't be read
+MALFORMED = -1
+# Length of the TLVs overflowing their parent, but not the data
+OVERFLOW = -2
+
 
 @dataclass
 class TLVTriple:
@@ -57,238 +59,369 @@ class TLVTriple:
     tlv_start: int  # Position where TLV starts (for debugging)
 
 
+def tlv_triple(tag_class, constructed, *fields) -> TLVTriple:
+    return TLVTriple(tag_class, bool(constructed), *fields)
+
+
+class TLVIndex(ArrayIndex):
+    """Phase 1 TLVs as parallel arrays, read as TLVTriple one at a time"""
+
+    FIELDS = (
+        ("tag_class", "B"),
+        ("constructed", "B"),
+        ("tag_number", "q"),
+        ("value_start", "Q"),
+        ("value_length", "q"),
+        ("depth", "I"),
+        ("parent_idx", "q"),
+        ("tlv_start", "Q"),
+    )
+    ROW = staticmethod(tlv_triple)
+
+
+def interpret_records(
+    parser: Callable,
+    tlvs: TLVIndex,
+    data: memoryview | bytes,
+    first: int = 0,
+    offset: int = 0,
+) -> List[Optional[dict]]:
+    """Phase 2 for a range of records: the fields of each root TLV in tlvs.
+
+    The TLVs are in pre-order, each record is a root TLV followed by its
+    descendants. The schema of a TLV is the one its parent was parsed into, the
+    root schema for the records. An unknown tag, or a TLV without value, is skipped
+    with its children. A record whose root can't be decoded ends the range, as None,
+    and a MALFORMED TLV raises ValueError. A record with an OVERFLOW TLV is decoded
+    again by `BerDecoderOptimized.decode_into`, which reads that TLV whole and
+    resumes at the end of its parent, so data must then hold the rest of the file.
+
+    Args:
+        parser: TLV parser, `parser(tag_number, value, schema)`
+        tlvs: TLVs of whole records, tlvs[i] being TLV first + i of phase 1
+        data: Data of the records, starting at offset of the phase 1 data
+        first: Index of tlvs[0] in phase 1, for the parent indexes
+        offset: Position of data[0] in phase 1, for the value positions
+
+    Returns:
+        List of records, the last one None if the range ended early
+    """
+    records = []
+    # Child schema of the constructed TLVs decoded so far, by index
+    schemas = {}
+    constructed = tlvs.constructed
+    tag_number = tlvs.tag_number
+    value_start = tlvs.value_start
+    value_length = tlvs.value_length
+    parent_idx = tlvs.parent_idx
+
+    for j in range(len(tlvs)):
+        parent = parent_idx[j]
+        if parent == -1:
+            record = {}
+            records.append(record)
+            root = tlvs.tlv_start[j] - offset
+            schemas.clear()
+            schema = None
+        elif parent not in schemas:
+            # Parent skipped
+            continue
+        else:
+            schema = schemas[parent]
+
+        length = value_length[j]
+        if length == MALFORMED:
+            raise ValueError(f"Malformed TLV at position {tlvs.tlv_start[j]}")
+        if length == OVERFLOW:
+            record.clear()
+            BerDecoderOptimized(parser, None).decode_into(
+                data, root, record.__setitem__
+            )
+            # Skip the rest of the record
+            schemas.clear()
+            continue
+
+        start = value_start[j] - offset
+        # A view, copied by the parser for the decode functions, see decode_into
+        try:
+            parsed = parser(tag_number[j], data[start : start + length], schema)
+        except KeyError:
+            # Unknown tag in schema
+            parsed = None
+
+        if parsed is None or parsed.value is None:
+            if parent == -1:
+                # No more valid data
+                records[-1] = None
+                return records
+            continue
+
+        if isinstance(parsed.value, dict):
+            for k, v in parsed.value.items():
+                record[f"{parsed.name}.{k}"] = v
+        else:
+            record[parsed.name] = parsed.value
+        if constructed[j]:
+            schemas[first + j] = parsed.schema
+
+    return records
+
+
 @dataclass
 class BerDecoderTwoPhase:
     """Two-phase BER decoder for optimal performance.
 
     Phase 1: Extract all TLV structures in one pass (no recursion)
-    Phase 2: Interpret values in parallel
+    Phase 2: Interpret the records in a process pool, `records_per_task` at a time.
+    With a single worker, or a single range of records, phase 2 runs in process.
     """
 
     parser: Callable
     buffer_manager: MemoryBufferManager
     FIELDNAMES: set = None
     n_workers: int = 4
+    records_per_task: int = 5000
 
     def __post_init__(self):
         """Initialize the decoder."""
         if self.FIELDNAMES is None:
-            self.FIELDNAMES = ERICSSON_VOZ_FIELDS
+            self.FIELDNAMES = CALL_DATA_RECORD_FIELDS
 
     def extract_tlv_structure(self, data: memoryview) -> List[TLVTriple]:
-        """Phase 1: Extract ALL TLVs in a single pass without interpretation.
-
-        Returns:
-            List of TLVTriple objects representing the complete TLV structure
-        """
-        tlvs = []
-        # Stack entries: (start_pos, end_pos, depth, parent_idx)
-        stack = [(0, len(data), 0, -1)]
-
-        while stack:
-            pos, end_pos, depth, parent_idx = stack.pop()
+        """Phase 1 as a list of TLVTriple objects, see `build_index`"""
+        return list(self.build_index(data))
 
-            while pos < end_pos:
-                tlv_start = pos
-
-                # Read tag
-                tag_bytes, tag_len = BerDecoderOptimized.read_tag(data, pos)
-                if tag_bytes is None:
-                    break
-                pos += tag_len
-
-                # Decode tag
-                tag = BerDecoderOptimized.decode_tag(tag_bytes)
-
-                # Read length
-                try:
-                    length, len_bytes = BerDecoderOptimized.read_length(data, pos)
-                except ValueError:
-                    # Malformed length, skip this TLV
-                    break
-                pos += len_bytes
-
-                # Handle EOC or zero-length
-                if BerDecoderOptimized.reached_eoc(tag, length) and length == 0:
-                    continue  # Skip EOC markers
-                    # For indefinite length, we'd need special handling
-                    # For now, treat as regular TLV
-
-                # Check if we have enough data for the value
-                if pos + length > len(data):
-                    # Not enough data, possibly truncated file
-                    break
-
-                # Store TLV triple
-                current_idx = len(tlvs)
-                tlvs.append(
-                    TLVTriple(
-                        tag_class=tag.tag_class,
-                        constructed=tag.constructed,
-                        tag_number=tag.number,
-                        value_start=pos,
-                        value_length=length,
-                        depth=depth,
-                        parent_idx=parent_idx,
-                        tlv_start=tlv_start,
-                    )
-                )
-
-                # Schedule children for constructed types
-                if tag.constructed and length > 0:
-                    stack.append((pos, pos + length, depth + 1, current_idx))
-
-                pos += length
-
-        return tlvs
-
-    def get_schema_for_tlv(self, tlvs: List[TLVTriple], tlv_idx: int) -> dict:
-        """Get the appropriate schema for a TLV based on its parent hierarchy."""
-        tlv = tlvs[tlv_idx]
-
-        if tlv.parent_idx == -1:
-            # Root level - use main schema
-            return None
-
-        # Walk up the parent chain to find the right schema context
-        # This is a simplified version - in practice, you'd need to
-        # implement the full schema resolution logic
-        parent_tlv = tlvs[tlv.parent_idx]
-
-        # For now, return None (will use root schema in parser)
-        # TODO: Implement full schema traversal
-        return None
+    def build_index(self, data: memoryview) -> TLVIndex:
+        """Phase 1: Extract ALL TLVs in a single pass without interpretation.
 
-    def interpret_tlv_batch(
-        self, tlvs: List[TLVTriple], data: memoryview, start_idx: int, end_idx: int
-    ) -> dict:
-        """Interpret a batch of TLVs in parallel.
+        The TLVs are listed in pre-order, a record (root TLV) followed by all its
+        descendants. Zero-length and End-of-Content headers are skipped, as in
+        `BerDecoderOptimized.decode_into`.
 
-        Args:
-            tlvs: List of all TLVs
-            data: Raw data memoryview
-            start_idx: Start index in tlvs list
-            end_idx: End index in tlvs list
+        A malformed TLV, truncated or with an invalid header, is listed with a
+        MALFORMED length and ends its parent, or the structure at the top level. It
+        is only an error if phase 2 gets to it: `BerDecoderOptimized` doesn't read
+        the children of the TLVs it skips either. Unlike it, the children of every
+        TLV are read here, so they must fit in their parent to keep the pass linear:
+        a TLV overflowing its parent, but not the data, is listed with an OVERFLOW
+        length, without its children, and ends its parent as well.
 
         Returns:
-            Dictionary of parsed field names and values
+            TLVIndex representing the complete TLV structure
         """
-        results = {}
-
-        for i in range(start_idx, end_idx):
-            if i >= len(tlvs):
-                break
-
-            tlv = tlvs[i]
-
-            # Skip constructed types - their values come from children
-            if tlv.constructed:
-                continue
-
-            # Extract value from memoryview (zero-copy)
-            if tlv.value_length == 0:
-                continue
-
+        index = TLVIndex()
+        (
+            add_class,
+            add_constructed,
+            add_number,
+            add_value_start,
+            add_value_length,
+            add_depth,
+            add_parent,
+            add_tlv_start,
+        ) = (column.append for column in index.columns)
+        read_tag_number = BerDecoderOptimized.read_tag_number
+        read_length = BerDecoderOptimized.read_length
+        size = len(data)
+        count = 0
+        position = 0
+        # (end, index) of the constructed TLVs whose children are being read
+        stack = []
+
+        while position < size:
+            tlv_start = position
+            first_byte = data[position]
             try:
-                value = bytes(
-                    data[tlv.value_start : tlv.value_start + tlv.value_length]
-                )
+                tag_number, tag_bytes_read = read_tag_number(data, position)
+                position += tag_bytes_read
+                if position < size and data[position] < MASK_BIT8:
+                    # Short form, the usual case
+                    length = data[position]
+                    position += 1
+                else:
+                    length, length_bytes_read = read_length(data, position)
+                    position += length_bytes_read
+                if position + length > size:
+                    raise ValueError("TLV overflows the data")
+            except ValueError:
+                # Malformed or truncated, an error only if phase 2 gets to it
+                tag_number, constructed = -1, 0
+                position, length = tlv_start, MALFORMED
+            else:
+                constructed = first_byte & CONSTRUCTED_BIT
+                if stack and position + length > stack[-1][0]:
+                    # Decoded with its record by phase 2, if it gets to it
+                    constructed, length = 0, OVERFLOW
+
+            if length == 0:
+                # EOC or zero-length, not listed
+                if not stack:
+                    # Before a record, which it belongs to
+                    continue
+            else:
+                add_class(first_byte >> CLASS_SHIFT)
+                add_constructed(1 if constructed else 0)
+                add_number(tag_number)
+                add_value_start(position)
+                add_value_length(length)
+                add_depth(len(stack))
+                add_parent(stack[-1][1] if stack else -1)
+                add_tlv_start(tlv_start)
+                count += 1
+
+                if length in (MALFORMED, OVERFLOW):
+                    if not stack:
+                        break
+                    # Skip the rest of the parent
+                    position = stack[-1][0]
+                elif constructed:
+                    # Read the children next
+                    stack.append((position + length, count - 1))
+                    continue
+                else:
+                    position += length
+
+            # Close the constructed TLVs whose children have all been read
+            while stack and position >= stack[-1][0]:
+                position = stack.pop()[0]
+
+        return index
+
+    def get_schema_for_tlv(
+        self, tlvs: List[TLVTriple], tlv_idx: int, data: memoryview = None
+    ) -> Optional[tuple]:
+        """Get the appropriate schema for a TLV based on its parent hierarchy.
+
+        The ancestors are parsed from the root down, each one with the schema of its
+        parent, so data is only read for the TLVs below the root.
 
-                # Get appropriate schema based on parent
-                schema = self.get_schema_for_tlv(tlvs, i)
-
-                # Parse the value
-                parsed = self.parser(tlv.tag_number, value, schema)
-
-                if parsed.value is not None:
-                    if isinstance(parsed.value, dict):
-                        # Flatten nested dictionaries
-                        for k, v in parsed.value.items():
-                            results[f"{parsed.name}.{k}"] = v
-                    else:
-                        results[parsed.name] = parsed.value
+        Returns:
+            The schema passed to the parser for this TLV, None for the root schema
 
-            except (KeyError, ValueError, AttributeError) as e:
-                # Unknown tag or parsing error - skip silently
-                # In production, you might want to log this
-                continue
+        Raises:
+            KeyError: An ancestor has an unknown tag
+        """
+        ancestors = []
+        parent_idx = tlvs[tlv_idx].parent_idx
+        while parent_idx != -1:
+            ancestors.append(tlvs[parent_idx])
+            parent_idx = tlvs[parent_idx].parent_idx
+
+        schema = None
+        for tlv in reversed(ancestors):
+            value = data[tlv.value_start : tlv.value_start + tlv.value_length]
+            schema = self.parser(tlv.tag_number, value, schema).schema
+        return schema
+
+    def record_ranges(self, tlvs: TLVIndex) -> List[range]:
+        """Ranges of TLV indexes with `records_per_task` whole records each"""
+        roots = [i for i, parent in enumerate(tlvs.parent_idx) if parent == -1]
+        starts = roots[:: max(1, self.records_per_task)]
+        return [range(a, b) for a, b in zip(starts, starts[1:] + [len(tlvs)])]
+
+    def interpret_batches(
+        self, tlvs: TLVIndex, data: memoryview
+    ) -> Iterator[List[Optional[dict]]]:
+        """Phase 2 range by range: the records of each range, see `interpret_records`.
+
+        With several workers the ranges are interpreted in a process pool, at most
+        two per worker ahead of the range being yielded. Each worker gets a slice of
+        the index and a copy of the data of its range. The ranges with an OVERFLOW
+        TLV, whose records can read past the range, are interpreted in process.
+        """
+        ranges = self.record_ranges(tlvs)
+        n_workers = min(self.n_workers, len(ranges))
+        if n_workers <= 1:
+            for indexes in ranges:
+                yield interpret_records(
+                    self.parser, tlvs[indexes.start : indexes.stop], data, indexes.start
+                )
+            return
 
-        return results
+        def submit(indexes: range):
+            batch = tlvs[indexes.start : indexes.stop]
+            if OVERFLOW in batch.value_length:
+                future = Future()
+                try:
+                    future.set_result(
+                        interpret_records(self.parser, batch, data, indexes.start)
+                    )
+                except Exception as e:
+                    # Raised in turn, the ranges before may end the records first
+                    future.set_exception(e)
+                return future
+
+            start = tlvs.tlv_start[indexes.start]
+            stop = (
+                tlvs.tlv_start[indexes.stop] if indexes.stop < len(tlvs) else len(data)
+            )
+            return executor.submit(
+                interpret_records,
+                self.parser,
+                batch,
+                bytes(data[start:stop]),
+                indexes.start,
+                start,
+            )
 
-    def parallel_interpret(self, tlvs: List[TLVTriple], data: memoryview) -> List[dict]:
-        """Phase 2: Interpret TLV values in parallel.
+        executor = ProcessPoolExecutor(max_workers=n_workers)
+        try:
+            ranges = iter(ranges)
+            pending = deque(
+                submit(indexes) for indexes in islice(ranges, 2 * n_workers)
+            )
+            while pending:
+                batch = pending.popleft().result()
+                if (indexes := next(ranges, None)) is not None:
+                    pending.append(submit(indexes))
+                yield batch
+        finally:
+            # The ranges after a record which couldn't be decoded don't matter
+            executor.shutdown(cancel_futures=True)
+
+    def parallel_interpret(
+        self, tlvs: TLVIndex | List[TLVTriple], data: memoryview
+    ) -> List[dict]:
+        """Phase 2: Interpret the records, in parallel over ranges of records.
+
+        The records end at the first one which can't be decoded, as with
+        `BerDecoderOptimized`.
 
         Args:
-            tlvs: List of TLV structures from phase 1
+            tlvs: TLV structures from phase 1
             data: Raw data memoryview
 
         Returns:
             List of parsed records
         """
-        if not tlvs:
-            return []
-
-        # Find leaf (non-constructed) TLVs for parallel processing
-        leaf_indices = [i for i, tlv in enumerate(tlvs) if not tlv.constructed]
+        if not isinstance(tlvs, TLVIndex):
+            tlvs = TLVIndex.from_rows(tlvs)
+        return self.collect(self.interpret_batches(tlvs, data))
 
-        if not leaf_indices:
-            return []
+    @staticmethod
+    def valid_records(batches) -> Iterator[dict]:
+        """Records of the batches up to the first one which couldn't be decoded.
 
-        # Create batches for parallel processing
-        if len(leaf_indices) < self.n_workers:
-            # Not enough work for parallelization
-            batch_size = len(leaf_indices)
-            n_workers = 1
-        else:
-            batch_size = max(1, len(leaf_indices) // self.n_workers)
-            n_workers = self.n_workers
-
-        batches = []
-        for i in range(0, len(leaf_indices), batch_size):
-            batch_indices = leaf_indices[i : i + batch_size]
-            if batch_indices:
-                batches.append((min(batch_indices), max(batch_indices) + 1))
-
-        # Process batches in parallel
-        if n_workers > 1:
-            with ThreadPoolExecutor(max_workers=n_workers) as executor:
-                batch_results = list(
-                    executor.map(
-                        lambda batch: self.interpret_tlv_batch(
-                            tlvs, data, batch[0], batch[1]
-                        ),
-                        batches,
-                    )
-                )
-        else:
-            # Sequential processing for small datasets
-            batch_results = [
-                self.interpret_tlv_batch(tlvs, data, batch[0], batch[1])
-                for batch in batches
-            ]
-
-        # Group results by record (top-level TLVs)
-        records = []
-
-        # Find root-level TLVs (depth 0)
-        root_tlvs = [i for i, tlv in enumerate(tlvs) if tlv.depth == 0]
-
-        for root_idx in root_tlvs:
-            record = {}
-
-            # Collect all parsed fields for this record
-            # In a more sophisticated implementation, you'd need to
-            # properly associate child TLVs with their parent records
-            for batch_result in batch_results:
-                record.update(batch_result)
-
-            if record:
-                records.append(record)
+        The batches after it aren't waited for, their errors don't matter.
+        """
+        for batch in batches:
+            if batch and batch[-1] is None:
+                # No more valid data
+                yield from batch[:-1]
+                return
+            yield from batch
 
-        return records
+    @staticmethod
+    def collect(batches) -> List[dict]:
+        """`valid_records` as a list"""
+        return list(BerDecoderTwoPhase.valid_records(batches))
 
     def parse_blocks(self):
-        """Parse all blocks using two-phase approach."""
+        """Parse all blocks using two-phase approach.
+
+        The whole file is indexed first, then the records are interpreted and
+        yielded one range of `records_per_task` records at a time.
+        """
         with self.buffer_manager.open():
             data = self.buffer_manager.get_memoryview()
 
@@ -296,19 +429,32 @@ class BerDecoderTwoPhase:
                 return
 
             # Phase 1: Extract TLV structure (fast, single-threaded)
-            # start_time = time.perf_counter()
-            tlvs = self.extract_tlv_structure(data)
-            # phase1_time = time.perf_counter() - start_time
+            tlvs = self.build_index(data)
 
-            # Phase 2: Parallel interpretation
-            # start_time = time.perf_counter()
-            records = self.parallel_interpret(tlvs, data)
-            # phase2_time = time.perf_counter() - start_time
+            # Phase 2: Interpretation, range by range
+            batches = self.interpret_batches(tlvs, data)
+            try:
+                yield from self.valid_records(batches)
+            finally:
+                batches.close()
 
-            # Optional: Print timing info for benchmarking
-            # print(f"Phase 1 (structure): {phase1_time:.4f}s, Phase 2 (interpret): {phase2_time:.4f}s")
+    def stream(self, pbar_position=None, show_progress=True):
+        """Yield the parsed blocks, once the file is indexed, range by range.
 
-            yield from records
+        Args:
+            pbar_position: Position for nested progress bar
+            show_progress: Whether to show progress bar
+        """
+        if show_progress:
+            return tqdm(
+                self.parse_blocks(),
+                desc="  ↳ Parsing TLVs (2-phase)",
+                unit=" block",
+                leave=False,
+                position=pbar_position,
+                colour="green",
+            )
+        return self.parse_blocks()
 
     def process(self, pbar_position=None, show_progress=True):
         """Process the BER data and return a list of parsed blocks.
@@ -317,43 +463,9 @@ class BerDecoderTwoPhase:
             pbar_position: Position for nested progress bar
             show_progress: Whether to show progress bar
         """
-        if show_progress:
-            return list(
-                tqdm(
-                    self.parse_blocks(),
-                    desc="  ↳ Parsing TLVs (2-phase)",
-                    unit=" block",
-                    leave=False,
-                    position=pbar_position,
-                    colour="green",
-                )
-            )
-        else:
-            return list(self.parse_blocks())
+        return list(self.stream(pbar_position, show_progress))
 
     @property
     def transform_func(self):
         """Placeholder for compatibility."""
         return None
-
-
-def ericsson_voz_decoder_two_phase(
-    buffer_manager: MemoryBufferManager, n_workers: int = 4
-):
-    """Create a two-phase BER decoder for Ericsson VOZ records.
-
-    Args:
-        buffer_manager: Memory buffer manager for the input file
-        n_workers: Number of worker threads for parallel interpretation
-
-    Returns:
-        Configured two-phase BER decoder
-    """
-    from teleparser.decoders.ericsson.voz import EricssonVoz
-
-    return BerDecoderTwoPhase(
-        parser=EricssonVoz,
-        buffer_manager=buffer_manager,
-        FIELDNAMES=ERICSSON_VOZ_FIELDS,
-        n_workers=n_workers,
-    )
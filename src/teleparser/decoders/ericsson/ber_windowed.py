@@ -0,0 +1,129 @@
+from dataclasses import dataclass
+from typing import Any, Callable, Iterator, Optional
+from teleparser.buffer import BufferManager
+from teleparser.decoders.ericsson.ber_optimized import (
+    BerDecoderOptimized,
+    TruncatedDataError,
+)
+
+# Decompressed bytes read from the stream on each refill of the window
+WINDOW_SIZE = 4 * 1024 * 1024
+
+
+@dataclass
+class BerDecoderWindowed(BerDecoderOptimized):
+    """BER decoder over a bounded sliding window of the decompressed stream.
+
+    Middle path between the legacy stream decoder, which reads the file one byte at
+    a time, and the optimized decoder, which needs the whole decompressed file in
+    memory. The stream is read in blocks of `window_size` bytes into a refillable
+    bytearray, the complete top-level records in it are decoded with memoryview
+    slicing, and the partial record at the end is carried over to the next refill.
+    Memory stays around `window_size` plus the largest record.
+    """
+
+    buffer_manager: BufferManager
+    window_size: int = WINDOW_SIZE
+
+    @staticmethod
+    def record_end(data: bytearray, position: int) -> Optional[int]:
+        """End of the top-level record starting at position.
+
+        Zero-length or End-of-Content headers are kept with the record that follows
+        them, as `decode` does.
+
+        Returns:
+            The offset after the record, or None if it isn't complete in data
+        """
+        size = len(data)
+        try:
+            while position < size:
+                _, tag_bytes_read = BerDecoderOptimized.read_tag_number(data, position)
+                length, length_bytes_read = BerDecoderOptimized.read_length(
+                    data, position + tag_bytes_read
+                )
+                position += tag_bytes_read + length_bytes_read
+                if length == 0:
+                    continue
+                position += length
+                return position if position <= size else None
+        except TruncatedDataError:
+            # Tag or length split by the end of the window
+            pass
+        return None
+
+    def records(self, decode: Callable) -> Iterator[Any]:
+        """Decode the top-level records of the stream with `decode(window, position)`.
+
+        decode returns (result, bytes_consumed) like `decode`, the next record is
+        read after the bytes it consumed. A TLV running past the end of the window,
+        which the optimized decoder reads from the rest of the data, is decoded
+        again after a refill, so the results and errors are the same as decoding the
+        whole data at once. At the end of the stream the incomplete tail, if any, is
+        decoded as well so `decode` can tell trailing padding from a truncated record.
+
+        Yields:
+            The results of decode, up to the first None
+        """
+        window = bytearray()
+        position = 0
+        eof = False
+
+        with self.buffer_manager.open():
+            while True:
+                if self.record_end(window, position) is not None or (
+                    eof and position < len(window)
+                ):
+                    truncated = False
+                    with memoryview(window) as view:
+                        try:
+                            result, bytes_read = decode(view, position)
+                        except TruncatedDataError:
+                            if eof:
+                                raise
+                            truncated = True
+                    if not truncated:
+                        if result is None:
+                            return
+                        yield result
+                        position += bytes_read
+                        continue
+                elif eof:
+                    return
+
+                # Carry the unread data over and refill
+                del window[:position]
+                position = 0
+                block = self.buffer_manager.read(self.window_size)
+                if block:
+                    window += block
+                else:
+                    eof = True
+
+    def parse_columns(self, sink):
+        """Parse all blocks into a columnar sink, yielding once per finished row.
+
+        The caller may flush and clear the sink between rows.
+        """
+        add = sink.add
+
+        def decode(data, position):
+            try:
+                decoded, bytes_read = self.decode_into(data, position, add)
+            except Exception:
+                # Decoded again after a refill, or raised
+                sink.discard_row()
+                raise
+            if not decoded:
+                # No more valid data
+                sink.discard_row()
+                return None, bytes_read
+            return decoded, bytes_read
+
+        for _ in self.records(decode):
+            sink.end_row()
+            yield sink.n_rows
+
+    def parse_blocks(self):
+        """Parse all blocks from the sliding window over the stream."""
+        yield from self.records(self.decode)
@@ -4,3 +4,4 @@ from .enums import *  # noqa: F403
 from .ints import *  # noqa: F403
 from .primitives import *  # noqa: F403
 from .composite import *  # noqa: F403
+from .decoders import *  # noqa: F403
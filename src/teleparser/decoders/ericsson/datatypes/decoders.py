@@ -0,0 +1,379 @@
+"""Function-based decoders of the datatypes, returning their final value directly.
+
+The datatype classes build an object per value, going through the `fixed_size_*`
+wrappers, the `OctetString` bounds checks and intermediate lists, just to read its
+`value` once. The functions registered here compute the same value (and fail on the
+same invalid octets) without that, and are used on the decoding hot path through
+`decoder_for`. The classes stay the reference implementation, for introspection and
+tests; datatypes without a function are decoded by their class.
+"""
+
+from functools import lru_cache
+from typing import Any, Callable
+
+from teleparser.prestadoras import PRESTADORAS, Prestadora
+from . import exceptions
+from .enums import FrequencyBandSupported
+from .primitives import (
+    AddressString,
+    Bool,
+    ByteEnum,
+    DigitString,
+    Ia5String,
+    TBCDString,
+    UnsignedInt,
+    tbcd_digits,
+)
+from .string import (
+    AccountCode,
+    BSSMAPCauseCode,
+    CarrierIdentificationCode,
+    CarrierInformation,
+    Date,
+    ExchangeIdentity,
+    FreeFormatData,
+    GlobalTitle,
+    GlobalTitleAndSubSystemNumber,
+    GsmSCFAddress,
+    GSMCallReferenceNumber,
+    IMEI,
+    IMSI,
+    InternalCauseAndLoc,
+    LocationInformation,
+    NetworkCallReference,
+    PointCodeAndSubSystemNumber,
+    PositionAccuracy,
+    PresentationAndScreeningIndicator,
+    ProcedureCode,
+    Route,
+    ServiceCode,
+    TAC,
+    TargetRNCid,
+    Time,
+)
+
+__all__ = [
+    "DECODERS",
+    "IMSI_CACHE_SIZE",
+    "VALUE_FIELDS",
+    "configure_imsi_cache",
+    "decoder_for",
+    "imsi_cache_info",
+    "register",
+    "value_fields",
+]
+
+Decoder = Callable[[bytes], Any]
+
+# Decode functions of the datatypes, by class
+DECODERS: dict[type, Decoder] = {}
+
+# Keys of the datatypes decoded to a dict, output as the fields `name.key`. By
+# exact class: many subclasses of AddressString are decoded to a single value
+CARRIER_FIELDS = ("mnc", "mcc", "nome", "cnpj", "pais")
+ADDRESS_FIELDS = ("ton", "npi", "digits")
+GLOBAL_TITLE_FIELDS = (
+    "translation_type",
+    "numbering_plan",
+    "odd",
+    "nature_of_address",
+    "digits",
+)
+VALUE_FIELDS: dict[type, tuple[str, ...]] = {
+    AddressString: ADDRESS_FIELDS,
+    GsmSCFAddress: ADDRESS_FIELDS,
+    BSSMAPCauseCode: ("cause_value", "extended_cause_value"),
+    CarrierInformation: (
+        "type_of_network_identification",
+        "network_identification_plan",
+    ),
+    FrequencyBandSupported: ("pgsm", "egsm", "gsm1800"),
+    GlobalTitle: GLOBAL_TITLE_FIELDS,
+    GlobalTitleAndSubSystemNumber: ("subsystem_number",) + GLOBAL_TITLE_FIELDS,
+    IMEI: ("TAC", "SNR", "Spare"),
+    IMSI: ("mcc", "mnc", "msin", "nome", "cnpj", "pais"),
+    InternalCauseAndLoc: ("location", "cause"),
+    LocationInformation: CARRIER_FIELDS + ("lac", "ci_sac"),
+    PointCodeAndSubSystemNumber: ("spc_type", "spc", "subsystem_number"),
+    PositionAccuracy: ("error_shape", "angle", "area"),
+    PresentationAndScreeningIndicator: ("screening", "presentation"),
+    TargetRNCid: CARRIER_FIELDS + ("lac", "rnc_id"),
+}
+
+# Decoded IMSIs kept in memory, subscribers repeat a lot within a file
+IMSI_CACHE_SIZE = 65536
+
+
+def register(*datatypes: type) -> Callable[[Decoder], Decoder]:
+    """Register the decorated function as the decoder of the datatypes"""
+
+    def decorator(decode: Decoder) -> Decoder:
+        for datatype in datatypes:
+            DECODERS[datatype] = decode
+        return decode
+
+    return decorator
+
+
+def check_size(octets: bytes, lower: int | None = None, upper: int | None = None):
+    """Same bounds check as OctetString, with the size taken from the octets"""
+    size = len(octets)
+    if lower and lower > size:
+        raise exceptions.OctetStringError(f"{size=} is smaller than {lower=} limit")
+    if upper and size > upper:
+        raise exceptions.OctetStringError(f"{size=} is bigger than {upper=} limit")
+
+
+def check_fixed_size(octets: bytes, size: int):
+    """Same check as the `fixed_size_*` wrappers: at least size octets"""
+    if size > len(octets):
+        raise exceptions.OctetStringError(
+            f"{size=} parameter is bigger than octets' length: {len(octets)}"
+        )
+
+
+# Families of datatypes, decoded by a function built from the class attributes
+
+
+def unsigned_int(octets: bytes) -> int:
+    if not isinstance(octets, bytes):
+        raise TypeError(f"Octet parameter is not a byte object: {type(octets)}")
+    return int.from_bytes(octets, "big")
+
+
+def bool_flag(octets: bytes) -> bool:
+    assert not octets, "byte should be empty"
+    return True
+
+
+def digit_string(
+    size: int | None = None, lower: int | None = None, upper: int | None = None
+) -> Decoder:
+    def decode(octets: bytes) -> str:
+        if size:
+            check_fixed_size(octets, size)
+        check_size(octets, lower, upper)
+        return "".join([str(digit) for digit in octets])
+
+    return decode
+
+
+def byte_enum(values: dict) -> Decoder:
+    def decode(octets: bytes) -> str:
+        check_fixed_size(octets, 1)
+        return values.get(int.from_bytes(octets, "big"), "Unknown")
+
+    return decode
+
+
+def ia5_string(lower: int | None = None, upper: int | None = None) -> Decoder:
+    def decode(octets: bytes) -> str:
+        check_size(octets, lower, upper)
+        return octets.decode("latin-1")
+
+    return decode
+
+
+def tbcd_string(
+    size: int | None = None, lower: int | None = None, upper: int | None = None
+) -> Decoder:
+    def decode(octets: bytes) -> str:
+        if size:
+            check_fixed_size(octets, size)
+        check_size(octets, lower, upper)
+        return tbcd_digits(octets)
+
+    return decode
+
+
+def address_string(lower: int | None = None, upper: int | None = None) -> Decoder:
+    ton_labels = AddressString.TON_LABELS
+    npi_labels = AddressString.NPI_LABELS
+
+    def decode(octets: bytes) -> dict:
+        check_size(octets, lower, upper)
+        first_octet = octets[0]
+        digits = tbcd_digits(octets[1:])
+        if digits.endswith("F"):
+            digits = digits[:-1]
+        return {
+            "ton": ton_labels.get(first_octet >> 4, "Unknown"),
+            "npi": npi_labels.get(first_octet & 0x0F, "Unknown"),
+            "digits": digits,
+        }
+
+    return decode
+
+
+def overrides(datatype: type, base: type, *names: str) -> bool:
+    """Whether datatype changes any of the attributes it inherits from base"""
+    return any(getattr(datatype, name) is not getattr(base, name) for name in names)
+
+
+def family_decoder(datatype: type) -> Decoder | None:
+    """Decoder of a subclass which only inherits the behaviour of its primitive"""
+    init = getattr(datatype.__init__, "__wrapped__", datatype.__init__)
+    size = getattr(datatype, "SIZE", None)
+
+    if issubclass(datatype, Bool) and not overrides(datatype, Bool, "__init__"):
+        return bool_flag
+    if issubclass(datatype, UnsignedInt) and init is UnsignedInt.__init__ and size:
+        # UnsignedInt itself needs the size argument of the wrapper
+        return unsigned_int
+    if issubclass(datatype, ByteEnum) and not overrides(
+        datatype, ByteEnum, "__init__", "_value"
+    ):
+        return byte_enum(datatype.VALUES)
+    if issubclass(datatype, DigitString) and init is DigitString.__init__:
+        return digit_string(size)
+    if issubclass(datatype, Ia5String) and init is Ia5String.__init__:
+        return ia5_string()
+    if issubclass(datatype, TBCDString) and not overrides(
+        datatype, TBCDString, "__init__", "_parse_digits"
+    ):
+        return tbcd_string()
+    if issubclass(datatype, AddressString) and not overrides(
+        datatype, AddressString, "__init__", "_parse_ton_npi", "_parse_digits", "_value"
+    ):
+        return address_string()
+    return None
+
+
+def value_fields(datatype: type) -> tuple[str, ...]:
+    """Keys of the dict decoded from datatype, empty for a single value"""
+    return VALUE_FIELDS.get(datatype, ())
+
+
+def decoder_for(datatype: type) -> Decoder:
+    """Function decoding octets into the value of datatype.
+
+    The registered function, a function of the primitive family of the datatype, or
+    as a fallback the construction of the datatype object.
+    """
+    if (decode := DECODERS.get(datatype)) is not None:
+        return decode
+    if (decode := family_decoder(datatype)) is not None:
+        return decode
+
+    def decode(octets):
+        return datatype(octets).value
+
+    return decode
+
+
+# Datatypes with their own size constraints or value
+
+register(ExchangeIdentity)(ia5_string(lower=1, upper=15))
+register(Route)(ia5_string(lower=1, upper=7))
+register(GsmSCFAddress)(address_string(lower=1, upper=9))
+register(GSMCallReferenceNumber)(digit_string(lower=1, upper=8))
+register(FreeFormatData)(digit_string(upper=160))
+register(AccountCode)(tbcd_string(lower=1, upper=5))
+register(CarrierIdentificationCode)(tbcd_string(lower=1, upper=3))
+register(ServiceCode)(tbcd_string(lower=1, upper=2))
+register(ProcedureCode)(tbcd_string(size=1))
+
+
+@register(Time)
+def decode_time(octets: bytes) -> str:
+    check_size(octets, 3, 4)
+    hour, minute, second = octets[0], octets[1], octets[2]
+    assert 0 <= hour <= 23, f"Hour should be in range 0-23: {hour}"
+    assert 0 <= minute <= 59, f"Minute should be in range 0-59: {minute}"
+    assert 0 <= second <= 59, f"Second should be in range 0-59: {second}"
+    if len(octets) == 4:
+        tenth_of_a_second = octets[3]
+        assert 0 <= tenth_of_a_second <= 9, (
+            f"10th of a second should be in range 0-9: {tenth_of_a_second}"
+        )
+        return f"{hour:02d}:{minute:02d}:{second:02d}.{tenth_of_a_second:01d}"
+    return f"{hour:02d}:{minute:02d}:{second:02d}"
+
+
+@register(Date)
+def decode_date(octets: bytes) -> str:
+    check_size(octets, 3, 4)
+    if len(octets) == 4:
+        year1, year2, month, day = octets
+        assert 19 <= year1 <= 20, f"Year should be in range 19-20: {year1}"
+        assert 0 <= year2 <= 99, f"Year should be in range 0-99: {year2}"
+        year = year1 * 100 + year2
+    else:
+        year, month, day = octets
+        assert 0 <= year <= 99, f"Year should be in range 0-99: {year}"
+    assert 1 <= month <= 12, f"Month should be in range 1-12: {month}"
+    assert 1 <= day <= 31, f"Day should be in range 1-31: {day}"
+    if len(octets) == 4:
+        return f"{day:04d}-{month:02d}-{year:02d}"
+    return f"{day:02d}-{month:02d}-{year:02d}"
+
+
+@register(TAC)
+def decode_tac(octets: bytes) -> str:
+    check_fixed_size(octets, 2)
+    first, second = octets[0], octets[1]
+    return (
+        f"TSC: {first >> 4}, TOS: {first & 0x0F}, "
+        f"TOI: {second >> 4}, TOP: {second & 0x0F}"
+    )
+
+
+@register(NetworkCallReference)
+def decode_network_call_reference(octets: bytes) -> str:
+    check_fixed_size(octets, 5)
+    return octets.hex()
+
+
+@register(InternalCauseAndLoc)
+def decode_internal_cause_and_loc(octets: bytes) -> dict:
+    check_fixed_size(octets, 2)
+    return {"location": octets[0], "cause": octets[1]}
+
+
+def imsi_value(octets: bytes) -> dict:
+    """MCC, MNC, MSIN and carrier of an IMSI"""
+    digits = tbcd_digits(octets)
+    assert 5 <= len(digits) <= 16, (
+        f"IMSI must have at least 5 digits and at most 16 digits, got {len(digits)}"
+    )
+    mcc = digits[0:3]
+    mnc = digits[3:6]
+    msin = digits[5:].rstrip("F")
+
+    if carrier := PRESTADORAS.get((mnc, mcc)):
+        # The third MNC digit isn't part of the MSIN
+        msin = msin[1:]
+    elif carrier := PRESTADORAS.get((mnc[:-1], mcc)):
+        mnc = mnc[:-1]
+    else:
+        carrier = Prestadora(
+            mnc=mnc, mcc=mcc, nome="Desconhecida", cnpj=None, pais=None
+        )
+    return {
+        "mcc": mcc,
+        "mnc": mnc,
+        "msin": msin,
+        "nome": carrier.nome,
+        "cnpj": carrier.cnpj,
+        "pais": carrier.pais,
+    }
+
+
+imsi_cache = lru_cache(maxsize=IMSI_CACHE_SIZE)(imsi_value)
+
+
+@register(IMSI)
+def decode_imsi(octets: bytes) -> dict:
+    """IMSI value, memoized by its octets: the dict is shared, don't change it"""
+    return imsi_cache(octets)
+
+
+def configure_imsi_cache(maxsize: int = IMSI_CACHE_SIZE):
+    """Replace the IMSI cache by an empty one of maxsize entries, 0 disables it"""
+    global imsi_cache
+    imsi_cache = lru_cache(maxsize=maxsize)(imsi_value)
+
+
+def imsi_cache_info():
+    """Hits, misses, maxsize and current size of the IMSI cache"""
+    return imsi_cache.cache_info()
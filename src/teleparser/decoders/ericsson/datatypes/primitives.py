@@ -20,6 +20,7 @@ def fixed_size_unsigned_int(size):
                 original_init(self, octets, *args, **kwargs)
 
         cls.__init__ = new_init
+        cls.SIZE = size
         return cls
 
     return decorator
@@ -41,6 +42,7 @@ def fixed_size_digit_string(size):
                 original_init(self, octets, *args, **kwargs)
 
         cls.__init__ = new_init
+        cls.SIZE = size
         return cls
 
     return decorator
@@ -62,6 +64,7 @@ def fixed_size_ia5_string(size):
                 original_init(self, octets, *args, **kwargs)
 
         cls.__init__ = new_init
+        cls.SIZE = size
         return cls
 
     return decorator
@@ -178,7 +181,7 @@ class AddressString(OctetString):
 
     def _parse_digits(self):
         """Parse TBCD-encoded digits from remaining octets"""
-        digits = TBCDString(self.octets[1:]).digits
+        digits = list(tbcd_digits(self.octets[1:]))
         if digits and digits[-1] == "F":
             digits = digits[:-1]
         self.digits = digits
@@ -207,6 +210,16 @@ class Ia5String(OctetString):
         self.value = "".join(chr(byte) for byte in self.octets)
 
 
+# Octet with its nibbles swapped: the hex of the swapped octet is its two TBCD digits,
+# low nibble first, so a whole field decodes with `translate(...).hex()` in C
+TBCD_SWAP = bytes(((octet & 0x0F) << 4) | (octet >> 4) for octet in range(256))
+
+
+def tbcd_digits(octets: bytes) -> str:
+    """TBCD digits of the octets, low nibble first, fillers (F) included"""
+    return bytes(octets).translate(TBCD_SWAP).hex().upper()
+
+
 class TBCDString(OctetString):
     r"""TBCDString ::= OCTET STRING (SIZE(1..n))
 
@@ -257,13 +270,7 @@ class TBCDString(OctetString):
             return str(d)
 
     def _parse_digits(self):
-        digits = []
-        for octet in self.octets:
-            # Extract two digits from each octet
-            digit1 = octet & 0x0F
-            digit2 = (octet >> 4) & 0x0F
-            digits.extend([digit1, digit2])
-        self.digits = [self._digit_to_str(d) for d in digits]
+        self.digits = list(tbcd_digits(self.octets))
 
 
 class UnsignedInt:
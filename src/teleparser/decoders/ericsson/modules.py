@@ -1,4 +1,7 @@
+from typing import Callable, NamedTuple, Optional
+
 from . import datatypes as dt
+from .fieldnames import ERICSSON_VOZ_FIELDS
 
 CAMELTDPData = {
     0: {"name": "serviceKey", "type": dt.ServiceKey},
@@ -1235,3 +1238,94 @@ CallDataRecord = {
         "type": CompositeDataRecord,
     },
 }
+
+
+# Compiled schema
+#
+# The module dicts above are compiled once at import time into flat tuples indexed
+# by tag number, so decoding a TLV is one indexed lookup and one call instead of
+# several dict lookups, a type check and the construction of a datatype object.
+
+
+class TagEntry(NamedTuple):
+    """Compiled schema entry of a tag number.
+
+    Primitive tags have the output column `name` and a `decode` function of the
+    value octets. Constructed tags have the column `name` taking the module name as
+    `value`, and the compiled `table` of their children.
+    """
+
+    name: str
+    value: Optional[str]
+    decode: Optional[Callable]
+    table: tuple
+
+
+def compile_schema(schema: dict, compiled: dict | None = None) -> tuple:
+    """Compile a module dict into a tuple of TagEntry indexed by tag number.
+
+    Unused tag numbers are None. Constructed entries without a column `tag` can't be
+    decoded and are left out as well. Modules shared by several parents are compiled
+    once.
+    """
+    if compiled is None:
+        compiled = {}
+    if id(schema) in compiled:
+        return compiled[id(schema)]
+
+    table = [None] * (max(schema) + 1)
+    for tag_number, mapping in schema.items():
+        datatype = mapping["type"]
+        if isinstance(datatype, dict):
+            if "tag" not in mapping:
+                continue
+            table[tag_number] = TagEntry(
+                mapping["tag"],
+                mapping["name"],
+                None,
+                compile_schema(datatype, compiled),
+            )
+        else:
+            table[tag_number] = TagEntry(
+                mapping["name"], None, dt.decoder_for(datatype), ()
+            )
+
+    compiled[id(schema)] = table = tuple(table)
+    return table
+
+
+CALL_DATA_RECORD = compile_schema(CallDataRecord)
+
+
+def schema_fieldnames(schema: dict) -> set[str]:
+    """Every field decoded from a module dict, with the entries of `compile_schema`.
+
+    The column `tag` of the constructed entries, and the name of the primitive ones,
+    as `name.key` for each key of the datatypes decoded to a dict.
+    """
+    names = set()
+    seen = set()
+    pending = [schema]
+    while pending:
+        schema = pending.pop()
+        if id(schema) in seen:
+            continue
+        seen.add(id(schema))
+        for mapping in schema.values():
+            datatype = mapping["type"]
+            if isinstance(datatype, dict):
+                if "tag" in mapping:
+                    names.add(mapping["tag"])
+                    pending.append(datatype)
+            elif keys := dt.value_fields(datatype):
+                names.update(f"{mapping['name']}.{key}" for key in keys)
+            else:
+                names.add(mapping["name"])
+    return names
+
+
+# Output columns of the Voz decoders: every field of the schema, and the fields of
+# the first outputs which are kept even when they are no longer decoded
+CALL_DATA_RECORD_FIELDS = frozenset(
+    ERICSSON_VOZ_FIELDS | schema_fieldnames(CallDataRecord)
+)
@@ -1,6 +1,9 @@
 import logging
 import struct
+from collections import Counter
 from datetime import datetime, timedelta
+from functools import lru_cache
+from itertools import repeat
 from dataclasses import dataclass
 from typing import Generator, Tuple
 import socket
@@ -386,6 +389,15 @@ AVP_DB = {
 }
 
 
+# Output columns: every AVP decoded to a value, and the fields of the first outputs
+# with the ones added by `insert_vendor_info`. Vendor-Id is only read by the
+# transform, which removes it
+VOLTE_FIELDS = frozenset(
+    ERICSSON_VOLTE_FIELDS
+    | {avp_def.avp for avp_def in AVP_DB.values() if avp_def.type != TYPE_GROUPED}
+) - {"Vendor-Id"}
+
+
 def is_avp_flag_valid(flags_byte: int, parameter_flag: str | None = None) -> bool:
     """Validate AVP flags byte according to Diameter protocol specification
 
@@ -428,12 +440,59 @@ def is_avp_flag_valid(flags_byte: int, parameter_flag: str | None = None) -> boo
     return flags_string == parameter_flag
 
 
+# Accounting-Record-Type names, by decoded value or as read back from a file
+ACCOUNTING_RECORD_TYPES = {
+    1.0: "EVENT",
+    2.0: "START",
+    3.0: "INTERIM",
+    4.0: "STOP",
+    "1.0": "EVENT",
+    "2.0": "START",
+    "3.0": "INTERIM",
+    "4.0": "STOP",
+    1: "EVENT",
+    2: "START",
+    3: "INTERIM",
+    4: "STOP",
+}
+UNKNOWN_RECORD_TYPE = "UNKNOWN"
+
+# Vendor and Type of the records with a Vendor-Id
+VENDOR_ID_NODE = ("HUAWEI", "TAS")
+# (Origin-Host prefix, Vendor, Type) of the records without Vendor-Id, in order
+ORIGIN_HOST_NODES = (
+    ("pcscf", "ERICSSON", "SBG"),
+    ("scscf", "ERICSSON", "IMS"),
+    ("tas", "ERICSSON", "TAS"),
+)
+
+
+@lru_cache(maxsize=4096)
+def origin_host_node(origin_host: str) -> Tuple[str, str] | None:
+    """(Vendor, Type) of a node by its Origin-Host, None if not recognized"""
+    for prefix, vendor, node_type in ORIGIN_HOST_NODES:
+        if origin_host.startswith(prefix):
+            return vendor, node_type
+    return None
+
+
+def log_unmapped_record_types(unmapped: Counter) -> None:
+    """One warning for all the unmapped Accounting-Record-Type values of a batch"""
+    if unmapped:
+        logger.warning(
+            f"Unmapped Accounting-Record-Type in {unmapped.total()} records, "
+            f"set to {UNKNOWN_RECORD_TYPE}: {dict(unmapped.most_common(10))}"
+        )
+
+
 class EricssonVolte:
     DIAMETER_HEADER_FORMAT = struct.Struct(">B3sB3sIII")  # Big-endian format
     HEADER_SIZE = 20  # Fixed 20-byte header
     NTP_EPOCH = datetime(1900, 1, 1)  # For timestamp conversion
     PREFIX_HEADER_LENGTH = 2
-    FIELDNAMES: set[str] | None = ERICSSON_VOLTE_FIELDS
+    FIELDNAMES: set[str] | None = VOLTE_FIELDS
+    # Fields read by `transform_columns` which are not in the output
+    TRANSFORM_FIELDS = ("Vendor-Id",)
 
     def __init__(self, buffer_manager):
         self.buffer_manager = buffer_manager
@@ -443,7 +502,7 @@ class EricssonVolte:
     def __post_init__(self):
         """Initialize the memory buffer after dataclass initialization."""
         if self.FIELDNAMES is None:
-            self.FIELDNAMES = ERICSSON_VOLTE_FIELDS
+            self.FIELDNAMES = VOLTE_FIELDS
 
     def _init_handler(self) -> None:
         """Initialize the handler for parsing AVPs"""
@@ -679,6 +738,24 @@ class EricssonVolte:
         else:
             return binary_view.tobytes().hex()  # type: ignore # Fallback for unknown types
 
+    def stream(self, pbar_position=None, show_progress=True):
+        """Lazily yield the parsed AVPs of the VoLTE data, one record at a time.
+
+        Args:
+            pbar_position: Position for nested progress bar (for hierarchical display)
+            show_progress: Whether to show progress bar
+        """
+        if show_progress:
+            return tqdm(
+                self.avps(),
+                desc="  ↳ Parsing AVPs",
+                unit=" block",
+                leave=False,
+                position=pbar_position,
+                colour="blue",
+            )
+        return self.avps()
+
     def process(self, pbar_position=None, show_progress=True):
         """Process the VoLTE data and return a list of parsed AVPs.
 
@@ -686,19 +763,7 @@ class EricssonVolte:
             pbar_position: Position for nested progress bar (for hierarchical display)
             show_progress: Whether to show progress bar
         """
-        if show_progress:
-            return list(
-                tqdm(
-                    self.avps(),
-                    desc="  ↳ Parsing AVPs",
-                    unit=" block",
-                    leave=False,
-                    position=pbar_position,
-                    colour="blue",
-                )
-            )  # Process all AVPs and return as a list
-        else:
-            return list(self.avps())
+        return list(self.stream(pbar_position, show_progress))
 
     @staticmethod
     def insert_vendor_info(blocks):
@@ -710,22 +775,7 @@ class EricssonVolte:
         Returns:
             List of dictionaries with vendor information added and Vendor-Id removed
         """
-        # Accounting record type mapping
-        accounting_type_map = {
-            1.0: "EVENT",
-            2.0: "START",
-            3.0: "INTERIM",
-            4.0: "STOP",
-            "1.0": "EVENT",
-            "2.0": "START",
-            "3.0": "INTERIM",
-            "4.0": "STOP",
-            1: "EVENT",
-            2: "START",
-            3: "INTERIM",
-            4: "STOP",
-        }
-
+        unmapped = Counter()
         for block in blocks:
             # Extract Origin-Host from Session-Id by splitting on first semicolon
             session_id = block.get("Session-Id", "")
@@ -740,22 +790,10 @@ class EricssonVolte:
 
             # Rule 1: If Vendor-Id is present (not None/empty), it's HUAWEI TAS
             if vendor_id is not None and vendor_id != "":
-                block["Vendor"] = "HUAWEI"
-                block["Type"] = "TAS"
-            # Rule 2: If Origin-Host starts with "pcscf", it's ERICSSON SBG
-            elif origin_host.startswith("pcscf"):
-                block["Vendor"] = "ERICSSON"
-                block["Type"] = "SBG"
-            # Rule 3: If Origin-Host starts with "scscf", it's ERICSSON IMS
-            elif origin_host.startswith("scscf"):
-                block["Vendor"] = "ERICSSON"
-                block["Type"] = "IMS"
-            # Rule 4: If Origin-Host starts with "tas" and no Vendor-Id, it's ERICSSON TAS
-            elif origin_host.startswith("tas") and (
-                vendor_id is None or vendor_id == ""
-            ):
-                block["Vendor"] = "ERICSSON"
-                block["Type"] = "TAS"
+                block["Vendor"], block["Type"] = VENDOR_ID_NODE
+            # Rules 2-4: ERICSSON SBG, IMS or TAS by the Origin-Host prefix
+            elif node := origin_host_node(origin_host):
+                block["Vendor"], block["Type"] = node
             else:
                 # Default values if no rule matches
                 block["Vendor"] = block.get("Vendor", "")
@@ -763,19 +801,75 @@ class EricssonVolte:
 
             # Map Accounting-Record-Type to human-readable values
             acct_type = block.get("Accounting-Record-Type")
-            if acct_type in accounting_type_map:
-                block["Accounting-Record-Type"] = accounting_type_map[acct_type]
+            if acct_type in ACCOUNTING_RECORD_TYPES:
+                block["Accounting-Record-Type"] = ACCOUNTING_RECORD_TYPES[acct_type]
             else:
-                logger.warning(
-                    f"Unmapped Accounting-Record-Type encountered: {acct_type!r} in block: {block}"
-                )
-                block["Accounting-Record-Type"] = "UNKNOWN"
+                unmapped[acct_type] += 1
+                block["Accounting-Record-Type"] = UNKNOWN_RECORD_TYPE
             # Remove Vendor-Id as it's no longer needed
             if "Vendor-Id" in block:
                 del block["Vendor-Id"]
 
+        log_unmapped_record_types(unmapped)
         return blocks
 
+    @staticmethod
+    def insert_vendor_columns(sink) -> None:
+        """Column-wise `insert_vendor_info` over the rows of a `ColumnarBuilder`.
+
+        Each rule is applied to a whole column at a time, with the node of each
+        distinct Origin-Host classified once. The sink must buffer the
+        `TRANSFORM_FIELDS` as extra columns.
+        """
+        n_rows = sink.n_rows
+        if not n_rows:
+            return
+
+        session_ids = sink.get_column("Session-Id") or repeat(None, n_rows)
+        origin_hosts = [
+            session_id.split(";", 1)[0] if session_id else ""
+            for session_id in session_ids
+        ]
+        vendor_ids = sink.get_column("Vendor-Id") or repeat(None, n_rows)
+        nodes = [
+            VENDOR_ID_NODE
+            if vendor_id is not None and vendor_id != ""
+            else origin_host_node(origin_host)
+            for origin_host, vendor_id in zip(origin_hosts, vendor_ids)
+        ]
+        vendors = sink.get_column("Vendor") or repeat(None, n_rows)
+        types = sink.get_column("Type") or repeat(None, n_rows)
+        sink.set_column("Origin-Host", origin_hosts)
+        sink.set_column(
+            "Vendor",
+            [
+                node[0] if node else ("" if vendor is None else vendor)
+                for node, vendor in zip(nodes, vendors)
+            ],
+        )
+        sink.set_column(
+            "Type",
+            [
+                node[1] if node else ("" if node_type is None else node_type)
+                for node, node_type in zip(nodes, types)
+            ],
+        )
+
+        record_types = sink.get_column("Accounting-Record-Type") or [None] * n_rows
+        mapped = [
+            ACCOUNTING_RECORD_TYPES.get(record_type, UNKNOWN_RECORD_TYPE)
+            for record_type in record_types
+        ]
+        log_unmapped_record_types(
+            Counter(
+                record_type
+                for record_type, name in zip(record_types, mapped)
+                if name == UNKNOWN_RECORD_TYPE
+            )
+        )
+        sink.set_column("Accounting-Record-Type", mapped)
+        sink.set_column("Vendor-Id", None)
+
     @staticmethod
     def transform_func(blocks):
         """Transform function that applies vendor information enrichment.
@@ -787,3 +881,8 @@ class EricssonVolte:
             List of dictionaries with transformations applied
         """
         return EricssonVolte.insert_vendor_info(blocks)
+
+    @staticmethod
+    def transform_columns(sink) -> None:
+        """Columnar `transform_func`, applied to each batch before it is written"""
+        EricssonVolte.insert_vendor_columns(sink)
@@ -0,0 +1,340 @@
+"""VoLTE (Diameter) decoding engine with pluggable strategies.
+
+The VoLTE decoders of this package differ in how they slice the messages, walk
+their AVPs, parse the values and spread the work. `VolteEngine` takes each of
+these as a strategy, so they are combined instead of re-implemented:
+
+- slicer: `(data) -> (start, stop, error)` of each message, `diameter_messages`
+- walker: by name in `WALKERS`, "strict" (`EricssonVolteFinal`) or "reference"
+  (the original `EricssonVolte`, with its own value parsers)
+- time_format: the value parsers of the strict walker, see `AVP_TABLES`
+- execution: "serial", "threaded" or "processes", over spans of whole messages,
+  or "auto" to choose from the size of the data and the number of workers. The
+  threads share the data, the processes get the offsets of their span and memory
+  map the decompressed file themselves, as the chunks of `teleparser.chunks`
+
+Every execution strategy yields the records of the walker in file order, with the
+same output as running it serially.
+
+Unlike the original `EricssonVolte`, which raises ValueError on a header with an
+invalid version or Command-Code, the slicer skips that header and goes on with
+the data after it, as `EricssonVolteFinal` does.
+"""
+
+import os
+import tempfile
+from array import array
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager
+from itertools import islice
+from pathlib import Path
+from typing import Callable, Generator, Iterator, List, Tuple
+
+from tqdm.auto import tqdm
+
+from teleparser.buffer import MappedBufferManager
+from teleparser.chunks import pool_workers
+from teleparser.decoders.ericsson.volte import VOLTE_FIELDS, EricssonVolte
+from teleparser.decoders.ericsson.volte_final import (
+    AVP_TABLES,
+    TIME_FORMAT_INTEGER_FIELDS,
+    TIME_TEXT,
+    EricssonVolteFinal,
+    diameter_messages,
+    log_avp_stats,
+)
+
+# Execution strategies
+SERIAL = "serial"
+THREADED = "threaded"  # Bound by the GIL, never chosen by AUTO
+PROCESSES = "processes"
+AUTO = "auto"
+EXECUTIONS = (SERIAL, THREADED, PROCESSES, AUTO)
+
+# Smallest data worth a process pool: below, starting the workers and mapping
+# the file in each of them costs more than decoding in the current process
+PROCESS_MIN_SIZE = 16 * 1024 * 1024
+MESSAGES_PER_TASK = 5000
+
+
+def reference_walk(block: bytes, add: Callable, stats=None, table=None) -> None:
+    """Walk of the original `EricssonVolte`, whose value parsers need memoryviews"""
+    for name, value in EricssonVolte.parse_block(memoryview(block)).items():
+        add(name, value)
+
+
+# AVP walkers: (block, add, stats, table), sending each field to `add(name, value)`
+WALKERS = {
+    "strict": EricssonVolteFinal.parse_block_into,
+    "reference": reference_walk,
+}
+
+
+def choose_execution(size: int, n_workers: int) -> str:
+    """Execution strategy for data of the given size"""
+    if n_workers > 1 and size >= PROCESS_MIN_SIZE:
+        return PROCESSES
+    return SERIAL
+
+
+def walk_messages(
+    data: memoryview | bytes,
+    slicer: Callable,
+    walker: str,
+    time_format: str,
+    stats: Counter,
+) -> Iterator[dict]:
+    """Records of the valid messages of the data, in order"""
+    walk = WALKERS[walker]
+    table = AVP_TABLES[time_format]
+    for start, stop, error in slicer(data):
+        if not error:
+            record = {}
+            walk(bytes(data[start:stop]), record.__setitem__, stats, table)
+            yield record
+
+
+def decode_span(
+    data: memoryview | bytes, slicer: Callable, walker: str, time_format: str
+) -> Tuple[List[dict], Counter]:
+    """Records and AVP stats of a span of whole messages, run by the threads"""
+    stats = Counter()
+    records = list(walk_messages(data, slicer, walker, time_format, stats))
+    return records, stats
+
+
+def decode_mapped_span(
+    raw_file: Path,
+    start: int,
+    stop: int,
+    slicer: Callable,
+    walker: str,
+    time_format: str,
+) -> Tuple[List[dict], Counter]:
+    """`decode_span` of a byte range of a decompressed file, run by the processes"""
+    buffer_manager = MappedBufferManager(raw_file, start, stop)
+    try:
+        return decode_span(buffer_manager.get_memoryview(), slicer, walker, time_format)
+    finally:
+        buffer_manager.close()
+
+
+class VolteEngine:
+    """VoLTE decoder combining a slicer, an AVP walker, value parsers and an execution.
+
+    The data is read in memory once. The parallel executions split it in spans of
+    `messages_per_task` messages, each decoded by a worker, and yield the records
+    span by span in order. The process workers only get the offsets of their span
+    in the decompressed file, see `shared_file`.
+    """
+
+    FIELDNAMES: set[str] | None = VOLTE_FIELDS
+    # Fields read by `transform_columns` which are not in the output
+    TRANSFORM_FIELDS = EricssonVolte.TRANSFORM_FIELDS
+    INTEGER_FIELDS = EricssonVolteFinal.INTEGER_FIELDS
+
+    def __init__(
+        self,
+        buffer_manager,
+        walker: str = "strict",
+        time_format: str = TIME_TEXT,
+        execution: str = AUTO,
+        n_workers: int | None = None,
+        messages_per_task: int = MESSAGES_PER_TASK,
+        slicer: Callable = diameter_messages,
+    ):
+        for name, value, choices in (
+            ("walker", walker, WALKERS),
+            ("time format", time_format, AVP_TABLES),
+            ("execution", execution, EXECUTIONS),
+        ):
+            if value not in choices:
+                raise ValueError(
+                    f"Unknown {name} {value!r}, expected one of {list(choices)}"
+                )
+        self.buffer_manager = buffer_manager
+        self.walker = walker
+        self.time_format = time_format
+        self.INTEGER_FIELDS = TIME_FORMAT_INTEGER_FIELDS[time_format]
+        self.slicer = slicer
+        self.n_workers = n_workers or pool_workers()
+        self.messages_per_task = messages_per_task
+        with buffer_manager.open() as file_buffer:
+            self.binary_data = memoryview(file_buffer.read())
+        self.length = len(self.binary_data)
+        self.execution = (
+            choose_execution(self.length, self.n_workers)
+            if execution == AUTO
+            else execution
+        )
+        # Outcomes of the AVP walk over the file, see `EricssonVolteFinal.avp_stats`
+        self.avp_stats = Counter()
+
+    def record_boundaries(self) -> array:
+        """Offsets of the messages, the last one is the end of the data.
+
+        Returns:
+            array of offsets: message i spans [offsets[i], offsets[i + 1])
+        """
+        offsets = array("Q", [0])
+        offsets.extend(
+            min(stop, self.length) for _, stop, _ in self.slicer(self.binary_data)
+        )
+        return offsets
+
+    def spans(self) -> List[Tuple[int, int]]:
+        """(start, stop) of the spans of `messages_per_task` whole messages"""
+        offsets = self.record_boundaries()
+        starts = offsets[:-1].tolist()[:: max(1, self.messages_per_task)]
+        return list(zip(starts, starts[1:] + [self.length]))
+
+    @contextmanager
+    def shared_file(self) -> Iterator[Tuple[Path, int]]:
+        """Decompressed file of the data, and offset of the data in it.
+
+        Data mapped from a file (the cache, or a chunk of a large file) is shared
+        as is. Data read in memory is written once to a temporary file, removed
+        when the workers are done.
+        """
+        if isinstance(self.buffer_manager, MappedBufferManager):
+            yield Path(self.buffer_manager.file_path), self.buffer_manager.start
+            return
+        fd, name = tempfile.mkstemp(prefix="teleparser_volte_", suffix=".raw")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(self.binary_data)
+            yield Path(name), 0
+        finally:
+            os.unlink(name)
+
+    def parallel_avps(self, spans: List[Tuple[int, int]]) -> Iterator[dict]:
+        """Records of the spans decoded by a thread or process pool, in order"""
+        max_workers = min(self.n_workers, len(spans))
+        options = (self.slicer, self.walker, self.time_format)
+        with ExitStack() as stack:
+            if self.execution == THREADED:
+                # Threads share the data
+                data = self.binary_data
+                executor = stack.enter_context(ThreadPoolExecutor(max_workers))
+
+                def submit(span: Tuple[int, int]):
+                    start, stop = span
+                    return executor.submit(decode_span, data[start:stop], *options)
+
+            else:
+                # Processes map the file, nothing but the offsets is pickled
+                raw_file, base = stack.enter_context(self.shared_file())
+                executor = stack.enter_context(ProcessPoolExecutor(max_workers))
+
+                def submit(span: Tuple[int, int]):
+                    start, stop = span
+                    return executor.submit(
+                        decode_mapped_span,
+                        raw_file,
+                        base + start,
+                        base + stop,
+                        *options,
+                    )
+
+            # At most two spans per worker in flight, so the decoded records
+            # waiting to be yielded stay bounded
+            spans = iter(spans)
+            pending = deque(map(submit, islice(spans, 2 * self.n_workers)))
+            while pending:
+                records, stats = pending.popleft().result()
+                pending.extend(map(submit, islice(spans, 1)))
+                self.avp_stats.update(stats)
+                yield from records
+
+    def avps(self) -> Generator[dict[str, int | str | bool], None, None]:
+        """Parse all messages with the execution strategy"""
+        spans = self.spans() if self.execution != SERIAL else []
+        if len(spans) > 1:
+            yield from self.parallel_avps(spans)
+        else:
+            yield from walk_messages(
+                self.binary_data,
+                self.slicer,
+                self.walker,
+                self.time_format,
+                self.avp_stats,
+            )
+        log_avp_stats(self.avp_stats)
+
+    def parse_columns(self, sink):
+        """Parse all messages into a columnar sink, yielding once per finished row"""
+        add = sink.add
+        if self.execution != SERIAL:
+            for record in self.avps():
+                for name, value in record.items():
+                    add(name, value)
+                sink.end_row()
+                yield sink.n_rows
+            return
+
+        data = self.binary_data
+        walk = WALKERS[self.walker]
+        table = AVP_TABLES[self.time_format]
+        stats = self.avp_stats
+        for start, stop, error in self.slicer(data):
+            if not error:
+                walk(bytes(data[start:stop]), add, stats, table)
+                sink.end_row()
+                yield sink.n_rows
+        log_avp_stats(stats)
+
+    def stream(self, pbar_position=None, show_progress=True):
+        """Lazily yield the parsed AVPs of the VoLTE data, one record at a time.
+
+        Args:
+            pbar_position: Position for nested progress bar (for hierarchical display)
+            show_progress: Whether to show progress bar
+        """
+        if show_progress:
+            return tqdm(
+                self.avps(),
+                desc=f"  ↳ Parsing AVPs ({self.execution})",
+                unit=" block",
+                leave=False,
+                position=pbar_position,
+                colour="cyan",
+            )
+        return self.avps()
+
+    def stream_columns(self, sink, pbar_position=None, show_progress=True):
+        """Progress-bar wrapped `parse_columns`, see `stream`"""
+        if show_progress:
+            return tqdm(
+                self.parse_columns(sink),
+                desc=f"  ↳ Parsing AVPs ({self.execution})",
+                unit=" block",
+                leave=False,
+                position=pbar_position,
+                colour="cyan",
+            )
+        return self.parse_columns(sink)
+
+    def process(self, pbar_position=None, show_progress=True):
+        """Process the VoLTE data and return a list of parsed AVPs.
+
+        Args:
+            pbar_position: Position for nested progress bar (for hierarchical display)
+            show_progress: Whether to show progress bar
+        """
+        return list(self.stream(pbar_position, show_progress))
+
+    @staticmethod
+    def insert_vendor_info(blocks):
+        """Insert vendor information into blocks (same as original)."""
+        return EricssonVolte.insert_vendor_info(blocks)
+
+    @staticmethod
+    def transform_func(blocks):
+        """Transform function that applies vendor information enrichment."""
+        return EricssonVolte.insert_vendor_info(blocks)
+
+    @staticmethod
+    def transform_columns(sink) -> None:
+        """Columnar `transform_func`, applied to each batch before it is written"""
+        EricssonVolte.insert_vendor_columns(sink)
@@ -8,11 +8,29 @@ Optimizations included:
 2. Improved flag validation
 3. Better memory usage patterns
 4. Optimized string handling
+
+`AVP_DB` is compiled once into `AVP_TABLE`, where each code maps to an `AvpEntry`
+with the flag bits it requires as an integer mask, the size of its value and the
+function parsing that value. Checking and parsing a candidate AVP is then one
+lookup, one mask test and one call.
+
+The AVPs are walked trusting their length: an unknown code, or a known one with
+unexpected flags or size, is skipped whole, padded to 4 bytes (RFC 6733). The
+byte-by-byte search for the next known AVP only runs from a header which can't be
+an AVP (too short or past the end of its block). How often each case happened is
+counted per decoder in `avp_stats`.
+
+The Time AVPs are formatted as text with the date of each day cached, or given
+as Unix epoch seconds with `time_format="epoch"`, skipping the formatting.
 """
 
+import logging
 import struct
+from collections import Counter
+from array import array
 from datetime import datetime, timedelta
-from typing import Generator, Tuple
+from functools import lru_cache
+from typing import Callable, Generator, Iterator, NamedTuple, Tuple
 import socket
 from tqdm.auto import tqdm
 
@@ -33,23 +51,302 @@ from teleparser.decoders.ericsson.volte import (
     STRUCT_SIGNED_32,
     STRUCT_UNSIGNED_64,
     KNOWN_SIZES,
-    ERICSSON_VOLTE_FIELDS,
+    VOLTE_FIELDS,
 )
 
+NTP_EPOCH = datetime(1900, 1, 1)  # For timestamp conversion
+# Seconds from the NTP epoch to the Unix epoch (1970-01-01)
+NTP_TO_UNIX = 2_208_988_800
+SECONDS_PER_DAY = 86_400
+
+# Output of the Time AVPs
+TIME_TEXT = "text"  # "%Y-%m-%d %H:%M:%S"
+TIME_EPOCH = "epoch"  # Unix epoch seconds
+
+# AVP flags
+FLAG_VENDOR = 0x80
+FLAG_MANDATORY = 0x40
+FLAG_PROTECTED = 0x20
+FLAG_RESERVED = 0x1F
+FLAG_BITS = {"V": FLAG_VENDOR, "M": FLAG_MANDATORY, "P": FLAG_PROTECTED}
+
+# Code and flags followed by the 24-bit length
+AVP_HEADER = struct.Struct(">II")
+LENGTH_MASK = 0xFFFFFF
+
+# Outcomes of the AVP walk, the keys of `EricssonVolteFinal.avp_stats`
+AVP_PARSED = "parsed"
+AVP_UNKNOWN = "unknown"  # Code not in AVP_DB, skipped
+AVP_INVALID = "invalid"  # Known code with unexpected flags or size, skipped
+AVP_RESYNC = "resync"  # Corrupt header, searched byte by byte
+
+logger = logging.getLogger(__name__)
+
+DIAMETER_HEADER = struct.Struct(">B3sB3sIII")  # Big-endian format
+DIAMETER_HEADER_SIZE = 20  # Fixed 20-byte header
+ACCOUNTING_COMMAND = b"\x00\x01\x0f"  # Command code 271
+
+
+# Parsers of the simple AVP values, by type
+
+
+def parse_string(binary_view: bytes) -> str:
+    try:
+        # Strip null bytes directly
+        result = binary_view.decode("utf-8")
+        return result.rstrip("\x00") if "\x00" in result else result
+    except UnicodeDecodeError:
+        return binary_view.hex()
+
+
+@lru_cache(maxsize=1024)
+def ntp_date(days: int) -> str:
+    """Date of a day counted from the NTP epoch, the records of a file span a few"""
+    return (NTP_EPOCH + timedelta(days=days)).strftime("%Y-%m-%d")
+
+
+def parse_time(binary_view: bytes) -> str:
+    if len(binary_view) >= 4:
+        seconds = STRUCT_UNSIGNED_32.unpack(binary_view[:4])[0]
+        days, seconds = divmod(seconds, SECONDS_PER_DAY)
+        hours, seconds = divmod(seconds, 3600)
+        minutes, seconds = divmod(seconds, 60)
+        return f"{ntp_date(days)} {hours:02d}:{minutes:02d}:{seconds:02d}"
+    return binary_view.hex()
+
+
+def parse_time_epoch(binary_view: bytes) -> int | str:
+    if len(binary_view) >= 4:
+        return STRUCT_UNSIGNED_32.unpack(binary_view[:4])[0] - NTP_TO_UNIX
+    return binary_view.hex()
+
+
+def parse_signed_32(binary_view: bytes) -> int | str:
+    if len(binary_view) >= 4:
+        return STRUCT_SIGNED_32.unpack(binary_view[:4])[0]
+    return binary_view.hex()
+
+
+def parse_unsigned_32(binary_view: bytes) -> int | str:
+    if len(binary_view) >= 4:
+        return STRUCT_UNSIGNED_32.unpack(binary_view[:4])[0]
+    return binary_view.hex()
+
+
+def parse_unsigned_64(binary_view: bytes) -> int | str:
+    if len(binary_view) >= 8:
+        return STRUCT_UNSIGNED_64.unpack(binary_view[:8])[0]
+    return binary_view.hex()
+
+
+def parse_address(binary_view: bytes) -> str:
+    if len(binary_view) < 2:
+        return binary_view.hex()
+    family = int.from_bytes(binary_view[:2], "big")
+    address_bytes = binary_view[2:]
+    try:
+        if family == 1 and len(address_bytes) == 4:  # IPv4
+            return socket.inet_ntoa(address_bytes)
+        elif family == 2 and len(address_bytes) == 16:  # IPv6
+            return socket.inet_ntop(socket.AF_INET6, address_bytes)
+        else:
+            return binary_view.decode("utf-8", errors="replace")
+    except (socket.error, UnicodeDecodeError):
+        return binary_view.hex()
+
+
+def parse_hex(binary_view: bytes) -> str:
+    return binary_view.hex()
+
+
+VALUE_PARSERS: dict[int, Callable] = {
+    TYPE_OCTET_STRING: parse_string,
+    TYPE_UTF8_STRING: parse_string,
+    TYPE_DIAMETER_IDENTITY: parse_string,
+    TYPE_TIME: parse_time,
+    TYPE_ENUMERATED: parse_signed_32,
+    TYPE_INTEGER_32: parse_signed_32,
+    TYPE_UNSIGNED_32: parse_unsigned_32,
+    TYPE_UNSIGNED_64: parse_unsigned_64,
+    TYPE_ADDRESS: parse_address,
+}
+
+
+class AvpEntry(NamedTuple):
+    """Compiled definition of an AVP code.
+
+    The flags of an AVP are valid when `flags & mask == required`: the reserved
+    bits are clear and the expected V, M and P bits are set, more may be. A size
+    of 0 accepts any value length. Grouped AVPs have no `parse`.
+    """
+
+    name: str
+    type: int
+    mask: int
+    required: int
+    size: int
+    parse: Callable | None
+
+
+def flag_mask(expected_flags: str | None) -> Tuple[int, int]:
+    """(mask, required) bits of the flags expected as a string like "VM" """
+    if expected_flags is None:
+        return 0, 0
+    required = 0
+    for flag in expected_flags:
+        required |= FLAG_BITS.get(flag, 0)
+    return FLAG_RESERVED | required, required
+
+
+def compile_avp_table(
+    avp_db: dict, value_parsers: dict[int, Callable] = VALUE_PARSERS
+) -> dict[int, AvpEntry]:
+    """`AvpEntry` of each code of an AVP database like `AVP_DB`"""
+    table = {}
+    for code, avp_def in avp_db.items():
+        mask, required = flag_mask(avp_def.acr_flag)
+        parse = (
+            None
+            if avp_def.type == TYPE_GROUPED
+            else value_parsers.get(avp_def.type, parse_hex)
+        )
+        table[code] = AvpEntry(
+            avp_def.avp,
+            avp_def.type,
+            mask,
+            required,
+            KNOWN_SIZES.get(avp_def.type, 0),
+            parse,
+        )
+    return table
+
+
+AVP_TABLE = compile_avp_table(AVP_DB)
+# Compiled tables by time format
+AVP_TABLES = {
+    TIME_TEXT: AVP_TABLE,
+    TIME_EPOCH: compile_avp_table(
+        AVP_DB, VALUE_PARSERS | {TYPE_TIME: parse_time_epoch}
+    ),
+}
+# Output fields of integers by time format, written as int64 columns
+TIME_FORMAT_INTEGER_FIELDS = {
+    TIME_TEXT: frozenset(),
+    TIME_EPOCH: frozenset(
+        entry.name for entry in AVP_TABLE.values() if entry.type == TYPE_TIME
+    ),
+}
+
+
+def next_message(data: memoryview, index: int) -> Tuple[int, int, bool]:
+    """Parse the Diameter header of the message at index, after its 2-byte prefix.
+
+    Returns:
+        Tuple of (start, stop, error): the AVPs are data[start:stop] and the next
+        message is at stop, error is True for an invalid header, which is skipped
+    """
+    index += 2  # Skip first 2 bytes
+    header = data[index : index + DIAMETER_HEADER_SIZE]
+
+    # Validate minimum length
+    if len(header) < DIAMETER_HEADER_SIZE:
+        index += len(header)  # Skip this block
+        return index, index, True
+
+    # Unpack all header fields
+    try:
+        (version, msg_len_bytes, flag_int, cmd_bytes, app_id, hbh_id, e2e_id) = (
+            DIAMETER_HEADER.unpack(header)
+        )
+    except struct.error as e:
+        logger.error(f"Diameter header unpacking failed at index {index}: {e}")
+        return index + len(header), index + len(header), True
+
+    # Convert 24-bit fields
+    msg_length = int.from_bytes(msg_len_bytes)
+
+    # Validate version (MUST be 1)
+    if version != 1:
+        return index + len(header), index + len(header), True
+
+    # Validate message type
+    if cmd_bytes != ACCOUNTING_COMMAND:
+        return index + len(header), index + len(header), True
+
+    return index + DIAMETER_HEADER_SIZE, index + msg_length, False
+
+
+def diameter_messages(data: memoryview) -> Iterator[Tuple[int, int, bool]]:
+    """`next_message` of every message of the data, in order"""
+    index = 0
+    length = len(data)
+    while index < length:
+        start, index, error = next_message(data, index)
+        yield start, index, error
+
+
+def message_boundaries(data: memoryview) -> array:
+    """Offsets of the Diameter messages, reading only their headers.
+
+    Follows the same walk as `diameter_messages`, including the skipped invalid
+    headers, so decoding any range between two offsets yields exactly the
+    messages found in it. The last offset is the end of the data.
+
+    Returns:
+        array of offsets: message i spans [offsets[i], offsets[i + 1])
+    """
+    length = len(data)
+    offsets = array("Q", [0])
+    offsets.extend(min(stop, length) for _, stop, _ in diameter_messages(data))
+    return offsets
+
+
+def log_avp_stats(stats: Counter) -> None:
+    """Log how the AVPs of a file were walked, at INFO if any was skipped"""
+    if not stats:
+        return
+    level = (
+        logging.INFO
+        if stats[AVP_UNKNOWN] or stats[AVP_INVALID] or stats[AVP_RESYNC]
+        else logging.DEBUG
+    )
+    logger.log(
+        level,
+        "AVPs: %d parsed, %d unknown skipped, %d invalid skipped, %d resyncs",
+        stats[AVP_PARSED],
+        stats[AVP_UNKNOWN],
+        stats[AVP_INVALID],
+        stats[AVP_RESYNC],
+    )
+
 
 class EricssonVolteFinal:
     """Final optimized EricssonVolte decoder with selected optimizations."""
 
-    DIAMETER_HEADER_FORMAT = struct.Struct(">B3sB3sIII")  # Big-endian format
-    HEADER_SIZE = 20  # Fixed 20-byte header
-    NTP_EPOCH = datetime(1900, 1, 1)  # For timestamp conversion
+    DIAMETER_HEADER_FORMAT = DIAMETER_HEADER
+    HEADER_SIZE = DIAMETER_HEADER_SIZE
+    NTP_EPOCH = NTP_EPOCH
     PREFIX_HEADER_LENGTH = 2
-    FIELDNAMES: set[str] | None = ERICSSON_VOLTE_FIELDS
-
-    def __init__(self, buffer_manager):
+    FIELDNAMES: set[str] | None = VOLTE_FIELDS
+    # Fields read by `transform_columns` which are not in the output
+    TRANSFORM_FIELDS = ("Vendor-Id",)
+    # Fields written as integers instead of strings, set by the time format
+    INTEGER_FIELDS: frozenset[str] = frozenset()
+
+    def __init__(self, buffer_manager, time_format: str = TIME_TEXT):
+        if time_format not in AVP_TABLES:
+            raise ValueError(
+                f"Unknown time format {time_format!r}, "
+                f"expected one of {list(AVP_TABLES)}"
+            )
         self.buffer_manager = buffer_manager
+        self.time_format = time_format
+        self.avp_table = AVP_TABLES[time_format]
+        self.INTEGER_FIELDS = TIME_FORMAT_INTEGER_FIELDS[time_format]
         self._init_handler()
         self.index = 0
+        # Outcomes of the AVP walk over the file, AVP_PARSED, AVP_UNKNOWN...
+        self.avp_stats = Counter()
 
     def _init_handler(self) -> None:
         """Initialize the handler for parsing AVPs"""
@@ -60,17 +357,21 @@ class EricssonVolteFinal:
     def __post_init__(self):
         """Initialize the memory buffer after dataclass initialization."""
         if self.FIELDNAMES is None:
-            self.FIELDNAMES = ERICSSON_VOLTE_FIELDS
+            self.FIELDNAMES = VOLTE_FIELDS
 
     @staticmethod
-    def parse_block(block: bytes) -> dict[str, int | str | bool]:
+    def parse_block(
+        block: bytes, stats: Counter | None = None, table: dict = AVP_TABLE
+    ) -> dict[str, int | str | bool]:
         """Parse a block using optimized approach."""
         result = {}
         pos = 0
         block_len = len(block)
 
         while pos < block_len:
-            avp_data, offset = EricssonVolteFinal.parse_avp_optimized(block, pos)
+            avp_data, offset = EricssonVolteFinal.parse_avp_optimized(
+                block, pos, stats, table
+            )
             if avp_data:
                 result |= avp_data
             pos += offset
@@ -80,8 +381,92 @@ class EricssonVolteFinal:
         return result
 
     @staticmethod
-    def parse_avp_optimized(block: bytes, start_pos: int) -> Tuple[dict, int]:
-        """Optimized AVP parsing with reduced overhead."""
+    def parse_block_into(
+        block: bytes, add, stats: Counter | None = None, table: dict = AVP_TABLE
+    ) -> None:
+        """Parse a block sending each top-level field to `add(name, value)`.
+
+        Same output as `parse_block` without merging the AVPs into a record dict.
+        """
+        pos = 0
+        block_len = len(block)
+
+        while pos < block_len:
+            avp_data, offset = EricssonVolteFinal.parse_avp_optimized(
+                block, pos, stats, table
+            )
+            for name, value in avp_data.items():
+                add(name, value)
+            pos += offset
+            if offset == 0:  # Prevent infinite loop
+                break
+
+    @staticmethod
+    def parse_avp_optimized(
+        block: bytes,
+        start_pos: int,
+        stats: Counter | None = None,
+        table: dict = AVP_TABLE,
+    ) -> Tuple[dict, int]:
+        """Parse the AVP at start_pos, trusting its length unless its header is corrupt.
+
+        Returns:
+            Tuple of (fields, bytes_consumed), no fields for a skipped AVP
+        """
+        pos = start_pos
+        block_len = len(block)
+
+        if pos + 8 > block_len:
+            # Trailing bytes, too short for an AVP header
+            return {}, block_len - pos
+
+        avp_code, flags_length = AVP_HEADER.unpack_from(block, pos)
+        flags = flags_length >> 24
+        avp_length = flags_length & LENGTH_MASK
+        header_size = 12 if flags & FLAG_VENDOR else 8
+        end = pos + avp_length
+
+        if avp_length < header_size or end > block_len:
+            # Not an AVP header, look for the next known AVP
+            if stats is not None:
+                stats[AVP_RESYNC] += 1
+            return EricssonVolteFinal.resync_avp(block, pos, stats, table)
+
+        # Next AVP after the padding, when the padding is there
+        padded_end = min((end + 3) & ~3, block_len)
+        offset = (padded_end if not any(block[end:padded_end]) else end) - pos
+
+        entry = table.get(avp_code)
+        if entry is None:
+            outcome = AVP_UNKNOWN
+        elif (entry.size and avp_length - header_size != entry.size) or (
+            flags & entry.mask != entry.required
+        ):
+            outcome = AVP_INVALID
+        else:
+            outcome = AVP_PARSED
+        if stats is not None:
+            stats[outcome] += 1
+        if outcome is not AVP_PARSED:
+            return {}, offset
+
+        value_data = block[pos + header_size : end]
+        if entry.parse is None:
+            # Recursive parsing for grouped AVPs
+            nested_avp = EricssonVolteFinal.parse_grouped_avp_optimized(
+                value_data, stats, table
+            )
+            return EricssonVolteFinal.flatten_avp_fast(entry.name, nested_avp), offset
+        return {entry.name: entry.parse(value_data)}, offset
+
+    @staticmethod
+    def resync_avp(
+        block: bytes,
+        start_pos: int,
+        stats: Counter | None = None,
+        table: dict = AVP_TABLE,
+    ) -> Tuple[dict, int]:
+        """Search the next valid known AVP from start_pos, one byte at a time."""
         pos = start_pos
         block_len = len(block)
 
@@ -94,14 +479,14 @@ class EricssonVolteFinal:
                 return {}, block_len - pos
 
             # Parse AVP header
-            avp_code = int.from_bytes(block[i : i + 4], byteorder="big")
+            avp_code, flags_length = AVP_HEADER.unpack_from(block, i)
 
             # Fast lookup - exit early if unknown
-            if not (avp_def := AVP_DB.get(avp_code)):
+            if (entry := table.get(avp_code)) is None:
                 continue
 
-            flags = block[i + 4]
-            avp_length = int.from_bytes(block[i + 5 : i + 8], byteorder="big")
+            flags = flags_length >> 24
+            avp_length = flags_length & LENGTH_MASK
 
             # Validate basic constraints
             if avp_length < 8 or i + avp_length > block_len:
@@ -109,44 +494,26 @@ class EricssonVolteFinal:
 
             # Handle vendor flag
             header_size = 8
-            if flags & 0x80:  # Vendor flag set
+            if flags & FLAG_VENDOR:
                 if avp_length < 12:
                     continue
                 header_size = 12
 
-            # Fast size validation for known types
-            known_size = KNOWN_SIZES.get(avp_def.type)
-            if known_size is not None and avp_length - header_size != known_size:
+            # Size of the fixed-size types and expected flags
+            if entry.size and avp_length - header_size != entry.size:
                 continue
-
-            # Fast flags validation
-            if not EricssonVolteFinal.validate_flags_fast(flags, avp_def.acr_flag):
+            if flags & entry.mask != entry.required:
                 continue
 
-            # Parse value
-            value_start = i + header_size
-            value_end = i + avp_length
-            value_data = block[value_start:value_end]
-
-            # Handle different AVP types
-            if avp_def.type == TYPE_GROUPED:
-                # Recursive parsing for grouped AVPs
-                nested_avp = EricssonVolteFinal.parse_grouped_avp_optimized(value_data)
-                flattened = EricssonVolteFinal.flatten_avp_fast(avp_def.avp, nested_avp)
-                return flattened, avp_length + attempt
-            else:
-                # Parse simple value
-                parsed_value = EricssonVolteFinal.parse_simple_value_fast(
-                    value_data, avp_def.type
-                )
-                return {avp_def.avp: parsed_value}, avp_length + attempt
+            # Found: the walk goes on from this AVP
+            return {}, attempt
 
         # No valid AVP found
         return {}, block_len - pos
 
     @staticmethod
     def validate_flags_fast(flags: int, expected_flags: str | None) -> bool:
-        """Fast flags validation."""
+        """Fast flags validation, `AVP_TABLE` entries hold the same check as masks."""
         if expected_flags is None:
             return True
 
@@ -174,13 +541,17 @@ class EricssonVolteFinal:
         return True
 
     @staticmethod
-    def parse_grouped_avp_optimized(binary_data: bytes) -> dict:
+    def parse_grouped_avp_optimized(
+        binary_data: bytes, stats: Counter | None = None, table: dict = AVP_TABLE
+    ) -> dict:
         """Parse grouped AVP with reduced overhead."""
         result = {}
         pos = 0
 
         while pos < len(binary_data):
-            avp_data, offset = EricssonVolteFinal.parse_avp_optimized(binary_data, pos)
+            avp_data, offset = EricssonVolteFinal.parse_avp_optimized(
+                binary_data, pos, stats, table
+            )
             if avp_data:
                 result |= avp_data
             pos += offset
@@ -213,129 +584,86 @@ class EricssonVolteFinal:
 
     @staticmethod
     def parse_simple_value_fast(binary_view: bytes, avp_type: int) -> str | int:
-        """Fast simple value parsing with optimizations."""
-
-        # String types - optimized path
-        if avp_type in (TYPE_OCTET_STRING, TYPE_UTF8_STRING, TYPE_DIAMETER_IDENTITY):
-            try:
-                # Strip null bytes directly
-                result = binary_view.decode("utf-8")
-                return result.rstrip("\x00") if "\x00" in result else result
-            except UnicodeDecodeError:
-                return binary_view.hex()
-
-        # Time type - optimized path
-        elif avp_type == TYPE_TIME:
-            if len(binary_view) >= 4:
-                seconds = STRUCT_UNSIGNED_32.unpack(binary_view[:4])[0]
-                # Cache the epoch calculation would be even better, but this is still fast
-                return (
-                    EricssonVolteFinal.NTP_EPOCH + timedelta(seconds=seconds)
-                ).strftime("%Y-%m-%d %H:%M:%S")
-            return binary_view.hex()
-
-        # Integer types - direct struct unpack
-        elif avp_type in (TYPE_ENUMERATED, TYPE_INTEGER_32):
-            if len(binary_view) >= 4:
-                return STRUCT_SIGNED_32.unpack(binary_view[:4])[0]
-            return binary_view.hex()
-
-        elif avp_type == TYPE_UNSIGNED_32:
-            if len(binary_view) >= 4:
-                return STRUCT_UNSIGNED_32.unpack(binary_view[:4])[0]
-            return binary_view.hex()
-
-        elif avp_type == TYPE_UNSIGNED_64:
-            if len(binary_view) >= 8:
-                return STRUCT_UNSIGNED_64.unpack(binary_view[:8])[0]
-            return binary_view.hex()
-
-        # Address type - optimized path
-        elif avp_type == TYPE_ADDRESS:
-            if len(binary_view) < 2:
-                return binary_view.hex()
-            family = int.from_bytes(binary_view[:2], "big")
-            address_bytes = binary_view[2:]
-            try:
-                if family == 1 and len(address_bytes) == 4:  # IPv4
-                    return socket.inet_ntoa(address_bytes)
-                elif family == 2 and len(address_bytes) == 16:  # IPv6
-                    return socket.inet_ntop(socket.AF_INET6, address_bytes)
-                else:
-                    return binary_view.decode("utf-8", errors="replace")
-            except (socket.error, UnicodeDecodeError):
-                return binary_view.hex()
-
-        # Fallback
-        else:
-            return binary_view.hex()
+        """Fast simple value parsing, dispatched on the type through `VALUE_PARSERS`."""
+        return VALUE_PARSERS.get(avp_type, parse_hex)(binary_view)
 
     def avps(self) -> Generator[dict[str, int | str | bool], None, None]:
         """Parse all blocks in the binary data"""
-        return (self.parse_block(block) for block in self.blocks())
+        stats = self.avp_stats
+        table = self.avp_table
+        for block in self.blocks():
+            yield self.parse_block(block, stats, table)
+        self.log_avp_stats()
+
+    def parse_columns(self, sink):
+        """Parse all blocks into a columnar sink, yielding once per finished row"""
+        add = sink.add
+        stats = self.avp_stats
+        table = self.avp_table
+        for block in self.blocks():
+            self.parse_block_into(block, add, stats, table)
+            sink.end_row()
+            yield sink.n_rows
+        self.log_avp_stats()
+
+    def log_avp_stats(self) -> None:
+        """Log how the AVPs of the file were walked, at INFO if any was skipped"""
+        log_avp_stats(self.avp_stats)
 
     def blocks(self) -> Generator[bytes, None, None]:
         """Generator to yield sliced blocks from binary data"""
-        idx = 0
-        length = self.length
-        while idx < length:
-            start_idx, stop_idx, error = self.slice_next_block(idx)
+        data = self.binary_data
+        for start, stop, error in diameter_messages(data):
             if not error:
-                yield bytes(self.binary_data[start_idx:stop_idx])
-            idx = stop_idx
+                yield bytes(data[start:stop])
+
+    def record_boundaries(self) -> array:
+        """Offsets of the Diameter messages, see `message_boundaries`"""
+        return message_boundaries(self.binary_data)
 
     def slice_next_block(self, index: int) -> Tuple[int, int, bool]:
         """Parse Diameter header using the same logic as original"""
-        index += 2  # Skip first 2 bytes
-        end_idx = index + EricssonVolteFinal.HEADER_SIZE
-        header = self.binary_data[index:end_idx]
-
-        # Validate minimum length
-        if len(header) < EricssonVolteFinal.HEADER_SIZE:
-            index += len(header)  # Skip this block
-            return index, index, True
-
-        # Unpack all header fields
-        try:
-            (version, msg_len_bytes, flag_int, cmd_bytes, app_id, hbh_id, e2e_id) = (
-                EricssonVolteFinal.DIAMETER_HEADER_FORMAT.unpack(header)
-            )
-        except struct.error as e:
-            import logging
-
-            logging.error(f"Diameter header unpacking failed at index {index}: {e}")
-            return index + len(header), index + len(header), True
-
-        # Convert 24-bit fields
-        msg_length = int.from_bytes(msg_len_bytes)
+        return next_message(self.binary_data, index)
 
-        # Validate version (MUST be 1)
-        if version != 1:
-            return index + len(header), index + len(header), True
+    def stream(self, pbar_position=None, show_progress=True):
+        """Lazily yield the parsed AVPs of the VoLTE data, one record at a time.
 
-        # Validate message type
-        if cmd_bytes != b"\x00\x01\x0f":
-            return index + len(header), index + len(header), True
-
-        start_idx = index + EricssonVolteFinal.HEADER_SIZE
-        index += msg_length
-        return start_idx, index, False
+        Args:
+            pbar_position: Position for nested progress bar (for hierarchical display)
+            show_progress: Whether to show progress bar
+        """
+        if show_progress:
+            return tqdm(
+                self.avps(),
+                desc="  ↳ Parsing AVPs (final optimized)",
+                unit=" block",
+                leave=False,
+                position=pbar_position,
+                colour="cyan",
+            )
+        return self.avps()
 
-    def process(self, pbar_position=None, show_progress=True):
-        """Process the VoLTE data and return a list of parsed AVPs."""
+    def stream_columns(self, sink, pbar_position=None, show_progress=True):
+        """Progress-bar wrapped `parse_columns`, see `stream`"""
         if show_progress:
-            return list(
-                tqdm(
-                    self.avps(),
-                    desc="  ↳ Parsing AVPs (final optimized)",
-                    unit=" block",
-                    leave=False,
-                    position=pbar_position,
-                    colour="cyan",
-                )
+            return tqdm(
+                self.parse_columns(sink),
+                desc="  ↳ Parsing AVPs (final optimized)",
+                unit=" block",
+                leave=False,
+                position=pbar_position,
+                colour="cyan",
             )
-        else:
-            return list(self.avps())
+        return self.parse_columns(sink)
+
+    def process(self, pbar_position=None, show_progress=True):
+        """Process the VoLTE data and return a list of parsed AVPs.
+
+        Args:
+            pbar_position: Position for nested progress bar (for hierarchical display)
+            show_progress: Whether to show progress bar
+        """
+        return list(self.stream(pbar_position, show_progress))
 
     @staticmethod
     def insert_vendor_info(blocks):
@@ -348,3 +676,10 @@ class EricssonVolteFinal:
     def transform_func(blocks):
         """Transform function that applies vendor information enrichment."""
         return EricssonVolteFinal.insert_vendor_info(blocks)
+
+    @staticmethod
+    def transform_columns(sink) -> None:
+        """Columnar `transform_func`, applied to each batch before it is written"""
+        from teleparser.decoders.ericsson.volte import EricssonVolte
+
+        EricssonVolte.insert_vendor_columns(sink)
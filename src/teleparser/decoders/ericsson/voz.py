@@ -1,26 +1,28 @@
-from typing import Mapping
 from teleparser.decoders.ericsson import modules
 
 
 class EricssonVoz:
-    """Tag-Length-Value object for BER encoding for Ericsson Common Charging Output"""
+    """Tag-Length-Value object for BER encoding for Ericsson Common Charging Output
+
+    The schema is a compiled table of `modules` (see `modules.compile_schema`), the
+    root `CallDataRecord` table when None. An unknown tag raises KeyError. The value
+    may be a view of the data, it is copied to bytes for the decode functions only.
+    """
+
+    __slots__ = ("length", "name", "value", "schema")
 
     def __init__(
         self,
         tag_number: int,
-        value: bytes,
-        schema: Mapping = None,
+        value: bytes | memoryview,
+        schema: tuple = None,
     ):
         self.length = len(value)
         if schema is None:  # root
-            tag_mapping = modules.CallDataRecord[tag_number]
-        else:
-            tag_mapping = schema[tag_number]
-        if isinstance(tag_mapping["type"], dict):
-            self.name = tag_mapping["tag"]
-            self.value = tag_mapping["name"]
-            self.schema = tag_mapping["type"]
-        else:
-            self.name = tag_mapping["name"]
-            self.value = getattr(tag_mapping["type"](value), "value")
-            self.schema = {}
+            schema = modules.CALL_DATA_RECORD
+        try:
+            self.name, constant, decode, self.schema = schema[tag_number]
+        except (IndexError, TypeError):
+            # Out of the table or an unused tag number
+            raise KeyError(tag_number) from None
+        self.value = constant if decode is None else decode(bytes(value))
@@ -1,6047 +1,302 @@
-SPECIFICATION = {'IMS-R8-2009-03': {'extensibility-implied': False,
-                    'imports': {},
-                    'object-classes': {},
-                    'object-sets': {},
-                    'tags': 'IMPLICIT',
-                    'types': {'ACRInterimLost': {'type': 'ENUMERATED',
-                                                 'values': [('no', 0),
-                                                            ('yes', 1),
-                                                            ('unknown', 2)]},
-                              'AD-Information': {'members': [{'name': 'id-of-play',
-                                                              'optional': True,
-                                                              'tag': {'number': 0},
-                                                              'type': 'INTEGER'},
-                                                             {'name': 'type-of-charging',
-                                                              'optional': True,
-                                                              'tag': {'number': 1},
-                                                              'type': 'Type-Of-Charging'},
-                                                             {'name': 'level',
-                                                              'optional': True,
-                                                              'tag': {'number': 2},
-                                                              'type': 'Level'},
-                                                             {'name': 'strategy-of-play',
-                                                              'optional': True,
-                                                              'tag': {'number': 3},
-                                                              'type': 'INTEGER'}],
-                                                 'type': 'SET'},
-                              'AGCFRecord': {'members': [{'name': 'recordType',
-                                                          'optional': True,
-                                                          'tag': {'number': 0},
-                                                          'type': 'RecordType'},
-                                                         {'name': 'retransmission',
-                                                          'optional': True,
-                                                          'tag': {'number': 1},
-                                                          'type': 'NULL'},
-                                                         {'name': 'sIP-Method',
-                                                          'optional': True,
-                                                          'tag': {'number': 2},
-                                                          'type': 'SIP-Method'},
-                                                         {'name': 'role-of-Node',
-                                                          'optional': True,
-                                                          'tag': {'number': 3},
-                                                          'type': 'Role-of-Node'},
-                                                         {'name': 'nodeAddress',
-                                                          'optional': True,
-                                                          'tag': {'number': 4},
-                                                          'type': 'NodeAddress'},
-                                                         {'name': 'session-Id',
-                                                          'optional': True,
-                                                          'tag': {'number': 5},
-                                                          'type': 'Session-Id'},
-                                                         {'name': 'list-Of-Calling-Party-Address',
-                                                          'optional': True,
-                                                          'tag': {'number': 6},
-                                                          'type': 'ListOfInvolvedParties'},
-                                                         {'name': 'called-Party-Address',
-                                                          'optional': True,
-                                                          'tag': {'number': 7},
-                                                          'type': 'InvolvedParty'},
-                                                         {'name': 'serviceRequestTimeStamp',
-                                                          'optional': True,
-                                                          'tag': {'number': 9},
-                                                          'type': 'TimeStamp'},
-                                                         {'name': 'serviceDeliveryStartTimeStamp',
-                                                          'optional': True,
-                                                          'tag': {'number': 10},
-                                                          'type': 'TimeStamp'},
-                                                         {'name': 'serviceDeliveryEndTimeStamp',
-                                                          'optional': True,
-                                                          'tag': {'number': 11},
-                                                          'type': 'TimeStamp'},
-                                                         {'name': 'recordOpeningTime',
-                                                          'optional': True,
-                                                          'tag': {'number': 12},
-                                                          'type': 'TimeStamp'},
-                                                         {'name': 'recordClosureTime',
-                                                          'optional': True,
-                                                          'tag': {'number': 13},
-                                                          'type': 'TimeStamp'},
-                                                         {'name': 'localRecordSequenceNumber',
-                                                          'optional': True,
-                                                          'tag': {'number': 15},
-                                                          'type': 'LocalSequenceNumber'},
-                                                         {'name': 'recordSequenceNumber',
-                                                          'optional': True,
-                                                          'tag': {'number': 16},
-                                                          'type': 'INTEGER'},
-                                                         {'name': 'causeForRecordClosing',
-                                                          'optional': True,
-                                                          'tag': {'number': 17},
-                                                          'type': 'CauseForRecordClosing'},
-                                                         {'name': 'incomplete-CDR-Indication',
-                                                          'optional': True,
-                                                          'tag': {'number': 18},
-                                                          'type': 'Incomplete-CDR-Indication'},
-                                                         {'name': 'iMS-Charging-Identifier',
-                                                          'optional': True,
-                                                          'tag': {'number': 19},
-                                                          'type': 'IMS-Charging-Identifier'},
-                                                         {'name': 'serviceReasonReturnCode',
-                                                          'optional': True,
-                                                          'tag': {'number': 23},
-                                                          'type': 'UTF8String'},
-                                                         {'name': 'duration',
-                                                          'optional': True,
-                                                          'tag': {'number': 200},
-                                                          'type': 'INTEGER'},
-                                                         {'name': 'sCSCF-Bypass-State',
-                                                          'optional': True,
-                                                          'tag': {'number': 204},
-                                                          'type': 'INTEGER'},
-                                                         {'name': 'session-Priority',
-                                                          'optional': True,
-                                                          'tag': {'number': 205},
-                                                          'type': 'Session-Priority'},
-                                                         {'name': 'accounting-record-type',
-                                                          'optional': True,
-                                                          'tag': {'number': 227},
-                                                          'type': 'INTEGER'},
-                                                         {'name': 'charge-category',
-                                                          'optional': True,
-                                                          'tag': {'number': 228},
-                                                          'type': 'INTEGER'},
-                                                         {'name': 'qos-Statistics',
-                                                          'optional': True,
-                                                          'tag': {'number': 412},
-                                                          'type': 'UTF8String'},
-                                                         {'name': 'interOperatorIdentifiers',
-                                                          'optional': True,
-                                                          'tag': {'number': 14},
-                                                          'type': 'InterOperatorIdentifiers'},
-                                                         {'name': 'accessNetworkInformation',
-                                                          'optional': True,
-                                                          'tag': {'number': 29},
-                                                          'type': 'OCTET '
-                                                                  'STRING'},
-                                                         {'name': 'trunkGroupID',
-                                                          'optional': True,
-                                                          'tag': {'number': 80},
-                                                          'type': 'TrunkGroupID'},
-                                                         {'name': 'charged-Party',
-                                                          'optional': True,
-                                                          'tag': {'number': 156},
-                                                          'type': 'InvolvedParty'},
-                                                         {'name': 'dialled-Party-Address',
-                                                          'optional': True,
-                                                          'tag': {'number': 203},
-                                                          'type': 'InvolvedParty'},
-                                                         {'name': 'business-Trunking-Indication',
-                                                          'optional': True,
-                                                          'tag': {'number': 434},
-                                                          'type': 'Business-Trunking-Indication'},
-                                                         {'name': 'private-TrunkGroupID',
-                                                          'optional': True,
-                                                          'tag': {'number': 243},
-                                                          'type': 'TrunkGroupIBCF'}],
-                                             'type': 'SET'},
-                              'AIN-Information': {'members': [{'name': 'amaslpid',
-                                                               'optional': True,
-                                                               'tag': {'number': 0},
-                                                               'type': 'UTF8String'}],
-                                                  'type': 'SET'},
-                              'ALU-Call-Direction': {'type': 'ENUMERATED',
-                                                     'values': [('origination',
-                                                                 0),
-                                                                ('termination',
-                                                                 1)]},
-                              'ALU-Call-Type': {'type': 'ENUMERATED',
-                                                'values': [('inter-lata-call',
-                                                            0),
-                                                           ('intra-lata-call',
-                                                            1),
-                                                           ('local-call', 2),
-                                                           ('emergency-type1',
-                                                            3),
-                                                           ('local-operator-call',
-                                                            4),
-                                                           ('long-distance-oc',
-                                                            5),
-                                                           ('intl-operator-assist',
-                                                            6),
-                                                           ('international-oc',
-                                                            7),
-                                                           ('fgd', 8),
-                                                           ('fgb', 9),
-                                                           ('direct-international',
-                                                            10),
-                                                           ('national', 11),
-                                                           ('nll', 12),
-                                                           ('toll-free', 13),
-                                                           ('directory-assistance',
-                                                            14),
-                                                           ('surcharge-applies',
-                                                            15),
-                                                           ('cbfa1', 16),
-                                                           ('cbfa2', 17),
-                                                           ('cbfa3', 18),
-                                                           ('emergency-type2',
-                                                            19),
-                                                           ('emergency-type3',
-                                                            20),
-                                                           ('emergency-type4',
-                                                            21),
-                                                           ('emergency-type5',
-                                                            22),
-                                                           ('pdp-intercom', 23),
-                                                           ('invalid-dest', 24),
-                                                           ('idddcarrier', 25),
-                                                           ('nocarrier', 26),
-                                                           ('nodialedcarrier',
-                                                            27),
-                                                           ('calltypea', 28),
-                                                           ('calltypeb', 29)]},
-                              'ALU-Mobile-ID': {'members': [{'name': 'calling-imsi',
-                                                             'optional': True,
-                                                             'tag': {'number': 0},
-                                                             'type': 'UTF8String'},
-                                                            {'name': 'calling-min',
-                                                             'optional': True,
-                                                             'tag': {'number': 1},
-                                                             'type': 'UTF8String'},
-                                                            {'name': 'called-imsi',
-                                                             'optional': True,
-                                                             'tag': {'number': 2},
-                                                             'type': 'UTF8String'},
-                                                            {'name': 'called-min',
-                                                             'optional': True,
-                                                             'tag': {'number': 3},
-                                                             'type': 'UTF8String'}],
-                                                'type': 'SET'},
-                              'ALUCTSRecord': {'members': [{'name': 'recordType',
-                                                            'optional': True,
-                                                            'tag': {'number': 0},
-                                                            'type': 'RecordType'},
-                                                           {'name': 'retransmission',
-                                                            'optional': True,
-                                                            'tag': {'number': 1},
-                                                            'type': 'NULL'},
-                                                           {'name': 'sIP-Method',
-                                                            'optional': True,
-                                                            'tag': {'number': 2},
-                                                            'type': 'SIP-Method'},
-                                                           {'name': 'role-of-Node',
-                                                            'optional': True,
-                                                            'tag': {'number': 3},
-                                                            'type': 'Role-of-Node'},
-                                                           {'name': 'nodeAddress',
-                                                            'optional': True,
-                                                            'tag': {'number': 4},
-                                                            'type': 'NodeAddress'},
-                                                           {'name': 'session-Id',
-                                                            'optional': True,
-                                                            'tag': {'number': 5},
-                                                            'type': 'Session-Id'},
-                                                           {'name': 'list-Of-Calling-Party-Address',
-                                                            'optional': True,
-                                                            'tag': {'number': 6},
-                                                            'type': 'ListOfInvolvedParties'},
-                                                           {'name': 'called-Party-Address',
-                                                            'optional': True,
-                                                            'tag': {'number': 7},
-                                                            'type': 'InvolvedParty'},
-                                                           {'name': 'serviceRequestTimeStamp',
-                                                            'optional': True,
-                                                            'tag': {'number': 9},
-                                                            'type': 'TimeStamp'},
-                                                           {'name': 'serviceDeliveryStartTimeStamp',
-                                                            'optional': True,
-                                                            'tag': {'number': 10},
-                                                            'type': 'TimeStamp'},
-                                                           {'name': 'serviceDeliveryEndTimeStamp',
-                                                            'optional': True,
-                                                            'tag': {'number': 11},
-                                                            'type': 'TimeStamp'},
-                                                           {'name': 'recordOpeningTime',
-                                                            'optional': True,
-                                                            'tag': {'number': 12},
-                                                            'type': 'TimeStamp'},
-                                                           {'name': 'recordClosureTime',
-                                                            'optional': True,
-                                                            'tag': {'number': 13},
-                                                            'type': 'TimeStamp'},
-                                                           {'name': 'interOperatorIdentifiers',
-                                                            'optional': True,
-                                                            'tag': {'number': 14},
-                                                            'type': 'InterOperatorIdentifierlist'},
-                                                           {'name': 'localRecordSequenceNumber',
-                                                            'optional': True,
-                                                            'tag': {'number': 15},
-                                                            'type': 'LocalSequenceNumber'},
-                                                           {'name': 'recordSequenceNumber',
-                                                            'optional': True,
-                                                            'tag': {'number': 16},
-                                                            'type': 'INTEGER'},
-                                                           {'name': 'causeForRecordClosing',
-                                                            'optional': True,
-                                                            'tag': {'number': 17},
-                                                            'type': 'CauseForRecordClosing'},
-                                                           {'name': 'incomplete-CDR-Indication',
-                                                            'optional': True,
-                                                            'tag': {'number': 18},
-                                                            'type': 'Incomplete-CDR-Indication'},
-                                                           {'name': 'iMS-Charging-Identifier',
-                                                            'optional': True,
-                                                            'tag': {'number': 19},
-                                                            'type': 'IMS-Charging-Identifier'},
-                                                           {'element': {'type': 'Media-Components-List'},
-                                                            'name': 'list-Of-SDP-Media-Components',
-                                                            'optional': True,
-                                                            'tag': {'number': 21},
-                                                            'type': 'SEQUENCE '
-                                                                    'OF'},
-                                                           {'name': 'gGSNaddress',
-                                                            'optional': True,
-                                                            'tag': {'number': 22},
-                                                            'type': 'NodeAddress'},
-                                                           {'name': 'serviceReasonReturnCode',
-                                                            'optional': True,
-                                                            'tag': {'number': 23},
-                                                            'type': 'UTF8String'},
-                                                           {'element': {'type': 'MessageBody'},
-                                                            'name': 'list-Of-Message-Bodies',
-                                                            'optional': True,
-                                                            'tag': {'number': 24},
-                                                            'type': 'SEQUENCE '
-                                                                    'OF'},
-                                                           {'name': 'recordExtensions',
-                                                            'optional': True,
-                                                            'tag': {'number': 25},
-                                                            'type': 'ManagementExtensions'},
-                                                           {'name': 'expiresInformation',
-                                                            'optional': True,
-                                                            'tag': {'number': 26},
-                                                            'type': 'INTEGER'},
-                                                           {'name': 'event',
-                                                            'optional': True,
-                                                            'tag': {'number': 28},
-                                                            'type': 'UTF8String'},
-                                                           {'name': 'accessNetworkInformation',
-                                                            'optional': True,
-                                                            'tag': {'number': 29},
-                                                            'type': 'OCTET '
-                                                                    'STRING'},
-                                                           {'name': 'serviceContextID',
-                                                            'optional': True,
-                                                            'tag': {'number': 30},
-                                                            'type': 'ServiceContextID'},
-                                                           {'element': {'type': 'SubscriptionID'},
-                                                            'name': 'list-of-subscription-ID',
-                                                            'optional': True,
-                                                            'tag': {'number': 31},
-                                                            'type': 'SEQUENCE '
-                                                                    'OF'},
-                                                           {'element': {'type': 'Early-Media-Components-List'},
-                                                            'name': 'list-Of-Early-SDP-Media-Components',
-                                                            'optional': True,
-                                                            'tag': {'number': 32},
-                                                            'type': 'SEQUENCE '
-                                                                    'OF'},
-                                                           {'name': 'iMSCommunicationServiceIdentifier',
-                                                            'optional': True,
-                                                            'tag': {'number': 33},
-                                                            'type': 'IMSCommunicationServiceIdentifier'},
-                                                           {'name': 'numberPortabilityRouting',
-                                                            'optional': True,
-                                                            'tag': {'number': 34},
-                                                            'type': 'NumberPortabilityRouting'},
-                                                           {'name': 'carrierSelectRouting',
-                                                            'optional': True,
-                                                            'tag': {'number': 35},
-                                                            'type': 'CarrierSelectRouting'},
-                                                           {'element': {'type': 'ServiceSpecificInfo'},
-                                                            'name': 'serviceSpecificInfo',
-                                                            'optional': True,
-                                                            'tag': {'number': 100},
-                                                            'type': 'SEQUENCE '
-                                                                    'OF'},
-                                                           {'name': 'requested-Party-Address',
-                                                            'optional': True,
-                                                            'tag': {'number': 101},
-                                                            'type': 'InvolvedParty'},
-                                                           {'name': 'list-Of-Called-Asserted-Identity',
-                                                            'optional': True,
-                                                            'tag': {'number': 102},
-                                                            'type': 'ListOfInvolvedParties'},
-                                                           {'name': 'alternateChargedPartyAddress',
-                                                            'optional': True,
-                                                            'tag': {'number': 103},
-                                                            'type': 'UTF8String'},
-                                                           {'name': 'duration',
-                                                            'optional': True,
-                                                            'tag': {'number': 200},
-                                                            'type': 'INTEGER'},
-                                                           {'element': {'type': 'Supplementary-Service'},
-                                                            'name': 'supplementary-Service-Info',
-                                                            'optional': True,
-                                                            'tag': {'number': 280},
-                                                            'type': 'SEQUENCE '
-                                                                    'OF'},
-                                                           {'name': 'call-direction',
-                                                            'optional': True,
-                                                            'tag': {'number': 281},
-                                                            'type': 'ALU-Call-Direction'},
-                                                           {'name': 'call-type',
-                                                            'optional': True,
-                                                            'tag': {'number': 282},
-                                                            'type': 'ALU-Call-Type'},
-                                                           {'name': 'mobile-id',
-                                                            'optional': True,
-                                                            'tag': {'number': 283},
-                                                            'type': 'ALU-Mobile-ID'},
-                                                           {'name': 'ue-local-timezone-offset',
-                                                            'optional': True,
-                                                            'tag': {'number': 284},
-                                                            'type': 'UTF8String'},
-                                                           {'name': 'mac-id',
-                                                            'optional': True,
-                                                            'tag': {'number': 285},
-                                                            'type': 'UTF8String'},
-                                                           {'name': 'ain-information',
-                                                            'optional': True,
-                                                            'tag': {'number': 286},
-                                                            'type': 'AIN-Information'}],
-                                               'type': 'SET'},
-                              'AOCParameters': {'members': [{'name': 'e1',
-                                                             'optional': True,
-                                                             'restricted-to': [(0,
-                                                                                8191)],
-                                                             'tag': {'number': 0},
-                                                             'type': 'INTEGER'},
-                                                            {'name': 'e2',
-                                                             'optional': True,
-                                                             'restricted-to': [(0,
-                                                                                8191)],
-                                                             'tag': {'number': 1},
-                                                             'type': 'INTEGER'},
-                                                            {'name': 'e3',
-                                                             'optional': True,
-                                                             'restricted-to': [(0,
-                                                                                8191)],
-                                                             'tag': {'number': 2},
-                                                             'type': 'INTEGER'},
-                                                            {'name': 'e4',
-                                                             'optional': True,
-                                                             'restricted-to': [(0,
-                                                                                8191)],
-                                                             'tag': {'number': 3},
-                                                             'type': 'INTEGER'},
-                                                            {'name': 'e5',
-                                                             'optional': True,
-                                                             'restricted-to': [(0,
-                                                                                8191)],
-                                                             'tag': {'number': 4},
-                                                             'type': 'INTEGER'},
-                                                            {'name': 'e6',
-                                                             'optional': True,
-                                                             'restricted-to': [(0,
-                                                                                8191)],
-                                                             'tag': {'number': 5},
-                                                             'type': 'INTEGER'},
-                                                            {'name': 'e7',
-                                                             'optional': True,
-                                                             'restricted-to': [(0,
-                                                                                8191)],
-                                                             'tag': {'number': 6},
-                                                             'type': 'INTEGER'}],
-                                                'type': 'SEQUENCE'},
-                              'ATSRecord': {'members': [{'name': 'recordType',
-                                                         'optional': True,
-                                                         'tag': {'number': 0},
-                                                         'type': 'RecordType'},
-                                                        {'name': 'retransmission',
-                                                         'optional': True,
-                                                         'tag': {'number': 1},
-                                                         'type': 'NULL'},
-                                                        {'name': 'sIP-Method',
-                                                         'optional': True,
-                                                         'tag': {'number': 2},
-                                                         'type': 'SIP-Method'},
-                                                        {'name': 'role-of-Node',
-                                                         'optional': True,
-                                                         'tag': {'number': 3},
-                                                         'type': 'Role-of-Node'},
-                                                        {'name': 'nodeAddress',
-                                                         'optional': True,
-                                                         'tag': {'number': 4},
-                                                         'type': 'NodeAddress'},
-                                                        {'name': 'session-Id',
-                                                         'optional': True,
-                                                         'tag': {'number': 5},
-                                                         'type': 'Session-Id'},
-                                                        {'name': 'list-Of-Calling-Party-Address',
-                                                         'optional': True,
-                                                         'tag': {'number': 6},
-                                                         'type': 'ListOfInvolvedParties'},
-                                                        {'name': 'called-Party-Address',
-                                                         'optional': True,
-                                                         'tag': {'number': 7},
-                                                         'type': 'InvolvedParty'},
-                                                        {'name': 'serviceRequestTimeStamp',
-                                                         'optional': True,
-                                                         'tag': {'number': 9},
-                                                         'type': 'TimeStamp'},
-                                                        {'name': 'serviceDeliveryStartTimeStamp',
-                                                         'optional': True,
-                                                         'tag': {'number': 10},
-                                                         'type': 'TimeStamp'},
-                                                        {'name': 'serviceDeliveryEndTimeStamp',
-                                                         'optional': True,
-                                                         'tag': {'number': 11},
-                                                         'type': 'TimeStamp'},
-                                                        {'name': 'recordOpeningTime',
-                                                         'optional': True,
-                                                         'tag': {'number': 12},
-                                                         'type': 'TimeStamp'},
-                                                        {'name': 'recordClosureTime',
-                                                         'optional': True,
-                                                         'tag': {'number': 13},
-                                                         'type': 'TimeStamp'},
-                                                        {'name': 'interOperatorIdentifiers',
-                                                         'optional': True,
-                                                         'tag': {'number': 14},
-                                                         'type': 'InterOperatorIdentifierlist'},
-                                                        {'name': 'localRecordSequenceNumber',
-                                                         'optional': True,
-                                                         'tag': {'number': 15},
-                                                         'type': 'LocalSequenceNumber'},
-                                                        {'name': 'recordSequenceNumber',
-                                                         'optional': True,
-                                                         'tag': {'number': 16},
-                                                         'type': 'INTEGER'},
-                                                        {'name': 'causeForRecordClosing',
-                                                         'optional': True,
-                                                         'tag': {'number': 17},
-                                                         'type': 'CauseForRecordClosing'},
-                                                        {'name': 'incomplete-CDR-Indication',
-                                                         'optional': True,
-                                                         'tag': {'number': 18},
-                                                         'type': 'Incomplete-CDR-Indication'},
-                                                        {'name': 'iMS-Charging-Identifier',
-                                                         'optional': True,
-                                                         'tag': {'number': 19},
-                                                         'type': 'IMS-Charging-Identifier'},
-                                                        {'element': {'type': 'Media-Components-List'},
-                                                         'name': 'list-Of-SDP-Media-Components',
-                                                         'optional': True,
-                                                         'tag': {'number': 21},
-                                                         'type': 'SEQUENCE OF'},
-                                                        {'name': 'gGSNaddress',
-                                                         'optional': True,
-                                                         'tag': {'number': 22},
-                                                         'type': 'NodeAddress'},
-                                                        {'name': 'serviceReasonReturnCode',
-                                                         'optional': True,
-                                                         'tag': {'number': 23},
-                                                         'type': 'UTF8String'},
-                                                        {'element': {'type': 'MessageBody'},
-                                                         'name': 'list-Of-Message-Bodies',
-                                                         'optional': True,
-                                                         'tag': {'number': 24},
-                                                         'type': 'SEQUENCE OF'},
-                                                        {'name': 'recordExtensions',
-                                                         'optional': True,
-                                                         'tag': {'number': 25},
-                                                         'type': 'ManagementExtensions'},
-                                                        {'name': 'expiresInformation',
-                                                         'optional': True,
-                                                         'tag': {'number': 26},
-                                                         'type': 'INTEGER'},
-                                                        {'name': 'event',
-                                                         'optional': True,
-                                                         'tag': {'number': 28},
-                                                         'type': 'UTF8String'},
-                                                        {'name': 'accessNetworkInformation',
-                                                         'optional': True,
-                                                         'tag': {'number': 29},
-                                                         'type': 'OCTET '
-                                                                 'STRING'},
-                                                        {'name': 'serviceContextID',
-                                                         'optional': True,
-                                                         'tag': {'number': 30},
-                                                         'type': 'ServiceContextID'},
-                                                        {'element': {'type': 'SubscriptionID'},
-                                                         'name': 'list-of-subscription-ID',
-                                                         'optional': True,
-                                                         'tag': {'number': 31},
-                                                         'type': 'SEQUENCE OF'},
-                                                        {'element': {'type': 'Early-Media-Components-List'},
-                                                         'name': 'list-Of-Early-SDP-Media-Components',
-                                                         'optional': True,
-                                                         'tag': {'number': 32},
-                                                         'type': 'SEQUENCE OF'},
-                                                        {'name': 'iMSCommunicationServiceIdentifier',
-                                                         'optional': True,
-                                                         'tag': {'number': 33},
-                                                         'type': 'IMSCommunicationServiceIdentifier'},
-                                                        {'name': 'numberPortabilityRouting',
-                                                         'optional': True,
-                                                         'tag': {'number': 34},
-                                                         'type': 'NumberPortabilityRouting'},
-                                                        {'name': 'carrierSelectRouting',
-                                                         'optional': True,
-                                                         'tag': {'number': 35},
-                                                         'type': 'CarrierSelectRouting'},
-                                                        {'name': 'serviceRequestTimeStampFraction',
-                                                         'optional': True,
-                                                         'tag': {'number': 37},
-                                                         'type': 'Milliseconds'},
-                                                        {'name': 'serviceDeliveryStartTimeStampFraction',
-                                                         'optional': True,
-                                                         'tag': {'number': 38},
-                                                         'type': 'Milliseconds'},
-                                                        {'name': 'serviceDeliveryEndTimeStampFraction',
-                                                         'optional': True,
-                                                         'tag': {'number': 39},
-                                                         'type': 'Milliseconds'},
-                                                        {'name': 'subscriberEquipmentNumber',
-                                                         'optional': True,
-                                                         'tag': {'number': 58},
-                                                         'type': 'SubscriberEquipmentNumber'},
-                                                        {'element': {'type': 'ServiceSpecificInfo'},
-                                                         'name': 'serviceSpecificInfo',
-                                                         'optional': True,
-                                                         'tag': {'number': 100},
-                                                         'type': 'SEQUENCE OF'},
-                                                        {'name': 'requested-Party-Address',
-                                                         'optional': True,
-                                                         'tag': {'number': 101},
-                                                         'type': 'InvolvedParty'},
-                                                        {'name': 'list-Of-Called-Asserted-Identity',
-                                                         'optional': True,
-                                                         'tag': {'number': 102},
-                                                         'type': 'ListOfInvolvedParties'},
-                                                        {'name': 'alternateChargedPartyAddress',
-                                                         'optional': True,
-                                                         'tag': {'number': 103},
-                                                         'type': 'UTF8String'},
-                                                        {'name': 'initialIMS-Charging-Identifier',
-                                                         'optional': True,
-                                                         'tag': {'number': 105},
-                                                         'type': 'IMS-Charging-Identifier'},
-                                                        {'name': 'duration',
-                                                         'optional': True,
-                                                         'tag': {'number': 200},
-                                                         'type': 'INTEGER'},
-                                                        {'name': 'origin-Callee-Party-Address',
-                                                         'optional': True,
-                                                         'tag': {'number': 202},
-                                                         'type': 'InvolvedParty'},
-                                                        {'name': 'dialled-Party-Address',
-                                                         'optional': True,
-                                                         'tag': {'number': 203},
-                                                         'type': 'InvolvedParty'},
-                                                        {'name': 'ringing-Duration',
-                                                         'optional': True,
-                                                         'tag': {'number': 204},
-                                                         'type': 'UnsignedInter32'},
-                                                        {'name': 'carrier-Identification-Code',
-                                                         'optional': True,
-                                                         'tag': {'number': 206},
-                                                         'type': 'GraphicString'},
-                                                        {'name': 'abnormal-Finish-Info',
-                                                         'optional': True,
-                                                         'tag': {'number': 207},
-                                                         'type': 'Abnormal-Finish-Info'},
-                                                        {'name': 'np-Route-Number',
-                                                         'optional': True,
-                                                         'tag': {'number': 211},
-                                                         'type': 'OCTET '
-                                                                 'STRING'},
-                                                        {'name': 'pbxaddress',
-                                                         'optional': True,
-                                                         'tag': {'number': 212},
-                                                         'type': 'GraphicString'},
-                                                        {'element': {'type': 'Service-Identifier'},
-                                                         'name': 'serviceIdentifier',
-                                                         'optional': True,
-                                                         'tag': {'number': 213},
-                                                         'type': 'SEQUENCE OF'},
-                                                        {'name': 'diversionreason',
-                                                         'optional': True,
-                                                         'tag': {'number': 214},
-                                                         'type': 'DiversionReason'},
-                                                        {'name': 'diversioncount',
-                                                         'optional': True,
-                                                         'tag': {'number': 215},
-                                                         'type': 'INTEGER'},
-                                                        {'name': 'chargingCategory',
-                                                         'optional': True,
-                                                         'tag': {'number': 216},
-                                                         'type': 'ChargingCategory'},
-                                                        {'name': 'serverUserType',
-                                                         'optional': True,
-                                                         'tag': {'number': 217},
-                                                         'type': 'INTEGER'},
-                                                        {'name': 'privateNetworkIndication',
-                                                         'optional': True,
-                                                         'tag': {'number': 218},
-                                                         'type': 'INTEGER'},
-                                                        {'name': 'related-call-reference',
-                                                         'optional': True,
-                                                         'tag': {'number': 220},
-                                                         'type': 'UTF8String'},
-                                                        {'name': 'vmsc-id',
-                                                         'optional': True,
-                                                         'tag': {'number': 221},
-                                                         'type': 'UTF8String'},
-                                                        {'name': 'call-property',
-                                                         'optional': True,
-                                                         'tag': {'number': 222},
-                                                         'type': 'INTEGER'},
-                                                        {'name': 'tariffPulses',
-                                                         'optional': True,
-                                                         'tag': {'number': 226},
-                                                         'type': 'INTEGER'},
-                                                        {'name': 'accounting-record-type',
-                                                         'optional': True,
-                                                         'tag': {'number': 227},
-                                                         'type': 'INTEGER'},
-                                                        {'name': 'groupID',
-                                                         'optional': True,
-                                                         'tag': {'number': 230},
-                                                         'type': 'UnsignedInter32'},
-                                                        {'name': 'privateNumber',
-                                                         'optional': True,
-                                                         'tag': {'number': 231},
-                                                         'type': 'UTF8String'},
-                                                        {'name': 'vPNCallProperty',
-                                                         'optional': True,
-                                                         'tag': {'number': 232},
-                                                         'type': 'VPNCallProperty'},
-                                                        {'name': 'sDP-Media-Identifier',
-                                                         'optional': True,
-                                                         'tag': {'number': 233},
-                                                         'type': 'SDP-Media-Identifier'},
-                                                        {'name': 'rst-information',
-                                                         'optional': True,
-                                                         'tag': {'number': 234},
-                                                         'type': 'RST-Information'},
-                                                        {'name': 'msc-number',
-                                                         'optional': True,
-                                                         'tag': {'number': 235},
-                                                         'type': 'UTF8String'},
-                                                        {'name': 'vlr-number',
-                                                         'optional': True,
-                                                         'tag': {'number': 236},
-                                                         'type': 'UTF8String'},
-                                                        {'name': 'calling-User-Type',
-                                                         'optional': True,
-                                                         'tag': {'number': 239},
-                                                         'type': 'INTEGER'},
-                                                        {'name': 'first-level-bill-group',
-                                                         'optional': True,
-                                                         'tag': {'number': 250},
-                                                         'type': 'INTEGER'},
-                                                        {'name': 'second-level-bill-group',
-                                                         'optional': True,
-                                                         'tag': {'number': 251},
-                                                         'type': 'INTEGER'},
-                                                        {'name': 'onlineChargingFlag',
-                                                         'optional': True,
-                                                         'tag': {'number': 150},
-                                                         'type': 'Online-Charging-Type'},
-                                                        {'name': 'call-description',
-                                                         'optional': True,
-                                                         'tag': {'number': 152},
-                                                         'type': 'Call-Description'},
-                                                        {'name': 'group-number',
-                                                         'optional': True,
-                                                         'tag': {'number': 153},
-                                                         'type': 'UTF8String'},
-                                                        {'name': 'short-number',
-                                                         'optional': True,
-                                                         'tag': {'number': 154},
-                                                         'type': 'UTF8String'},
-                                                        {'element': {'type': 'Service-Indetity'},
-                                                         'name': 'service-indetity-list',
-                                                         'optional': True,
-                                                         'tag': {'number': 155},
-                                                         'type': 'SEQUENCE OF'},
-                                                        {'name': 'charged-party',
-                                                         'optional': True,
-                                                         'tag': {'number': 156},
-                                                         'type': 'InvolvedParty'},
-                                                        {'name': 'osg-bill-indication',
-                                                         'optional': True,
-                                                         'tag': {'number': 308},
-                                                         'type': 'INTEGER'},
-                                                        {'name': 'subgroup-id',
-                                                         'optional': True,
-                                                         'tag': {'number': 309},
-                                                         'type': 'INTEGER'},
-                                                        {'name': 'servedPartyIPAddress',
-                                                         'optional': True,
-                                                         'tag': {'number': 50},
-                                                         'type': 'ServedPartyIPAddress'},
-                                                        {'name': 'pstn-cdr-info',
-                                                         'optional': True,
-                                                         'tag': {'number': 310},
-                                                         'type': 'PSTN-CDR-Info'},
-                                                        {'name': 'visited-network-id',
-                                                         'optional': True,
-                                                         'tag': {'number': 311},
-                                                         'type': 'UTF8String'},
-                                                        {'element': {'type': 'User-SIP-URI'},
-                                                         'name': 'user-sip-uri',
-                                                         'optional': True,
-                                                         'tag': {'number': 312},
-                                                         'type': 'SEQUENCE OF'},
-                                                        {'name': 'mMTelInformation',
-                                                         'optional': True,
-                                                         'tag': {'number': 110},
-                                                         'type': 'MMTelInformation'},
-                                                        {'name': 'additional-Calling-Party-Address',
-                                                         'optional': True,
-                                                         'tag': {'number': 252},
-                                                         'type': 'UTF8String'},
-                                                        {'name': 'additional-Called-Party-Address',
-                                                         'optional': True,
-                                                         'tag': {'number': 253},
-                                                         'type': 'UTF8String'},
-                                                        {'name': 'restriction-Group-ID',
-                                                         'optional': True,
-                                                         'tag': {'number': 254},
-                                                         'type': 'INTEGER'},
-                                                        {'name': 'caller-Service-Identifier',
-                                                         'optional': True,
-                                                         'tag': {'number': 255},
-                                                         'type': 'INTEGER'},
-                                                        {'name': 'aCName',
-                                                         'optional': True,
-                                                         'tag': {'number': 256},
-                                                         'type': 'UTF8String'},
-                                                        {'name': 'sms-information',
-                                                         'optional': True,
-                                                         'tag': {'number': 257},
-                                                         'type': 'SMS-Information'},
-                                                        {'name': 'closed-User-Group-ID',
-                                                         'optional': True,
-                                                         'tag': {'number': 258},
-                                                         'type': 'UTF8String'},
-                                                        {'name': 'pBX-Pilot-Number',
-                                                         'optional': True,
-                                                         'tag': {'number': 259},
-                                                         'type': 'UTF8String'},
-                                                        {'element': {'type': 'INTEGER'},
-                                                         'name': 'list-of-valueadded-service-identity',
-                                                         'optional': True,
-                                                         'tag': {'number': 260},
-                                                         'type': 'SEQUENCE OF'},
-                                                        {'name': 'virtual-Caller-Number',
-                                                         'optional': True,
-                                                         'tag': {'number': 270},
-                                                         'type': 'InvolvedParty'},
-                                                        {'name': 'charging-Label',
-                                                         'optional': True,
-                                                         'tag': {'number': 271},
-                                                         'type': 'UTF8String'},
-                                                        {'name': 'charging-Complaint',
-                                                         'optional': True,
-                                                         'tag': {'number': 402},
-                                                         'type': 'Charging-Complaint'},
-                                                        {'name': 'call-Watch-Flag',
-                                                         'optional': True,
-                                                         'tag': {'number': 403},
-                                                         'type': 'Call-Watch-Flag'},
-                                                        {'name': 'emulational-Service-Type',
-                                                         'optional': True,
-                                                         'tag': {'number': 404},
-                                                         'type': 'UTF8String'},
-                                                        {'name': 'user-to-User-Signalling1-Count',
-                                                         'optional': True,
-                                                         'tag': {'number': 407},
-                                                         'type': 'UTF8String'},
-                                                        {'name': 'calling-Party-Sub-Addressing',
-                                                         'optional': True,
-                                                         'tag': {'number': 408},
-                                                         'type': 'UTF8String'},
-                                                        {'name': 'called-Party-Sub-Addressing',
-                                                         'optional': True,
-                                                         'tag': {'number': 409},
-                                                         'type': 'UTF8String'},
-                                                        {'name': 'tADS-Indication',
-                                                         'optional': True,
-                                                         'tag': {'number': 410},
-                                                         'type': 'TADS-Indication'},
-                                                        {'name': 'calling-Party-Address-Generic',
-                                                         'optional': True,
-                                                         'tag': {'number': 411},
-                                                         'type': 'UTF8String'},
-                                                        {'name': 'qos-Statistics',
-                                                         'optional': True,
-                                                         'tag': {'number': 412},
-                                                         'type': 'UTF8String'},
-                                                        {'element': {'type': 'IN-Information'},
-                                                         'name': 'list-Of-IN-Information',
-                                                         'optional': True,
-                                                         'tag': {'number': 413},
-                                                         'type': 'SEQUENCE OF'},
-                                                        {'name': 'session-Release-Mode',
-                                                         'optional': True,
-                                                         'tag': {'number': 414},
-                                                         'type': 'INTEGER'},
-                                                        {'name': 'account-Code',
-                                                         'optional': True,
-                                                         'tag': {'number': 435},
-                                                         'type': 'OCTET '
-                                                                 'STRING'},
-                                                        {'name': 'user-Charging-Category',
-                                                         'optional': True,
-                                                         'tag': {'number': 501},
-                                                         'type': 'INTEGER'},
-                                                        {'name': 'ims-3gpp-Session-Priority',
-                                                         'optional': True,
-                                                         'tag': {'number': 36},
-                                                         'type': 'INTEGER'},
-                                                        {'name': 'calling-Party-Name',
-                                                         'optional': True,
-                                                         'tag': {'number': 415},
-                                                         'type': 'UTF8String'},
-                                                        {'name': 'session-Priority',
-                                                         'optional': True,
-                                                         'tag': {'number': 205},
-                                                         'type': 'Session-Priority'},
-                                                        {'name': 'initial-Location',
-                                                         'optional': True,
-                                                         'tag': {'number': 416},
-                                                         'type': 'UTF8String'},
-                                                        {'element': {'type': 'Change-Of-Location'},
-                                                         'name': 'list-Of-Change-Of-Location',
-                                                         'optional': True,
-                                                         'tag': {'number': 417},
-                                                         'type': 'SEQUENCE OF'},
-                                                        {'name': 'private-User-Equipment-Info',
-                                                         'optional': True,
-                                                         'tag': {'number': 418},
-                                                         'type': 'Private-User-Equipment-Info'},
-                                                        {'name': 'private-MediaPartialRecordNumber',
-                                                         'optional': True,
-                                                         'tag': {'number': 419},
-                                                         'type': 'INTEGER'},
-                                                        {'name': 'user-Agent-Value',
-                                                         'optional': True,
-                                                         'tag': {'number': 420},
-                                                         'type': 'UTF8String'},
-                                                        {'name': 'private-BillType',
-                                                         'optional': True,
-                                                         'tag': {'number': 421},
-                                                         'type': 'INTEGER'},
-                                                        {'name': 'routing-Category',
-                                                         'optional': True,
-                                                         'tag': {'number': 422},
-                                                         'type': 'UnsignedInter32'},
-                                                        {'name': 'routing-Category-Ext',
-                                                         'optional': True,
-                                                         'tag': {'number': 423},
-                                                         'type': 'UnsignedInter32'},
-                                                        {'name': 'network-Call-Reference',
-                                                         'optional': True,
-                                                         'tag': {'number': 426},
-                                                         'type': 'UTF8String'},
-                                                        {'name': 'ut-Operate-Result',
-                                                         'optional': True,
-                                                         'tag': {'number': 430},
-                                                         'type': 'UnsignedInter32'},
-                                                        {'name': 'calling-Party',
-                                                         'optional': True,
-                                                         'tag': {'number': 301},
-                                                         'type': 'InvolvedParty'},
-                                                        {'name': 'sNMD-Service-Type',
-                                                         'optional': True,
-                                                         'tag': {'number': 304},
-                                                         'type': 'OCTET '
-                                                                 'STRING'},
-                                                        {'name': 'connected-Number',
-                                                         'optional': True,
-                                                         'tag': {'number': 305},
-                                                         'type': 'InvolvedParty'},
-                                                        {'name': 'iMSVisitedNetworkIdentifier',
-                                                         'optional': True,
-                                                         'tag': {'number': 54},
-                                                         'type': 'OCTET '
-                                                                 'STRING'},
-                                                        {'name': 'private-ConnectTime',
-                                                         'optional': True,
-                                                         'tag': {'number': 424},
-                                                         'type': 'Private-ConnectTime'},
-                                                        {'name': 'sip-From-Uri',
-                                                         'optional': True,
-                                                         'tag': {'number': 427},
-                                                         'type': 'UTF8String'},
-                                                        {'element': {'type': 'Call-Transfer-Info-List'},
-                                                         'name': 'list-of-Call-Transfer-Info',
-                                                         'optional': True,
-                                                         'tag': {'number': 428},
-                                                         'type': 'SEQUENCE OF'},
-                                                        {'name': 'recording-Entity-ID',
-                                                         'optional': True,
-                                                         'tag': {'number': 429},
-                                                         'type': 'UTF8String'},
-                                                        {'element': {'type': 'CS-Location-Information'},
-                                                         'name': 'cS-Location-Information',
-                                                         'optional': True,
-                                                         'tag': {'number': 302},
-                                                         'type': 'SEQUENCE OF'},
-                                                        {'name': 'service-Interact-Info',
-                                                         'optional': True,
-                                                         'tag': {'number': 303},
-                                                         'type': 'Service-Interact-Info'},
-                                                        {'name': 'iMS-3GPP-Online-Charging-Flag',
-                                                         'optional': True,
-                                                         'tag': {'number': 43},
-                                                         'type': 'NULL'},
-                                                        {'name': 'es-Service-Information',
-                                                         'optional': True,
-                                                         'tag': {'number': 437},
-                                                         'type': 'Es-Service-Information'},
-                                                        {'element': {'type': 'DRVCC-Info'},
-                                                         'name': 'list-Of-DRVCC-Info',
-                                                         'optional': True,
-                                                         'tag': {'number': 439},
-                                                         'type': 'SEQUENCE OF'},
-                                                        {'name': 'sp-id',
-                                                         'optional': True,
-                                                         'tag': {'number': 438},
-                                                         'type': 'UTF8String'},
-                                                        {'name': 'enhanced-Category',
-                                                         'optional': True,
-                                                         'tag': {'number': 443},
-                                                         'type': 'UnsignedInter32'},
-                                                        {'name': 'special-CDR-Flag',
-                                                         'optional': True,
-                                                         'tag': {'number': 444},
-                                                         'type': 'UnsignedInter32'},
-                                                        {'name': 'peer-subgroup-id',
-                                                         'optional': True,
-                                                         'tag': {'number': 445},
-                                                         'type': 'UnsignedInter32'},
-                                                        {'name': 'specifiedTreatmentField',
-                                                         'optional': True,
-                                                         'tag': {'number': 446},
-                                                         'type': 'SpecifiedTreatmentField'},
-                                                        {'name': 'isvolte-call-type',
-                                                         'optional': True,
-                                                         'tag': {'number': 447},
-                                                         'type': 'IsVolte-Call-Type'},
-                                                        {'name': 'finish-P-Access-Network-Information',
-                                                         'optional': True,
-                                                         'tag': {'number': 448},
-                                                         'type': 'OCTET '
-                                                                 'STRING'},
-                                                        {'name': 'pinCode-Account',
-                                                         'optional': True,
-                                                         'tag': {'number': 449},
-                                                         'type': 'UTF8String'},
-                                                        {'name': 'intercom-Call-Group-ID',
-                                                         'optional': True,
-                                                         'tag': {'number': 450},
-                                                         'type': 'UnsignedInter32'},
-                                                        {'element': {'type': 'Fail-AS-Addr'},
-                                                         'name': 'list-of-Fail-AS-Addr',
-                                                         'optional': True,
-                                                         'tag': {'number': 453},
-                                                         'type': 'SEQUENCE OF'},
-                                                        {'name': 'province',
-                                                         'optional': True,
-                                                         'tag': {'number': 245},
-                                                         'type': 'UTF8String'},
-                                                        {'name': 'roam-Type',
-                                                         'optional': True,
-                                                         'tag': {'number': 246},
-                                                         'type': 'Roam-Type'},
-                                                        {'name': 'first-level-bill-number',
-                                                         'optional': True,
-                                                         'tag': {'number': 454},
-                                                         'type': 'UTF8String'},
-                                                        {'name': 'second-level-bill-number',
-                                                         'optional': True,
-                                                         'tag': {'number': 455},
-                                                         'type': 'UTF8String'},
-                                                        {'name': 'user-Category',
-                                                         'optional': True,
-                                                         'tag': {'number': 457},
-                                                         'type': 'UnsignedInter32'},
-                                                        {'name': 'p-Cellular-Network-Info',
-                                                         'optional': True,
-                                                         'tag': {'number': 459},
-                                                         'type': 'UTF8String'},
-                                                        {'name': 'centrex-User-Accont',
-                                                         'optional': True,
-                                                         'tag': {'number': 464},
-                                                         'type': 'UTF8String'},
-                                                        {'name': 'centrex-Callee-User-Accont',
-                                                         'optional': True,
-                                                         'tag': {'number': 465},
-                                                         'type': 'UTF8String'},
-                                                        {'name': 'sCP-Connection',
-                                                         'optional': True,
-                                                         'tag': {'number': 466},
-                                                         'type': 'SCP-Connection'},
-                                                        {'name': 'sIP-Ringing-TimeStamp',
-                                                         'optional': True,
-                                                         'tag': {'number': 467},
-                                                         'type': 'TimeStamp'},
-                                                        {'name': 'sIP-Ringing-TimeStamp-Fraction',
-                                                         'optional': True,
-                                                         'tag': {'number': 468},
-                                                         'type': 'Milliseconds'},
-                                                        {'name': 'p-cellular-access-network-info',
-                                                         'optional': True,
-                                                         'tag': {'number': 469},
-                                                         'type': 'UTF8String'},
-                                                        {'name': 'p-last-access-network-info',
-                                                         'optional': True,
-                                                         'tag': {'number': 470},
-                                                         'type': 'UTF8String'},
-                                                        {'name': 'p-last-cell-id',
-                                                         'optional': True,
-                                                         'tag': {'number': 471},
-                                                         'type': 'UTF8String'},
-                                                        {'name': 'geo-coordinates',
-                                                         'optional': True,
-                                                         'tag': {'number': 472},
-                                                         'type': 'UTF8String'}],
-                                            'type': 'SET'},
-                              'Abnormal-Finish-Info': {'members': [{'name': 'abnormalFinishWarning',
-                                                                    'optional': True,
-                                                                    'tag': {'number': 0},
-                                                                    'type': 'GraphicString'},
-                                                                   {'name': 'abnormalFinishReason',
-                                                                    'optional': True,
-                                                                    'tag': {'number': 1},
-                                                                    'type': 'GraphicString'}],
-                                                       'type': 'SEQUENCE'},
-                              'AccessCorrelationID': {'members': [{'name': 'gPRS-Charging-Id',
-                                                                   'tag': {'number': 2},
-                                                                   'type': 'INTEGER'},
-                                                                  {'name': 'accessNetworkChargingIdentifier',
-                                                                   'tag': {'number': 4},
-                                                                   'type': 'GraphicString'}],
-                                                      'type': 'CHOICE'},
-                              'Application-Servers-Abnormal': {'type': 'UTF8String'},
-                              'ApplicationServersInformation': {'members': [{'name': 'applicationServersInvolved',
-                                                                             'optional': True,
-                                                                             'tag': {'number': 0},
-                                                                             'type': 'NodeAddress'},
-                                                                            {'element': {'type': 'InvolvedParty'},
-                                                                             'name': 'applicationProvidedCalledParties',
-                                                                             'optional': True,
-                                                                             'tag': {'number': 1},
-                                                                             'type': 'SEQUENCE '
-                                                                                     'OF'}],
-                                                                'type': 'SEQUENCE'},
-                              'Attendee': {'members': [{'name': 'attendee-Account',
-                                                        'optional': True,
-                                                        'tag': {'number': 0},
-                                                        'type': 'UTF8String'},
-                                                       {'name': 'attendee-Number',
-                                                        'optional': True,
-                                                        'tag': {'number': 1},
-                                                        'type': 'UTF8String'}],
-                                           'type': 'SEQUENCE'},
-                              'BGCFRecord': {'members': [{'name': 'recordType',
-                                                          'optional': True,
-                                                          'tag': {'number': 0},
-                                                          'type': 'RecordType'},
-                                                         {'name': 'retransmission',
-                                                          'optional': True,
-                                                          'tag': {'number': 1},
-                                                          'type': 'NULL'},
-                                                         {'name': 'sIP-Method',
-                                                          'optional': True,
-                                                          'tag': {'number': 2},
-                                                          'type': 'SIP-Method'},
-                                                         {'name': 'role-of-Node',
-                                                          'optional': True,
-                                                          'tag': {'number': 3},
-                                                          'type': 'Role-of-Node'},
-                                                         {'name': 'nodeAddress',
-                                                          'optional': True,
-                                                          'tag': {'number': 4},
-                                                          'type': 'NodeAddress'},
-                                                         {'name': 'session-Id',
-                                                          'optional': True,
-                                                          'tag': {'number': 5},
-                                                          'type': 'Session-Id'},
-                                                         {'name': 'list-Of-Calling-Party-Address',
-                                                          'optional': True,
-                                                          'tag': {'number': 6},
-                                                          'type': 'ListOfInvolvedParties'},
-                                                         {'name': 'called-Party-Address',
-                                                          'optional': True,
-                                                          'tag': {'number': 7},
-                                                          'type': 'InvolvedParty'},
-                                                         {'name': 'serviceRequestTimeStamp',
-                                                          'optional': True,
-                                                          'tag': {'number': 9},
-                                                          'type': 'TimeStamp'},
-                                                         {'name': 'serviceDeliveryStartTimeStamp',
-                                                          'optional': True,
-                                                          'tag': {'number': 10},
-                                                          'type': 'TimeStamp'},
-                                                         {'name': 'serviceDeliveryEndTimeStamp',
-                                                          'optional': True,
-                                                          'tag': {'number': 11},
-                                                          'type': 'TimeStamp'},
-                                                         {'name': 'recordOpeningTime',
-                                                          'optional': True,
-                                                          'tag': {'number': 12},
-                                                          'type': 'TimeStamp'},
-                                                         {'name': 'recordClosureTime',
-                                                          'optional': True,
-                                                          'tag': {'number': 13},
-                                                          'type': 'TimeStamp'},
-                                                         {'name': 'interOperatorIdentifiers',
-                                                          'optional': True,
-                                                          'tag': {'number': 14},
-                                                          'type': 'InterOperatorIdentifierlist'},
-                                                         {'name': 'localRecordSequenceNumber',
-                                                          'optional': True,
-                                                          'tag': {'number': 15},
-                                                          'type': 'LocalSequenceNumber'},
-                                                         {'name': 'recordSequenceNumber',
-                                                          'optional': True,
-                                                          'tag': {'number': 16},
-                                                          'type': 'INTEGER'},
-                                                         {'name': 'causeForRecordClosing',
-                                                          'optional': True,
-                                                          'tag': {'number': 17},
-                                                          'type': 'CauseForRecordClosing'},
-                                                         {'name': 'incomplete-CDR-Indication',
-                                                          'optional': True,
-                                                          'tag': {'number': 18},
-                                                          'type': 'Incomplete-CDR-Indication'},
-                                                         {'name': 'iMS-Charging-Identifier',
-                                                          'optional': True,
-                                                          'tag': {'number': 19},
-                                                          'type': 'IMS-Charging-Identifier'},
-                                                         {'element': {'type': 'Media-Components-List'},
-                                                          'name': 'list-Of-SDP-Media-Components',
-                                                          'optional': True,
-                                                          'tag': {'number': 21},
-                                                          'type': 'SEQUENCE '
-                                                                  'OF'},
-                                                         {'name': 'serviceReasonReturnCode',
-                                                          'optional': True,
-                                                          'tag': {'number': 23},
-                                                          'type': 'UTF8String'},
-                                                         {'name': 'recordExtensions',
-                                                          'optional': True,
-                                                          'tag': {'number': 25},
-                                                          'type': 'ManagementExtensions'},
-                                                         {'name': 'expiresInformation',
-                                                          'optional': True,
-                                                          'tag': {'number': 26},
-                                                          'type': 'INTEGER'},
-                                                         {'name': 'event',
-                                                          'optional': True,
-                                                          'tag': {'number': 28},
-                                                          'type': 'UTF8String'},
-                                                         {'name': 'serviceContextID',
-                                                          'optional': True,
-                                                          'tag': {'number': 30},
-                                                          'type': 'ServiceContextID'},
-                                                         {'element': {'type': 'Early-Media-Components-List'},
-                                                          'name': 'list-Of-Early-SDP-Media-Components',
-                                                          'optional': True,
-                                                          'tag': {'number': 32},
-                                                          'type': 'SEQUENCE '
-                                                                  'OF'},
-                                                         {'name': 'numberPortabilityRouting',
-                                                          'optional': True,
-                                                          'tag': {'number': 34},
-                                                          'type': 'NumberPortabilityRouting'},
-                                                         {'name': 'carrierSelectRouting',
-                                                          'optional': True,
-                                                          'tag': {'number': 35},
-                                                          'type': 'CarrierSelectRouting'},
-                                                         {'name': 'duration',
-                                                          'optional': True,
-                                                          'tag': {'number': 200},
-                                                          'type': 'INTEGER'}],
-                                             'type': 'SET'},
-                              'Bill-Type': {'type': 'ENUMERATED',
-                                            'values': [('accessCDR', 1),
-                                                       ('conferenceCDR', 2),
-                                                       ('recordingListenCDR',
-                                                        3),
-                                                       ('schedulingCDR', 5),
-                                                       ('cancellationCDR', 6),
-                                                       ('modificationCDR', 7),
-                                                       ('callSetCDR', 8),
-                                                       ('extensionCDR', 9),
-                                                       ('dataconferncecdr', 10),
-                                                       ('recordingCDR', 11),
-                                                       ('meetingCDR', 12),
-                                                       ('smsCDR', 13),
-                                                       ('ordercdr', 15),
-                                                       ('qosCDR', 16),
-                                                       ('conferenceFailCDR',
-                                                        17),
-                                                       ('callSetFailCDR', 18),
-                                                       ('meetingFailCDR', 19)]},
-                              'Business-Trunking-Indication': {'type': 'ENUMERATED',
-                                                               'values': [('peering-mode',
-                                                                           0),
-                                                                          ('subscribe-mode',
-                                                                           1)]},
-                              'CS-Location': {'type': 'UTF8String'},
-                              'CS-Location-Information': {'members': [{'name': 'mscNumber',
-                                                                       'optional': True,
-                                                                       'tag': {'number': 1},
-                                                                       'type': 'OCTET '
-                                                                               'STRING'},
-                                                                      {'name': 'location-Area',
-                                                                       'optional': True,
-                                                                       'tag': {'number': 2},
-                                                                       'type': 'LocationAreaCode'},
-                                                                      {'name': 'cell-Identification',
-                                                                       'optional': True,
-                                                                       'tag': {'number': 3},
-                                                                       'type': 'CellId'},
-                                                                      {'name': 'service-Area-Code',
-                                                                       'optional': True,
-                                                                       'tag': {'number': 4},
-                                                                       'type': 'ServiceAreaCode'}],
-                                                          'type': 'SEQUENCE'},
-                              'Call-Description': {'type': 'ENUMERATED',
-                                                   'values': [('in-group', 1),
-                                                              ('in-union-Group',
-                                                               2),
-                                                              ('in-inter-province-Group',
-                                                               3),
-                                                              ('out-group', 4),
-                                                              ('operator-call',
-                                                               5),
-                                                              ('a6', 6),
-                                                              ('a7', 7),
-                                                              ('a8', 8),
-                                                              ('a9', 9),
-                                                              ('a10', 10),
-                                                              ('a11', 11),
-                                                              ('a12', 12),
-                                                              ('a13', 13),
-                                                              ('a14', 14),
-                                                              ('a15', 15),
-                                                              ('a16', 16),
-                                                              ('a17', 17),
-                                                              ('a18', 18),
-                                                              ('a19', 19),
-                                                              ('a20', 20)]},
-                              'Call-In-Out': {'type': 'ENUMERATED',
-                                              'values': [('callout', 0),
-                                                         ('callin', 1)]},
-                              'Call-Party-Number-Type': {'type': 'ENUMERATED',
-                                                         'values': [('subscriber-number',
-                                                                     0),
-                                                                    ('reserved',
-                                                                     1),
-                                                                    ('national-number',
-                                                                     2),
-                                                                    ('international-number',
-                                                                     3)]},
-                              'Call-Transfer-Info': {'members': [{'name': 'call-Transfer-Type',
-                                                                  'optional': True,
-                                                                  'tag': {'number': 0},
-                                                                  'type': 'Call-Transfer-Type'},
-                                                                 {'name': 'call-Transfer-Data',
-                                                                  'optional': True,
-                                                                  'tag': {'number': 1},
-                                                                  'type': 'UTF8String'}],
-                                                     'type': 'SET'},
-                              'Call-Transfer-Info-List': {'element': {'type': 'Call-Transfer-Info'},
-                                                          'type': 'SEQUENCE '
-                                                                  'OF'},
-                              'Call-Transfer-Type': {'type': 'ENUMERATED',
-                                                     'values': [('tRANSFER-TIME',
-                                                                 0),
-                                                                ('tRANSFER-ACCESS-TYPE',
-                                                                 1),
-                                                                ('tRANSFER-USER-NUM',
-                                                                 2)]},
-                              'Call-Watch-Flag': {'type': 'ENUMERATED',
-                                                  'values': [('nO', 0),
-                                                             ('yES', 1)]},
-                              'Called-User': {'type': 'UTF8String'},
-                              'Callee-Info': {'members': [{'name': 'callee-short-number',
-                                                           'optional': True,
-                                                           'tag': {'number': 0},
-                                                           'type': 'UTF8String'},
-                                                          {'name': 'callee-group-id',
-                                                           'optional': True,
-                                                           'tag': {'number': 1},
-                                                           'type': 'UTF8String'},
-                                                          {'name': 'callee-type',
-                                                           'optional': True,
-                                                           'tag': {'number': 2},
-                                                           'type': 'INTEGER'}],
-                                              'type': 'SET'},
-                              'Caller-Info': {'members': [{'name': 'caller-short-number',
-                                                           'optional': True,
-                                                           'tag': {'number': 0},
-                                                           'type': 'UTF8String'},
-                                                          {'name': 'caller-group-id',
-                                                           'optional': True,
-                                                           'tag': {'number': 1},
-                                                           'type': 'UTF8String'},
-                                                          {'name': 'caller-type',
-                                                           'optional': True,
-                                                           'tag': {'number': 2},
-                                                           'type': 'INTEGER'}],
-                                              'type': 'SET'},
-                              'Caller-Originating-Domain': {'type': 'ENUMERATED',
-                                                            'values': [('ims',
-                                                                        0),
-                                                                       ('cs',
-                                                                        1)]},
-                              'Calling-Party-Category': {'type': 'ENUMERATED',
-                                                         'values': [('unknown',
-                                                                     0),
-                                                                    ('operator-french',
-                                                                     1),
-                                                                    ('operator-english',
-                                                                     2),
-                                                                    ('operator-german',
-                                                                     3),
-                                                                    ('operator-russian',
-                                                                     4),
-                                                                    ('operator-spanish',
-                                                                     5),
-                                                                    ('operator-particular-language1-by-mutual-agreement',
-                                                                     6),
-                                                                    ('operator-particular-language2-by-mutual-agreement',
-                                                                     7),
-                                                                    ('operator-particular-language3-by-mutual-agreement',
-                                                                     8),
-                                                                    ('operator-without-trunk-offering-facility',
-                                                                     9),
-                                                                    ('ordinary',
-                                                                     10),
-                                                                    ('priority',
-                                                                     11),
-                                                                    ('data',
-                                                                     12),
-                                                                    ('test',
-                                                                     13),
-                                                                    ('payphone',
-                                                                     15),
-                                                                    ('prison',
-                                                                     16),
-                                                                    ('local-Brazil',
-                                                                     224),
-                                                                    ('customized-operator',
-                                                                     226),
-                                                                    ('customized-IN-platform',
-                                                                     232)]},
-                              'Camel-Destination-Number-Type': {'type': 'ENUMERATED',
-                                                                'values': [('reserved',
-                                                                            0),
-                                                                           ('user-number',
-                                                                            1),
-                                                                           ('unknown-number',
-                                                                            2),
-                                                                           ('national-number',
-                                                                            3),
-                                                                           ('international-number',
-                                                                            4),
-                                                                           ('specific-number',
-                                                                            5)]},
-                              'CarrierSelectRouting': {'type': 'GraphicString'},
-                              'CauseForRecordClosing': {'type': 'ENUMERATED',
-                                                        'values': [('serviceDeliveryEndSuccessfully',
-                                                                    0),
-                                                                   ('unSuccessfulServiceDelivery',
-                                                                    1),
-                                                                   ('timeLimit',
-                                                                    3),
-                                                                   ('serviceChange',
-                                                                    4),
-                                                                   ('managementIntervention',
-                                                                    5),
-                                                                   ('maxChangeCond',
-                                                                    6)]},
-                              'CellId': {'size': [2], 'type': 'OCTET STRING'},
-                              'CentrexASRecord': {'members': [{'name': 'recordType',
-                                                               'optional': True,
-                                                               'tag': {'number': 0},
-                                                               'type': 'RecordType'},
-                                                              {'name': 'retransmission',
-                                                               'optional': True,
-                                                               'tag': {'number': 1},
-                                                               'type': 'NULL'},
-                                                              {'name': 'sIP-Method',
-                                                               'optional': True,
-                                                               'tag': {'number': 2},
-                                                               'type': 'SIP-Method'},
-                                                              {'name': 'role-of-Node',
-                                                               'optional': True,
-                                                               'tag': {'number': 3},
-                                                               'type': 'Role-of-Node'},
-                                                              {'name': 'nodeAddress',
-                                                               'optional': True,
-                                                               'tag': {'number': 4},
-                                                               'type': 'NodeAddress'},
-                                                              {'name': 'session-Id',
-                                                               'optional': True,
-                                                               'tag': {'number': 5},
-                                                               'type': 'Session-Id'},
-                                                              {'name': 'list-Of-Calling-Party-Address',
-                                                               'optional': True,
-                                                               'tag': {'number': 6},
-                                                               'type': 'ListOfInvolvedParties'},
-                                                              {'name': 'called-Party-Address',
-                                                               'optional': True,
-                                                               'tag': {'number': 7},
-                                                               'type': 'InvolvedParty'},
-                                                              {'name': 'serviceRequestTimeStamp',
-                                                               'optional': True,
-                                                               'tag': {'number': 9},
-                                                               'type': 'TimeStamp'},
-                                                              {'name': 'serviceDeliveryStartTimeStamp',
-                                                               'optional': True,
-                                                               'tag': {'number': 10},
-                                                               'type': 'TimeStamp'},
-                                                              {'name': 'serviceDeliveryEndTimeStamp',
-                                                               'optional': True,
-                                                               'tag': {'number': 11},
-                                                               'type': 'TimeStamp'},
-                                                              {'name': 'recordOpeningTime',
-                                                               'optional': True,
-                                                               'tag': {'number': 12},
-                                                               'type': 'TimeStamp'},
-                                                              {'name': 'recordClosureTime',
-                                                               'optional': True,
-                                                               'tag': {'number': 13},
-                                                               'type': 'TimeStamp'},
-                                                              {'name': 'interOperatorIdentifiers',
-                                                               'optional': True,
-                                                               'tag': {'number': 14},
-                                                               'type': 'InterOperatorIdentifierlist'},
-                                                              {'name': 'localRecordSequenceNumber',
-                                                               'optional': True,
-                                                               'tag': {'number': 15},
-                                                               'type': 'LocalSequenceNumber'},
-                                                              {'name': 'recordSequenceNumber',
-                                                               'optional': True,
-                                                               'tag': {'number': 16},
-                                                               'type': 'INTEGER'},
-                                                              {'name': 'causeForRecordClosing',
-                                                               'optional': True,
-                                                               'tag': {'number': 17},
-                                                               'type': 'CauseForRecordClosing'},
-                                                              {'name': 'incomplete-CDR-Indication',
-                                                               'optional': True,
-                                                               'tag': {'number': 18},
-                                                               'type': 'Incomplete-CDR-Indication'},
-                                                              {'name': 'iMS-Charging-Identifier',
-                                                               'optional': True,
-                                                               'tag': {'number': 19},
-                                                               'type': 'IMS-Charging-Identifier'},
-                                                              {'element': {'type': 'Media-Components-List-Centrex'},
-                                                               'name': 'list-Of-SDP-Media-Components',
-                                                               'optional': True,
-                                                               'tag': {'number': 21},
-                                                               'type': 'SEQUENCE '
-                                                                       'OF'},
-                                                              {'name': 'gGSNaddress',
-                                                               'optional': True,
-                                                               'tag': {'number': 22},
-                                                               'type': 'NodeAddress'},
-                                                              {'name': 'serviceReasonReturnCode',
-                                                               'optional': True,
-                                                               'tag': {'number': 23},
-                                                               'type': 'UTF8String'},
-                                                              {'element': {'type': 'MessageBody'},
-                                                               'name': 'list-Of-Message-Bodies',
-                                                               'optional': True,
-                                                               'tag': {'number': 24},
-                                                               'type': 'SEQUENCE '
-                                                                       'OF'},
-                                                              {'name': 'recordExtensions',
-                                                               'optional': True,
-                                                               'tag': {'number': 25},
-                                                               'type': 'ManagementExtensions'},
-                                                              {'name': 'expiresInformation',
-                                                               'optional': True,
-                                                               'tag': {'number': 26},
-                                                               'type': 'INTEGER'},
-                                                              {'name': 'event',
-                                                               'optional': True,
-                                                               'tag': {'number': 28},
-                                                               'type': 'UTF8String'},
-                                                              {'name': 'accessNetworkInformation',
-                                                               'optional': True,
-                                                               'tag': {'number': 29},
-                                                               'type': 'OCTET '
-                                                                       'STRING'},
-                                                              {'name': 'serviceContextID',
-                                                               'optional': True,
-                                                               'tag': {'number': 30},
-                                                               'type': 'ServiceContextID'},
-                                                              {'element': {'type': 'SubscriptionID'},
-                                                               'name': 'list-of-subscription-ID',
-                                                               'optional': True,
-                                                               'tag': {'number': 31},
-                                                               'type': 'SEQUENCE '
-                                                                       'OF'},
-                                                              {'element': {'type': 'Early-Media-Components-List'},
-                                                               'name': 'list-Of-Early-SDP-Media-Components',
-                                                               'optional': True,
-                                                               'tag': {'number': 32},
-                                                               'type': 'SEQUENCE '
-                                                                       'OF'},
-                                                              {'name': 'iMSCommunicationServiceIdentifier',
-                                                               'optional': True,
-                                                               'tag': {'number': 33},
-                                                               'type': 'IMSCommunicationServiceIdentifier'},
-                                                              {'name': 'numberPortabilityRouting',
-                                                               'optional': True,
-                                                               'tag': {'number': 34},
-                                                               'type': 'NumberPortabilityRouting'},
-                                                              {'name': 'carrierSelectRouting',
-                                                               'optional': True,
-                                                               'tag': {'number': 35},
-                                                               'type': 'CarrierSelectRouting'},
-                                                              {'element': {'type': 'ServiceSpecificInfo'},
-                                                               'name': 'serviceSpecificInfo',
-                                                               'optional': True,
-                                                               'tag': {'number': 100},
-                                                               'type': 'SEQUENCE '
-                                                                       'OF'},
-                                                              {'name': 'requested-Party-Address',
-                                                               'optional': True,
-                                                               'tag': {'number': 101},
-                                                               'type': 'InvolvedParty'},
-                                                              {'name': 'list-Of-Called-Asserted-Identity',
-                                                               'optional': True,
-                                                               'tag': {'number': 102},
-                                                               'type': 'ListOfInvolvedParties'},
-                                                              {'name': 'alternateChargedPartyAddress',
-                                                               'optional': True,
-                                                               'tag': {'number': 103},
-                                                               'type': 'UTF8String'},
-                                                              {'name': 'duration',
-                                                               'optional': True,
-                                                               'tag': {'number': 200},
-                                                               'type': 'INTEGER'},
-                                                              {'name': 'onlineChargingFlag',
-                                                               'optional': True,
-                                                               'tag': {'number': 150},
-                                                               'type': 'Online-Charging-Type'},
-                                                              {'name': 'call-description',
-                                                               'optional': True,
-                                                               'tag': {'number': 152},
-                                                               'type': 'Call-Description'},
-                                                              {'name': 'group-number',
-                                                               'optional': True,
-                                                               'tag': {'number': 153},
-                                                               'type': 'UTF8String'},
-                                                              {'name': 'short-number',
-                                                               'optional': True,
-                                                               'tag': {'number': 154},
-                                                               'type': 'UTF8String'},
-                                                              {'element': {'type': 'Service-Indetity'},
-                                                               'name': 'service-indetity-list',
-                                                               'optional': True,
-                                                               'tag': {'number': 155},
-                                                               'type': 'SEQUENCE '
-                                                                       'OF'},
-                                                              {'name': 'charged-party',
-                                                               'optional': True,
-                                                               'tag': {'number': 156},
-                                                               'type': 'InvolvedParty'},
-                                                              {'name': 'subscriber-Identity',
-                                                               'optional': True,
-                                                               'tag': {'number': 201},
-                                                               'type': 'InvolvedParty'},
-                                                              {'name': 'calling-party-subgroup-number',
-                                                               'optional': True,
-                                                               'tag': {'number': 202},
-                                                               'type': 'UTF8String'},
-                                                              {'name': 'called-party-subgroup-number',
-                                                               'optional': True,
-                                                               'tag': {'number': 203},
-                                                               'type': 'UTF8String'},
-                                                              {'name': 'calling-Party',
-                                                               'optional': True,
-                                                               'tag': {'number': 204},
-                                                               'type': 'InvolvedParty'}],
-                                                  'type': 'SET'},
-                              'Change-Of-Location': {'members': [{'name': 'location-Info',
-                                                                  'optional': True,
-                                                                  'tag': {'number': 0},
-                                                                  'type': 'UTF8String'}],
-                                                     'type': 'SEQUENCE'},
-                              'Charging-Complaint': {'type': 'ENUMERATED',
-                                                     'values': [('nO', 0),
-                                                                ('yES', 1)]},
-                              'ChargingCategory': {'type': 'ENUMERATED',
-                                                   'values': [('normal-user',
-                                                               0),
-                                                              ('free-user', 1),
-                                                              ('charge-prepaid',
-                                                               2),
-                                                              ('charge-called',
-                                                               3)]},
-                              'Closed-Code': {'type': 'INTEGER'},
-                              'Conference-Server-Role': {'type': 'ENUMERATED',
-                                                         'values': [('controller',
-                                                                     0),
-                                                                    ('participant',
-                                                                     1)]},
-                              'Conference-Session-Information': {'members': [{'name': 'startTimestamp',
-                                                                              'optional': True,
-                                                                              'tag': {'number': 0},
-                                                                              'type': 'TimeStamp'},
-                                                                             {'name': 'duration',
-                                                                              'optional': True,
-                                                                              'tag': {'number': 1},
-                                                                              'type': 'Duration'},
-                                                                             {'name': 'conferenceSessionType',
-                                                                              'optional': True,
-                                                                              'tag': {'number': 2},
-                                                                              'type': 'Conference-Session-Type'},
-                                                                             {'name': 'numberOfParticipants',
-                                                                              'optional': True,
-                                                                              'tag': {'number': 3},
-                                                                              'type': 'Number-Of-Participants'},
-                                                                             {'element': {'type': 'Participant'},
-                                                                              'name': 'participant',
-                                                                              'optional': True,
-                                                                              'tag': {'number': 4},
-                                                                              'type': 'SEQUENCE '
-                                                                                      'OF'},
-                                                                             {'name': 'streamExchangeUpLink',
-                                                                              'optional': True,
-                                                                              'tag': {'number': 5},
-                                                                              'type': 'Stream-Exchange'},
-                                                                             {'name': 'streamExchangeDownLink',
-                                                                              'optional': True,
-                                                                              'tag': {'number': 6},
-                                                                              'type': 'Stream-Exchange'}],
-                                                                 'type': 'SEQUENCE'},
-                              'Conference-Session-Type': {'type': 'ENUMERATED',
-                                                          'values': [('ad-hoc',
-                                                                      0),
-                                                                     ('pre-arranged',
-                                                                      1)]},
-                              'ConferenceASRecord': {'members': [{'name': 'recordType',
-                                                                  'optional': True,
-                                                                  'tag': {'number': 0},
-                                                                  'type': 'RecordType'},
-                                                                 {'name': 'retransmission',
-                                                                  'optional': True,
-                                                                  'tag': {'number': 1},
-                                                                  'type': 'NULL'},
-                                                                 {'name': 'sIP-Method',
-                                                                  'optional': True,
-                                                                  'tag': {'number': 2},
-                                                                  'type': 'SIP-Method'},
-                                                                 {'name': 'role-of-Node',
-                                                                  'optional': True,
-                                                                  'tag': {'number': 3},
-                                                                  'type': 'Role-of-Node'},
-                                                                 {'name': 'nodeAddress',
-                                                                  'optional': True,
-                                                                  'tag': {'number': 4},
-                                                                  'type': 'NodeAddress'},
-                                                                 {'name': 'session-Id',
-                                                                  'optional': True,
-                                                                  'tag': {'number': 5},
-                                                                  'type': 'Session-Id'},
-                                                                 {'name': 'list-Of-Calling-Party-Address',
-                                                                  'optional': True,
-                                                                  'tag': {'number': 6},
-                                                                  'type': 'ListOfInvolvedParties'},
-                                                                 {'name': 'called-Party-Address',
-                                                                  'optional': True,
-                                                                  'tag': {'number': 7},
-                                                                  'type': 'InvolvedParty'},
-                                                                 {'name': 'serviceRequestTimeStamp',
-                                                                  'optional': True,
-                                                                  'tag': {'number': 9},
-                                                                  'type': 'TimeStamp'},
-                                                                 {'name': 'serviceDeliveryStartTimeStamp',
-                                                                  'optional': True,
-                                                                  'tag': {'number': 10},
-                                                                  'type': 'TimeStamp'},
-                                                                 {'name': 'serviceDeliveryEndTimeStamp',
-                                                                  'optional': True,
-                                                                  'tag': {'number': 11},
-                                                                  'type': 'TimeStamp'},
-                                                                 {'name': 'recordOpeningTime',
-                                                                  'optional': True,
-                                                                  'tag': {'number': 12},
-                                                                  'type': 'TimeStamp'},
-                                                                 {'name': 'recordClosureTime',
-                                                                  'optional': True,
-                                                                  'tag': {'number': 13},
-                                                                  'type': 'TimeStamp'},
-                                                                 {'name': 'interOperatorIdentifiers',
-                                                                  'optional': True,
-                                                                  'tag': {'number': 14},
-                                                                  'type': 'InterOperatorIdentifierlist'},
-                                                                 {'name': 'localRecordSequenceNumber',
-                                                                  'optional': True,
-                                                                  'tag': {'number': 15},
-                                                                  'type': 'LocalSequenceNumber'},
-                                                                 {'name': 'recordSequenceNumber',
-                                                                  'optional': True,
-                                                                  'tag': {'number': 16},
-                                                                  'type': 'INTEGER'},
-                                                                 {'name': 'causeForRecordClosing',
-                                                                  'optional': True,
-                                                                  'tag': {'number': 17},
-                                                                  'type': 'CauseForRecordClosing'},
-                                                                 {'name': 'incomplete-CDR-Indication',
-                                                                  'optional': True,
-                                                                  'tag': {'number': 18},
-                                                                  'type': 'Incomplete-CDR-Indication'},
-                                                                 {'name': 'iMS-Charging-Identifier',
-                                                                  'optional': True,
-                                                                  'tag': {'number': 19},
-                                                                  'type': 'IMS-Charging-Identifier'},
-                                                                 {'element': {'type': 'Media-Components-List'},
-                                                                  'name': 'list-Of-SDP-Media-Components',
-                                                                  'optional': True,
-                                                                  'tag': {'number': 21},
-                                                                  'type': 'SEQUENCE '
-                                                                          'OF'},
-                                                                 {'name': 'gGSNaddress',
-                                                                  'optional': True,
-                                                                  'tag': {'number': 22},
-                                                                  'type': 'NodeAddress'},
-                                                                 {'name': 'serviceReasonReturnCode',
-                                                                  'optional': True,
-                                                                  'tag': {'number': 23},
-                                                                  'type': 'UTF8String'},
-                                                                 {'element': {'type': 'MessageBody'},
-                                                                  'name': 'list-Of-Message-Bodies',
-                                                                  'optional': True,
-                                                                  'tag': {'number': 24},
-                                                                  'type': 'SEQUENCE '
-                                                                          'OF'},
-                                                                 {'name': 'recordExtensions',
-                                                                  'optional': True,
-                                                                  'tag': {'number': 25},
-                                                                  'type': 'ManagementExtensions'},
-                                                                 {'name': 'expiresInformation',
-                                                                  'optional': True,
-                                                                  'tag': {'number': 26},
-                                                                  'type': 'INTEGER'},
-                                                                 {'name': 'event',
-                                                                  'optional': True,
-                                                                  'tag': {'number': 28},
-                                                                  'type': 'UTF8String'},
-                                                                 {'name': 'accessNetworkInformation',
-                                                                  'optional': True,
-                                                                  'tag': {'number': 29},
-                                                                  'type': 'OCTET '
-                                                                          'STRING'},
-                                                                 {'name': 'serviceContextID',
-                                                                  'optional': True,
-                                                                  'tag': {'number': 30},
-                                                                  'type': 'ServiceContextID'},
-                                                                 {'element': {'type': 'SubscriptionID'},
-                                                                  'name': 'list-of-subscription-ID',
-                                                                  'optional': True,
-                                                                  'tag': {'number': 31},
-                                                                  'type': 'SEQUENCE '
-                                                                          'OF'},
-                                                                 {'element': {'type': 'Early-Media-Components-List'},
-                                                                  'name': 'list-Of-Early-SDP-Media-Components',
-                                                                  'optional': True,
-                                                                  'tag': {'number': 32},
-                                                                  'type': 'SEQUENCE '
-                                                                          'OF'},
-                                                                 {'name': 'iMSCommunicationServiceIdentifier',
-                                                                  'optional': True,
-                                                                  'tag': {'number': 33},
-                                                                  'type': 'IMSCommunicationServiceIdentifier'},
-                                                                 {'name': 'numberPortabilityRouting',
-                                                                  'optional': True,
-                                                                  'tag': {'number': 34},
-                                                                  'type': 'NumberPortabilityRouting'},
-                                                                 {'name': 'carrierSelectRouting',
-                                                                  'optional': True,
-                                                                  'tag': {'number': 35},
-                                                                  'type': 'CarrierSelectRouting'},
-                                                                 {'element': {'type': 'ServiceSpecificInfo'},
-                                                                  'name': 'serviceSpecificInfo',
-                                                                  'optional': True,
-                                                                  'tag': {'number': 100},
-                                                                  'type': 'SEQUENCE '
-                                                                          'OF'},
-                                                                 {'name': 'requested-Party-Address',
-                                                                  'optional': True,
-                                                                  'tag': {'number': 101},
-                                                                  'type': 'InvolvedParty'},
-                                                                 {'name': 'list-Of-Called-Asserted-Identity',
-                                                                  'optional': True,
-                                                                  'tag': {'number': 102},
-                                                                  'type': 'ListOfInvolvedParties'},
-                                                                 {'name': 'alternateChargedPartyAddress',
-                                                                  'optional': True,
-                                                                  'tag': {'number': 103},
-                                                                  'type': 'UTF8String'},
-                                                                 {'name': 'privateUserID',
-                                                                  'optional': True,
-                                                                  'tag': {'number': 8},
-                                                                  'type': 'GraphicString'},
-                                                                 {'name': 'service-Id',
-                                                                  'optional': True,
-                                                                  'tag': {'number': 70},
-                                                                  'type': 'Service-Id'},
-                                                                 {'name': 'duration',
-                                                                  'optional': True,
-                                                                  'tag': {'number': 200},
-                                                                  'type': 'INTEGER'},
-                                                                 {'element': {'type': 'Service-Identifier'},
-                                                                  'name': 'serviceIdentifier',
-                                                                  'optional': True,
-                                                                  'tag': {'number': 213},
-                                                                  'type': 'SEQUENCE '
-                                                                          'OF'},
-                                                                 {'name': 'conferenceServerRole',
-                                                                  'tag': {'number': 300},
-                                                                  'type': 'Conference-Server-Role'},
-                                                                 {'name': 'conference-id',
-                                                                  'optional': True,
-                                                                  'tag': {'number': 301},
-                                                                  'type': 'UTF8String'},
-                                                                 {'element': {'type': 'Conference-Session-Information'},
-                                                                  'name': 'conferenceSessionInformation',
-                                                                  'optional': True,
-                                                                  'tag': {'number': 302},
-                                                                  'type': 'SEQUENCE '
-                                                                          'OF'},
-                                                                 {'name': 'streamExchangeUpLink',
-                                                                  'optional': True,
-                                                                  'tag': {'number': 303},
-                                                                  'type': 'Stream-Exchange'},
-                                                                 {'name': 'streamExchangeDownLink',
-                                                                  'optional': True,
-                                                                  'tag': {'number': 304},
-                                                                  'type': 'Stream-Exchange'},
-                                                                 {'name': 'operate',
-                                                                  'optional': True,
-                                                                  'tag': {'number': 305},
-                                                                  'type': 'Operate'},
-                                                                 {'name': 'operated',
-                                                                  'optional': True,
-                                                                  'tag': {'number': 306},
-                                                                  'type': 'Operated'},
-                                                                 {'name': 'deliveryCode',
-                                                                  'optional': True,
-                                                                  'tag': {'number': 307},
-                                                                  'type': 'Delivery-Code'}],
-                                                     'type': 'SET'},
-                              'DRVCC-Info': {'members': [{'name': 'drvcc-Type',
-                                                          'optional': True,
-                                                          'tag': {'number': 0},
-                                                          'type': 'Drvcc-Type'},
-                                                         {'name': 'drvcc-Request-Time',
-                                                          'optional': True,
-                                                          'tag': {'number': 1},
-                                                          'type': 'TimeStamp'},
-                                                         {'name': 'drvcc-Transfer-Number',
-                                                          'optional': True,
-                                                          'tag': {'number': 2},
-                                                          'type': 'UTF8String'},
-                                                         {'name': 'drvcc-Transfer-Identity',
-                                                          'optional': True,
-                                                          'tag': {'number': 3},
-                                                          'type': 'UTF8String'}],
-                                             'type': 'SET'},
-                              'Data-Coding-Scheme': {'type': 'ENUMERATED',
-                                                     'values': [('aSCII', 0),
-                                                                ('uSC2', 8),
-                                                                ('a8Bit', 4)]},
-                              'Default-Call-Handling': {'type': 'ENUMERATED',
-                                                        'values': [('cONTINUE',
-                                                                    0),
-                                                                   ('rELEASE',
-                                                                    1)]},
-                              'Delivery-Code': {'type': 'INTEGER'},
-                              'Direction': {'type': 'ENUMERATED',
-                                            'values': [('uPLINK', 0),
-                                                       ('dOWNLINK', 1)]},
-                              'DiversionReason': {'type': 'INTEGER'},
-                              'Drvcc-Type': {'type': 'ENUMERATED',
-                                             'values': [('ps-to-cs', 0),
-                                                        ('cs-to-ps', 1)]},
-                              'Duration': {'type': 'INTEGER'},
-                              'ECSCFRecord': {'members': [{'name': 'recordType',
-                                                           'optional': True,
-                                                           'tag': {'number': 0},
-                                                           'type': 'RecordType'},
-                                                          {'name': 'retransmission',
-                                                           'optional': True,
-                                                           'tag': {'number': 1},
-                                                           'type': 'NULL'},
-                                                          {'name': 'sIP-Method',
-                                                           'optional': True,
-                                                           'tag': {'number': 2},
-                                                           'type': 'SIP-Method'},
-                                                          {'name': 'role-of-Node',
-                                                           'optional': True,
-                                                           'tag': {'number': 3},
-                                                           'type': 'Role-of-Node'},
-                                                          {'name': 'nodeAddress',
-                                                           'optional': True,
-                                                           'tag': {'number': 4},
-                                                           'type': 'NodeAddress'},
-                                                          {'name': 'session-Id',
-                                                           'optional': True,
-                                                           'tag': {'number': 5},
-                                                           'type': 'Session-Id'},
-                                                          {'name': 'list-Of-Calling-Party-Address',
-                                                           'optional': True,
-                                                           'tag': {'number': 6},
-                                                           'type': 'ListOfInvolvedParties'},
-                                                          {'name': 'called-Party-Address',
-                                                           'optional': True,
-                                                           'tag': {'number': 7},
-                                                           'type': 'InvolvedParty'},
-                                                          {'name': 'privateUserID',
-                                                           'optional': True,
-                                                           'tag': {'number': 8},
-                                                           'type': 'GraphicString'},
-                                                          {'name': 'serviceRequestTimeStamp',
-                                                           'optional': True,
-                                                           'tag': {'number': 9},
-                                                           'type': 'TimeStamp'},
-                                                          {'name': 'serviceDeliveryStartTimeStamp',
-                                                           'optional': True,
-                                                           'tag': {'number': 10},
-                                                           'type': 'TimeStamp'},
-                                                          {'name': 'serviceDeliveryEndTimeStamp',
-                                                           'optional': True,
-                                                           'tag': {'number': 11},
-                                                           'type': 'TimeStamp'},
-                                                          {'name': 'recordOpeningTime',
-                                                           'optional': True,
-                                                           'tag': {'number': 12},
-                                                           'type': 'TimeStamp'},
-                                                          {'name': 'recordClosureTime',
-                                                           'optional': True,
-                                                           'tag': {'number': 13},
-                                                           'type': 'TimeStamp'},
-                                                          {'name': 'interOperatorIdentifiers',
-                                                           'optional': True,
-                                                           'tag': {'number': 14},
-                                                           'type': 'InterOperatorIdentifierlist'},
-                                                          {'name': 'localRecordSequenceNumber',
-                                                           'optional': True,
-                                                           'tag': {'number': 15},
-                                                           'type': 'LocalSequenceNumber'},
-                                                          {'name': 'recordSequenceNumber',
-                                                           'optional': True,
-                                                           'tag': {'number': 16},
-                                                           'type': 'INTEGER'},
-                                                          {'name': 'causeForRecordClosing',
-                                                           'optional': True,
-                                                           'tag': {'number': 17},
-                                                           'type': 'CauseForRecordClosing'},
-                                                          {'name': 'incomplete-CDR-Indication',
-                                                           'optional': True,
-                                                           'tag': {'number': 18},
-                                                           'type': 'Incomplete-CDR-Indication'},
-                                                          {'name': 'iMS-Charging-Identifier',
-                                                           'optional': True,
-                                                           'tag': {'number': 19},
-                                                           'type': 'IMS-Charging-Identifier'},
-                                                          {'element': {'type': 'Media-Components-List'},
-                                                           'name': 'list-Of-SDP-Media-Components',
-                                                           'optional': True,
-                                                           'tag': {'number': 21},
-                                                           'type': 'SEQUENCE '
-                                                                   'OF'},
-                                                          {'name': 'gGSNaddress',
-                                                           'optional': True,
-                                                           'tag': {'number': 22},
-                                                           'type': 'NodeAddress'},
-                                                          {'name': 'serviceReasonReturnCode',
-                                                           'optional': True,
-                                                           'tag': {'number': 23},
-                                                           'type': 'UTF8String'},
-                                                          {'element': {'type': 'MessageBody'},
-                                                           'name': 'list-Of-Message-Bodies',
-                                                           'optional': True,
-                                                           'tag': {'number': 24},
-                                                           'type': 'SEQUENCE '
-                                                                   'OF'},
-                                                          {'name': 'recordExtensions',
-                                                           'optional': True,
-                                                           'tag': {'number': 25},
-                                                           'type': 'ManagementExtensions'},
-                                                          {'name': 'expiresInformation',
-                                                           'optional': True,
-                                                           'tag': {'number': 26},
-                                                           'type': 'INTEGER'},
-                                                          {'name': 'list-Of-Associated-URI',
-                                                           'optional': True,
-                                                           'tag': {'number': 27},
-                                                           'type': 'ListOfInvolvedParties'},
-                                                          {'name': 'event',
-                                                           'optional': True,
-                                                           'tag': {'number': 28},
-                                                           'type': 'UTF8String'},
-                                                          {'name': 'accessNetworkInformation',
-                                                           'optional': True,
-                                                           'tag': {'number': 29},
-                                                           'type': 'OCTET '
-                                                                   'STRING'},
-                                                          {'name': 'serviceContextID',
-                                                           'optional': True,
-                                                           'tag': {'number': 30},
-                                                           'type': 'ServiceContextID'},
-                                                          {'element': {'type': 'SubscriptionID'},
-                                                           'name': 'list-of-subscription-ID',
-                                                           'optional': True,
-                                                           'tag': {'number': 31},
-                                                           'type': 'SEQUENCE '
-                                                                   'OF'},
-                                                          {'element': {'type': 'Early-Media-Components-List'},
-                                                           'name': 'list-Of-Early-SDP-Media-Components',
-                                                           'optional': True,
-                                                           'tag': {'number': 32},
-                                                           'type': 'SEQUENCE '
-                                                                   'OF'},
-                                                          {'name': 'iMSCommunicationServiceIdentifier',
-                                                           'optional': True,
-                                                           'tag': {'number': 33},
-                                                           'type': 'IMSCommunicationServiceIdentifier'},
-                                                          {'name': 'numberPortabilityRouting',
-                                                           'optional': True,
-                                                           'tag': {'number': 34},
-                                                           'type': 'NumberPortabilityRouting'},
-                                                          {'name': 'carrierSelectRouting',
-                                                           'optional': True,
-                                                           'tag': {'number': 35},
-                                                           'type': 'CarrierSelectRouting'},
-                                                          {'name': 'ims-3gpp-Session-Priority',
-                                                           'optional': True,
-                                                           'tag': {'number': 36},
-                                                           'type': 'INTEGER'},
-                                                          {'name': 'serviceRequestTimeStampFraction',
-                                                           'optional': True,
-                                                           'tag': {'number': 37},
-                                                           'type': 'Milliseconds'},
-                                                          {'name': 'serviceDeliveryStartTimeStampFraction',
-                                                           'optional': True,
-                                                           'tag': {'number': 38},
-                                                           'type': 'Milliseconds'},
-                                                          {'name': 'serviceDeliveryEndTimeStampFraction',
-                                                           'optional': True,
-                                                           'tag': {'number': 39},
-                                                           'type': 'Milliseconds'},
-                                                          {'element': {'type': 'ApplicationServersInformation'},
-                                                           'name': 'applicationServersInformation',
-                                                           'optional': True,
-                                                           'tag': {'number': 40},
-                                                           'type': 'SEQUENCE '
-                                                                   'OF'},
-                                                          {'name': 'requested-Party-Address',
-                                                           'optional': True,
-                                                           'tag': {'number': 41},
-                                                           'type': 'InvolvedParty'},
-                                                          {'name': 'list-Of-Called-Asserted-Identity',
-                                                           'optional': True,
-                                                           'tag': {'number': 42},
-                                                           'type': 'ListOfInvolvedParties'},
-                                                          {'name': 'subscriberEquipmentNumber',
-                                                           'optional': True,
-                                                           'tag': {'number': 58},
-                                                           'type': 'SubscriberEquipmentNumber'},
-                                                          {'name': 'duration',
-                                                           'optional': True,
-                                                           'tag': {'number': 200},
-                                                           'type': 'INTEGER'},
-                                                          {'name': 'onlineChargingType',
-                                                           'optional': True,
-                                                           'tag': {'number': 201},
-                                                           'type': 'Online-Charging-Type'},
-                                                          {'name': 'origin-Callee-Party-Address',
-                                                           'optional': True,
-                                                           'tag': {'number': 202},
-                                                           'type': 'InvolvedParty'},
-                                                          {'name': 'dialled-Party-Address',
-                                                           'optional': True,
-                                                           'tag': {'number': 203},
-                                                           'type': 'InvolvedParty'},
-                                                          {'name': 'ringing-Duration',
-                                                           'optional': True,
-                                                           'tag': {'number': 204},
-                                                           'type': 'UnsignedInter32'},
-                                                          {'name': 'session-Priority',
-                                                           'optional': True,
-                                                           'tag': {'number': 205},
-                                                           'type': 'Session-Priority'},
-                                                          {'name': 'carrier-Identification-Code',
-                                                           'optional': True,
-                                                           'tag': {'number': 206},
-                                                           'type': 'GraphicString'},
-                                                          {'name': 'abnormal-Finish-Info',
-                                                           'optional': True,
-                                                           'tag': {'number': 207},
-                                                           'type': 'Abnormal-Finish-Info'},
-                                                          {'name': 'nP-Data',
-                                                           'optional': True,
-                                                           'tag': {'number': 208},
-                                                           'type': 'NP-Data'},
-                                                          {'name': 'refer-To',
-                                                           'optional': True,
-                                                           'tag': {'number': 209},
-                                                           'type': 'UTF8String'},
-                                                          {'name': 'target',
-                                                           'optional': True,
-                                                           'tag': {'number': 210},
-                                                           'type': 'UTF8String'},
-                                                          {'name': 'inner-error',
-                                                           'optional': True,
-                                                           'tag': {'number': 265},
-                                                           'type': 'INTEGER'},
-                                                          {'name': 'application-Servers-State',
-                                                           'optional': True,
-                                                           'tag': {'number': 266},
-                                                           'type': 'INTEGER'},
-                                                          {'element': {'type': 'Application-Servers-Abnormal'},
-                                                           'name': 'list-of-application-Servers-Abnormal',
-                                                           'optional': True,
-                                                           'tag': {'number': 267},
-                                                           'type': 'SEQUENCE '
-                                                                   'OF'},
-                                                          {'name': 'segment-Id',
-                                                           'optional': True,
-                                                           'tag': {'number': 300},
-                                                           'type': 'UnsignedInter32'},
-                                                          {'name': 'qos-Statistics',
-                                                           'optional': True,
-                                                           'tag': {'number': 412},
-                                                           'type': 'UTF8String'},
-                                                          {'name': 'private-ConnectTime',
-                                                           'optional': True,
-                                                           'tag': {'number': 424},
-                                                           'type': 'Private-ConnectTime'},
-                                                          {'name': 'from-Header',
-                                                           'optional': True,
-                                                           'tag': {'number': 440},
-                                                           'type': 'UTF8String'},
-                                                          {'name': 'to-Header',
-                                                           'optional': True,
-                                                           'tag': {'number': 441},
-                                                           'type': 'UTF8String'},
-                                                          {'name': 'c-Cause-Closing',
-                                                           'optional': True,
-                                                           'tag': {'number': 442},
-                                                           'type': 'UnsignedInter32'}],
-                                              'type': 'SET'},
-                              'Early-Media-Components-List': {'members': [{'name': 'sDP-Offer-Timestamp',
-                                                                           'optional': True,
-                                                                           'tag': {'number': 0},
-                                                                           'type': 'TimeStamp'},
-                                                                          {'name': 'sDP-Answer-Timestamp',
-                                                                           'optional': True,
-                                                                           'tag': {'number': 1},
-                                                                           'type': 'TimeStamp'},
-                                                                          {'element': {'type': 'SDP-Media-Component'},
-                                                                           'name': 'sDP-Media-Components',
-                                                                           'optional': True,
-                                                                           'tag': {'number': 2},
-                                                                           'type': 'SEQUENCE '
-                                                                                   'OF'},
-                                                                          {'name': 'mediaInitiatorFlag',
-                                                                           'optional': True,
-                                                                           'tag': {'number': 3},
-                                                                           'type': 'NULL'},
-                                                                          {'element': {'type': 'GraphicString'},
-                                                                           'name': 'sDP-Session-Description',
-                                                                           'optional': True,
-                                                                           'tag': {'number': 4},
-                                                                           'type': 'SEQUENCE '
-                                                                                   'OF'}],
-                                                              'type': 'SEQUENCE'},
-                              'End-Code': {'type': 'INTEGER'},
-                              'Es-Service-Information': {'members': [{'name': 'es-Service-Type',
-                                                                      'optional': True,
-                                                                      'tag': {'number': 0},
-                                                                      'type': 'UnsignedInter32'},
-                                                                     {'name': 'es-Ctd-Direction',
-                                                                      'optional': True,
-                                                                      'tag': {'number': 1},
-                                                                      'type': 'UnsignedInter32'}],
-                                                         'type': 'SET'},
-                              'Fail-AS-Addr': {'members': [{'name': 'iFCSeq',
-                                                            'optional': True,
-                                                            'tag': {'number': 0},
-                                                            'type': 'UnsignedInter32'},
-                                                           {'name': 'aSPriority',
-                                                            'optional': True,
-                                                            'tag': {'number': 1},
-                                                            'type': 'UnsignedInter32'},
-                                                           {'name': 'iFCAddr',
-                                                            'optional': True,
-                                                            'tag': {'number': 2},
-                                                            'type': 'UTF8String'}],
-                                               'type': 'SEQUENCE'},
-                              'Fci-Free-Format-Data-Manner': {'type': 'ENUMERATED',
-                                                              'values': [('oVERWRITE',
-                                                                          0),
-                                                                         ('aPPEND',
-                                                                          1)]},
-                              'IBCFRecord': {'members': [{'name': 'recordType',
-                                                          'optional': True,
-                                                          'tag': {'number': 0},
-                                                          'type': 'RecordType'},
-                                                         {'name': 'retransmission',
-                                                          'optional': True,
-                                                          'tag': {'number': 1},
-                                                          'type': 'NULL'},
-                                                         {'name': 'sIP-Method',
-                                                          'optional': True,
-                                                          'tag': {'number': 2},
-                                                          'type': 'SIP-Method'},
-                                                         {'name': 'role-of-Node',
-                                                          'optional': True,
-                                                          'tag': {'number': 3},
-                                                          'type': 'Role-of-Node'},
-                                                         {'name': 'nodeAddress',
-                                                          'optional': True,
-                                                          'tag': {'number': 4},
-                                                          'type': 'NodeAddress'},
-                                                         {'name': 'session-Id',
-                                                          'optional': True,
-                                                          'tag': {'number': 5},
-                                                          'type': 'Session-Id'},
-                                                         {'name': 'list-Of-Calling-Party-Address',
-                                                          'optional': True,
-                                                          'tag': {'number': 6},
-                                                          'type': 'ListOfInvolvedParties'},
-                                                         {'name': 'called-Party-Address',
-                                                          'optional': True,
-                                                          'tag': {'number': 7},
-                                                          'type': 'InvolvedParty'},
-                                                         {'name': 'serviceRequestTimeStamp',
-                                                          'optional': True,
-                                                          'tag': {'number': 9},
-                                                          'type': 'TimeStamp'},
-                                                         {'name': 'serviceDeliveryStartTimeStamp',
-                                                          'optional': True,
-                                                          'tag': {'number': 10},
-                                                          'type': 'TimeStamp'},
-                                                         {'name': 'serviceDeliveryEndTimeStamp',
-                                                          'optional': True,
-                                                          'tag': {'number': 11},
-                                                          'type': 'TimeStamp'},
-                                                         {'name': 'recordOpeningTime',
-                                                          'optional': True,
-                                                          'tag': {'number': 12},
-                                                          'type': 'TimeStamp'},
-                                                         {'name': 'recordClosureTime',
-                                                          'optional': True,
-                                                          'tag': {'number': 13},
-                                                          'type': 'TimeStamp'},
-                                                         {'name': 'interOperatorIdentifiers',
-                                                          'optional': True,
-                                                          'tag': {'number': 14},
-                                                          'type': 'InterOperatorIdentifierlist'},
-                                                         {'name': 'localRecordSequenceNumber',
-                                                          'optional': True,
-                                                          'tag': {'number': 15},
-                                                          'type': 'LocalSequenceNumber'},
-                                                         {'name': 'recordSequenceNumber',
-                                                          'optional': True,
-                                                          'tag': {'number': 16},
-                                                          'type': 'INTEGER'},
-                                                         {'name': 'causeForRecordClosing',
-                                                          'optional': True,
-                                                          'tag': {'number': 17},
-                                                          'type': 'CauseForRecordClosing'},
-                                                         {'name': 'incomplete-CDR-Indication',
-                                                          'optional': True,
-                                                          'tag': {'number': 18},
-                                                          'type': 'Incomplete-CDR-Indication'},
-                                                         {'name': 'iMS-Charging-Identifier',
-                                                          'optional': True,
-                                                          'tag': {'number': 19},
-                                                          'type': 'IMS-Charging-Identifier'},
-                                                         {'element': {'type': 'Media-Components-List'},
-                                                          'name': 'list-Of-SDP-Media-Components',
-                                                          'optional': True,
-                                                          'tag': {'number': 21},
-                                                          'type': 'SEQUENCE '
-                                                                  'OF'},
-                                                         {'name': 'serviceReasonReturnCode',
-                                                          'optional': True,
-                                                          'tag': {'number': 23},
-                                                          'type': 'UTF8String'},
-                                                         {'name': 'recordExtensions',
-                                                          'optional': True,
-                                                          'tag': {'number': 25},
-                                                          'type': 'ManagementExtensions'},
-                                                         {'name': 'expiresInformation',
-                                                          'optional': True,
-                                                          'tag': {'number': 26},
-                                                          'type': 'INTEGER'},
-                                                         {'name': 'event',
-                                                          'optional': True,
-                                                          'tag': {'number': 28},
-                                                          'type': 'UTF8String'},
-                                                         {'name': 'serviceContextID',
-                                                          'optional': True,
-                                                          'tag': {'number': 30},
-                                                          'type': 'ServiceContextID'},
-                                                         {'element': {'type': 'Early-Media-Components-List'},
-                                                          'name': 'list-Of-Early-SDP-Media-Components',
-                                                          'optional': True,
-                                                          'tag': {'number': 32},
-                                                          'type': 'SEQUENCE '
-                                                                  'OF'},
-                                                         {'name': 'iMSCommunicationServiceIdentifier',
-                                                          'optional': True,
-                                                          'tag': {'number': 33},
-                                                          'type': 'IMSCommunicationServiceIdentifier'},
-                                                         {'name': 'numberPortabilityRouting',
-                                                          'optional': True,
-                                                          'tag': {'number': 34},
-                                                          'type': 'NumberPortabilityRouting'},
-                                                         {'name': 'carrierSelectRouting',
-                                                          'optional': True,
-                                                          'tag': {'number': 35},
-                                                          'type': 'CarrierSelectRouting'},
-                                                         {'name': 'ims-3gpp-Session-Priority',
-                                                          'optional': True,
-                                                          'tag': {'number': 36},
-                                                          'type': 'INTEGER'},
-                                                         {'name': 'serviceRequestTimeStampFraction',
-                                                          'optional': True,
-                                                          'tag': {'number': 37},
-                                                          'type': 'Milliseconds'},
-                                                         {'name': 'serviceDeliveryStartTimeStampFraction',
-                                                          'optional': True,
-                                                          'tag': {'number': 38},
-                                                          'type': 'Milliseconds'},
-                                                         {'name': 'serviceDeliveryEndTimeStampFraction',
-                                                          'optional': True,
-                                                          'tag': {'number': 39},
-                                                          'type': 'Milliseconds'},
-                                                         {'name': 'transit-IOI-List',
-                                                          'optional': True,
-                                                          'tag': {'number': 45},
-                                                          'type': 'GraphicString'},
-                                                         {'name': 'nNI-Information',
-                                                          'optional': True,
-                                                          'tag': {'number': 46},
-                                                          'type': 'NNI-Information'},
-                                                         {'name': 'privateUserID',
-                                                          'optional': True,
-                                                          'tag': {'number': 8},
-                                                          'type': 'GraphicString'},
-                                                         {'element': {'type': 'MessageBody'},
-                                                          'name': 'list-Of-Message-Bodies',
-                                                          'optional': True,
-                                                          'tag': {'number': 24},
-                                                          'type': 'SEQUENCE '
-                                                                  'OF'},
-                                                         {'name': 'accessNetworkInformation',
-                                                          'optional': True,
-                                                          'tag': {'number': 29},
-                                                          'type': 'OCTET '
-                                                                  'STRING'},
-                                                         {'element': {'type': 'SubscriptionID'},
-                                                          'name': 'list-of-subscription-ID',
-                                                          'optional': True,
-                                                          'tag': {'number': 31},
-                                                          'type': 'SEQUENCE '
-                                                                  'OF'},
-                                                         {'name': 'servedPartyIPAddress',
-                                                          'optional': True,
-                                                          'tag': {'number': 50},
-                                                          'type': 'ServedPartyIPAddress'},
-                                                         {'name': 'duration',
-                                                          'optional': True,
-                                                          'tag': {'number': 200},
-                                                          'type': 'INTEGER'},
-                                                         {'name': 'ringing-Duration',
-                                                          'optional': True,
-                                                          'tag': {'number': 204},
-                                                          'type': 'UnsignedInter32'},
-                                                         {'name': 'session-Priority',
-                                                          'optional': True,
-                                                          'tag': {'number': 205},
-                                                          'type': 'Session-Priority'},
-                                                         {'name': 'carrier-Identification-Code',
-                                                          'optional': True,
-                                                          'tag': {'number': 206},
-                                                          'type': 'GraphicString'},
-                                                         {'name': 'abnormal-Finish-Info',
-                                                          'optional': True,
-                                                          'tag': {'number': 207},
-                                                          'type': 'Abnormal-Finish-Info'},
-                                                         {'name': 'nP-Data',
-                                                          'optional': True,
-                                                          'tag': {'number': 208},
-                                                          'type': 'NP-Data'},
-                                                         {'name': 'refer-To',
-                                                          'optional': True,
-                                                          'tag': {'number': 209},
-                                                          'type': 'UTF8String'},
-                                                         {'name': 'target',
-                                                          'optional': True,
-                                                          'tag': {'number': 210},
-                                                          'type': 'UTF8String'},
-                                                         {'name': 'accounting-record-type',
-                                                          'optional': True,
-                                                          'tag': {'number': 227},
-                                                          'type': 'INTEGER'},
-                                                         {'name': 'np-Route-Number',
-                                                          'optional': True,
-                                                          'tag': {'number': 211},
-                                                          'type': 'OCTET '
-                                                                  'STRING'},
-                                                         {'name': 'recordExtensions1',
-                                                          'optional': True,
-                                                          'tag': {'number': 241},
-                                                          'type': 'ManagementExtensions'},
-                                                         {'name': 'recordExtensions2',
-                                                          'optional': True,
-                                                          'tag': {'number': 242},
-                                                          'type': 'ManagementExtensions'},
-                                                         {'name': 'trunkGroupID',
-                                                          'optional': True,
-                                                          'tag': {'number': 243},
-                                                          'type': 'TrunkGroupIBCF'},
-                                                         {'name': 'onlineChargingType',
-                                                          'optional': True,
-                                                          'tag': {'number': 244},
-                                                          'type': 'Online-Charging-Type'},
-                                                         {'name': 'qos-Statistics',
-                                                          'optional': True,
-                                                          'tag': {'number': 412},
-                                                          'type': 'UTF8String'},
-                                                         {'name': 'interworking-Signaling-Address',
-                                                          'optional': True,
-                                                          'tag': {'number': 431},
-                                                          'type': 'Interworking-Signaling-Address'},
-                                                         {'name': 'sDP-Media-Identifier',
-                                                          'optional': True,
-                                                          'tag': {'number': 233},
-                                                          'type': 'SDP-Media-Identifier'},
-                                                         {'element': {'type': 'SIP-Diversion'},
-                                                          'name': 'list-of-SIP-Diversion',
-                                                          'optional': True,
-                                                          'tag': {'number': 456},
-                                                          'type': 'SEQUENCE '
-                                                                  'OF'},
-                                                         {'name': 'dialled-Party-Address',
-                                                          'optional': True,
-                                                          'tag': {'number': 203},
-                                                          'type': 'InvolvedParty'}],
-                                             'type': 'SET'},
-                              'ICSCFRecord': {'members': [{'name': 'recordType',
-                                                           'optional': True,
-                                                           'tag': {'number': 0},
-                                                           'type': 'RecordType'},
-                                                          {'name': 'retransmission',
-                                                           'optional': True,
-                                                           'tag': {'number': 1},
-                                                           'type': 'NULL'},
-                                                          {'name': 'sIP-Method',
-                                                           'optional': True,
-                                                           'tag': {'number': 2},
-                                                           'type': 'SIP-Method'},
-                                                          {'name': 'role-of-Node',
-                                                           'optional': True,
-                                                           'tag': {'number': 3},
-                                                           'type': 'Role-of-Node'},
-                                                          {'name': 'nodeAddress',
-                                                           'optional': True,
-                                                           'tag': {'number': 4},
-                                                           'type': 'NodeAddress'},
-                                                          {'name': 'session-Id',
-                                                           'optional': True,
-                                                           'tag': {'number': 5},
-                                                           'type': 'Session-Id'},
-                                                          {'name': 'list-Of-Calling-Party-Address',
-                                                           'optional': True,
-                                                           'tag': {'number': 6},
-                                                           'type': 'ListOfInvolvedParties'},
-                                                          {'name': 'called-Party-Address',
-                                                           'optional': True,
-                                                           'tag': {'number': 7},
-                                                           'type': 'InvolvedParty'},
-                                                          {'name': 'serviceRequestTimeStamp',
-                                                           'optional': True,
-                                                           'tag': {'number': 9},
-                                                           'type': 'TimeStamp'},
-                                                          {'name': 'interOperatorIdentifiers',
-                                                           'optional': True,
-                                                           'tag': {'number': 14},
-                                                           'type': 'InterOperatorIdentifierlist'},
-                                                          {'name': 'localRecordSequenceNumber',
-                                                           'optional': True,
-                                                           'tag': {'number': 15},
-                                                           'type': 'LocalSequenceNumber'},
-                                                          {'name': 'causeForRecordClosing',
-                                                           'optional': True,
-                                                           'tag': {'number': 17},
-                                                           'type': 'CauseForRecordClosing'},
-                                                          {'name': 'incomplete-CDR-Indication',
-                                                           'optional': True,
-                                                           'tag': {'number': 18},
-                                                           'type': 'Incomplete-CDR-Indication'},
-                                                          {'name': 'iMS-Charging-Identifier',
-                                                           'optional': True,
-                                                           'tag': {'number': 19},
-                                                           'type': 'IMS-Charging-Identifier'},
-                                                          {'name': 'serviceReasonReturnCode',
-                                                           'optional': True,
-                                                           'tag': {'number': 23},
-                                                           'type': 'UTF8String'},
-                                                          {'name': 'recordExtensions',
-                                                           'optional': True,
-                                                           'tag': {'number': 25},
-                                                           'type': 'ManagementExtensions'},
-                                                          {'name': 'expiresInformation',
-                                                           'optional': True,
-                                                           'tag': {'number': 26},
-                                                           'type': 'INTEGER'},
-                                                          {'name': 'list-Of-Associated-URI',
-                                                           'optional': True,
-                                                           'tag': {'number': 27},
-                                                           'type': 'ListOfInvolvedParties'},
-                                                          {'name': 'event',
-                                                           'optional': True,
-                                                           'tag': {'number': 28},
-                                                           'type': 'UTF8String'},
-                                                          {'name': 'accessNetworkInformation',
-                                                           'optional': True,
-                                                           'tag': {'number': 29},
-                                                           'type': 'OCTET '
-                                                                   'STRING'},
-                                                          {'name': 'serviceContextID',
-                                                           'optional': True,
-                                                           'tag': {'number': 30},
-                                                           'type': 'ServiceContextID'},
-                                                          {'name': 'numberPortabilityRouting',
-                                                           'optional': True,
-                                                           'tag': {'number': 34},
-                                                           'type': 'NumberPortabilityRouting'},
-                                                          {'name': 'carrierSelectRouting',
-                                                           'optional': True,
-                                                           'tag': {'number': 35},
-                                                           'type': 'CarrierSelectRouting'},
-                                                          {'name': 'ims-3gpp-Session-Priority',
-                                                           'optional': True,
-                                                           'tag': {'number': 36},
-                                                           'type': 'INTEGER'},
-                                                          {'name': 's-CSCF-Information',
-                                                           'optional': True,
-                                                           'tag': {'number': 61},
-                                                           'type': 'S-CSCF-Information'},
-                                                          {'element': {'type': 'MessageBody'},
-                                                           'name': 'list-Of-Message-Bodies',
-                                                           'optional': True,
-                                                           'tag': {'number': 24},
-                                                           'type': 'SEQUENCE '
-                                                                   'OF'},
-                                                          {'element': {'type': 'SubscriptionID'},
-                                                           'name': 'list-of-subscription-ID',
-                                                           'optional': True,
-                                                           'tag': {'number': 31},
-                                                           'type': 'SEQUENCE '
-                                                                   'OF'},
-                                                          {'name': 'abnormal-Finish-Info',
-                                                           'optional': True,
-                                                           'tag': {'number': 207},
-                                                           'type': 'Abnormal-Finish-Info'}],
-                                              'type': 'SET'},
-                              'IMPU': {'type': 'GraphicString'},
-                              'IMS-Charging-Identifier': {'type': 'OCTET '
-                                                                  'STRING'},
-                              'IMSCommunicationServiceIdentifier': {'type': 'OCTET '
-                                                                            'STRING'},
-                              'IMSRecord': {'members': [{'name': 'sCSCFRecord',
-                                                         'tag': {'number': 63},
-                                                         'type': 'SCSCFRecord'},
-                                                        {'name': 'pCSCFRecord',
-                                                         'tag': {'number': 64},
-                                                         'type': 'PCSCFRecord'},
-                                                        {'name': 'iCSCFRecord',
-                                                         'tag': {'number': 65},
-                                                         'type': 'ICSCFRecord'},
-                                                        {'name': 'mRFCRecord',
-                                                         'tag': {'number': 66},
-                                                         'type': 'MRFCRecord'},
-                                                        {'name': 'mGCFRecord',
-                                                         'tag': {'number': 67},
-                                                         'type': 'MGCFRecord'},
-                                                        {'name': 'bGCFRecord',
-                                                         'tag': {'number': 68},
-                                                         'type': 'BGCFRecord'},
-                                                        {'name': 'aTSRecord',
-                                                         'tag': {'number': 69},
-                                                         'type': 'ATSRecord'},
-                                                        {'name': 'eCSCFRecord',
-                                                         'tag': {'number': 70},
-                                                         'type': 'ECSCFRecord'},
-                                                        {'name': 'iBCFRecord',
-                                                         'tag': {'number': 82},
-                                                         'type': 'IBCFRecord'},
-                                                        {'name': 'vCCASRecord',
-                                                         'tag': {'number': 201},
-                                                         'type': 'VCCASRecord'},
-                                                        {'name': 'vIDEOASRecord',
-                                                         'tag': {'number': 202},
-                                                         'type': 'VideoASRecord'},
-                                                        {'name': 'aLUCTSRecord',
-                                                         'tag': {'number': 203},
-                                                         'type': 'ALUCTSRecord'},
-                                                        {'name': 'mEDIAXRecord',
-                                                         'tag': {'number': 204},
-                                                         'type': 'MediaXRecord'},
-                                                        {'name': 'aGCFRecord',
-                                                         'tag': {'number': 205},
-                                                         'type': 'AGCFRecord'},
-                                                        {'name': 'cONFERENCEASRecord',
-                                                         'tag': {'number': 206},
-                                                         'type': 'ConferenceASRecord'},
-                                                        {'name': 'rCSRecord',
-                                                         'tag': {'number': 252},
-                                                         'type': 'RCSRecord'},
-                                                        {'name': 'sBCRecord',
-                                                         'tag': {'number': 253},
-                                                         'type': 'SBCRecord'},
-                                                        {'name': 'cENTREXASRecord',
-                                                         'tag': {'number': 254},
-                                                         'type': 'CentrexASRecord'}],
-                                            'type': 'CHOICE'},
-                              'IN-Information': {'members': [{'name': 'service-Key',
-                                                              'optional': True,
-                                                              'tag': {'number': 0},
-                                                              'type': 'INTEGER'},
-                                                             {'name': 'call-Reference-Number',
-                                                              'optional': True,
-                                                              'tag': {'number': 1},
-                                                              'type': 'UTF8String'},
-                                                             {'name': 'fci-Free-Format-Data',
-                                                              'optional': True,
-                                                              'tag': {'number': 2},
-                                                              'type': 'OCTET '
-                                                                      'STRING'},
-                                                             {'name': 'fci-Free-Format-Data-Manner',
-                                                              'optional': True,
-                                                              'tag': {'number': 3},
-                                                              'type': 'Fci-Free-Format-Data-Manner'},
-                                                             {'name': 'default-Call-Handling',
-                                                              'optional': True,
-                                                              'tag': {'number': 4},
-                                                              'type': 'Default-Call-Handling'},
-                                                             {'name': 'scf-address',
-                                                              'optional': True,
-                                                              'tag': {'number': 5},
-                                                              'type': 'OCTET '
-                                                                      'STRING'},
-                                                             {'name': 'iN-Generic-Number',
-                                                              'optional': True,
-                                                              'tag': {'number': 6},
-                                                              'type': 'UTF8String'},
-                                                             {'name': 'level-Of-Camel-Service',
-                                                              'optional': True,
-                                                              'tag': {'number': 7},
-                                                              'type': 'Level-Of-Camel-Service'},
-                                                             {'name': 'charge-Class',
-                                                              'optional': True,
-                                                              'tag': {'number': 8},
-                                                              'type': 'UnsignedInter32'},
-                                                             {'name': 'iN-Bypass',
-                                                              'optional': True,
-                                                              'tag': {'number': 9},
-                                                              'type': 'UnsignedInter32'},
-                                                             {'name': 'camel-Destination-Number',
-                                                              'optional': True,
-                                                              'tag': {'number': 10},
-                                                              'type': 'UTF8String'},
-                                                             {'name': 'camel-Destination-Number-Type',
-                                                              'optional': True,
-                                                              'tag': {'number': 11},
-                                                              'type': 'Camel-Destination-Number-Type'},
-                                                             {'name': 'sCI-Charge-Number',
-                                                              'optional': True,
-                                                              'tag': {'number': 12},
-                                                              'type': 'OCTET '
-                                                                      'STRING'},
-                                                             {'name': 'fCI-Charge-Number',
-                                                              'optional': True,
-                                                              'tag': {'number': 13},
-                                                              'type': 'OCTET '
-                                                                      'STRING'},
-                                                             {'name': 'fCI-Charged-Party-ID',
-                                                              'optional': True,
-                                                              'tag': {'number': 14},
-                                                              'type': 'OCTET '
-                                                                      'STRING'},
-                                                             {'name': 'aOCParameters',
-                                                              'optional': True,
-                                                              'tag': {'number': 15},
-                                                              'type': 'AOCParameters'},
-                                                             {'name': 'interaction-With-IP',
-                                                              'optional': True,
-                                                              'tag': {'number': 16},
-                                                              'type': 'UnsignedInter32'},
-                                                             {'name': 'resource-Charge-IP-number',
-                                                              'optional': True,
-                                                              'tag': {'number': 17},
-                                                              'type': 'OCTET '
-                                                                      'STRING'},
-                                                             {'name': 'iN-Composite-CDR',
-                                                              'optional': True,
-                                                              'tag': {'number': 18},
-                                                              'type': 'UnsignedInter32'},
-                                                             {'name': 'iN-Service-Trigger',
-                                                              'optional': True,
-                                                              'tag': {'number': 19},
-                                                              'type': 'UTF8String'},
-                                                             {'name': 'sSF-Charging-Case',
-                                                              'optional': True,
-                                                              'tag': {'number': 20},
-                                                              'type': 'UnsignedInter32'},
-                                                             {'name': 'global-Title-Subsystem',
-                                                              'optional': True,
-                                                              'tag': {'number': 21},
-                                                              'type': 'OCTET '
-                                                                      'STRING'},
-                                                             {'name': 'time-For-TH-EOS',
-                                                              'optional': True,
-                                                              'tag': {'number': 22},
-                                                              'type': 'TimeStamp'},
-                                                             {'name': 'trigger-Detection-Point',
-                                                              'optional': True,
-                                                              'tag': {'number': 23},
-                                                              'type': 'UnsignedInter32'}],
-                                                 'type': 'SEQUENCE'},
-                              'IPAddress': {'members': [{'name': 'iPBinaryAddress',
-                                                         'type': 'IPBinaryAddress'},
-                                                        {'name': 'iPTextRepresentedAddress',
-                                                         'type': 'IPTextRepresentedAddress'}],
-                                            'type': 'CHOICE'},
-                              'IPBinaryAddress': {'members': [{'name': 'iPBinV4Address',
-                                                               'size': [4],
-                                                               'tag': {'number': 0},
-                                                               'type': 'OCTET '
-                                                                       'STRING'},
-                                                              {'name': 'iPBinV6Address',
-                                                               'size': [16],
-                                                               'tag': {'number': 1},
-                                                               'type': 'OCTET '
-                                                                       'STRING'}],
-                                                  'type': 'CHOICE'},
-                              'IPTextRepresentedAddress': {'members': [{'name': 'iPTextV4Address',
-                                                                        'size': [(7,
-                                                                                  15)],
-                                                                        'tag': {'number': 2},
-                                                                        'type': 'IA5String'},
-                                                                       {'name': 'iPTextV6Address',
-                                                                        'size': [(15,
-                                                                                  45)],
-                                                                        'tag': {'number': 3},
-                                                                        'type': 'IA5String'}],
-                                                           'type': 'CHOICE'},
-                              'Incomplete-CDR-Indication': {'members': [{'name': 'aCRStartLost',
-                                                                         'optional': True,
-                                                                         'tag': {'number': 0},
-                                                                         'type': 'BOOLEAN'},
-                                                                        {'name': 'aCRInterimLost',
-                                                                         'optional': True,
-                                                                         'tag': {'number': 1},
-                                                                         'type': 'ACRInterimLost'},
-                                                                        {'name': 'aCRStopLost',
-                                                                         'optional': True,
-                                                                         'tag': {'number': 2},
-                                                                         'type': 'BOOLEAN'}],
-                                                            'type': 'SET'},
-                              'InterOperatorIdentifierlist': {'element': {'type': 'InterOperatorIdentifiers'},
-                                                              'type': 'SEQUENCE '
-                                                                      'OF'},
-                              'InterOperatorIdentifiers': {'members': [{'name': 'originatingIOI',
-                                                                        'optional': True,
-                                                                        'tag': {'number': 0},
-                                                                        'type': 'GraphicString'},
-                                                                       {'name': 'terminatingIOI',
-                                                                        'optional': True,
-                                                                        'tag': {'number': 1},
-                                                                        'type': 'GraphicString'}],
-                                                           'type': 'SEQUENCE'},
-                              'Interworking-Signaling-Address': {'members': [{'name': 'ingress-Local-Signaling-Address',
-                                                                              'optional': True,
-                                                                              'tag': {'number': 0},
-                                                                              'type': 'UTF8String'},
-                                                                             {'name': 'ingress-Remote-Signaling-Address',
-                                                                              'optional': True,
-                                                                              'tag': {'number': 1},
-                                                                              'type': 'UTF8String'},
-                                                                             {'name': 'egress-Local-Signaling-Address',
-                                                                              'optional': True,
-                                                                              'tag': {'number': 2},
-                                                                              'type': 'UTF8String'},
-                                                                             {'name': 'egress-Remote-Signaling-Address',
-                                                                              'optional': True,
-                                                                              'tag': {'number': 3},
-                                                                              'type': 'UTF8String'}],
-                                                                 'type': 'SET'},
-                              'InvolvedParty': {'members': [{'name': 'sIP-URI',
-                                                             'tag': {'number': 0},
-                                                             'type': 'GraphicString'},
-                                                            {'name': 'tEL-URI',
-                                                             'tag': {'number': 1},
-                                                             'type': 'GraphicString'}],
-                                                'type': 'CHOICE'},
-                              'IsVolte-Call-Type': {'type': 'ENUMERATED',
-                                                    'values': [('vOLTE', 1),
-                                                               ('vOBB', 2)]},
-                              'Level': {'type': 'ENUMERATED',
-                                        'values': [('level-1', 1),
-                                                   ('level-2', 2),
-                                                   ('level-3', 3),
-                                                   ('level-4', 4),
-                                                   ('level-5', 5)]},
-                              'Level-Of-Camel-Service': {'named-bits': [('basic',
-                                                                         '0'),
-                                                                        ('call-duration-supervision',
-                                                                         '1'),
-                                                                        ('online-charging',
-                                                                         '2'),
-                                                                        ('call-party-handling',
-                                                                         '3'),
-                                                                        ('tc-end',
-                                                                         '4')],
-                                                         'type': 'BIT STRING'},
-                              'ListOfInvolvedParties': {'element': {'type': 'InvolvedParty'},
-                                                        'type': 'SEQUENCE OF'},
-                              'ListOfSDPMediaComponents': {'members': [{'element': {'type': 'Media-Components-List-Centrex-test'},
-                                                                        'name': 'listOfSDPMediaComponent',
-                                                                        'tag': {'number': 0},
-                                                                        'type': 'SEQUENCE '
-                                                                                'OF'}],
-                                                           'type': 'SEQUENCE'},
-                              'ListOfSDPMediaComponentsATS': {'members': [{'element': {'type': 'Media-Components-List-ATS-test'},
-                                                                           'name': 'listOfSDPMediaComponentATS',
-                                                                           'tag': {'number': 0},
-                                                                           'type': 'SEQUENCE '
-                                                                                   'OF'}],
-                                                              'type': 'SET'},
-                              'LocalSequenceNumber': {'restricted-to': [(0,
-                                                                         4294967295)],
-                                                      'type': 'INTEGER'},
-                              'Location-Information': {'type': 'GraphicString'},
-                              'LocationAreaCode': {'size': [2],
-                                                   'type': 'OCTET STRING'},
-                              'Logic-Resource': {'members': [{'name': 'port-media-type',
-                                                              'optional': True,
-                                                              'tag': {'number': 20},
-                                                              'type': 'Port-Media-Type'},
-                                                             {'name': 'port-count',
-                                                              'optional': True,
-                                                              'tag': {'number': 21},
-                                                              'type': 'INTEGER'}],
-                                                 'type': 'SEQUENCE'},
-                              'MGCFRecord': {'members': [{'name': 'recordType',
-                                                          'optional': True,
-                                                          'tag': {'number': 0},
-                                                          'type': 'RecordType'},
-                                                         {'name': 'retransmission',
-                                                          'optional': True,
-                                                          'tag': {'number': 1},
-                                                          'type': 'NULL'},
-                                                         {'name': 'sIP-Method',
-                                                          'optional': True,
-                                                          'tag': {'number': 2},
-                                                          'type': 'SIP-Method'},
-                                                         {'name': 'role-of-Node',
-                                                          'optional': True,
-                                                          'tag': {'number': 3},
-                                                          'type': 'Role-of-Node'},
-                                                         {'name': 'nodeAddress',
-                                                          'optional': True,
-                                                          'tag': {'number': 4},
-                                                          'type': 'NodeAddress'},
-                                                         {'name': 'session-Id',
-                                                          'optional': True,
-                                                          'tag': {'number': 5},
-                                                          'type': 'Session-Id'},
-                                                         {'name': 'list-Of-Calling-Party-Address',
-                                                          'optional': True,
-                                                          'tag': {'number': 6},
-                                                          'type': 'ListOfInvolvedParties'},
-                                                         {'name': 'called-Party-Address',
-                                                          'optional': True,
-                                                          'tag': {'number': 7},
-                                                          'type': 'InvolvedParty'},
-                                                         {'name': 'serviceRequestTimeStamp',
-                                                          'optional': True,
-                                                          'tag': {'number': 9},
-                                                          'type': 'TimeStamp'},
-                                                         {'name': 'serviceDeliveryStartTimeStamp',
-                                                          'optional': True,
-                                                          'tag': {'number': 10},
-                                                          'type': 'TimeStamp'},
-                                                         {'name': 'serviceDeliveryEndTimeStamp',
-                                                          'optional': True,
-                                                          'tag': {'number': 11},
-                                                          'type': 'TimeStamp'},
-                                                         {'name': 'recordOpeningTime',
-                                                          'optional': True,
-                                                          'tag': {'number': 12},
-                                                          'type': 'TimeStamp'},
-                                                         {'name': 'recordClosureTime',
-                                                          'optional': True,
-                                                          'tag': {'number': 13},
-                                                          'type': 'TimeStamp'},
-                                                         {'name': 'interOperatorIdentifiers',
-                                                          'optional': True,
-                                                          'tag': {'number': 14},
-                                                          'type': 'InterOperatorIdentifierlist'},
-                                                         {'name': 'localRecordSequenceNumber',
-                                                          'optional': True,
-                                                          'tag': {'number': 15},
-                                                          'type': 'LocalSequenceNumber'},
-                                                         {'name': 'recordSequenceNumber',
-                                                          'optional': True,
-                                                          'tag': {'number': 16},
-                                                          'type': 'INTEGER'},
-                                                         {'name': 'causeForRecordClosing',
-                                                          'optional': True,
-                                                          'tag': {'number': 17},
-                                                          'type': 'CauseForRecordClosing'},
-                                                         {'name': 'incomplete-CDR-Indication',
-                                                          'optional': True,
-                                                          'tag': {'number': 18},
-                                                          'type': 'Incomplete-CDR-Indication'},
-                                                         {'name': 'iMS-Charging-Identifier',
-                                                          'optional': True,
-                                                          'tag': {'number': 19},
-                                                          'type': 'IMS-Charging-Identifier'},
-                                                         {'element': {'type': 'Media-Components-List'},
-                                                          'name': 'list-Of-SDP-Media-Components',
-                                                          'optional': True,
-                                                          'tag': {'number': 21},
-                                                          'type': 'SEQUENCE '
-                                                                  'OF'},
-                                                         {'name': 'serviceReasonReturnCode',
-                                                          'optional': True,
-                                                          'tag': {'number': 23},
-                                                          'type': 'UTF8String'},
-                                                         {'name': 'recordExtensions',
-                                                          'optional': True,
-                                                          'tag': {'number': 25},
-                                                          'type': 'ManagementExtensions'},
-                                                         {'name': 'expiresInformation',
-                                                          'optional': True,
-                                                          'tag': {'number': 26},
-                                                          'type': 'INTEGER'},
-                                                         {'name': 'event',
-                                                          'optional': True,
-                                                          'tag': {'number': 28},
-                                                          'type': 'UTF8String'},
-                                                         {'name': 'accessNetworkInformation',
-                                                          'optional': True,
-                                                          'tag': {'number': 29},
-                                                          'type': 'OCTET '
-                                                                  'STRING'},
-                                                         {'name': 'serviceContextID',
-                                                          'optional': True,
-                                                          'tag': {'number': 30},
-                                                          'type': 'ServiceContextID'},
-                                                         {'element': {'type': 'Early-Media-Components-List'},
-                                                          'name': 'list-Of-Early-SDP-Media-Components',
-                                                          'optional': True,
-                                                          'tag': {'number': 32},
-                                                          'type': 'SEQUENCE '
-                                                                  'OF'},
-                                                         {'name': 'numberPortabilityRouting',
-                                                          'optional': True,
-                                                          'tag': {'number': 34},
-                                                          'type': 'NumberPortabilityRouting'},
-                                                         {'name': 'carrierSelectRouting',
-                                                          'optional': True,
-                                                          'tag': {'number': 35},
-                                                          'type': 'CarrierSelectRouting'},
-                                                         {'name': 'serviceRequestTimeStampFraction',
-                                                          'optional': True,
-                                                          'tag': {'number': 37},
-                                                          'type': 'Milliseconds'},
-                                                         {'name': 'serviceDeliveryStartTimeStampFraction',
-                                                          'optional': True,
-                                                          'tag': {'number': 38},
-                                                          'type': 'Milliseconds'},
-                                                         {'name': 'serviceDeliveryEndTimeStampFraction',
-                                                          'optional': True,
-                                                          'tag': {'number': 39},
-                                                          'type': 'Milliseconds'},
-                                                         {'name': 'trunkGroupID',
-                                                          'optional': True,
-                                                          'tag': {'number': 80},
-                                                          'type': 'TrunkGroupID'},
-                                                         {'name': 'bearerService',
-                                                          'optional': True,
-                                                          'tag': {'number': 81},
-                                                          'type': 'TransmissionMedium'},
-                                                         {'name': 'privateUserID',
-                                                          'optional': True,
-                                                          'tag': {'number': 8},
-                                                          'type': 'GraphicString'},
-                                                         {'name': 'gGSNaddress',
-                                                          'optional': True,
-                                                          'tag': {'number': 22},
-                                                          'type': 'NodeAddress'},
-                                                         {'element': {'type': 'MessageBody'},
-                                                          'name': 'list-Of-Message-Bodies',
-                                                          'optional': True,
-                                                          'tag': {'number': 24},
-                                                          'type': 'SEQUENCE '
-                                                                  'OF'},
-                                                         {'name': 'duration',
-                                                          'optional': True,
-                                                          'tag': {'number': 200},
-                                                          'type': 'INTEGER'},
-                                                         {'name': 'abnormal-Finish-Info',
-                                                          'optional': True,
-                                                          'tag': {'number': 207},
-                                                          'type': 'Abnormal-Finish-Info'},
-                                                         {'name': 'additional-Calling-Party-Address',
-                                                          'optional': True,
-                                                          'tag': {'number': 252},
-                                                          'type': 'UTF8String'},
-                                                         {'name': 'nP-Query',
-                                                          'optional': True,
-                                                          'tag': {'number': 801},
-                                                          'type': 'NP-Query'},
-                                                         {'name': 'session-Priority',
-                                                          'optional': True,
-                                                          'tag': {'number': 205},
-                                                          'type': 'Session-Priority'},
-                                                         {'name': 'nP-Data',
-                                                          'optional': True,
-                                                          'tag': {'number': 208},
-                                                          'type': 'NP-Data'},
-                                                         {'name': 'chargingCategory',
-                                                          'optional': True,
-                                                          'tag': {'number': 216},
-                                                          'type': 'ChargingCategory'},
-                                                         {'name': 'call-property',
-                                                          'optional': True,
-                                                          'tag': {'number': 222},
-                                                          'type': 'INTEGER'},
-                                                         {'name': 'charged-party',
-                                                          'optional': True,
-                                                          'tag': {'number': 156},
-                                                          'type': 'InvolvedParty'},
-                                                         {'name': 'ims-3gpp-Session-Priority',
-                                                          'optional': True,
-                                                          'tag': {'number': 36},
-                                                          'type': 'INTEGER'},
-                                                         {'name': 'ringing-Duration',
-                                                          'optional': True,
-                                                          'tag': {'number': 204},
-                                                          'type': 'UnsignedInter32'},
-                                                         {'name': 'accounting-record-type',
-                                                          'optional': True,
-                                                          'tag': {'number': 227},
-                                                          'type': 'INTEGER'},
-                                                         {'name': 'carrier-Identification-Code',
-                                                          'optional': True,
-                                                          'tag': {'number': 206},
-                                                          'type': 'GraphicString'},
-                                                         {'name': 'session-Release-Mode',
-                                                          'optional': True,
-                                                          'tag': {'number': 414},
-                                                          'type': 'INTEGER'},
-                                                         {'name': 'origin-Callee-Party-Address',
-                                                          'optional': True,
-                                                          'tag': {'number': 202},
-                                                          'type': 'InvolvedParty'},
-                                                         {'name': 'redirecting-Number',
-                                                          'optional': True,
-                                                          'tag': {'number': 451},
-                                                          'type': 'InvolvedParty'},
-                                                         {'name': 'prefixes',
-                                                          'optional': True,
-                                                          'tag': {'number': 452},
-                                                          'type': 'GraphicString'}],
-                                             'type': 'SET'},
-                              'MMTelInformation': {'members': [{'element': {'type': 'SupplService'},
-                                                                'name': 'listOfSupplServices',
-                                                                'optional': True,
-                                                                'tag': {'number': 0},
-                                                                'type': 'SEQUENCE '
-                                                                        'OF'},
-                                                               {'name': 'subscriberRole',
-                                                                'optional': True,
-                                                                'tag': {'number': 1},
-                                                                'type': 'SubscriberRole'}],
-                                                   'type': 'SET'},
-                              'MRFCRecord': {'members': [{'name': 'recordType',
-                                                          'optional': True,
-                                                          'tag': {'number': 0},
-                                                          'type': 'RecordType'},
-                                                         {'name': 'retransmission',
-                                                          'optional': True,
-                                                          'tag': {'number': 1},
-                                                          'type': 'NULL'},
-                                                         {'name': 'sIP-Method',
-                                                          'optional': True,
-                                                          'tag': {'number': 2},
-                                                          'type': 'SIP-Method'},
-                                                         {'name': 'role-of-Node',
-                                                          'optional': True,
-                                                          'tag': {'number': 3},
-                                                          'type': 'Role-of-Node'},
-                                                         {'name': 'nodeAddress',
-                                                          'optional': True,
-                                                          'tag': {'number': 4},
-                                                          'type': 'NodeAddress'},
-                                                         {'name': 'session-Id',
-                                                          'optional': True,
-                                                          'tag': {'number': 5},
-                                                          'type': 'Session-Id'},
-                                                         {'name': 'list-Of-Calling-Party-Address',
-                                                          'optional': True,
-                                                          'tag': {'number': 6},
-                                                          'type': 'ListOfInvolvedParties'},
-                                                         {'name': 'called-Party-Address',
-                                                          'optional': True,
-                                                          'tag': {'number': 7},
-                                                          'type': 'InvolvedParty'},
-                                                         {'name': 'serviceRequestTimeStamp',
-                                                          'optional': True,
-                                                          'tag': {'number': 9},
-                                                          'type': 'TimeStamp'},
-                                                         {'name': 'serviceDeliveryStartTimeStamp',
-                                                          'optional': True,
-                                                          'tag': {'number': 10},
-                                                          'type': 'TimeStamp'},
-                                                         {'name': 'serviceDeliveryEndTimeStamp',
-                                                          'optional': True,
-                                                          'tag': {'number': 11},
-                                                          'type': 'TimeStamp'},
-                                                         {'name': 'recordOpeningTime',
-                                                          'optional': True,
-                                                          'tag': {'number': 12},
-                                                          'type': 'TimeStamp'},
-                                                         {'name': 'recordClosureTime',
-                                                          'optional': True,
-                                                          'tag': {'number': 13},
-                                                          'type': 'TimeStamp'},
-                                                         {'name': 'interOperatorIdentifiers',
-                                                          'optional': True,
-                                                          'tag': {'number': 14},
-                                                          'type': 'InterOperatorIdentifierlist'},
-                                                         {'name': 'localRecordSequenceNumber',
-                                                          'optional': True,
-                                                          'tag': {'number': 15},
-                                                          'type': 'LocalSequenceNumber'},
-                                                         {'name': 'recordSequenceNumber',
-                                                          'optional': True,
-                                                          'tag': {'number': 16},
-                                                          'type': 'INTEGER'},
-                                                         {'name': 'causeForRecordClosing',
-                                                          'optional': True,
-                                                          'tag': {'number': 17},
-                                                          'type': 'CauseForRecordClosing'},
-                                                         {'name': 'incomplete-CDR-Indication',
-                                                          'optional': True,
-                                                          'tag': {'number': 18},
-                                                          'type': 'Incomplete-CDR-Indication'},
-                                                         {'name': 'iMS-Charging-Identifier',
-                                                          'optional': True,
-                                                          'tag': {'number': 19},
-                                                          'type': 'IMS-Charging-Identifier'},
-                                                         {'element': {'type': 'Media-Components-List'},
-                                                          'name': 'list-Of-SDP-Media-Components',
-                                                          'optional': True,
-                                                          'tag': {'number': 21},
-                                                          'type': 'SEQUENCE '
-                                                                  'OF'},
-                                                         {'name': 'gGSNaddress',
-                                                          'optional': True,
-                                                          'tag': {'number': 22},
-                                                          'type': 'NodeAddress'},
-                                                         {'name': 'serviceReasonReturnCode',
-                                                          'optional': True,
-                                                          'tag': {'number': 23},
-                                                          'type': 'UTF8String'},
-                                                         {'name': 'recordExtensions',
-                                                          'optional': True,
-                                                          'tag': {'number': 25},
-                                                          'type': 'ManagementExtensions'},
-                                                         {'name': 'expiresInformation',
-                                                          'optional': True,
-                                                          'tag': {'number': 26},
-                                                          'type': 'INTEGER'},
-                                                         {'name': 'event',
-                                                          'optional': True,
-                                                          'tag': {'number': 28},
-                                                          'type': 'UTF8String'},
-                                                         {'name': 'accessNetworkInformation',
-                                                          'optional': True,
-                                                          'tag': {'number': 29},
-                                                          'type': 'OCTET '
-                                                                  'STRING'},
-                                                         {'name': 'serviceContextID',
-                                                          'optional': True,
-                                                          'tag': {'number': 30},
-                                                          'type': 'ServiceContextID'},
-                                                         {'element': {'type': 'SubscriptionID'},
-                                                          'name': 'list-of-subscription-ID',
-                                                          'optional': True,
-                                                          'tag': {'number': 31},
-                                                          'type': 'SEQUENCE '
-                                                                  'OF'},
-                                                         {'element': {'type': 'Early-Media-Components-List'},
-                                                          'name': 'list-Of-Early-SDP-Media-Components',
-                                                          'optional': True,
-                                                          'tag': {'number': 32},
-                                                          'type': 'SEQUENCE '
-                                                                  'OF'},
-                                                         {'name': 'numberPortabilityRouting',
-                                                          'optional': True,
-                                                          'tag': {'number': 34},
-                                                          'type': 'NumberPortabilityRouting'},
-                                                         {'name': 'carrierSelectRouting',
-                                                          'optional': True,
-                                                          'tag': {'number': 35},
-                                                          'type': 'CarrierSelectRouting'},
-                                                         {'element': {'type': 'ApplicationServersInformation'},
-                                                          'name': 'applicationServersInformation',
-                                                          'optional': True,
-                                                          'tag': {'number': 40},
-                                                          'type': 'SEQUENCE '
-                                                                  'OF'},
-                                                         {'name': 'service-Id',
-                                                          'optional': True,
-                                                          'tag': {'number': 70},
-                                                          'type': 'Service-Id'},
-                                                         {'name': 'requested-Party-Address',
-                                                          'optional': True,
-                                                          'tag': {'number': 71},
-                                                          'type': 'InvolvedParty'},
-                                                         {'name': 'list-Of-Called-Asserted-Identity',
-                                                          'optional': True,
-                                                          'tag': {'number': 72},
-                                                          'type': 'ListOfInvolvedParties'},
-                                                         {'name': 'privateUserID',
-                                                          'optional': True,
-                                                          'tag': {'number': 8},
-                                                          'type': 'GraphicString'},
-                                                         {'name': 'duration',
-                                                          'optional': True,
-                                                          'tag': {'number': 200},
-                                                          'type': 'INTEGER'},
-                                                         {'name': 'onlineChargingType',
-                                                          'optional': True,
-                                                          'tag': {'number': 201},
-                                                          'type': 'Online-Charging-Type'},
-                                                         {'name': 'origin-Callee-Party-Address',
-                                                          'optional': True,
-                                                          'tag': {'number': 202},
-                                                          'type': 'InvolvedParty'},
-                                                         {'name': 'dialled-Party-Address',
-                                                          'optional': True,
-                                                          'tag': {'number': 203},
-                                                          'type': 'InvolvedParty'},
-                                                         {'name': 'ringing-Duration',
-                                                          'optional': True,
-                                                          'tag': {'number': 204},
-                                                          'type': 'UnsignedInter32'},
-                                                         {'name': 'np-Route-Number',
-                                                          'optional': True,
-                                                          'tag': {'number': 211},
-                                                          'type': 'OCTET '
-                                                                  'STRING'},
-                                                         {'name': 'recordExtensions1',
-                                                          'optional': True,
-                                                          'tag': {'number': 241},
-                                                          'type': 'ManagementExtensions'}],
-                                             'type': 'SET'},
-                              'Main-Screen-Entrance-Type': {'type': 'INTEGER'},
-                              'ManagementExtension': {'members': [],
-                                                      'type': 'SET'},
-                              'ManagementExtensions': {'element': {'type': 'ManagementExtension'},
-                                                       'type': 'SET OF'},
-                              'Media-Components-List': {'members': [{'name': 'sIP-Request-Timestamp',
-                                                                     'optional': True,
-                                                                     'tag': {'number': 0},
-                                                                     'type': 'TimeStamp'},
-                                                                    {'name': 'sIP-Response-Timestamp',
-                                                                     'optional': True,
-                                                                     'tag': {'number': 1},
-                                                                     'type': 'TimeStamp'},
-                                                                    {'element': {'type': 'SDP-Media-Component'},
-                                                                     'name': 'sDP-Media-Components',
-                                                                     'optional': True,
-                                                                     'tag': {'number': 2},
-                                                                     'type': 'SEQUENCE '
-                                                                             'OF'},
-                                                                    {'name': 'mediaInitiatorFlag',
-                                                                     'optional': True,
-                                                                     'tag': {'number': 3},
-                                                                     'type': 'NULL'},
-                                                                    {'element': {'type': 'GraphicString'},
-                                                                     'name': 'sDP-Session-Description',
-                                                                     'optional': True,
-                                                                     'tag': {'number': 4},
-                                                                     'type': 'SEQUENCE '
-                                                                             'OF'},
-                                                                    {'name': 'mediaInitiatorParty',
-                                                                     'optional': True,
-                                                                     'tag': {'number': 5},
-                                                                     'type': 'InvolvedParty'},
-                                                                    {'name': 'sIP-Request-Timestamp-Fraction',
-                                                                     'optional': True,
-                                                                     'tag': {'number': 6},
-                                                                     'type': 'INTEGER'},
-                                                                    {'name': 'sIP-Response-Timestamp-Fraction',
-                                                                     'optional': True,
-                                                                     'tag': {'number': 7},
-                                                                     'type': 'INTEGER'},
-                                                                    {'name': 'sDP-Type',
-                                                                     'optional': True,
-                                                                     'tag': {'number': 8},
-                                                                     'type': 'SDP-Type'},
-                                                                    {'name': 'localGWInsertedIndication',
-                                                                     'optional': True,
-                                                                     'tag': {'number': 9},
-                                                                     'type': 'BOOLEAN'},
-                                                                    {'name': 'transcoderInsertedIndication',
-                                                                     'optional': True,
-                                                                     'tag': {'number': 11},
-                                                                     'type': 'BOOLEAN'}],
-                                                        'type': 'SEQUENCE'},
-                              'Media-Components-List-ATS-test': {'type': 'Media-Components-List'},
-                              'Media-Components-List-Centrex': {'members': [{'name': 'sIP-Request-Timestamp',
-                                                                             'optional': True,
-                                                                             'tag': {'number': 0},
-                                                                             'type': 'TimeStamp'},
-                                                                            {'name': 'sIP-Response-Timestamp',
-                                                                             'optional': True,
-                                                                             'tag': {'number': 1},
-                                                                             'type': 'TimeStamp'},
-                                                                            {'element': {'type': 'SDP-Media-Component'},
-                                                                             'name': 'sDP-Media-Components',
-                                                                             'optional': True,
-                                                                             'tag': {'number': 2},
-                                                                             'type': 'SEQUENCE '
-                                                                                     'OF'},
-                                                                            {'name': 'mediaInitiatorFlag',
-                                                                             'optional': True,
-                                                                             'tag': {'number': 3},
-                                                                             'type': 'NULL'},
-                                                                            {'element': {'type': 'GraphicString'},
-                                                                             'name': 'sDP-Session-Description',
-                                                                             'optional': True,
-                                                                             'tag': {'number': 4},
-                                                                             'type': 'SEQUENCE '
-                                                                                     'OF'},
-                                                                            {'name': 'sDP-Type',
-                                                                             'optional': True,
-                                                                             'tag': {'number': 5},
-                                                                             'type': 'SDP-Type'}],
-                                                                'type': 'SEQUENCE'},
-                              'Media-Components-List-Centrex-test': {'type': 'Media-Components-List-Centrex'},
-                              'MediaX-Terminal-Information': {'members': [{'name': 'terminal-type',
-                                                                           'optional': True,
-                                                                           'tag': {'number': 0},
-                                                                           'type': 'Terminal-Type'},
-                                                                          {'name': 'screen-number',
-                                                                           'optional': True,
-                                                                           'tag': {'number': 1},
-                                                                           'type': 'INTEGER'},
-                                                                          {'name': 'main-screen',
-                                                                           'optional': True,
-                                                                           'tag': {'number': 2},
-                                                                           'type': 'UTF8String'},
-                                                                          {'name': 'main-screen-entrance-type',
-                                                                           'optional': True,
-                                                                           'tag': {'number': 3},
-                                                                           'type': 'Main-Screen-Entrance-Type'}],
-                                                              'type': 'SET'},
-                              'MediaX-Type': {'type': 'INTEGER'},
-                              'MediaX-User-Information': {'members': [{'name': 'pay-account',
-                                                                       'optional': True,
-                                                                       'tag': {'number': 0},
-                                                                       'type': 'UTF8String'},
-                                                                      {'name': 'organization-id',
-                                                                       'optional': True,
-                                                                       'tag': {'number': 1},
-                                                                       'type': 'UTF8String'},
-                                                                      {'name': 'user-id',
-                                                                       'optional': True,
-                                                                       'tag': {'number': 2},
-                                                                       'type': 'UTF8String'},
-                                                                      {'name': 'call-id',
-                                                                       'optional': True,
-                                                                       'tag': {'number': 3},
-                                                                       'type': 'UTF8String'},
-                                                                      {'name': 'port-type',
-                                                                       'optional': True,
-                                                                       'tag': {'number': 4},
-                                                                       'type': 'Port-Type'},
-                                                                      {'name': 'end-code',
-                                                                       'optional': True,
-                                                                       'tag': {'number': 5},
-                                                                       'type': 'End-Code'},
-                                                                      {'name': 'group-id',
-                                                                       'optional': True,
-                                                                       'tag': {'number': 6},
-                                                                       'type': 'UTF8String'},
-                                                                      {'name': 'user-category',
-                                                                       'optional': True,
-                                                                       'tag': {'number': 18},
-                                                                       'type': 'User-Category'},
-                                                                      {'element': {'type': 'Logic-Resource'},
-                                                                       'name': 'list-Of-Logic-Resource',
-                                                                       'optional': True,
-                                                                       'tag': {'number': 19},
-                                                                       'type': 'SEQUENCE '
-                                                                               'OF'},
-                                                                      {'name': 'qos-Statistics',
-                                                                       'optional': True,
-                                                                       'tag': {'number': 7},
-                                                                       'type': 'UTF8String'},
-                                                                      {'name': 'organization-OrderID',
-                                                                       'optional': True,
-                                                                       'tag': {'number': 8},
-                                                                       'type': 'UTF8String'},
-                                                                      {'name': 'user-ServiceType',
-                                                                       'optional': True,
-                                                                       'tag': {'number': 9},
-                                                                       'type': 'UTF8String'},
-                                                                      {'name': 'order-OwnerType',
-                                                                       'optional': True,
-                                                                       'tag': {'number': 10},
-                                                                       'type': 'INTEGER'}],
-                                                          'type': 'SET'},
-                              'MediaX-conference-Information': {'members': [{'name': 'meeting-id',
-                                                                             'optional': True,
-                                                                             'tag': {'number': 0},
-                                                                             'type': 'UTF8String'},
-                                                                            {'name': 'access-phone',
-                                                                             'optional': True,
-                                                                             'tag': {'number': 1},
-                                                                             'type': 'UTF8String'},
-                                                                            {'name': 'meeting-frequency',
-                                                                             'optional': True,
-                                                                             'tag': {'number': 2},
-                                                                             'type': 'Meeting-Frequency'},
-                                                                            {'name': 'meeting-mode',
-                                                                             'optional': True,
-                                                                             'tag': {'number': 3},
-                                                                             'type': 'Meeting-Mode'},
-                                                                            {'name': 'service-mode',
-                                                                             'optional': True,
-                                                                             'tag': {'number': 4},
-                                                                             'type': 'Service-Mode'},
-                                                                            {'name': 'order-start-time',
-                                                                             'optional': True,
-                                                                             'tag': {'number': 5},
-                                                                             'type': 'TimeStamp'},
-                                                                            {'name': 'order-end-time',
-                                                                             'optional': True,
-                                                                             'tag': {'number': 6},
-                                                                             'type': 'TimeStamp'},
-                                                                            {'name': 'order-party',
-                                                                             'optional': True,
-                                                                             'tag': {'number': 7},
-                                                                             'type': 'INTEGER'},
-                                                                            {'name': 'media-type',
-                                                                             'optional': True,
-                                                                             'tag': {'number': 8},
-                                                                             'type': 'MediaX-Type'},
-                                                                            {'name': 'modified-start-time',
-                                                                             'optional': True,
-                                                                             'tag': {'number': 9},
-                                                                             'type': 'TimeStamp'},
-                                                                            {'name': 'modified-end-time',
-                                                                             'optional': True,
-                                                                             'tag': {'number': 10},
-                                                                             'type': 'TimeStamp'},
-                                                                            {'name': 'modified-party',
-                                                                             'optional': True,
-                                                                             'tag': {'number': 11},
-                                                                             'type': 'INTEGER'},
-                                                                            {'name': 'operation-time',
-                                                                             'optional': True,
-                                                                             'tag': {'number': 12},
-                                                                             'type': 'TimeStamp'},
-                                                                            {'name': 'multiPic-Resource',
-                                                                             'optional': True,
-                                                                             'tag': {'number': 13},
-                                                                             'type': 'INTEGER'},
-                                                                            {'name': 'adapter-Resource',
-                                                                             'optional': True,
-                                                                             'tag': {'number': 14},
-                                                                             'type': 'INTEGER'},
-                                                                            {'name': 'bandwidth-Resource',
-                                                                             'optional': True,
-                                                                             'tag': {'number': 15},
-                                                                             'type': 'INTEGER'},
-                                                                            {'name': 'videoPort-Resource',
-                                                                             'optional': True,
-                                                                             'tag': {'number': 16},
-                                                                             'type': 'INTEGER'},
-                                                                            {'name': 'audioPort-Resource',
-                                                                             'optional': True,
-                                                                             'tag': {'number': 17},
-                                                                             'type': 'INTEGER'},
-                                                                            {'name': 'modified-MultiPic-Resource',
-                                                                             'optional': True,
-                                                                             'tag': {'number': 18},
-                                                                             'type': 'INTEGER'},
-                                                                            {'name': 'modified-Adapter-Resource',
-                                                                             'optional': True,
-                                                                             'tag': {'number': 19},
-                                                                             'type': 'INTEGER'},
-                                                                            {'name': 'modified-Bandwidth-Resource',
-                                                                             'optional': True,
-                                                                             'tag': {'number': 20},
-                                                                             'type': 'INTEGER'},
-                                                                            {'name': 'modified-VideoPort-Resource',
-                                                                             'optional': True,
-                                                                             'tag': {'number': 21},
-                                                                             'type': 'INTEGER'},
-                                                                            {'name': 'modified-AudioPort-Resource',
-                                                                             'optional': True,
-                                                                             'tag': {'number': 22},
-                                                                             'type': 'INTEGER'},
-                                                                            {'name': 'telepresence-party',
-                                                                             'optional': True,
-                                                                             'tag': {'number': 23},
-                                                                             'type': 'INTEGER'},
-                                                                            {'name': 'modified-telepresence-party',
-                                                                             'optional': True,
-                                                                             'tag': {'number': 24},
-                                                                             'type': 'INTEGER'},
-                                                                            {'name': 'created-time',
-                                                                             'optional': True,
-                                                                             'tag': {'number': 25},
-                                                                             'type': 'TimeStamp'},
-                                                                            {'name': 'closed-time',
-                                                                             'optional': True,
-                                                                             'tag': {'number': 26},
-                                                                             'type': 'TimeStamp'},
-                                                                            {'name': 'closed-code',
-                                                                             'optional': True,
-                                                                             'tag': {'number': 27},
-                                                                             'type': 'Closed-Code'},
-                                                                            {'name': 'current-party',
-                                                                             'optional': True,
-                                                                             'tag': {'number': 28},
-                                                                             'type': 'INTEGER'},
-                                                                            {'name': 'current-data-party',
-                                                                             'optional': True,
-                                                                             'tag': {'number': 29},
-                                                                             'type': 'INTEGER'},
-                                                                            {'name': 'current-telepresence-party',
-                                                                             'optional': True,
-                                                                             'tag': {'number': 30},
-                                                                             'type': 'INTEGER'},
-                                                                            {'name': 'sub-meetingID',
-                                                                             'optional': True,
-                                                                             'tag': {'number': 31},
-                                                                             'type': 'UTF8String'},
-                                                                            {'name': 'up-CascadePorts',
-                                                                             'optional': True,
-                                                                             'tag': {'number': 32},
-                                                                             'type': 'INTEGER'},
-                                                                            {'name': 'modified-Up-CascadePorts',
-                                                                             'optional': True,
-                                                                             'tag': {'number': 33},
-                                                                             'type': 'INTEGER'},
-                                                                            {'name': 'down-CascadePorts',
-                                                                             'optional': True,
-                                                                             'tag': {'number': 34},
-                                                                             'type': 'INTEGER'},
-                                                                            {'name': 'modified-Down-CascadePorts',
-                                                                             'optional': True,
-                                                                             'tag': {'number': 35},
-                                                                             'type': 'INTEGER'},
-                                                                            {'name': 'sMS-Notify-Type',
-                                                                             'optional': True,
-                                                                             'tag': {'number': 36},
-                                                                             'type': 'INTEGER'},
-                                                                            {'name': 'sMS-Notify-Amount',
-                                                                             'optional': True,
-                                                                             'tag': {'number': 37},
-                                                                             'type': 'INTEGER'},
-                                                                            {'name': 'recording-Resource',
-                                                                             'optional': True,
-                                                                             'tag': {'number': 38},
-                                                                             'type': 'INTEGER'},
-                                                                            {'name': 'modified-Recording-Resource',
-                                                                             'optional': True,
-                                                                             'tag': {'number': 39},
-                                                                             'type': 'INTEGER'},
-                                                                            {'name': 'mediaEncrypt-Mode',
-                                                                             'optional': True,
-                                                                             'tag': {'number': 40},
-                                                                             'type': 'INTEGER'},
-                                                                            {'name': 'modified-MediaEncrypt-Mode',
-                                                                             'optional': True,
-                                                                             'tag': {'number': 41},
-                                                                             'type': 'INTEGER'},
-                                                                            {'name': 'main-Meeting-ID',
-                                                                             'optional': True,
-                                                                             'tag': {'number': 42},
-                                                                             'type': 'UTF8String'},
-                                                                            {'name': 'modified-media-type',
-                                                                             'optional': True,
-                                                                             'tag': {'number': 43},
-                                                                             'type': 'MediaX-Type'},
-                                                                            {'name': 'conference-CdrType',
-                                                                             'optional': True,
-                                                                             'tag': {'number': 44},
-                                                                             'type': 'INTEGER'},
-                                                                            {'name': 'multistreamingVideoPort-Resource',
-                                                                             'optional': True,
-                                                                             'tag': {'number': 45},
-                                                                             'type': 'INTEGER'},
-                                                                            {'name': 'modified-MultistreamingVideoPort-Resource',
-                                                                             'optional': True,
-                                                                             'tag': {'number': 46},
-                                                                             'type': 'INTEGER'},
-                                                                            {'name': 'peak-Audio-Video-Ports',
-                                                                             'optional': True,
-                                                                             'tag': {'number': 47},
-                                                                             'type': 'INTEGER'},
-                                                                            {'name': 'peak-Data-Ports',
-                                                                             'optional': True,
-                                                                             'tag': {'number': 48},
-                                                                             'type': 'INTEGER'}],
-                                                                'type': 'SET'},
-                              'MediaXRecord': {'members': [{'name': 'recordType',
-                                                            'optional': True,
-                                                            'tag': {'number': 0},
-                                                            'type': 'RecordType'},
-                                                           {'name': 'retransmission',
-                                                            'optional': True,
-                                                            'tag': {'number': 1},
-                                                            'type': 'NULL'},
-                                                           {'name': 'sIP-Method',
-                                                            'optional': True,
-                                                            'tag': {'number': 2},
-                                                            'type': 'SIP-Method'},
-                                                           {'name': 'role-of-Node',
-                                                            'optional': True,
-                                                            'tag': {'number': 3},
-                                                            'type': 'Role-of-Node'},
-                                                           {'name': 'nodeAddress',
-                                                            'optional': True,
-                                                            'tag': {'number': 4},
-                                                            'type': 'NodeAddress'},
-                                                           {'name': 'session-Id',
-                                                            'optional': True,
-                                                            'tag': {'number': 5},
-                                                            'type': 'Session-Id'},
-                                                           {'name': 'list-Of-Calling-Party-Address',
-                                                            'optional': True,
-                                                            'tag': {'number': 6},
-                                                            'type': 'ListOfInvolvedParties'},
-                                                           {'name': 'called-Party-Address',
-                                                            'optional': True,
-                                                            'tag': {'number': 7},
-                                                            'type': 'InvolvedParty'},
-                                                           {'name': 'serviceRequestTimeStamp',
-                                                            'optional': True,
-                                                            'tag': {'number': 9},
-                                                            'type': 'TimeStamp'},
-                                                           {'name': 'serviceDeliveryStartTimeStamp',
-                                                            'optional': True,
-                                                            'tag': {'number': 10},
-                                                            'type': 'TimeStamp'},
-                                                           {'name': 'serviceDeliveryEndTimeStamp',
-                                                            'optional': True,
-                                                            'tag': {'number': 11},
-                                                            'type': 'TimeStamp'},
-                                                           {'name': 'recordOpeningTime',
-                                                            'optional': True,
-                                                            'tag': {'number': 12},
-                                                            'type': 'TimeStamp'},
-                                                           {'name': 'recordClosureTime',
-                                                            'optional': True,
-                                                            'tag': {'number': 13},
-                                                            'type': 'TimeStamp'},
-                                                           {'name': 'interOperatorIdentifiers',
-                                                            'optional': True,
-                                                            'tag': {'number': 14},
-                                                            'type': 'InterOperatorIdentifierlist'},
-                                                           {'name': 'localRecordSequenceNumber',
-                                                            'optional': True,
-                                                            'tag': {'number': 15},
-                                                            'type': 'LocalSequenceNumber'},
-                                                           {'name': 'recordSequenceNumber',
-                                                            'optional': True,
-                                                            'tag': {'number': 16},
-                                                            'type': 'INTEGER'},
-                                                           {'name': 'causeForRecordClosing',
-                                                            'optional': True,
-                                                            'tag': {'number': 17},
-                                                            'type': 'CauseForRecordClosing'},
-                                                           {'name': 'incomplete-CDR-Indication',
-                                                            'optional': True,
-                                                            'tag': {'number': 18},
-                                                            'type': 'Incomplete-CDR-Indication'},
-                                                           {'name': 'iMS-Charging-Identifier',
-                                                            'optional': True,
-                                                            'tag': {'number': 19},
-                                                            'type': 'IMS-Charging-Identifier'},
-                                                           {'element': {'type': 'Media-Components-List'},
-                                                            'name': 'list-Of-SDP-Media-Components',
-                                                            'optional': True,
-                                                            'tag': {'number': 21},
-                                                            'type': 'SEQUENCE '
-                                                                    'OF'},
-                                                           {'name': 'gGSNaddress',
-                                                            'optional': True,
-                                                            'tag': {'number': 22},
-                                                            'type': 'NodeAddress'},
-                                                           {'name': 'serviceReasonReturnCode',
-                                                            'optional': True,
-                                                            'tag': {'number': 23},
-                                                            'type': 'UTF8String'},
-                                                           {'element': {'type': 'MessageBody'},
-                                                            'name': 'list-Of-Message-Bodies',
-                                                            'optional': True,
-                                                            'tag': {'number': 24},
-                                                            'type': 'SEQUENCE '
-                                                                    'OF'},
-                                                           {'name': 'recordExtensions',
-                                                            'optional': True,
-                                                            'tag': {'number': 25},
-                                                            'type': 'ManagementExtensions'},
-                                                           {'name': 'expiresInformation',
-                                                            'optional': True,
-                                                            'tag': {'number': 26},
-                                                            'type': 'INTEGER'},
-                                                           {'name': 'event',
-                                                            'optional': True,
-                                                            'tag': {'number': 28},
-                                                            'type': 'UTF8String'},
-                                                           {'name': 'accessNetworkInformation',
-                                                            'optional': True,
-                                                            'tag': {'number': 29},
-                                                            'type': 'OCTET '
-                                                                    'STRING'},
-                                                           {'name': 'serviceContextID',
-                                                            'optional': True,
-                                                            'tag': {'number': 30},
-                                                            'type': 'ServiceContextID'},
-                                                           {'element': {'type': 'SubscriptionID'},
-                                                            'name': 'list-of-subscription-ID',
-                                                            'optional': True,
-                                                            'tag': {'number': 31},
-                                                            'type': 'SEQUENCE '
-                                                                    'OF'},
-                                                           {'element': {'type': 'Early-Media-Components-List'},
-                                                            'name': 'list-Of-Early-SDP-Media-Components',
-                                                            'optional': True,
-                                                            'tag': {'number': 32},
-                                                            'type': 'SEQUENCE '
-                                                                    'OF'},
-                                                           {'name': 'iMSCommunicationServiceIdentifier',
-                                                            'optional': True,
-                                                            'tag': {'number': 33},
-                                                            'type': 'IMSCommunicationServiceIdentifier'},
-                                                           {'name': 'numberPortabilityRouting',
-                                                            'optional': True,
-                                                            'tag': {'number': 34},
-                                                            'type': 'NumberPortabilityRouting'},
-                                                           {'name': 'carrierSelectRouting',
-                                                            'optional': True,
-                                                            'tag': {'number': 35},
-                                                            'type': 'CarrierSelectRouting'},
-                                                           {'element': {'type': 'ServiceSpecificInfo'},
-                                                            'name': 'serviceSpecificInfo',
-                                                            'optional': True,
-                                                            'tag': {'number': 100},
-                                                            'type': 'SEQUENCE '
-                                                                    'OF'},
-                                                           {'name': 'requested-Party-Address',
-                                                            'optional': True,
-                                                            'tag': {'number': 101},
-                                                            'type': 'InvolvedParty'},
-                                                           {'name': 'list-Of-Called-Asserted-Identity',
-                                                            'optional': True,
-                                                            'tag': {'number': 102},
-                                                            'type': 'ListOfInvolvedParties'},
-                                                           {'name': 'alternateChargedPartyAddress',
-                                                            'optional': True,
-                                                            'tag': {'number': 103},
-                                                            'type': 'UTF8String'},
-                                                           {'name': 'privateUserID',
-                                                            'optional': True,
-                                                            'tag': {'number': 8},
-                                                            'type': 'GraphicString'},
-                                                           {'name': 'duration',
-                                                            'optional': True,
-                                                            'tag': {'number': 200},
-                                                            'type': 'INTEGER'},
-                                                           {'name': 'bill-type',
-                                                            'optional': True,
-                                                            'tag': {'number': 290},
-                                                            'type': 'Bill-Type'},
-                                                           {'name': 'mediax-conference-information',
-                                                            'optional': True,
-                                                            'tag': {'number': 291},
-                                                            'type': 'MediaX-conference-Information'},
-                                                           {'name': 'mediax-user-information',
-                                                            'optional': True,
-                                                            'tag': {'number': 292},
-                                                            'type': 'MediaX-User-Information'},
-                                                           {'name': 'mediax-terminal-information',
-                                                            'optional': True,
-                                                            'tag': {'number': 401},
-                                                            'type': 'MediaX-Terminal-Information'},
-                                                           {'name': 'recordExtensions1',
-                                                            'optional': True,
-                                                            'tag': {'number': 241},
-                                                            'type': 'ManagementExtensions'},
-                                                           {'name': 'mediaX-Online-Charging-Flag',
-                                                            'optional': True,
-                                                            'tag': {'number': 402},
-                                                            'type': 'Online-Charging-Type'},
-                                                           {'name': 'mediaX-Online-Charging-Duration',
-                                                            'optional': True,
-                                                            'tag': {'number': 403},
-                                                            'type': 'INTEGER'},
-                                                           {'name': 'mediaX-OCS-Failed-TimeStamp',
-                                                            'optional': True,
-                                                            'tag': {'number': 404},
-                                                            'type': 'TimeStamp'},
-                                                           {'name': 'ringing-Duration',
-                                                            'optional': True,
-                                                            'tag': {'number': 204},
-                                                            'type': 'UnsignedInter32'},
-                                                           {'name': 'applicationId',
-                                                            'optional': True,
-                                                            'tag': {'number': 405},
-                                                            'type': 'UTF8String'},
-                                                           {'name': 'call-Type',
-                                                            'optional': True,
-                                                            'tag': {'number': 406},
-                                                            'type': 'INTEGER'},
-                                                           {'name': 'credit-Flag',
-                                                            'optional': True,
-                                                            'tag': {'number': 407},
-                                                            'type': 'INTEGER'},
-                                                           {'name': 'attendee-MediaType',
-                                                            'optional': True,
-                                                            'tag': {'number': 408},
-                                                            'type': 'INTEGER'},
-                                                           {'name': 'cause-Record',
-                                                            'optional': True,
-                                                            'tag': {'number': 409},
-                                                            'type': 'INTEGER'},
-                                                           {'name': 'sp-id',
-                                                            'optional': True,
-                                                            'tag': {'number': 438},
-                                                            'type': 'UTF8String'},
-                                                           {'name': 'recond-Type',
-                                                            'optional': True,
-                                                            'tag': {'number': 458},
-                                                            'type': 'INTEGER'},
-                                                           {'name': 'caller',
-                                                            'optional': True,
-                                                            'tag': {'number': 460},
-                                                            'type': 'UTF8String'},
-                                                           {'name': 'callee',
-                                                            'optional': True,
-                                                            'tag': {'number': 461},
-                                                            'type': 'UTF8String'},
-                                                           {'name': 'chairAccount',
-                                                            'optional': True,
-                                                            'tag': {'number': 462},
-                                                            'type': 'UTF8String'},
-                                                           {'element': {'type': 'Attendee'},
-                                                            'name': 'attendeeList',
-                                                            'optional': True,
-                                                            'tag': {'number': 463},
-                                                            'type': 'SEQUENCE '
-                                                                    'OF'}],
-                                               'type': 'SET'},
-                              'Meeting-Frequency': {'type': 'INTEGER'},
-                              'Meeting-Mode': {'type': 'INTEGER'},
-                              'Message-Feature-ID': {'type': 'INTEGER'},
-                              'MessageBody': {'members': [{'name': 'content-Type',
-                                                           'optional': True,
-                                                           'tag': {'number': 0},
-                                                           'type': 'GraphicString'},
-                                                          {'name': 'content-Disposition',
-                                                           'optional': True,
-                                                           'tag': {'number': 1},
-                                                           'type': 'GraphicString'},
-                                                          {'name': 'content-Length',
-                                                           'optional': True,
-                                                           'tag': {'number': 2},
-                                                           'type': 'INTEGER'},
-                                                          {'name': 'originator',
-                                                           'optional': True,
-                                                           'tag': {'number': 3},
-                                                           'type': 'InvolvedParty'}],
-                                              'type': 'SEQUENCE'},
-                              'Milliseconds': {'restricted-to': [(0, 999)],
-                                               'type': 'INTEGER'},
-                              'NNI-Information': {'members': [{'name': 'nNIType',
-                                                               'optional': True,
-                                                               'tag': {'number': 1},
-                                                               'type': 'NNIType'}],
-                                                  'type': 'SEQUENCE'},
-                              'NNIType': {'type': 'ENUMERATED',
-                                          'values': [('non-roaming', 0),
-                                                     ('roaming-without-loopback',
-                                                      1),
-                                                     ('roaming-with-loopback',
-                                                      2)]},
-                              'NP-Data': {'members': [{'name': 'location-routing-number',
-                                                       'optional': True,
-                                                       'tag': {'number': 0},
-                                                       'type': 'UTF8String'},
-                                                      {'name': 'lrn-source-indicator',
-                                                       'optional': True,
-                                                       'tag': {'number': 1},
-                                                       'type': 'INTEGER'},
-                                                      {'name': 'lrn-query-status',
-                                                       'optional': True,
-                                                       'tag': {'number': 2},
-                                                       'type': 'INTEGER'}],
-                                          'type': 'SET'},
-                              'NP-Query': {'type': 'INTEGER'},
-                              'NodeAddress': {'members': [{'name': 'iPAddress',
-                                                           'tag': {'number': 0},
-                                                           'type': 'IPAddress'},
-                                                          {'name': 'domainName',
-                                                           'tag': {'number': 1},
-                                                           'type': 'GraphicString'}],
-                                              'type': 'CHOICE'},
-                              'Number-Of-Participants': {'type': 'INTEGER'},
-                              'Number-of-Operated': {'type': 'INTEGER'},
-                              'Number-to-Operate': {'type': 'INTEGER'},
-                              'NumberPortabilityRouting': {'type': 'GraphicString'},
-                              'Online-Charging-Type': {'type': 'ENUMERATED',
-                                                       'values': [('notonlineservice',
-                                                                   0),
-                                                                  ('onlineservice',
-                                                                   1),
-                                                                  ('abnormalonlineservice',
-                                                                   2)]},
-                              'Operate': {'members': [{'name': 'numberToOperate',
-                                                       'optional': True,
-                                                       'tag': {'number': 0},
-                                                       'type': 'Number-to-Operate'},
-                                                      {'element': {'type': 'IMPU'},
-                                                       'name': 'impu',
-                                                       'optional': True,
-                                                       'tag': {'number': 1},
-                                                       'type': 'SEQUENCE OF'}],
-                                          'type': 'SET'},
-                              'Operated': {'members': [{'name': 'numberOfOperated',
-                                                        'optional': True,
-                                                        'tag': {'number': 0},
-                                                        'type': 'Number-of-Operated'},
-                                                       {'element': {'type': 'IMPU'},
-                                                        'name': 'impu',
-                                                        'optional': True,
-                                                        'tag': {'number': 1},
-                                                        'type': 'SEQUENCE OF'}],
-                                           'type': 'SET'},
-                              'Operation-SuccessFlag': {'type': 'ENUMERATED',
-                                                        'values': [('open-door-success',
-                                                                    0),
-                                                                   ('open-door-fail',
-                                                                    1)]},
-                              'PCSCFRecord': {'members': [{'name': 'recordType',
-                                                           'optional': True,
-                                                           'tag': {'number': 0},
-                                                           'type': 'RecordType'},
-                                                          {'name': 'retransmission',
-                                                           'optional': True,
-                                                           'tag': {'number': 1},
-                                                           'type': 'NULL'},
-                                                          {'name': 'sIP-Method',
-                                                           'optional': True,
-                                                           'tag': {'number': 2},
-                                                           'type': 'SIP-Method'},
-                                                          {'name': 'role-of-Node',
-                                                           'optional': True,
-                                                           'tag': {'number': 3},
-                                                           'type': 'Role-of-Node'},
-                                                          {'name': 'nodeAddress',
-                                                           'optional': True,
-                                                           'tag': {'number': 4},
-                                                           'type': 'NodeAddress'},
-                                                          {'name': 'session-Id',
-                                                           'optional': True,
-                                                           'tag': {'number': 5},
-                                                           'type': 'Session-Id'},
-                                                          {'name': 'list-Of-Calling-Party-Address',
-                                                           'optional': True,
-                                                           'tag': {'number': 6},
-                                                           'type': 'ListOfInvolvedParties'},
-                                                          {'name': 'called-Party-Address',
-                                                           'optional': True,
-                                                           'tag': {'number': 7},
-                                                           'type': 'InvolvedParty'},
-                                                          {'name': 'serviceRequestTimeStamp',
-                                                           'optional': True,
-                                                           'tag': {'number': 9},
-                                                           'type': 'TimeStamp'},
-                                                          {'name': 'serviceDeliveryStartTimeStamp',
-                                                           'optional': True,
-                                                           'tag': {'number': 10},
-                                                           'type': 'TimeStamp'},
-                                                          {'name': 'serviceDeliveryEndTimeStamp',
-                                                           'optional': True,
-                                                           'tag': {'number': 11},
-                                                           'type': 'TimeStamp'},
-                                                          {'name': 'recordOpeningTime',
-                                                           'optional': True,
-                                                           'tag': {'number': 12},
-                                                           'type': 'TimeStamp'},
-                                                          {'name': 'recordClosureTime',
-                                                           'optional': True,
-                                                           'tag': {'number': 13},
-                                                           'type': 'TimeStamp'},
-                                                          {'name': 'interOperatorIdentifiers',
-                                                           'optional': True,
-                                                           'tag': {'number': 14},
-                                                           'type': 'InterOperatorIdentifierlist'},
-                                                          {'name': 'localRecordSequenceNumber',
-                                                           'optional': True,
-                                                           'tag': {'number': 15},
-                                                           'type': 'LocalSequenceNumber'},
-                                                          {'name': 'recordSequenceNumber',
-                                                           'optional': True,
-                                                           'tag': {'number': 16},
-                                                           'type': 'INTEGER'},
-                                                          {'name': 'causeForRecordClosing',
-                                                           'optional': True,
-                                                           'tag': {'number': 17},
-                                                           'type': 'CauseForRecordClosing'},
-                                                          {'name': 'incomplete-CDR-Indication',
-                                                           'optional': True,
-                                                           'tag': {'number': 18},
-                                                           'type': 'Incomplete-CDR-Indication'},
-                                                          {'name': 'iMS-Charging-Identifier',
-                                                           'optional': True,
-                                                           'tag': {'number': 19},
-                                                           'type': 'IMS-Charging-Identifier'},
-                                                          {'element': {'type': 'Media-Components-List'},
-                                                           'name': 'list-Of-SDP-Media-Components',
-                                                           'optional': True,
-                                                           'tag': {'number': 21},
-                                                           'type': 'SEQUENCE '
-                                                                   'OF'},
-                                                          {'name': 'gGSNaddress',
-                                                           'optional': True,
-                                                           'tag': {'number': 22},
-                                                           'type': 'NodeAddress'},
-                                                          {'name': 'serviceReasonReturnCode',
-                                                           'optional': True,
-                                                           'tag': {'number': 23},
-                                                           'type': 'UTF8String'},
-                                                          {'element': {'type': 'MessageBody'},
-                                                           'name': 'list-Of-Message-Bodies',
-                                                           'optional': True,
-                                                           'tag': {'number': 24},
-                                                           'type': 'SEQUENCE '
-                                                                   'OF'},
-                                                          {'name': 'recordExtensions',
-                                                           'optional': True,
-                                                           'tag': {'number': 25},
-                                                           'type': 'ManagementExtensions'},
-                                                          {'name': 'expiresInformation',
-                                                           'optional': True,
-                                                           'tag': {'number': 26},
-                                                           'type': 'INTEGER'},
-                                                          {'name': 'list-Of-Associated-URI',
-                                                           'optional': True,
-                                                           'tag': {'number': 27},
-                                                           'type': 'ListOfInvolvedParties'},
-                                                          {'name': 'event',
-                                                           'optional': True,
-                                                           'tag': {'number': 28},
-                                                           'type': 'UTF8String'},
-                                                          {'name': 'accessNetworkInformation',
-                                                           'optional': True,
-                                                           'tag': {'number': 29},
-                                                           'type': 'OCTET '
-                                                                   'STRING'},
-                                                          {'name': 'serviceContextID',
-                                                           'optional': True,
-                                                           'tag': {'number': 30},
-                                                           'type': 'ServiceContextID'},
-                                                          {'element': {'type': 'SubscriptionID'},
-                                                           'name': 'list-of-subscription-ID',
-                                                           'optional': True,
-                                                           'tag': {'number': 31},
-                                                           'type': 'SEQUENCE '
-                                                                   'OF'},
-                                                          {'element': {'type': 'Early-Media-Components-List'},
-                                                           'name': 'list-Of-Early-SDP-Media-Components',
-                                                           'optional': True,
-                                                           'tag': {'number': 32},
-                                                           'type': 'SEQUENCE '
-                                                                   'OF'},
-                                                          {'name': 'numberPortabilityRouting',
-                                                           'optional': True,
-                                                           'tag': {'number': 34},
-                                                           'type': 'NumberPortabilityRouting'},
-                                                          {'name': 'carrierSelectRouting',
-                                                           'optional': True,
-                                                           'tag': {'number': 35},
-                                                           'type': 'CarrierSelectRouting'},
-                                                          {'name': 'ims-3gpp-Session-Priority',
-                                                           'optional': True,
-                                                           'tag': {'number': 36},
-                                                           'type': 'INTEGER'},
-                                                          {'name': 'serviceRequestTimeStampFraction',
-                                                           'optional': True,
-                                                           'tag': {'number': 37},
-                                                           'type': 'Milliseconds'},
-                                                          {'name': 'serviceDeliveryStartTimeStampFraction',
-                                                           'optional': True,
-                                                           'tag': {'number': 38},
-                                                           'type': 'Milliseconds'},
-                                                          {'name': 'serviceDeliveryEndTimeStampFraction',
-                                                           'optional': True,
-                                                           'tag': {'number': 39},
-                                                           'type': 'Milliseconds'},
-                                                          {'name': 'servedPartyIPAddress',
-                                                           'optional': True,
-                                                           'tag': {'number': 50},
-                                                           'type': 'ServedPartyIPAddress'},
-                                                          {'name': 'subscriberEquipmentNumber',
-                                                           'optional': True,
-                                                           'tag': {'number': 58},
-                                                           'type': 'SubscriberEquipmentNumber'},
-                                                          {'name': 'iMSVisitedNetworkIdentifier',
-                                                           'optional': True,
-                                                           'tag': {'number': 54},
-                                                           'type': 'OCTET '
-                                                                   'STRING'},
-                                                          {'name': 'privateUserID',
-                                                           'optional': True,
-                                                           'tag': {'number': 8},
-                                                           'type': 'GraphicString'},
-                                                          {'element': {'type': 'ServiceSpecificInfo'},
-                                                           'name': 'serviceSpecificInfo',
-                                                           'optional': True,
-                                                           'tag': {'number': 100},
-                                                           'type': 'SEQUENCE '
-                                                                   'OF'},
-                                                          {'name': 'duration',
-                                                           'optional': True,
-                                                           'tag': {'number': 200},
-                                                           'type': 'INTEGER'},
-                                                          {'name': 'ringing-Duration',
-                                                           'optional': True,
-                                                           'tag': {'number': 204},
-                                                           'type': 'UnsignedInter32'},
-                                                          {'name': 'session-Priority',
-                                                           'optional': True,
-                                                           'tag': {'number': 205},
-                                                           'type': 'Session-Priority'},
-                                                          {'name': 'abnormal-Finish-Info',
-                                                           'optional': True,
-                                                           'tag': {'number': 207},
-                                                           'type': 'Abnormal-Finish-Info'},
-                                                          {'name': 'refer-To',
-                                                           'optional': True,
-                                                           'tag': {'number': 209},
-                                                           'type': 'UTF8String'},
-                                                          {'name': 'target',
-                                                           'optional': True,
-                                                           'tag': {'number': 210},
-                                                           'type': 'UTF8String'},
-                                                          {'name': 'accounting-record-type',
-                                                           'optional': True,
-                                                           'tag': {'number': 227},
-                                                           'type': 'INTEGER'},
-                                                          {'name': 'locationInformation',
-                                                           'optional': True,
-                                                           'tag': {'number': 240},
-                                                           'type': 'Location-Information'},
-                                                          {'name': 'recordExtensions1',
-                                                           'optional': True,
-                                                           'tag': {'number': 241},
-                                                           'type': 'ManagementExtensions'},
-                                                          {'name': 'recordExtensions2',
-                                                           'optional': True,
-                                                           'tag': {'number': 242},
-                                                           'type': 'ManagementExtensions'},
-                                                          {'name': 'recordExtensions3',
-                                                           'optional': True,
-                                                           'tag': {'number': 243},
-                                                           'type': 'ManagementExtensions'},
-                                                          {'name': 'inner-error',
-                                                           'optional': True,
-                                                           'tag': {'number': 265},
-                                                           'type': 'INTEGER'},
-                                                          {'name': 'charge-Category',
-                                                           'optional': True,
-                                                           'tag': {'number': 268},
-                                                           'type': 'INTEGER'},
-                                                          {'name': 'onlineChargingType',
-                                                           'optional': True,
-                                                           'tag': {'number': 244},
-                                                           'type': 'Online-Charging-Type'},
-                                                          {'name': 'qos-Statistics',
-                                                           'optional': True,
-                                                           'tag': {'number': 412},
-                                                           'type': 'UTF8String'},
-                                                          {'name': 'interworking-Signaling-Address',
-                                                           'optional': True,
-                                                           'tag': {'number': 431},
-                                                           'type': 'Interworking-Signaling-Address'},
-                                                          {'name': 'finalAccessNetworkInformation',
-                                                           'optional': True,
-                                                           'tag': {'number': 436},
-                                                           'type': 'OCTET '
-                                                                   'STRING'},
-                                                          {'element': {'type': 'SIP-Diversion'},
-                                                           'name': 'list-of-SIP-Diversion',
-                                                           'optional': True,
-                                                           'tag': {'number': 456},
-                                                           'type': 'SEQUENCE '
-                                                                   'OF'}],
-                                              'type': 'SET'},
-                              'PSTN-CDR-Info': {'members': [{'name': 'calling-local-dn-set',
-                                                             'optional': True,
-                                                             'tag': {'number': 0},
-                                                             'type': 'UnsignedInter32'},
-                                                            {'name': 'calling-party-number-type',
-                                                             'optional': True,
-                                                             'tag': {'number': 1},
-                                                             'type': 'Call-Party-Number-Type'},
-                                                            {'name': 'called-local-dn-set',
-                                                             'optional': True,
-                                                             'tag': {'number': 2},
-                                                             'type': 'UnsignedInter32'},
-                                                            {'name': 'called-party-number-type',
-                                                             'optional': True,
-                                                             'tag': {'number': 3},
-                                                             'type': 'Call-Party-Number-Type'},
-                                                            {'name': 'calling-party-category',
-                                                             'optional': True,
-                                                             'tag': {'number': 4},
-                                                             'type': 'INTEGER'}],
-                                                'type': 'SET'},
-                              'Participant': {'members': [{'name': 'impu',
-                                                           'tag': {'number': 0},
-                                                           'type': 'IMPU'},
-                                                          {'name': 'callInOut',
-                                                           'tag': {'number': 1},
-                                                           'type': 'Call-In-Out'}],
-                                              'type': 'SEQUENCE'},
-                              'ParticipantActionType': {'type': 'ENUMERATED',
-                                                        'values': [('cREATE-CONF',
-                                                                    0),
-                                                                   ('jOIN-CONF',
-                                                                    1),
-                                                                   ('iNVITED-INTO-CONF',
-                                                                    2),
-                                                                   ('qUIT-CONF',
-                                                                    3),
-                                                                   ('aUDIO-SW-TO-VIDEO',
-                                                                    51),
-                                                                   ('vIDEO-SW-TO-AUDIO',
-                                                                    52)]},
-                              'Port-Media-Type': {'type': 'ENUMERATED',
-                                                  'values': [('port-audio', 1),
-                                                             ('port-sd-video',
-                                                              2),
-                                                             ('port-hd-video-2m',
-                                                              3),
-                                                             ('port-hd-video-4m',
-                                                              4)]},
-                              'Port-Type': {'type': 'INTEGER'},
-                              'Precedence-Level': {'type': 'ENUMERATED',
-                                                   'values': [('none', 0),
-                                                              ('routine', 1),
-                                                              ('priority', 2),
-                                                              ('immediate', 3),
-                                                              ('flash', 4),
-                                                              ('flash-override',
-                                                               5),
-                                                              ('flash-override-or',
-                                                               6)]},
-                              'Private-ConnectTime': {'members': [{'name': 'connectTime',
-                                                                   'optional': True,
-                                                                   'tag': {'number': 0},
-                                                                   'type': 'TimeStamp'},
-                                                                  {'name': 'connectTimeFraction',
-                                                                   'optional': True,
-                                                                   'tag': {'number': 1},
-                                                                   'type': 'UnsignedInter32'}],
-                                                      'type': 'SET'},
-                              'Private-User-Equipment-Info': {'members': [{'name': 'private-User-Equipment-Info-Type',
-                                                                           'optional': True,
-                                                                           'tag': {'number': 0},
-                                                                           'type': 'Private-User-Equipment-Info-Type'},
-                                                                          {'name': 'private-User-Equipment-Info-Value',
-                                                                           'optional': True,
-                                                                           'tag': {'number': 1},
-                                                                           'type': 'OCTET '
-                                                                                   'STRING'}],
-                                                              'type': 'SEQUENCE'},
-                              'Private-User-Equipment-Info-Type': {'type': 'ENUMERATED',
-                                                                   'values': [('iMEI',
-                                                                               0),
-                                                                              ('uuid',
-                                                                               501)]},
-                              'Push-SuccessFlag': {'type': 'ENUMERATED',
-                                                   'values': [('push-success',
-                                                               0),
-                                                              ('push-fail',
-                                                               1)]},
-                              'PushMessage-Information': {'members': [{'name': 'content-provider-id',
-                                                                       'optional': True,
-                                                                       'tag': {'number': 0},
-                                                                       'type': 'UTF8String'},
-                                                                      {'name': 'message-type',
-                                                                       'optional': True,
-                                                                       'tag': {'number': 1},
-                                                                       'type': 'UTF8String'},
-                                                                      {'name': 'times-of-push',
-                                                                       'optional': True,
-                                                                       'tag': {'number': 2},
-                                                                       'type': 'INTEGER'},
-                                                                      {'name': 'push-successflag',
-                                                                       'optional': True,
-                                                                       'tag': {'number': 3},
-                                                                       'type': 'Push-SuccessFlag'}],
-                                                          'type': 'SET'},
-                              'RCSRecord': {'members': [{'name': 'recordType',
-                                                         'optional': True,
-                                                         'tag': {'number': 0},
-                                                         'type': 'RecordType'},
-                                                        {'name': 'retransmission',
-                                                         'optional': True,
-                                                         'tag': {'number': 1},
-                                                         'type': 'NULL'},
-                                                        {'name': 'sIP-Method',
-                                                         'optional': True,
-                                                         'tag': {'number': 2},
-                                                         'type': 'SIP-Method'},
-                                                        {'name': 'role-of-Node',
-                                                         'optional': True,
-                                                         'tag': {'number': 3},
-                                                         'type': 'Role-of-Node'},
-                                                        {'name': 'nodeAddress',
-                                                         'optional': True,
-                                                         'tag': {'number': 4},
-                                                         'type': 'NodeAddress'},
-                                                        {'name': 'session-Id',
-                                                         'optional': True,
-                                                         'tag': {'number': 5},
-                                                         'type': 'Session-Id'},
-                                                        {'name': 'list-Of-Calling-Party-Address',
-                                                         'optional': True,
-                                                         'tag': {'number': 6},
-                                                         'type': 'ListOfInvolvedParties'},
-                                                        {'name': 'called-Party-Address',
-                                                         'optional': True,
-                                                         'tag': {'number': 7},
-                                                         'type': 'InvolvedParty'},
-                                                        {'name': 'privateUserID',
-                                                         'optional': True,
-                                                         'tag': {'number': 8},
-                                                         'type': 'GraphicString'},
-                                                        {'name': 'serviceRequestTimeStamp',
-                                                         'optional': True,
-                                                         'tag': {'number': 9},
-                                                         'type': 'TimeStamp'},
-                                                        {'name': 'serviceDeliveryStartTimeStamp',
-                                                         'optional': True,
-                                                         'tag': {'number': 10},
-                                                         'type': 'TimeStamp'},
-                                                        {'name': 'serviceDeliveryEndTimeStamp',
-                                                         'optional': True,
-                                                         'tag': {'number': 11},
-                                                         'type': 'TimeStamp'},
-                                                        {'name': 'recordOpeningTime',
-                                                         'optional': True,
-                                                         'tag': {'number': 12},
-                                                         'type': 'TimeStamp'},
-                                                        {'name': 'recordClosureTime',
-                                                         'optional': True,
-                                                         'tag': {'number': 13},
-                                                         'type': 'TimeStamp'},
-                                                        {'name': 'interOperatorIdentifiers',
-                                                         'optional': True,
-                                                         'tag': {'number': 14},
-                                                         'type': 'InterOperatorIdentifierlist'},
-                                                        {'name': 'localRecordSequenceNumber',
-                                                         'optional': True,
-                                                         'tag': {'number': 15},
-                                                         'type': 'LocalSequenceNumber'},
-                                                        {'name': 'recordSequenceNumber',
-                                                         'optional': True,
-                                                         'tag': {'number': 16},
-                                                         'type': 'INTEGER'},
-                                                        {'name': 'causeForRecordClosing',
-                                                         'optional': True,
-                                                         'tag': {'number': 17},
-                                                         'type': 'CauseForRecordClosing'},
-                                                        {'name': 'incomplete-CDR-Indication',
-                                                         'optional': True,
-                                                         'tag': {'number': 18},
-                                                         'type': 'Incomplete-CDR-Indication'},
-                                                        {'name': 'iMS-Charging-Identifier',
-                                                         'optional': True,
-                                                         'tag': {'number': 19},
-                                                         'type': 'IMS-Charging-Identifier'},
-                                                        {'name': 'serviceReasonReturnCode',
-                                                         'optional': True,
-                                                         'tag': {'number': 23},
-                                                         'type': 'UTF8String'},
-                                                        {'name': 'accessNetworkInformation',
-                                                         'optional': True,
-                                                         'tag': {'number': 29},
-                                                         'type': 'OCTET '
-                                                                 'STRING'},
-                                                        {'name': 'serviceContextID',
-                                                         'optional': True,
-                                                         'tag': {'number': 30},
-                                                         'type': 'ServiceContextID'},
-                                                        {'name': 'serviceRequestTimeStampFraction',
-                                                         'optional': True,
-                                                         'tag': {'number': 37},
-                                                         'type': 'Milliseconds'},
-                                                        {'name': 'serviceDeliveryStartTimeStampFraction',
-                                                         'optional': True,
-                                                         'tag': {'number': 38},
-                                                         'type': 'Milliseconds'},
-                                                        {'name': 'serviceDeliveryEndTimeStampFraction',
-                                                         'optional': True,
-                                                         'tag': {'number': 39},
-                                                         'type': 'Milliseconds'},
-                                                        {'name': 'onlineChargingFlag',
-                                                         'optional': True,
-                                                         'tag': {'number': 150},
-                                                         'type': 'Online-Charging-Type'},
-                                                        {'name': 'duration',
-                                                         'optional': True,
-                                                         'tag': {'number': 200},
-                                                         'type': 'INTEGER'},
-                                                        {'element': {'type': 'Service-Identifier'},
-                                                         'name': 'serviceIdentifier',
-                                                         'optional': True,
-                                                         'tag': {'number': 213},
-                                                         'type': 'SEQUENCE OF'},
-                                                        {'name': 'related-call-reference',
-                                                         'optional': True,
-                                                         'tag': {'number': 220},
-                                                         'type': 'UTF8String'},
-                                                        {'name': 'rcs-Message-Id',
-                                                         'optional': True,
-                                                         'tag': {'number': 280},
-                                                         'type': 'UTF8String'},
-                                                        {'name': 'message-Source',
-                                                         'optional': True,
-                                                         'tag': {'number': 281},
-                                                         'type': 'INTEGER'},
-                                                        {'name': 'called-Sum',
-                                                         'optional': True,
-                                                         'tag': {'number': 282},
-                                                         'type': 'INTEGER'},
-                                                        {'element': {'type': 'Called-User'},
-                                                         'name': 'list-Of-Called-User',
-                                                         'optional': True,
-                                                         'tag': {'number': 283},
-                                                         'type': 'SEQUENCE OF'},
-                                                        {'name': 'message-Length',
-                                                         'optional': True,
-                                                         'tag': {'number': 284},
-                                                         'type': 'INTEGER'},
-                                                        {'name': 'file-Name',
-                                                         'optional': True,
-                                                         'tag': {'number': 285},
-                                                         'type': 'UTF8String'},
-                                                        {'name': 'accountingInputOctets',
-                                                         'optional': True,
-                                                         'tag': {'number': 286},
-                                                         'type': 'UnsignedInter64'},
-                                                        {'name': 'accountingOutputOctets',
-                                                         'optional': True,
-                                                         'tag': {'number': 287},
-                                                         'type': 'UnsignedInter64'},
-                                                        {'name': 'accountingInputPackets',
-                                                         'optional': True,
-                                                         'tag': {'number': 288},
-                                                         'type': 'UnsignedInter64'},
-                                                        {'name': 'accountingOutputPackets',
-                                                         'optional': True,
-                                                         'tag': {'number': 289},
-                                                         'type': 'UnsignedInter64'},
-                                                        {'name': 'user-Agent-Value',
-                                                         'optional': True,
-                                                         'tag': {'number': 290},
-                                                         'type': 'UTF8String'},
-                                                        {'name': 'organization-Id',
-                                                         'optional': True,
-                                                         'tag': {'number': 291},
-                                                         'type': 'UTF8String'},
-                                                        {'name': 'sMS-Information',
-                                                         'optional': True,
-                                                         'tag': {'number': 292},
-                                                         'type': 'SMS-Information'},
-                                                        {'name': 'recordExtensions-13',
-                                                         'optional': True,
-                                                         'tag': {'number': 293},
-                                                         'type': 'ManagementExtensions'},
-                                                        {'name': 'sp-id',
-                                                         'optional': True,
-                                                         'tag': {'number': 438},
-                                                         'type': 'UTF8String'}],
-                                            'type': 'SET'},
-                              'RST-Information': {'members': [{'name': 'server-Role',
-                                                               'optional': True,
-                                                               'tag': {'number': 0},
-                                                               'type': 'RST-Server-Role'},
-                                                              {'name': 'session-Type',
-                                                               'optional': True,
-                                                               'tag': {'number': 1},
-                                                               'type': 'RST-Session-Type'},
-                                                              {'name': 'rST-Subscriber-ID',
-                                                               'optional': True,
-                                                               'tag': {'number': 2},
-                                                               'type': 'RST-Subscriber-ID'}],
-                                                  'type': 'SET'},
-                              'RST-Server-Role': {'type': 'INTEGER'},
-                              'RST-Session-Type': {'type': 'INTEGER'},
-                              'RST-Subscriber-ID': {'type': 'UTF8String'},
-                              'RecordType': {'named-numbers': {'aGCFRecord': 205,
-                                                               'aLUCTSRecord': 203,
-                                                               'aTSRecord': 69,
-                                                               'bGCFRecord': 68,
-                                                               'cENTREXASRecord': 254,
-                                                               'cONFERENCEASRecord': 206,
-                                                               'eCSCFRecord': 70,
-                                                               'iBCFRecord': 82,
-                                                               'iCSCFRecord': 65,
-                                                               'mEDIAXRecord': 204,
-                                                               'mGCFRecord': 67,
-                                                               'mRFCRecord': 66,
-                                                               'pCSCFRecord': 64,
-                                                               'rCSRecord': 252,
-                                                               'sBCRecord': 253,
-                                                               'sCSCFRecord': 63,
-                                                               'vCCASRecord': 201,
-                                                               'vIDEOASRecord': 202},
-                                             'type': 'INTEGER'},
-                              'Roam-Type': {'type': 'ENUMERATED',
-                                            'values': [('local', 0),
-                                                       ('inter-provincial-roaming',
-                                                        1),
-                                                       ('international-roaming',
-                                                        2)]},
-                              'Role-of-Node': {'type': 'INTEGER'},
-                              'S-CSCF-Information': {'members': [{'element': {'type': 'GraphicString'},
-                                                                  'name': 'mandatoryCapabilities',
-                                                                  'optional': True,
-                                                                  'tag': {'number': 0},
-                                                                  'type': 'SEQUENCE '
-                                                                          'OF'},
-                                                                 {'element': {'type': 'GraphicString'},
-                                                                  'name': 'optionalCapabilities',
-                                                                  'optional': True,
-                                                                  'tag': {'number': 1},
-                                                                  'type': 'SEQUENCE '
-                                                                          'OF'},
-                                                                 {'name': 'serverName',
-                                                                  'optional': True,
-                                                                  'tag': {'number': 2},
-                                                                  'type': 'GraphicString'}],
-                                                     'type': 'SEQUENCE'},
-                              'SBCRecord': {'members': [{'name': 'recordType',
-                                                         'optional': True,
-                                                         'tag': {'number': 0},
-                                                         'type': 'RecordType'},
-                                                        {'name': 'retransmission',
-                                                         'optional': True,
-                                                         'tag': {'number': 1},
-                                                         'type': 'NULL'},
-                                                        {'name': 'sIP-Method',
-                                                         'optional': True,
-                                                         'tag': {'number': 2},
-                                                         'type': 'SIP-Method'},
-                                                        {'name': 'role-of-Node',
-                                                         'optional': True,
-                                                         'tag': {'number': 3},
-                                                         'type': 'Role-of-Node'},
-                                                        {'name': 'nodeAddress',
-                                                         'optional': True,
-                                                         'tag': {'number': 4},
-                                                         'type': 'NodeAddress'},
-                                                        {'name': 'session-Id',
-                                                         'optional': True,
-                                                         'tag': {'number': 5},
-                                                         'type': 'Session-Id'},
-                                                        {'name': 'list-Of-Calling-Party-Address',
-                                                         'optional': True,
-                                                         'tag': {'number': 6},
-                                                         'type': 'ListOfInvolvedParties'},
-                                                        {'name': 'called-Party-Address',
-                                                         'optional': True,
-                                                         'tag': {'number': 7},
-                                                         'type': 'InvolvedParty'},
-                                                        {'name': 'serviceRequestTimeStamp',
-                                                         'optional': True,
-                                                         'tag': {'number': 9},
-                                                         'type': 'TimeStamp'},
-                                                        {'name': 'serviceDeliveryStartTimeStamp',
-                                                         'optional': True,
-                                                         'tag': {'number': 10},
-                                                         'type': 'TimeStamp'},
-                                                        {'name': 'serviceDeliveryEndTimeStamp',
-                                                         'optional': True,
-                                                         'tag': {'number': 11},
-                                                         'type': 'TimeStamp'},
-                                                        {'name': 'recordOpeningTime',
-                                                         'optional': True,
-                                                         'tag': {'number': 12},
-                                                         'type': 'TimeStamp'},
-                                                        {'name': 'recordClosureTime',
-                                                         'optional': True,
-                                                         'tag': {'number': 13},
-                                                         'type': 'TimeStamp'},
-                                                        {'name': 'localRecordSequenceNumber',
-                                                         'optional': True,
-                                                         'tag': {'number': 15},
-                                                         'type': 'LocalSequenceNumber'},
-                                                        {'name': 'recordSequenceNumber',
-                                                         'optional': True,
-                                                         'tag': {'number': 16},
-                                                         'type': 'INTEGER'},
-                                                        {'name': 'causeForRecordClosing',
-                                                         'optional': True,
-                                                         'tag': {'number': 17},
-                                                         'type': 'CauseForRecordClosing'},
-                                                        {'name': 'incomplete-CDR-Indication',
-                                                         'optional': True,
-                                                         'tag': {'number': 18},
-                                                         'type': 'Incomplete-CDR-Indication'},
-                                                        {'name': 'iMS-Charging-Identifier',
-                                                         'optional': True,
-                                                         'tag': {'number': 19},
-                                                         'type': 'IMS-Charging-Identifier'},
-                                                        {'element': {'type': 'Media-Components-List'},
-                                                         'name': 'list-Of-SDP-Media-Components',
-                                                         'optional': True,
-                                                         'tag': {'number': 21},
-                                                         'type': 'SEQUENCE OF'},
-                                                        {'name': 'serviceReasonReturnCode',
-                                                         'optional': True,
-                                                         'tag': {'number': 23},
-                                                         'type': 'UTF8String'},
-                                                        {'name': 'accessNetworkInformation',
-                                                         'optional': True,
-                                                         'tag': {'number': 29},
-                                                         'type': 'OCTET '
-                                                                 'STRING'},
-                                                        {'name': 'serviceRequestTimeStampFraction',
-                                                         'optional': True,
-                                                         'tag': {'number': 37},
-                                                         'type': 'Milliseconds'},
-                                                        {'name': 'serviceDeliveryStartTimeStampFraction',
-                                                         'optional': True,
-                                                         'tag': {'number': 38},
-                                                         'type': 'Milliseconds'},
-                                                        {'name': 'serviceDeliveryEndTimeStampFraction',
-                                                         'optional': True,
-                                                         'tag': {'number': 39},
-                                                         'type': 'Milliseconds'},
-                                                        {'name': 'transit-IOI-List',
-                                                         'optional': True,
-                                                         'tag': {'number': 45},
-                                                         'type': 'GraphicString'},
-                                                        {'name': 'servedPartyIPAddress',
-                                                         'optional': True,
-                                                         'tag': {'number': 50},
-                                                         'type': 'ServedPartyIPAddress'},
-                                                        {'name': 'duration',
-                                                         'optional': True,
-                                                         'tag': {'number': 200},
-                                                         'type': 'INTEGER'},
-                                                        {'name': 'session-Priority',
-                                                         'optional': True,
-                                                         'tag': {'number': 205},
-                                                         'type': 'Session-Priority'},
-                                                        {'name': 'accounting-record-type',
-                                                         'optional': True,
-                                                         'tag': {'number': 227},
-                                                         'type': 'INTEGER'},
-                                                        {'name': 'origin-Realm',
-                                                         'optional': True,
-                                                         'tag': {'number': 266},
-                                                         'type': 'OCTET '
-                                                                 'STRING'},
-                                                        {'name': 'destination-Realm',
-                                                         'optional': True,
-                                                         'tag': {'number': 267},
-                                                         'type': 'OCTET '
-                                                                 'STRING'},
-                                                        {'name': 'ringing-Duration',
-                                                         'optional': True,
-                                                         'tag': {'number': 204},
-                                                         'type': 'UnsignedInter32'},
-                                                        {'name': 'trunkGroupID',
-                                                         'optional': True,
-                                                         'tag': {'number': 243},
-                                                         'type': 'TrunkGroupIBCF'},
-                                                        {'name': 'recordExtensions-0',
-                                                         'optional': True,
-                                                         'tag': {'number': 280},
-                                                         'type': 'ManagementExtensions'},
-                                                        {'name': 'recordExtensions-1',
-                                                         'optional': True,
-                                                         'tag': {'number': 281},
-                                                         'type': 'ManagementExtensions'},
-                                                        {'name': 'recordExtensions-2',
-                                                         'optional': True,
-                                                         'tag': {'number': 282},
-                                                         'type': 'ManagementExtensions'},
-                                                        {'name': 'recordExtensions-3',
-                                                         'optional': True,
-                                                         'tag': {'number': 283},
-                                                         'type': 'ManagementExtensions'},
-                                                        {'name': 'recordExtensions-4',
-                                                         'optional': True,
-                                                         'tag': {'number': 284},
-                                                         'type': 'ManagementExtensions'},
-                                                        {'name': 'recordExtensions-5',
-                                                         'optional': True,
-                                                         'tag': {'number': 285},
-                                                         'type': 'ManagementExtensions'},
-                                                        {'name': 'recordExtensions-6',
-                                                         'optional': True,
-                                                         'tag': {'number': 286},
-                                                         'type': 'ManagementExtensions'},
-                                                        {'name': 'recordExtensions-7',
-                                                         'optional': True,
-                                                         'tag': {'number': 287},
-                                                         'type': 'ManagementExtensions'},
-                                                        {'name': 'recordExtensions-8',
-                                                         'optional': True,
-                                                         'tag': {'number': 288},
-                                                         'type': 'ManagementExtensions'},
-                                                        {'name': 'recordExtensions-9',
-                                                         'optional': True,
-                                                         'tag': {'number': 289},
-                                                         'type': 'ManagementExtensions'},
-                                                        {'name': 'recordExtensions-10',
-                                                         'optional': True,
-                                                         'tag': {'number': 290},
-                                                         'type': 'ManagementExtensions'},
-                                                        {'name': 'qos-Statistics',
-                                                         'optional': True,
-                                                         'tag': {'number': 412},
-                                                         'type': 'UTF8String'},
-                                                        {'name': 'user-IMEI',
-                                                         'optional': True,
-                                                         'tag': {'number': 432},
-                                                         'type': 'UTF8String'},
-                                                        {'name': 'sDP-Media-Identifier',
-                                                         'optional': True,
-                                                         'tag': {'number': 233},
-                                                         'type': 'SDP-Media-Identifier'},
-                                                        {'element': {'type': 'SIP-Diversion'},
-                                                         'name': 'list-of-SIP-Diversion',
-                                                         'optional': True,
-                                                         'tag': {'number': 456},
-                                                         'type': 'SEQUENCE '
-                                                                 'OF'}],
-                                            'type': 'SET'},
-                              'SCP-Connection': {'type': 'ENUMERATED',
-                                                 'values': [('no-connection-to-in',
-                                                             0),
-                                                            ('try-to-connect-to-in-but-fail',
-                                                             1),
-                                                            ('successful-connection-to-in',
-                                                             2)]},
-                              'SCSCFRecord': {'members': [{'name': 'recordType',
-                                                           'optional': True,
-                                                           'tag': {'number': 0},
-                                                           'type': 'RecordType'},
-                                                          {'name': 'retransmission',
-                                                           'optional': True,
-                                                           'tag': {'number': 1},
-                                                           'type': 'NULL'},
-                                                          {'name': 'sIP-Method',
-                                                           'optional': True,
-                                                           'tag': {'number': 2},
-                                                           'type': 'SIP-Method'},
-                                                          {'name': 'role-of-Node',
-                                                           'optional': True,
-                                                           'tag': {'number': 3},
-                                                           'type': 'Role-of-Node'},
-                                                          {'name': 'nodeAddress',
-                                                           'optional': True,
-                                                           'tag': {'number': 4},
-                                                           'type': 'NodeAddress'},
-                                                          {'name': 'session-Id',
-                                                           'optional': True,
-                                                           'tag': {'number': 5},
-                                                           'type': 'Session-Id'},
-                                                          {'name': 'list-Of-Calling-Party-Address',
-                                                           'optional': True,
-                                                           'tag': {'number': 6},
-                                                           'type': 'ListOfInvolvedParties'},
-                                                          {'name': 'called-Party-Address',
-                                                           'optional': True,
-                                                           'tag': {'number': 7},
-                                                           'type': 'InvolvedParty'},
-                                                          {'name': 'privateUserID',
-                                                           'optional': True,
-                                                           'tag': {'number': 8},
-                                                           'type': 'GraphicString'},
-                                                          {'name': 'serviceRequestTimeStamp',
-                                                           'optional': True,
-                                                           'tag': {'number': 9},
-                                                           'type': 'TimeStamp'},
-                                                          {'name': 'serviceDeliveryStartTimeStamp',
-                                                           'optional': True,
-                                                           'tag': {'number': 10},
-                                                           'type': 'TimeStamp'},
-                                                          {'name': 'serviceDeliveryEndTimeStamp',
-                                                           'optional': True,
-                                                           'tag': {'number': 11},
-                                                           'type': 'TimeStamp'},
-                                                          {'name': 'recordOpeningTime',
-                                                           'optional': True,
-                                                           'tag': {'number': 12},
-                                                           'type': 'TimeStamp'},
-                                                          {'name': 'recordClosureTime',
-                                                           'optional': True,
-                                                           'tag': {'number': 13},
-                                                           'type': 'TimeStamp'},
-                                                          {'name': 'interOperatorIdentifiers',
-                                                           'optional': True,
-                                                           'tag': {'number': 14},
-                                                           'type': 'InterOperatorIdentifierlist'},
-                                                          {'name': 'localRecordSequenceNumber',
-                                                           'optional': True,
-                                                           'tag': {'number': 15},
-                                                           'type': 'LocalSequenceNumber'},
-                                                          {'name': 'recordSequenceNumber',
-                                                           'optional': True,
-                                                           'tag': {'number': 16},
-                                                           'type': 'INTEGER'},
-                                                          {'name': 'causeForRecordClosing',
-                                                           'optional': True,
-                                                           'tag': {'number': 17},
-                                                           'type': 'CauseForRecordClosing'},
-                                                          {'name': 'incomplete-CDR-Indication',
-                                                           'optional': True,
-                                                           'tag': {'number': 18},
-                                                           'type': 'Incomplete-CDR-Indication'},
-                                                          {'name': 'iMS-Charging-Identifier',
-                                                           'optional': True,
-                                                           'tag': {'number': 19},
-                                                           'type': 'IMS-Charging-Identifier'},
-                                                          {'element': {'type': 'Media-Components-List'},
-                                                           'name': 'list-Of-SDP-Media-Components',
-                                                           'optional': True,
-                                                           'tag': {'number': 21},
-                                                           'type': 'SEQUENCE '
-                                                                   'OF'},
-                                                          {'name': 'gGSNaddress',
-                                                           'optional': True,
-                                                           'tag': {'number': 22},
-                                                           'type': 'NodeAddress'},
-                                                          {'name': 'serviceReasonReturnCode',
-                                                           'optional': True,
-                                                           'tag': {'number': 23},
-                                                           'type': 'UTF8String'},
-                                                          {'element': {'type': 'MessageBody'},
-                                                           'name': 'list-Of-Message-Bodies',
-                                                           'optional': True,
-                                                           'tag': {'number': 24},
-                                                           'type': 'SEQUENCE '
-                                                                   'OF'},
-                                                          {'name': 'recordExtensions',
-                                                           'optional': True,
-                                                           'tag': {'number': 25},
-                                                           'type': 'ManagementExtensions'},
-                                                          {'name': 'expiresInformation',
-                                                           'optional': True,
-                                                           'tag': {'number': 26},
-                                                           'type': 'INTEGER'},
-                                                          {'name': 'list-Of-Associated-URI',
-                                                           'optional': True,
-                                                           'tag': {'number': 27},
-                                                           'type': 'ListOfInvolvedParties'},
-                                                          {'name': 'event',
-                                                           'optional': True,
-                                                           'tag': {'number': 28},
-                                                           'type': 'UTF8String'},
-                                                          {'name': 'accessNetworkInformation',
-                                                           'optional': True,
-                                                           'tag': {'number': 29},
-                                                           'type': 'OCTET '
-                                                                   'STRING'},
-                                                          {'name': 'serviceContextID',
-                                                           'optional': True,
-                                                           'tag': {'number': 30},
-                                                           'type': 'ServiceContextID'},
-                                                          {'element': {'type': 'SubscriptionID'},
-                                                           'name': 'list-of-subscription-ID',
-                                                           'optional': True,
-                                                           'tag': {'number': 31},
-                                                           'type': 'SEQUENCE '
-                                                                   'OF'},
-                                                          {'element': {'type': 'Early-Media-Components-List'},
-                                                           'name': 'list-Of-Early-SDP-Media-Components',
-                                                           'optional': True,
-                                                           'tag': {'number': 32},
-                                                           'type': 'SEQUENCE '
-                                                                   'OF'},
-                                                          {'name': 'iMSCommunicationServiceIdentifier',
-                                                           'optional': True,
-                                                           'tag': {'number': 33},
-                                                           'type': 'IMSCommunicationServiceIdentifier'},
-                                                          {'name': 'numberPortabilityRouting',
-                                                           'optional': True,
-                                                           'tag': {'number': 34},
-                                                           'type': 'NumberPortabilityRouting'},
-                                                          {'name': 'carrierSelectRouting',
-                                                           'optional': True,
-                                                           'tag': {'number': 35},
-                                                           'type': 'CarrierSelectRouting'},
-                                                          {'name': 'ims-3gpp-Session-Priority',
-                                                           'optional': True,
-                                                           'tag': {'number': 36},
-                                                           'type': 'INTEGER'},
-                                                          {'name': 'serviceRequestTimeStampFraction',
-                                                           'optional': True,
-                                                           'tag': {'number': 37},
-                                                           'type': 'Milliseconds'},
-                                                          {'name': 'serviceDeliveryStartTimeStampFraction',
-                                                           'optional': True,
-                                                           'tag': {'number': 38},
-                                                           'type': 'Milliseconds'},
-                                                          {'name': 'serviceDeliveryEndTimeStampFraction',
-                                                           'optional': True,
-                                                           'tag': {'number': 39},
-                                                           'type': 'Milliseconds'},
-                                                          {'element': {'type': 'ApplicationServersInformation'},
-                                                           'name': 'applicationServersInformation',
-                                                           'optional': True,
-                                                           'tag': {'number': 40},
-                                                           'type': 'SEQUENCE '
-                                                                   'OF'},
-                                                          {'name': 'requested-Party-Address',
-                                                           'optional': True,
-                                                           'tag': {'number': 41},
-                                                           'type': 'InvolvedParty'},
-                                                          {'name': 'list-Of-Called-Asserted-Identity',
-                                                           'optional': True,
-                                                           'tag': {'number': 42},
-                                                           'type': 'ListOfInvolvedParties'},
-                                                          {'name': 'subscriberEquipmentNumber',
-                                                           'optional': True,
-                                                           'tag': {'number': 58},
-                                                           'type': 'SubscriberEquipmentNumber'},
-                                                          {'name': 'duration',
-                                                           'optional': True,
-                                                           'tag': {'number': 200},
-                                                           'type': 'INTEGER'},
-                                                          {'name': 'onlineChargingType',
-                                                           'optional': True,
-                                                           'tag': {'number': 201},
-                                                           'type': 'Online-Charging-Type'},
-                                                          {'name': 'origin-Callee-Party-Address',
-                                                           'optional': True,
-                                                           'tag': {'number': 202},
-                                                           'type': 'InvolvedParty'},
-                                                          {'name': 'dialled-Party-Address',
-                                                           'optional': True,
-                                                           'tag': {'number': 203},
-                                                           'type': 'InvolvedParty'},
-                                                          {'name': 'ringing-Duration',
-                                                           'optional': True,
-                                                           'tag': {'number': 204},
-                                                           'type': 'UnsignedInter32'},
-                                                          {'name': 'session-Priority',
-                                                           'optional': True,
-                                                           'tag': {'number': 205},
-                                                           'type': 'Session-Priority'},
-                                                          {'name': 'carrier-Identification-Code',
-                                                           'optional': True,
-                                                           'tag': {'number': 206},
-                                                           'type': 'GraphicString'},
-                                                          {'name': 'abnormal-Finish-Info',
-                                                           'optional': True,
-                                                           'tag': {'number': 207},
-                                                           'type': 'Abnormal-Finish-Info'},
-                                                          {'name': 'nP-Data',
-                                                           'optional': True,
-                                                           'tag': {'number': 208},
-                                                           'type': 'NP-Data'},
-                                                          {'name': 'refer-To',
-                                                           'optional': True,
-                                                           'tag': {'number': 209},
-                                                           'type': 'UTF8String'},
-                                                          {'name': 'target',
-                                                           'optional': True,
-                                                           'tag': {'number': 210},
-                                                           'type': 'UTF8String'},
-                                                          {'name': 'inner-error',
-                                                           'optional': True,
-                                                           'tag': {'number': 265},
-                                                           'type': 'INTEGER'},
-                                                          {'name': 'application-Servers-State',
-                                                           'optional': True,
-                                                           'tag': {'number': 266},
-                                                           'type': 'INTEGER'},
-                                                          {'element': {'type': 'Application-Servers-Abnormal'},
-                                                           'name': 'list-of-application-Servers-Abnormal',
-                                                           'optional': True,
-                                                           'tag': {'number': 267},
-                                                           'type': 'SEQUENCE '
-                                                                   'OF'},
-                                                          {'name': 'segment-Id',
-                                                           'optional': True,
-                                                           'tag': {'number': 300},
-                                                           'type': 'UnsignedInter32'},
-                                                          {'name': 'qos-Statistics',
-                                                           'optional': True,
-                                                           'tag': {'number': 412},
-                                                           'type': 'UTF8String'},
-                                                          {'name': 'private-ConnectTime',
-                                                           'optional': True,
-                                                           'tag': {'number': 424},
-                                                           'type': 'Private-ConnectTime'},
-                                                          {'name': 'from-Header',
-                                                           'optional': True,
-                                                           'tag': {'number': 440},
-                                                           'type': 'UTF8String'},
-                                                          {'name': 'to-Header',
-                                                           'optional': True,
-                                                           'tag': {'number': 441},
-                                                           'type': 'UTF8String'},
-                                                          {'name': 'c-Cause-Closing',
-                                                           'optional': True,
-                                                           'tag': {'number': 442},
-                                                           'type': 'UnsignedInter32'}],
-                                              'type': 'SET'},
-                              'SDP-Media-Component': {'members': [{'name': 'sDP-Media-Name',
-                                                                   'optional': True,
-                                                                   'tag': {'number': 0},
-                                                                   'type': 'GraphicString'},
-                                                                  {'name': 'sDP-Media-Descriptions',
-                                                                   'optional': True,
-                                                                   'tag': {'number': 1},
-                                                                   'type': 'SDP-Media-Description'},
-                                                                  {'name': 'accessCorrelationID',
-                                                                   'optional': True,
-                                                                   'type': 'AccessCorrelationID'},
-                                                                  {'name': 'authorized-QoS',
-                                                                   'optional': True,
-                                                                   'tag': {'number': 3},
-                                                                   'type': 'GraphicString'}],
-                                                      'type': 'SEQUENCE'},
-                              'SDP-Media-Description': {'element': {'type': 'GraphicString'},
-                                                        'type': 'SEQUENCE OF'},
-                              'SDP-Media-Identifier': {'type': 'ENUMERATED',
-                                                       'values': [('voiceCall',
-                                                                   0),
-                                                                  ('videoCall',
-                                                                   1),
-                                                                  ('fax', 2),
-                                                                  ('cSD', 3),
-                                                                  ('pABX', 4),
-                                                                  ('text', 5)]},
-                              'SDP-Type': {'type': 'ENUMERATED',
-                                           'values': [('sDP-offer', 0),
-                                                      ('sDP-answer', 1)]},
-                              'SIP-Diversion': {'type': 'UTF8String'},
-                              'SIP-Method': {'type': 'GraphicString'},
-                              'SMS-Information': {'members': [{'name': 'sms-node',
-                                                               'optional': True,
-                                                               'tag': {'number': 1},
-                                                               'type': 'INTEGER'},
-                                                              {'name': 'smsc-address',
-                                                               'optional': True,
-                                                               'tag': {'number': 2},
-                                                               'type': 'UTF8String'},
-                                                              {'name': 'originator-sccp-address',
-                                                               'optional': True,
-                                                               'tag': {'number': 3},
-                                                               'type': 'UTF8String'},
-                                                              {'name': 'message-reference',
-                                                               'optional': True,
-                                                               'tag': {'number': 4},
-                                                               'type': 'OCTET '
-                                                                       'STRING'},
-                                                              {'name': 'vmsc-address',
-                                                               'optional': True,
-                                                               'tag': {'number': 5},
-                                                               'type': 'UTF8String'},
-                                                              {'name': 'sms-result',
-                                                               'optional': True,
-                                                               'tag': {'number': 6},
-                                                               'type': 'SMS-Result'},
-                                                              {'name': 'map-fail-cause',
-                                                               'optional': True,
-                                                               'tag': {'number': 7},
-                                                               'type': 'UnsignedInter32'},
-                                                              {'name': 'maximum-of-concatenated-sms',
-                                                               'optional': True,
-                                                               'tag': {'number': 8},
-                                                               'type': 'UnsignedInter32'},
-                                                              {'name': 'concatenated-sms-reference-number',
-                                                               'optional': True,
-                                                               'tag': {'number': 9},
-                                                               'type': 'UnsignedInter32'},
-                                                              {'name': 'sequence-number-of-current-sms',
-                                                               'optional': True,
-                                                               'tag': {'number': 10},
-                                                               'type': 'UnsignedInter32'},
-                                                              {'name': 'data-coding-scheme',
-                                                               'optional': True,
-                                                               'tag': {'number': 11},
-                                                               'type': 'Data-Coding-Scheme'},
-                                                              {'name': 'number-of-messages-sent',
-                                                               'optional': True,
-                                                               'tag': {'number': 12},
-                                                               'type': 'UnsignedInter32'},
-                                                              {'name': 'userdatalength-sms',
-                                                               'optional': True,
-                                                               'tag': {'number': 13},
-                                                               'type': 'UnsignedInter32'}],
-                                                  'type': 'SET'},
-                              'SMS-Result': {'type': 'ENUMERATED',
-                                             'values': [('success', 0),
-                                                        ('failure', 1)]},
-                              'ServedPartyIPAddress': {'type': 'IPAddress'},
-                              'Service-Context-Id': {'type': 'GraphicString'},
-                              'Service-Id': {'type': 'GraphicString'},
-                              'Service-Identifier': {'type': 'INTEGER'},
-                              'Service-Indetity': {'type': 'INTEGER'},
-                              'Service-Interact-Info': {'members': [{'name': 'executed-Service',
-                                                                     'tag': {'number': 1},
-                                                                     'type': 'OCTET '
-                                                                             'STRING'}],
-                                                        'type': 'SEQUENCE'},
-                              'Service-Mode': {'type': 'INTEGER'},
-                              'Service-Type': {'type': 'ENUMERATED',
-                                               'values': [('acb', 1),
-                                                          ('ar', 2),
-                                                          ('sca', 3),
-                                                          ('trans', 4),
-                                                          ('cfd', 5),
-                                                          ('sim', 6),
-                                                          ('n-way', 7),
-                                                          ('rbwf', 8),
-                                                          ('cot', 9),
-                                                          ('park', 10),
-                                                          ('pickup', 11),
-                                                          ('auth', 12),
-                                                          ('account-code', 13),
-                                                          ('flixd', 14),
-                                                          ('seq', 15),
-                                                          ('cps', 16),
-                                                          ('mrb', 17),
-                                                          ('moh', 18),
-                                                          ('sp2', 19),
-                                                          ('mlpp', 20)]},
-                              'ServiceAreaCode': {'size': [2],
-                                                  'type': 'OCTET STRING'},
-                              'ServiceContextID': {'type': 'UTF8String'},
-                              'ServiceMode': {'named-numbers': {'aCRejection': 8,
-                                                                'aoC-D': 13,
-                                                                'aoC-E': 14,
-                                                                'aoC-S': 12,
-                                                                'cFbusy': 1,
-                                                                'cFnoReply': 2,
-                                                                'cFnotLogged': 3,
-                                                                'cFunCond': 0,
-                                                                'deflection': 4,
-                                                                'eCTBlind': 9,
-                                                                'eCTConsultative': 10,
-                                                                'iCBarring': 6,
-                                                                'notReach': 5,
-                                                                'oCBarring': 7,
-                                                                'threeParty': 11},
-                                              'type': 'INTEGER'},
-                              'ServiceSpecificInfo': {'members': [{'name': 'serviceSpecificData',
-                                                                   'optional': True,
-                                                                   'tag': {'number': 0},
-                                                                   'type': 'GraphicString'},
-                                                                  {'name': 'serviceSpecificType',
-                                                                   'optional': True,
-                                                                   'tag': {'number': 1},
-                                                                   'type': 'INTEGER'}],
-                                                      'type': 'SEQUENCE'},
-                              'ServiceType': {'named-numbers': {'aoC': 19,
-                                                                'cAT': 15,
-                                                                'cBarring': 5,
-                                                                'cCBS': 12,
-                                                                'cCNR': 13,
-                                                                'cDIVersion': 6,
-                                                                'cDIVersionNotif': 7,
-                                                                'cONF': 10,
-                                                                'cUG': 16,
-                                                                'cWaiting': 8,
-                                                                'eCT': 20,
-                                                                'fA': 11,
-                                                                'hOLD': 4,
-                                                                'mCID': 14,
-                                                                'mWaitingIndic': 9,
-                                                                'oIPresentation': 0,
-                                                                'oIRestriction': 1,
-                                                                'tIPresentation': 2,
-                                                                'tIRestriction': 3},
-                                              'type': 'INTEGER'},
-                              'Session-Id': {'type': 'GraphicString'},
-                              'Session-Priority': {'type': 'INTEGER'},
-                              'SpecifiedTreatmentField': {'members': [{'name': 'call-Identification-Number',
-                                                                       'optional': True,
-                                                                       'tag': {'number': 0},
-                                                                       'type': 'UTF8String'},
-                                                                      {'name': 'interruption-Time',
-                                                                       'optional': True,
-                                                                       'tag': {'number': 1},
-                                                                       'type': 'UnsignedInter32'},
-                                                                      {'name': 'origin-For-Charging',
-                                                                       'optional': True,
-                                                                       'tag': {'number': 2},
-                                                                       'type': 'UTF8String'},
-                                                                      {'name': 'outgoing-Route',
-                                                                       'optional': True,
-                                                                       'tag': {'number': 3},
-                                                                       'type': 'UTF8String'},
-                                                                      {'name': 'incoming-Route',
-                                                                       'optional': True,
-                                                                       'tag': {'number': 4},
-                                                                       'type': 'UTF8String'},
-                                                                      {'name': 'initial-Visit-CGI',
-                                                                       'optional': True,
-                                                                       'tag': {'number': 5},
-                                                                       'type': 'UTF8String'},
-                                                                      {'name': 'called-MNP-Info',
-                                                                       'optional': True,
-                                                                       'tag': {'number': 6},
-                                                                       'type': 'UTF8String'},
-                                                                      {'name': 'subscription-Type',
-                                                                       'optional': True,
-                                                                       'tag': {'number': 7},
-                                                                       'type': 'UnsignedInter32'},
-                                                                      {'name': 'translated-Number',
-                                                                       'optional': True,
-                                                                       'tag': {'number': 8},
-                                                                       'type': 'UTF8String'},
-                                                                      {'name': 'mTC-Roaming-Number',
-                                                                       'optional': True,
-                                                                       'tag': {'number': 9},
-                                                                       'type': 'UTF8String'},
-                                                                      {'name': 'redirecting-Number',
-                                                                       'optional': True,
-                                                                       'tag': {'number': 10},
-                                                                       'type': 'UTF8String'},
-                                                                      {'name': 'rCF-Roaming-Number',
-                                                                       'optional': True,
-                                                                       'tag': {'number': 11},
-                                                                       'type': 'UTF8String'},
-                                                                      {'name': 'rCF-Indication',
-                                                                       'optional': True,
-                                                                       'tag': {'number': 12},
-                                                                       'type': 'UnsignedInter32'},
-                                                                      {'name': 'specifiedBillType',
-                                                                       'optional': True,
-                                                                       'tag': {'number': 13},
-                                                                       'type': 'UnsignedInter32'}],
-                                                          'type': 'SET'},
-                              'Stream-Exchange': {'members': [{'name': 'streamType',
-                                                               'optional': True,
-                                                               'tag': {'number': 0},
-                                                               'type': 'Stream-Type'},
-                                                              {'name': 'direction',
-                                                               'optional': True,
-                                                               'tag': {'number': 1},
-                                                               'type': 'Direction'},
-                                                              {'name': 'number',
-                                                               'optional': True,
-                                                               'tag': {'number': 2},
-                                                               'type': 'INTEGER'},
-                                                              {'name': 'duration',
-                                                               'optional': True,
-                                                               'tag': {'number': 3},
-                                                               'type': 'INTEGER'},
-                                                              {'name': 'volume',
-                                                               'optional': True,
-                                                               'tag': {'number': 4},
-                                                               'type': 'Volume'}],
-                                                  'type': 'SEQUENCE'},
-                              'Stream-Type': {'type': 'ENUMERATED',
-                                              'values': [('message', 1),
-                                                         ('audio', 2),
-                                                         ('video', 3)]},
-                              'SubscriberEquipmentNumber': {'members': [{'name': 'subscriberEquipmentNumberType',
-                                                                         'tag': {'number': 0},
-                                                                         'type': 'SubscriberEquipmentType'},
-                                                                        {'name': 'subscriberEquipmentNumberData',
-                                                                         'tag': {'number': 1},
-                                                                         'type': 'OCTET '
-                                                                                 'STRING'}],
-                                                            'type': 'SET'},
-                              'SubscriberEquipmentType': {'type': 'ENUMERATED',
-                                                          'values': [('iMEISV',
-                                                                      0)]},
-                              'SubscriberRole': {'type': 'ENUMERATED',
-                                                 'values': [('originating', 0),
-                                                            ('terminating',
-                                                             1)]},
-                              'SubscriptionID': {'members': [{'name': 'subscriptionIDType',
-                                                              'optional': True,
-                                                              'tag': {'number': 0},
-                                                              'type': 'SubscriptionIDType'},
-                                                             {'name': 'subscriptionIDData',
-                                                              'optional': True,
-                                                              'tag': {'number': 1},
-                                                              'type': 'UTF8String'}],
-                                                 'type': 'SET'},
-                              'SubscriptionIDType': {'type': 'ENUMERATED',
-                                                     'values': [('eND-USER-E164',
-                                                                 0),
-                                                                ('eND-USER-IMSI',
-                                                                 1),
-                                                                ('eND-USER-SIP-URI',
-                                                                 2),
-                                                                ('eND-USER-NAI',
-                                                                 3),
-                                                                ('eND-USER-PRIVATE',
-                                                                 4)]},
-                              'Supp-Action': {'type': 'ENUMERATED',
-                                              'values': [('activation', 1),
-                                                         ('deactivation', 2),
-                                                         ('interrogation', 3),
-                                                         ('cancellation', 4)]},
-                              'Supp-Service-Mode': {'type': 'ENUMERATED',
-                                                    'values': [('cfu', 1),
-                                                               ('cfb', 2),
-                                                               ('cfda', 3),
-                                                               ('cfuu', 4),
-                                                               ('cfs', 5),
-                                                               ('cfsr', 6),
-                                                               ('cfl', 7),
-                                                               ('ctb', 8),
-                                                               ('ctc', 9),
-                                                               ('ctfnway', 10),
-                                                               ('ctlu', 11),
-                                                               ('other', 12),
-                                                               ('cpp', 13),
-                                                               ('cpr', 14),
-                                                               ('cph', 15),
-                                                               ('cpupu', 16),
-                                                               ('cpudpu', 17),
-                                                               ('cpubi', 18),
-                                                               ('nway3', 19),
-                                                               ('nway4', 20),
-                                                               ('nway5', 21),
-                                                               ('nway6', 22),
-                                                               ('cfsr23', 23),
-                                                               ('cfude24',
-                                                                24)]},
-                              'SupplService': {'members': [{'name': 'serviceType',
-                                                            'optional': True,
-                                                            'tag': {'number': 0},
-                                                            'type': 'ServiceType'},
-                                                           {'name': 'serviceMode',
-                                                            'optional': True,
-                                                            'tag': {'number': 1},
-                                                            'type': 'ServiceMode'},
-                                                           {'name': 'numberOfDiversions',
-                                                            'optional': True,
-                                                            'tag': {'number': 2},
-                                                            'type': 'INTEGER'},
-                                                           {'name': 'associated-Party-Address',
-                                                            'optional': True,
-                                                            'tag': {'number': 3},
-                                                            'type': 'InvolvedParty'},
-                                                           {'name': 'serviceId',
-                                                            'optional': True,
-                                                            'tag': {'number': 4},
-                                                            'type': 'Service-Id'},
-                                                           {'name': 'changeTime',
-                                                            'optional': True,
-                                                            'tag': {'number': 5},
-                                                            'type': 'TimeStamp'},
-                                                           {'name': 'numberOfParticipants',
-                                                            'optional': True,
-                                                            'tag': {'number': 6},
-                                                            'type': 'INTEGER'},
-                                                           {'name': 'participantActionType',
-                                                            'optional': True,
-                                                            'tag': {'number': 7},
-                                                            'type': 'ParticipantActionType'},
-                                                           {'name': 'cUGInformation',
-                                                            'optional': True,
-                                                            'tag': {'number': 8},
-                                                            'type': 'OCTET '
-                                                                    'STRING'},
-                                                           {'name': 'service-Operate-Result',
-                                                            'optional': True,
-                                                            'tag': {'number': 20},
-                                                            'type': 'UnsignedInter32'},
-                                                           {'name': 'number-Of-Video-Participants',
-                                                            'optional': True,
-                                                            'tag': {'number': 50},
-                                                            'type': 'UnsignedInter32'}],
-                                               'type': 'SET'},
-                              'Supplementary-Service': {'members': [{'name': 'service-type',
-                                                                     'optional': True,
-                                                                     'tag': {'number': 0},
-                                                                     'type': 'Service-Type'},
-                                                                    {'name': 'action',
-                                                                     'optional': True,
-                                                                     'tag': {'number': 1},
-                                                                     'type': 'Supp-Action'},
-                                                                    {'name': 'supp-service-mode',
-                                                                     'optional': True,
-                                                                     'tag': {'number': 2},
-                                                                     'type': 'Supp-Service-Mode'},
-                                                                    {'name': 'supp-service-id',
-                                                                     'optional': True,
-                                                                     'tag': {'number': 3},
-                                                                     'type': 'UTF8String'},
-                                                                    {'name': 'associated-number',
-                                                                     'optional': True,
-                                                                     'tag': {'number': 4},
-                                                                     'type': 'UTF8String'},
-                                                                    {'name': 'supp-start-time',
-                                                                     'optional': True,
-                                                                     'tag': {'number': 5},
-                                                                     'type': 'UTF8String'},
-                                                                    {'name': 'supp-stop-time',
-                                                                     'optional': True,
-                                                                     'tag': {'number': 6},
-                                                                     'type': 'UTF8String'},
-                                                                    {'name': 'name-space',
-                                                                     'optional': True,
-                                                                     'tag': {'number': 7},
-                                                                     'type': 'UTF8String'},
-                                                                    {'name': 'precedence-level',
-                                                                     'optional': True,
-                                                                     'tag': {'number': 8},
-                                                                     'type': 'Precedence-Level'}],
-                                                        'type': 'SEQUENCE'},
-                              'TADS-Indication': {'type': 'ENUMERATED',
-                                                  'values': [('cS', 0),
-                                                             ('lTE', 1),
-                                                             ('wiFi', 2)]},
-                              'Terminal-Type': {'type': 'INTEGER'},
-                              'TimeStamp': {'size': [9],
-                                            'type': 'OCTET STRING'},
-                              'TransmissionMedium': {'members': [{'name': 'tMR',
-                                                                  'optional': True,
-                                                                  'size': [1],
-                                                                  'tag': {'number': 0},
-                                                                  'type': 'OCTET '
-                                                                          'STRING'},
-                                                                 {'name': 'tMU',
-                                                                  'optional': True,
-                                                                  'size': [1],
-                                                                  'tag': {'number': 1},
-                                                                  'type': 'OCTET '
-                                                                          'STRING'}],
-                                                     'type': 'SEQUENCE'},
-                              'TrunkGroupIBCF': {'members': [{'name': 'incoming',
-                                                              'optional': True,
-                                                              'tag': {'number': 0},
-                                                              'type': 'GraphicString'},
-                                                             {'name': 'outgoing',
-                                                              'optional': True,
-                                                              'tag': {'number': 1},
-                                                              'type': 'GraphicString'}],
-                                                 'type': 'SEQUENCE'},
-                              'TrunkGroupID': {'members': [{'name': 'incoming',
-                                                            'tag': {'number': 0},
-                                                            'type': 'GraphicString'},
-                                                           {'name': 'outgoing',
-                                                            'tag': {'number': 1},
-                                                            'type': 'GraphicString'}],
-                                               'type': 'CHOICE'},
-                              'Type-Of-Charging': {'type': 'ENUMERATED',
-                                                   'values': [('free-ad', 0),
-                                                              ('charging-ad',
-                                                               1)]},
-                              'UnsignedInter32': {'restricted-to': [(0,
-                                                                     4294967295)],
-                                                  'type': 'INTEGER'},
-                              'UnsignedInter64': {'restricted-to': [(0,
-                                                                     18446744073709551615)],
-                                                  'type': 'INTEGER'},
-                              'User-Category': {'type': 'ENUMERATED',
-                                                'values': [('user-uc', 1),
-                                                           ('user-m-meeting',
-                                                            2),
-                                                           ('user-room', 3),
-                                                           ('user-undefined',
-                                                            256)]},
-                              'User-SIP-URI': {'type': 'UTF8String'},
-                              'VCCASRecord': {'members': [{'name': 'recordType',
-                                                           'optional': True,
-                                                           'tag': {'number': 0},
-                                                           'type': 'RecordType'},
-                                                          {'name': 'retransmission',
-                                                           'optional': True,
-                                                           'tag': {'number': 1},
-                                                           'type': 'NULL'},
-                                                          {'name': 'sIP-Method',
-                                                           'optional': True,
-                                                           'tag': {'number': 2},
-                                                           'type': 'SIP-Method'},
-                                                          {'name': 'role-of-Node',
-                                                           'optional': True,
-                                                           'tag': {'number': 3},
-                                                           'type': 'Role-of-Node'},
-                                                          {'name': 'nodeAddress',
-                                                           'optional': True,
-                                                           'tag': {'number': 4},
-                                                           'type': 'NodeAddress'},
-                                                          {'name': 'session-Id',
-                                                           'optional': True,
-                                                           'tag': {'number': 5},
-                                                           'type': 'Session-Id'},
-                                                          {'name': 'list-Of-Calling-Party-Address',
-                                                           'optional': True,
-                                                           'tag': {'number': 6},
-                                                           'type': 'ListOfInvolvedParties'},
-                                                          {'name': 'called-Party-Address',
-                                                           'optional': True,
-                                                           'tag': {'number': 7},
-                                                           'type': 'InvolvedParty'},
-                                                          {'name': 'serviceRequestTimeStamp',
-                                                           'optional': True,
-                                                           'tag': {'number': 9},
-                                                           'type': 'TimeStamp'},
-                                                          {'name': 'serviceDeliveryStartTimeStamp',
-                                                           'optional': True,
-                                                           'tag': {'number': 10},
-                                                           'type': 'TimeStamp'},
-                                                          {'name': 'serviceDeliveryEndTimeStamp',
-                                                           'optional': True,
-                                                           'tag': {'number': 11},
-                                                           'type': 'TimeStamp'},
-                                                          {'name': 'recordOpeningTime',
-                                                           'optional': True,
-                                                           'tag': {'number': 12},
-                                                           'type': 'TimeStamp'},
-                                                          {'name': 'recordClosureTime',
-                                                           'optional': True,
-                                                           'tag': {'number': 13},
-                                                           'type': 'TimeStamp'},
-                                                          {'name': 'interOperatorIdentifiers',
-                                                           'optional': True,
-                                                           'tag': {'number': 14},
-                                                           'type': 'InterOperatorIdentifierlist'},
-                                                          {'name': 'localRecordSequenceNumber',
-                                                           'optional': True,
-                                                           'tag': {'number': 15},
-                                                           'type': 'LocalSequenceNumber'},
-                                                          {'name': 'recordSequenceNumber',
-                                                           'optional': True,
-                                                           'tag': {'number': 16},
-                                                           'type': 'INTEGER'},
-                                                          {'name': 'causeForRecordClosing',
-                                                           'optional': True,
-                                                           'tag': {'number': 17},
-                                                           'type': 'CauseForRecordClosing'},
-                                                          {'name': 'incomplete-CDR-Indication',
-                                                           'optional': True,
-                                                           'tag': {'number': 18},
-                                                           'type': 'Incomplete-CDR-Indication'},
-                                                          {'name': 'iMS-Charging-Identifier',
-                                                           'optional': True,
-                                                           'tag': {'number': 19},
-                                                           'type': 'IMS-Charging-Identifier'},
-                                                          {'element': {'type': 'Media-Components-List'},
-                                                           'name': 'list-Of-SDP-Media-Components',
-                                                           'optional': True,
-                                                           'tag': {'number': 21},
-                                                           'type': 'SEQUENCE '
-                                                                   'OF'},
-                                                          {'name': 'gGSNaddress',
-                                                           'optional': True,
-                                                           'tag': {'number': 22},
-                                                           'type': 'NodeAddress'},
-                                                          {'name': 'serviceReasonReturnCode',
-                                                           'optional': True,
-                                                           'tag': {'number': 23},
-                                                           'type': 'UTF8String'},
-                                                          {'element': {'type': 'MessageBody'},
-                                                           'name': 'list-Of-Message-Bodies',
-                                                           'optional': True,
-                                                           'tag': {'number': 24},
-                                                           'type': 'SEQUENCE '
-                                                                   'OF'},
-                                                          {'name': 'recordExtensions',
-                                                           'optional': True,
-                                                           'tag': {'number': 25},
-                                                           'type': 'ManagementExtensions'},
-                                                          {'name': 'expiresInformation',
-                                                           'optional': True,
-                                                           'tag': {'number': 26},
-                                                           'type': 'INTEGER'},
-                                                          {'name': 'event',
-                                                           'optional': True,
-                                                           'tag': {'number': 28},
-                                                           'type': 'UTF8String'},
-                                                          {'name': 'accessNetworkInformation',
-                                                           'optional': True,
-                                                           'tag': {'number': 29},
-                                                           'type': 'OCTET '
-                                                                   'STRING'},
-                                                          {'name': 'serviceContextID',
-                                                           'optional': True,
-                                                           'tag': {'number': 30},
-                                                           'type': 'ServiceContextID'},
-                                                          {'element': {'type': 'SubscriptionID'},
-                                                           'name': 'list-of-subscription-ID',
-                                                           'optional': True,
-                                                           'tag': {'number': 31},
-                                                           'type': 'SEQUENCE '
-                                                                   'OF'},
-                                                          {'element': {'type': 'Early-Media-Components-List'},
-                                                           'name': 'list-Of-Early-SDP-Media-Components',
-                                                           'optional': True,
-                                                           'tag': {'number': 32},
-                                                           'type': 'SEQUENCE '
-                                                                   'OF'},
-                                                          {'name': 'iMSCommunicationServiceIdentifier',
-                                                           'optional': True,
-                                                           'tag': {'number': 33},
-                                                           'type': 'IMSCommunicationServiceIdentifier'},
-                                                          {'name': 'numberPortabilityRouting',
-                                                           'optional': True,
-                                                           'tag': {'number': 34},
-                                                           'type': 'NumberPortabilityRouting'},
-                                                          {'name': 'carrierSelectRouting',
-                                                           'optional': True,
-                                                           'tag': {'number': 35},
-                                                           'type': 'CarrierSelectRouting'},
-                                                          {'element': {'type': 'ServiceSpecificInfo'},
-                                                           'name': 'serviceSpecificInfo',
-                                                           'optional': True,
-                                                           'tag': {'number': 100},
-                                                           'type': 'SEQUENCE '
-                                                                   'OF'},
-                                                          {'name': 'requested-Party-Address',
-                                                           'optional': True,
-                                                           'tag': {'number': 101},
-                                                           'type': 'InvolvedParty'},
-                                                          {'name': 'list-Of-Called-Asserted-Identity',
-                                                           'optional': True,
-                                                           'tag': {'number': 102},
-                                                           'type': 'ListOfInvolvedParties'},
-                                                          {'name': 'alternateChargedPartyAddress',
-                                                           'optional': True,
-                                                           'tag': {'number': 103},
-                                                           'type': 'UTF8String'},
-                                                          {'name': 'privateUserID',
-                                                           'optional': True,
-                                                           'tag': {'number': 8},
-                                                           'type': 'GraphicString'},
-                                                          {'name': 'duration',
-                                                           'optional': True,
-                                                           'tag': {'number': 200},
-                                                           'type': 'INTEGER'},
-                                                          {'name': 'onlineChargingType',
-                                                           'optional': True,
-                                                           'tag': {'number': 201},
-                                                           'type': 'Online-Charging-Type'},
-                                                          {'name': 'dialled-Party-Address',
-                                                           'optional': True,
-                                                           'tag': {'number': 203},
-                                                           'type': 'InvolvedParty'},
-                                                          {'name': 'abnormal-Finish-Info',
-                                                           'optional': True,
-                                                           'tag': {'number': 207},
-                                                           'type': 'Abnormal-Finish-Info'},
-                                                          {'element': {'type': 'Service-Identifier'},
-                                                           'name': 'serviceIdentifier',
-                                                           'optional': True,
-                                                           'tag': {'number': 213},
-                                                           'type': 'SEQUENCE '
-                                                                   'OF'},
-                                                          {'name': 'vcc-service-id',
-                                                           'optional': True,
-                                                           'tag': {'number': 260},
-                                                           'type': 'UTF8String'},
-                                                          {'name': 'caller-originating-domain',
-                                                           'optional': True,
-                                                           'tag': {'number': 261},
-                                                           'type': 'Caller-Originating-Domain'},
-                                                          {'name': 'cs-location',
-                                                           'optional': True,
-                                                           'tag': {'number': 262},
-                                                           'type': 'CS-Location'}],
-                                              'type': 'SET'},
-                              'VPNCallProperty': {'type': 'ENUMERATED',
-                                                  'values': [('onnet', 0),
-                                                             ('offnet', 1),
-                                                             ('virtual-onnet',
-                                                              2),
-                                                             ('forced-onnet',
-                                                              3),
-                                                             ('emergency-offnet',
-                                                              4)]},
-                              'VideoASRecord': {'members': [{'name': 'recordType',
-                                                             'optional': True,
-                                                             'tag': {'number': 0},
-                                                             'type': 'RecordType'},
-                                                            {'name': 'retransmission',
-                                                             'optional': True,
-                                                             'tag': {'number': 1},
-                                                             'type': 'NULL'},
-                                                            {'name': 'sIP-Method',
-                                                             'optional': True,
-                                                             'tag': {'number': 2},
-                                                             'type': 'SIP-Method'},
-                                                            {'name': 'role-of-Node',
-                                                             'optional': True,
-                                                             'tag': {'number': 3},
-                                                             'type': 'Role-of-Node'},
-                                                            {'name': 'nodeAddress',
-                                                             'optional': True,
-                                                             'tag': {'number': 4},
-                                                             'type': 'NodeAddress'},
-                                                            {'name': 'session-Id',
-                                                             'optional': True,
-                                                             'tag': {'number': 5},
-                                                             'type': 'Session-Id'},
-                                                            {'name': 'list-Of-Calling-Party-Address',
-                                                             'optional': True,
-                                                             'tag': {'number': 6},
-                                                             'type': 'ListOfInvolvedParties'},
-                                                            {'name': 'called-Party-Address',
-                                                             'optional': True,
-                                                             'tag': {'number': 7},
-                                                             'type': 'InvolvedParty'},
-                                                            {'name': 'serviceRequestTimeStamp',
-                                                             'optional': True,
-                                                             'tag': {'number': 9},
-                                                             'type': 'TimeStamp'},
-                                                            {'name': 'serviceDeliveryStartTimeStamp',
-                                                             'optional': True,
-                                                             'tag': {'number': 10},
-                                                             'type': 'TimeStamp'},
-                                                            {'name': 'serviceDeliveryEndTimeStamp',
-                                                             'optional': True,
-                                                             'tag': {'number': 11},
-                                                             'type': 'TimeStamp'},
-                                                            {'name': 'recordOpeningTime',
-                                                             'optional': True,
-                                                             'tag': {'number': 12},
-                                                             'type': 'TimeStamp'},
-                                                            {'name': 'recordClosureTime',
-                                                             'optional': True,
-                                                             'tag': {'number': 13},
-                                                             'type': 'TimeStamp'},
-                                                            {'name': 'interOperatorIdentifiers',
-                                                             'optional': True,
-                                                             'tag': {'number': 14},
-                                                             'type': 'InterOperatorIdentifierlist'},
-                                                            {'name': 'localRecordSequenceNumber',
-                                                             'optional': True,
-                                                             'tag': {'number': 15},
-                                                             'type': 'LocalSequenceNumber'},
-                                                            {'name': 'recordSequenceNumber',
-                                                             'optional': True,
-                                                             'tag': {'number': 16},
-                                                             'type': 'INTEGER'},
-                                                            {'name': 'causeForRecordClosing',
-                                                             'optional': True,
-                                                             'tag': {'number': 17},
-                                                             'type': 'CauseForRecordClosing'},
-                                                            {'name': 'incomplete-CDR-Indication',
-                                                             'optional': True,
-                                                             'tag': {'number': 18},
-                                                             'type': 'Incomplete-CDR-Indication'},
-                                                            {'name': 'iMS-Charging-Identifier',
-                                                             'optional': True,
-                                                             'tag': {'number': 19},
-                                                             'type': 'IMS-Charging-Identifier'},
-                                                            {'element': {'type': 'Media-Components-List'},
-                                                             'name': 'list-Of-SDP-Media-Components',
-                                                             'optional': True,
-                                                             'tag': {'number': 21},
-                                                             'type': 'SEQUENCE '
-                                                                     'OF'},
-                                                            {'name': 'gGSNaddress',
-                                                             'optional': True,
-                                                             'tag': {'number': 22},
-                                                             'type': 'NodeAddress'},
-                                                            {'name': 'serviceReasonReturnCode',
-                                                             'optional': True,
-                                                             'tag': {'number': 23},
-                                                             'type': 'UTF8String'},
-                                                            {'element': {'type': 'MessageBody'},
-                                                             'name': 'list-Of-Message-Bodies',
-                                                             'optional': True,
-                                                             'tag': {'number': 24},
-                                                             'type': 'SEQUENCE '
-                                                                     'OF'},
-                                                            {'name': 'recordExtensions',
-                                                             'optional': True,
-                                                             'tag': {'number': 25},
-                                                             'type': 'ManagementExtensions'},
-                                                            {'name': 'expiresInformation',
-                                                             'optional': True,
-                                                             'tag': {'number': 26},
-                                                             'type': 'INTEGER'},
-                                                            {'name': 'event',
-                                                             'optional': True,
-                                                             'tag': {'number': 28},
-                                                             'type': 'UTF8String'},
-                                                            {'name': 'accessNetworkInformation',
-                                                             'optional': True,
-                                                             'tag': {'number': 29},
-                                                             'type': 'OCTET '
-                                                                     'STRING'},
-                                                            {'name': 'serviceContextID',
-                                                             'optional': True,
-                                                             'tag': {'number': 30},
-                                                             'type': 'ServiceContextID'},
-                                                            {'element': {'type': 'SubscriptionID'},
-                                                             'name': 'list-of-subscription-ID',
-                                                             'optional': True,
-                                                             'tag': {'number': 31},
-                                                             'type': 'SEQUENCE '
-                                                                     'OF'},
-                                                            {'element': {'type': 'Early-Media-Components-List'},
-                                                             'name': 'list-Of-Early-SDP-Media-Components',
-                                                             'optional': True,
-                                                             'tag': {'number': 32},
-                                                             'type': 'SEQUENCE '
-                                                                     'OF'},
-                                                            {'name': 'iMSCommunicationServiceIdentifier',
-                                                             'optional': True,
-                                                             'tag': {'number': 33},
-                                                             'type': 'IMSCommunicationServiceIdentifier'},
-                                                            {'name': 'numberPortabilityRouting',
-                                                             'optional': True,
-                                                             'tag': {'number': 34},
-                                                             'type': 'NumberPortabilityRouting'},
-                                                            {'name': 'carrierSelectRouting',
-                                                             'optional': True,
-                                                             'tag': {'number': 35},
-                                                             'type': 'CarrierSelectRouting'},
-                                                            {'element': {'type': 'ServiceSpecificInfo'},
-                                                             'name': 'serviceSpecificInfo',
-                                                             'optional': True,
-                                                             'tag': {'number': 100},
-                                                             'type': 'SEQUENCE '
-                                                                     'OF'},
-                                                            {'name': 'requested-Party-Address',
-                                                             'optional': True,
-                                                             'tag': {'number': 101},
-                                                             'type': 'InvolvedParty'},
-                                                            {'name': 'list-Of-Called-Asserted-Identity',
-                                                             'optional': True,
-                                                             'tag': {'number': 102},
-                                                             'type': 'ListOfInvolvedParties'},
-                                                            {'name': 'alternateChargedPartyAddress',
-                                                             'optional': True,
-                                                             'tag': {'number': 103},
-                                                             'type': 'UTF8String'},
-                                                            {'name': 'privateUserID',
-                                                             'optional': True,
-                                                             'tag': {'number': 8},
-                                                             'type': 'GraphicString'},
-                                                            {'name': 'duration',
-                                                             'optional': True,
-                                                             'tag': {'number': 200},
-                                                             'type': 'INTEGER'},
-                                                            {'element': {'type': 'Service-Identifier'},
-                                                             'name': 'serviceIdentifier',
-                                                             'optional': True,
-                                                             'tag': {'number': 213},
-                                                             'type': 'SEQUENCE '
-                                                                     'OF'},
-                                                            {'name': 'caller-info',
-                                                             'optional': True,
-                                                             'tag': {'number': 270},
-                                                             'type': 'Caller-Info'},
-                                                            {'name': 'callee-info',
-                                                             'optional': True,
-                                                             'tag': {'number': 271},
-                                                             'type': 'Callee-Info'},
-                                                            {'name': 'ad-information',
-                                                             'optional': True,
-                                                             'tag': {'number': 272},
-                                                             'type': 'AD-Information'},
-                                                            {'name': 'videogate-information',
-                                                             'optional': True,
-                                                             'tag': {'number': 273},
-                                                             'type': 'VideoGate-Information'},
-                                                            {'name': 'pushmessage-information',
-                                                             'optional': True,
-                                                             'tag': {'number': 274},
-                                                             'type': 'PushMessage-Information'},
-                                                            {'name': 'webonphone-information',
-                                                             'optional': True,
-                                                             'tag': {'number': 275},
-                                                             'type': 'WebOnPhone-Information'}],
-                                                'type': 'SET'},
-                              'VideoGate-Information': {'members': [{'name': 'operation-successflag',
-                                                                     'optional': True,
-                                                                     'tag': {'number': 0},
-                                                                     'type': 'Operation-SuccessFlag'}],
-                                                        'type': 'SET'},
-                              'Volume': {'members': [{'name': 'lowValue',
-                                                      'optional': True,
-                                                      'tag': {'number': 0},
-                                                      'type': 'INTEGER'},
-                                                     {'name': 'highValue',
-                                                      'optional': True,
-                                                      'tag': {'number': 1},
-                                                      'type': 'INTEGER'}],
-                                         'type': 'SET'},
-                              'WebOnPhone-Information': {'members': [{'name': 'web-num',
-                                                                      'optional': True,
-                                                                      'tag': {'number': 0},
-                                                                      'type': 'UTF8String'},
-                                                                     {'name': 'web-type',
-                                                                      'optional': True,
-                                                                      'tag': {'number': 1},
-                                                                      'type': 'UTF8String'},
-                                                                     {'name': 'web-address',
-                                                                      'optional': True,
-                                                                      'tag': {'number': 2},
-                                                                      'type': 'UTF8String'}],
-                                                         'type': 'SET'}},
-                    'values': {}}}
\ No newline at end of file
+"""ASN.1 specification of the SBC (IMS-R8-2009-03) CDRs and its BER decoder.
+
+The specification, in the dict format of `asn1tools.parse_files`, is stored as the
+`sbc.json` resource and only read on the first access to `specification()` (or to
+the `SPECIFICATION` module attribute), so importing this module is free for the
+decoders which don't use it. The tuples of the parsed format (enumerated values,
+sizes, named bits) are JSON arrays, loaded as lists.
+
+The decoder is driven by the specification: `record_table` compiles the types
+reachable from `IMSRecord` once into tables of `SbcEntry` indexed by tag number,
+and `SbcTLV` looks the TLVs up in them, with the same parser protocol as
+`EricssonVoz`, so the TLVs are walked by `BerDecoderOptimized`.
+"""
+
+import json
+from functools import cache
+from pathlib import Path
+from typing import Any, Callable, NamedTuple
+
+from teleparser.buffer import memory_buffer
+from teleparser.decoders.ericsson.ber_optimized import BerDecoderOptimized
+
+SPECIFICATION_FILE = Path(__file__).with_name("sbc.json")
+MODULE = "IMS-R8-2009-03"
+ROOT = "IMSRecord"
+
+# Universal tag numbers, for the untagged elements of SEQUENCE OF / SET OF
+UNIVERSAL_TAGS = {
+    "BOOLEAN": 1,
+    "INTEGER": 2,
+    "BIT STRING": 3,
+    "OCTET STRING": 4,
+    "NULL": 5,
+    "ENUMERATED": 10,
+    "UTF8String": 12,
+    "SEQUENCE": 16,
+    "SEQUENCE OF": 16,
+    "SET": 17,
+    "SET OF": 17,
+    "IA5String": 22,
+    "GraphicString": 25,
+}
+
+
+@cache
+def specification() -> dict:
+    """The parsed specification, loaded once per process"""
+    with SPECIFICATION_FILE.open(encoding="utf-8") as f:
+        return json.load(f)
+
+
+def __getattr__(name: str):
+    # `SPECIFICATION` stays available as a module attribute, loaded on demand
+    if name == "SPECIFICATION":
+        return specification()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+class SbcEntry(NamedTuple):
+    """Compiled member of a type: a field, or a constructed value and its table"""
+
+    name: str
+    value: Any
+    decode: Callable | None
+    table: tuple
+
+
+# Value of the constructed TLVs: no field of their own, only their children's
+CONSTRUCTED: dict = {}
+
+
+# Handlers of the primitive types, decoding the value octets
+
+
+def integer(octets: bytes) -> int:
+    return int.from_bytes(octets, "big", signed=True)
+
+
+def named_integer(names: dict[int, str]) -> Callable:
+    """INTEGER with named numbers or ENUMERATED: the name, or the number if unnamed"""
+
+    def decode(octets: bytes) -> str | int:
+        number = int.from_bytes(octets, "big", signed=True)
+        return names.get(number, number)
+
+    return decode
+
+
+def boolean(octets: bytes) -> bool:
+    return any(octets)
+
+
+def null(octets: bytes) -> bool:
+    return True
+
+
+def octet_string(octets: bytes) -> str:
+    return octets.hex()
+
+
+def utf8_string(octets: bytes) -> str:
+    return octets.decode("utf-8", errors="replace")
+
+
+def latin1_string(octets: bytes) -> str:
+    return octets.decode("latin-1")
+
+
+def bit_string(names: dict[int, str]) -> Callable:
+    """Names of the bits set, separated by commas, or the hex of the bits if unnamed"""
+
+    def decode(octets: bytes) -> str:
+        if not names or not octets:
+            return octets.hex()
+        unused, bits = octets[0], octets[1:]
+        size = 8 * len(bits) - unused
+        number = int.from_bytes(bits, "big")
+        return ",".join(
+            name
+            for bit, name in sorted(names.items())
+            if bit < size and number >> (8 * len(bits) - 1 - bit) & 1
+        )
+
+    return decode
+
+
+def timestamp(octets: bytes) -> str:
+    """3GPP TimeStamp: BCD YYMMDDhhmmss, the ASCII sign and hhmm offset to UTC"""
+    digits = octets[:6].hex() + octets[7:9].hex()
+    sign = chr(octets[6]) if len(octets) == 9 else ""
+    if sign not in ("+", "-") or not digits.isdigit():
+        return octets.hex()
+    return (
+        f"20{digits[0:2]}-{digits[2:4]}-{digits[4:6]}T"
+        f"{digits[6:8]}:{digits[8:10]}:{digits[10:12]}"
+        f"{sign}{digits[12:14]}:{digits[14:16]}"
+    )
+
+
+# Handlers of named types, taking precedence over the type they are defined with
+NAMED_TYPES = {"TimeStamp": timestamp}
+
+
+def primitive_decoder(definition: dict) -> Callable:
+    """Handler of a resolved primitive type definition"""
+    kind = definition["type"]
+    if kind in ("INTEGER", "ENUMERATED"):
+        if "named-numbers" in definition:
+            names = {n: name for name, n in definition["named-numbers"].items()}
+            return named_integer(names)
+        if "values" in definition:
+            names = {n: name for name, n in definition["values"] if name}
+            return named_integer(names)
+        return integer
+    if kind == "BIT STRING":
+        names = {int(n): name for name, n in definition.get("named-bits", [])}
+        return bit_string(names)
+    return {
+        "BOOLEAN": boolean,
+        "NULL": null,
+        "OCTET STRING": octet_string,
+        "UTF8String": utf8_string,
+        "IA5String": latin1_string,
+        "GraphicString": latin1_string,
+    }[kind]
+
+
+class SpecCompiler:
+    """Compile the types of the specification into tag-indexed tables.
+
+    Every field is named by the path of member names from its record, joined by
+    dots, without the names of the untagged CHOICE members which have no TLV of
+    their own. The tables depend on that prefix, so they are compiled (and shared)
+    per type and prefix.
+    """
+
+    def __init__(self, types: dict):
+        self.types = types
+        self.tables: dict[tuple[str, str], tuple] = {}
+        self.fieldnames: set[str] = set()
+
+    def resolve(self, definition: dict) -> tuple[str | None, dict]:
+        """Name of the first named type (if any) and the built-in type definition"""
+        name = None
+        while (type_name := definition["type"]) in self.types:
+            definition = self.types[type_name]
+            if type_name in NAMED_TYPES:
+                return type_name, definition
+            name = name or type_name
+        return name, definition
+
+    def field(self, name: str, decode: Callable) -> SbcEntry:
+        self.fieldnames.add(name)
+        return SbcEntry(name, None, decode, ())
+
+    def entries(self, definition: dict, prefix: str, path: tuple) -> dict:
+        """Entries by tag number of the TLVs of a type, its members or elements"""
+        type_name, definition = self.resolve(definition)
+        if type_name in path:
+            raise ValueError(f"Recursive type {type_name} at {prefix}")
+        path = path + (type_name,) if type_name else path
+        kind = definition["type"]
+        entries = {}
+
+        if kind in ("SEQUENCE OF", "SET OF"):
+            element = definition["element"]
+            _, resolved = self.resolve(element)
+            if resolved["type"] == "CHOICE":
+                return self.entries(element, prefix, path)
+            tag_number = UNIVERSAL_TAGS[resolved["type"]]
+            return {tag_number: self.entry(element, prefix, path)}
+
+        for member in definition["members"]:
+            if member is None:
+                # Extension marker
+                continue
+            if "tag" not in member:
+                # Untagged CHOICE, its alternatives are TLVs of this type
+                entries.update(self.entries(member, prefix, path))
+                continue
+            name = f"{prefix}.{member['name']}" if prefix else member["name"]
+            entries[member["tag"]["number"]] = self.entry(member, name, path)
+        return entries
+
+    def entry(self, definition: dict, name: str, path: tuple) -> SbcEntry:
+        """Entry of a TLV named name with the given type"""
+        type_name, resolved = self.resolve(definition)
+        if type_name in NAMED_TYPES:
+            return self.field(name, NAMED_TYPES[type_name])
+        if resolved["type"] in ("SEQUENCE", "SET", "CHOICE", "SEQUENCE OF", "SET OF"):
+            return SbcEntry(name, CONSTRUCTED, None, self.table(definition, name, path))
+        return self.field(name, primitive_decoder(resolved))
+
+    def table(self, definition: dict, prefix: str, path: tuple = ()) -> tuple:
+        """Tuple of SbcEntry indexed by tag number, None for unused numbers"""
+        key = (definition["type"], prefix) if definition["type"] in self.types else None
+        if key in self.tables:
+            return self.tables[key]
+        entries = self.entries(definition, prefix, path)
+        table = [None] * (max(entries, default=-1) + 1)
+        for tag_number, entry in entries.items():
+            table[tag_number] = entry
+        table = tuple(table)
+        if key is not None:
+            self.tables[key] = table
+        return table
+
+
+@cache
+def compiled() -> tuple[tuple, frozenset]:
+    """Root table and field names, compiled once per process"""
+    compiler = SpecCompiler(specification()[MODULE]["types"])
+    members = compiler.types[ROOT]["members"]
+    table = [None] * (max(member["tag"]["number"] for member in members) + 1)
+    for member in members:
+        # The record alternative is a field too, as a record may not have a type
+        table[member["tag"]["number"]] = SbcEntry(
+            ROOT, member["name"], None, compiler.table(member, "")
+        )
+    compiler.fieldnames.add(ROOT)
+    return tuple(table), frozenset(compiler.fieldnames)
+
+
+def record_table() -> tuple:
+    """Compiled table of the `IMSRecord` alternatives"""
+    return compiled()[0]
+
+
+def fieldnames() -> set[str]:
+    """Every field the decoder may output"""
+    return set(compiled()[1])
+
+
+class SbcTLV:
+    """Tag-Length-Value object for the BER encoded SBC records.
+
+    The schema is a compiled table of `record_table`, the root `IMSRecord` table
+    when None. An unknown tag raises KeyError. The value may be a view of the data,
+    it is copied to bytes for the decode functions only.
+    """
+
+    __slots__ = ("name", "value", "schema")
+
+    def __init__(
+        self, tag_number: int, value: bytes | memoryview, schema: tuple = None
+    ):
+        if schema is None:  # root
+            schema = record_table()
+        try:
+            self.name, constant, decode, self.schema = schema[tag_number]
+        except (IndexError, TypeError):
+            # Out of the table or an unused tag number
+            raise KeyError(tag_number) from None
+        self.value = constant if decode is None else decode(bytes(value))
+
+
+def sbc_decoder(buffer_manager):
+    """Decoder of the SBC (IMS-R8) records, driven by the ASN.1 specification.
+
+    The TLVs are walked in memory like `ericsson_voz_decoder_optimized`.
+    """
+    return BerDecoderOptimized(SbcTLV, memory_buffer(buffer_manager), fieldnames())
@@ -0,0 +1,108 @@
+"""Compact structure-of-arrays index for the first phase of the two-phase decoders.
+
+Phase 1 of a two-phase decoder lists every TLV of the data with its
+position and its parent. One Python object per entry costs around a hundred bytes,
+tens of millions of objects on a multi-GB file. `ArrayIndex` keeps each attribute
+in its own `array` instead, a few bytes per entry, so the index is built with
+plain appends and sliced, pickled (to the phase 2 workers) or saved as raw bytes.
+
+Subclasses declare the columns in `FIELDS` and the `ROW` type returned when a
+single entry is read, for the code which prefers attribute access over the arrays.
+"""
+
+from array import array
+from pathlib import Path
+from typing import Any, Callable, Iterator, Sequence, Tuple
+
+# Size of the entry count written before the columns by `save`
+COUNT_TYPECODE = "Q"
+
+
+class ArrayIndex:
+    """Parallel arrays, one per field, with a row per indexed entry.
+
+    The columns are attributes named after the fields. Reading an entry by
+    position gives a `ROW`, a slice gives an index of the same type.
+    """
+
+    # (name, array typecode) of each column
+    FIELDS: Tuple[Tuple[str, str], ...] = ()
+    # Type of the rows, called with the field values in FIELDS order
+    ROW: Callable = tuple
+
+    def __init__(self, columns: Sequence[array] | None = None):
+        if columns is None:
+            columns = [array(typecode) for _, typecode in self.FIELDS]
+        for (name, _), column in zip(self.FIELDS, columns, strict=True):
+            setattr(self, name, column)
+
+    @property
+    def columns(self) -> Tuple[array, ...]:
+        return tuple(getattr(self, name) for name, _ in self.FIELDS)
+
+    @classmethod
+    def from_rows(cls, rows):
+        """Index of rows with the fields as attributes, such as `ROW` objects"""
+        index = cls()
+        for name, _ in cls.FIELDS:
+            getattr(index, name).extend(getattr(row, name) for row in rows)
+        return index
+
+    def append(self, *values):
+        """Add an entry, with the values in FIELDS order"""
+        for column, value in zip(self.columns, values, strict=True):
+            column.append(value)
+
+    def row(self, i: int) -> Any:
+        return self.ROW(*(column[i] for column in self.columns))
+
+    def __len__(self) -> int:
+        return len(getattr(self, self.FIELDS[0][0]))
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return type(self)([column[key] for column in self.columns])
+        if key < 0:
+            key += len(self)
+        if not 0 <= key < len(self):
+            raise IndexError("index out of range")
+        return self.row(key)
+
+    def __iter__(self) -> Iterator:
+        return map(self.ROW, *self.columns)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, ArrayIndex):
+            return self.FIELDS == other.FIELDS and self.columns == other.columns
+        try:
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        except TypeError:
+            return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({len(self)} entries)"
+
+    @property
+    def nbytes(self) -> int:
+        """Memory used by the columns"""
+        return sum(column.itemsize * len(column) for column in self.columns)
+
+    def save(self, file_path: Path):
+        """Write the entry count and the columns, in the machine byte order"""
+        with open(file_path, "wb") as f:
+            array(COUNT_TYPECODE, [len(self)]).tofile(f)
+            for column in self.columns:
+                column.tofile(f)
+
+    @classmethod
+    def load(cls, file_path: Path):
+        """Read an index written by `save` on the same machine"""
+        with open(file_path, "rb") as f:
+            count = array(COUNT_TYPECODE)
+            count.fromfile(f, 1)
+            columns = []
+            for _, typecode in cls.FIELDS:
+                column = array(typecode)
+                column.fromfile(f, count[0])
+                columns.append(column)
+        return cls(columns)
@@ -1,27 +1,61 @@
 import argparse
 import concurrent.futures
-import csv
 import gc
-import gzip as gzip_module
 import logging
 import os
 import shutil
 import sys
+import tempfile
 import traceback
 import zipfile
 from concurrent.futures import ProcessPoolExecutor
 from contextlib import suppress
 from datetime import datetime, timezone
-from functools import cached_property
+from functools import cached_property, partial
 from pathlib import Path
 from time import perf_counter
-from typing import Any, Dict, List, Set
+from typing import Any, Dict, Iterable, List, Set, Tuple
 
 from tqdm.auto import tqdm
-from teleparser.buffer import BufferManager
+from teleparser.buffer import (
+    BufferManager,
+    DecompressedCache,
+    MappedBufferManager,
+    decompress_to,
+)
+from teleparser.chunks import (
+    CHUNK_SIZE,
+    MIN_COMPRESSION_RATIO,
+    Chunk,
+    finalize_parts,
+    part_name,
+    split_ranges,
+)
+from teleparser.columnar import ColumnarBuilder
+from teleparser.writer import (
+    BATCH_SIZE,
+    ArrowIpcBatchWriter,
+    arrow_available,
+    batched,
+    open_batch_writer,
+    output_suffix,
+    read_ipc_table,
+    sorted_fieldnames,
+)
 from teleparser.decoders.ericsson import (
+    ericsson_volte_decoder_auto,
+    ericsson_volte_decoder_epoch,
     ericsson_volte_decoder_optimized,
     ericsson_voz_decoder,
+    ericsson_voz_decoder_optimized,
+    ericsson_voz_decoder_two_phase,
+    ericsson_voz_decoder_windowed,
+)
+from teleparser.decoders.sbc import sbc_decoder
+from teleparser.decoders.ericsson.datatypes import (
+    IMSI_CACHE_SIZE,
+    configure_imsi_cache,
+    imsi_cache_info,
 )
 
 # Initialize a placeholder logger - will be properly configured later
@@ -73,7 +107,28 @@ def setup_logging(output_path: Path | None, log_level: int = logging.INFO):
 
 DECODERS = {
     "ericsson_voz": ericsson_voz_decoder,
+    "ericsson_voz_optimized": ericsson_voz_decoder_optimized,
+    "ericsson_voz_windowed": ericsson_voz_decoder_windowed,
+    "ericsson_voz_two_phase": ericsson_voz_decoder_two_phase,
     "ericsson_volte": ericsson_volte_decoder_optimized,
+    "ericsson_volte_epoch": ericsson_volte_decoder_epoch,
+    "ericsson_volte_auto": ericsson_volte_decoder_auto,
+    "sbc": sbc_decoder,
+}
+
+# Decoders able to index the record boundaries of a file, so a single large file
+# can be split in chunks decoded in parallel
+SPLITTABLE_DECODERS = {
+    "ericsson_voz_optimized",
+    "ericsson_volte",
+    "ericsson_volte_epoch",
+    "sbc",
+}
+
+# Decoders running their own process pool, given the number of workers asked for
+POOLED_DECODERS = {
+    "ericsson_voz_two_phase",
+    "ericsson_volte_auto",
 }
 
 
@@ -85,15 +140,29 @@ class CDRFileManager:
         cdr_type: str,
         reprocess: bool,
         max_count: int | None = None,
+        batch_size: int | None = BATCH_SIZE,
+        chunk_size: int | None = CHUNK_SIZE,
+        cache_dir: Path | None = None,
+        threaded_inflate: bool = False,
+        imsi_cache_size: int = IMSI_CACHE_SIZE,
+        workers: int | None = None,
     ):
         self.input_path = Path(input_path)
         self.output_path = Path(output_path) if output_path is not None else None
         self.cdr_type = cdr_type
         self.reprocess = reprocess
         self.max_count = max_count
+        self.batch_size = batch_size
+        self.chunk_size = chunk_size
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self.threaded_inflate = threaded_inflate
+        self.imsi_cache_size = imsi_cache_size
+        self.workers = workers
         self.processed_files: Set[Path] = set()
         self.failed_files: Set[Path] = set()
         self.temp_dir: Path | None = None
+        self.chunks_dir: Path | None = None
+        self.handoff_dir: Path | None = None
         self.setup()
 
     def setup(self):
@@ -104,6 +173,9 @@ class CDRFileManager:
                 f"Decoder invalid or not implemented for {self.cdr_type}"
             )
         self.decoder = DECODERS[self.cdr_type]
+        if self.cdr_type in POOLED_DECODERS:
+            # Also in the parent process, a single worker asked for means no pool
+            self.decoder = partial(self.decoder, n_workers=self.workers)
 
         if self.output_path is not None:
             output_dir = self.output_path
@@ -137,20 +209,12 @@ class CDRFileManager:
                 f
                 for f in gz_files
                 if not (
-                    (self.output_path / f"{f.stem}.csv.gz").is_file()
-                    or (self.output_path / f"{f.stem}.parquet").is_file()
+                    # Files decoded in chunks are saved as a directory of parts
+                    (self.output_path / f"{f.stem}.csv.gz").exists()
+                    or (self.output_path / f"{f.stem}.parquet").exists()
                 )
             ]
 
-        # Warn if .parquet files exist in output directory (migration notice)
-        if self.output_path is not None:
-            parquet_files = list(self.output_path.glob("*.parquet"))
-            if parquet_files:
-                logger.warning(
-                    f"Found {len(parquet_files)} .parquet files in output directory. "
-                    "These will not be processed. Consider migrating or cleaning up old .parquet files."
-                )
-
         # Sort by size for better load balancing in parallel processing
         gz_files.sort(key=lambda x: x.stat().st_size, reverse=True)
 
@@ -171,8 +235,6 @@ class CDRFileManager:
         if self.output_path is not None:
             self.temp_dir = self.output_path / "temp_extracted"
         else:
-            import tempfile
-
             self.temp_dir = Path(tempfile.gettempdir()) / "teleparser_temp_extracted"
 
         self.temp_dir.mkdir(parents=True, exist_ok=True)
@@ -199,69 +261,224 @@ class CDRFileManager:
 
     def cleanup(self):
         """Clean up temporary files and directories"""
-        if self.temp_dir is not None and self.temp_dir.exists():
-            logger.info(f"Cleaning up temporary directory: {self.temp_dir}")
-            shutil.rmtree(self.temp_dir)
+        for temp_dir in (self.temp_dir, self.chunks_dir, self.handoff_dir):
+            if temp_dir is not None and temp_dir.exists():
+                logger.info(f"Cleaning up temporary directory: {temp_dir}")
+                shutil.rmtree(temp_dir)
+
+    @property
+    def handoff(self) -> bool:
+        """Whether workers hand in-memory results over as Arrow IPC files"""
+        return self.output_path is None and bool(self.batch_size) and arrow_available()
+
+    @property
+    def splittable(self) -> bool:
+        """Whether large files can be decoded in parallel chunks"""
+        return (
+            bool(self.chunk_size)
+            and bool(self.batch_size)
+            and (self.output_path is not None or self.handoff)
+            and self.cdr_type in SPLITTABLE_DECODERS
+        )
+
+    def should_split(self, file_path: Path) -> bool:
+        return (
+            self.splittable
+            and file_path.stat().st_size >= self.chunk_size // MIN_COMPRESSION_RATIO
+        )
 
     @staticmethod
     def _save(
         blocks: List[Dict[str, Any]],
         output_file: Path,
         fieldnames_set: Set[str] | None = None,
+        integer_fields: Iterable[str] = (),
     ):
-        """Save blocks to a gzipped CSV file.
+        """Save blocks to a Parquet file, or to a gzipped CSV file without pyarrow.
 
         Args:
             blocks: List of dictionaries containing CDR data
-            output_file: Path to the output CSV.GZ file
+            output_file: Path to the output file, the suffix is set by the writer
+            fieldnames_set: Output schema, fields outside of it are dropped
+            integer_fields: Fields written as int64 columns instead of strings
         """
         try:
             if not blocks:
                 logger.warning(f"No data to save for {output_file}")
                 return
 
-            # Collect fieldnames if not provided or empty
-            if fieldnames_set is None:
-                fieldnames_set = set()
+            # Without a schema, use all the fields present in the blocks
+            if not fieldnames_set:
+                fieldnames_set = {k for block in blocks for k in block}
 
-            # Collect all unique fieldnames from all blocks
-            # This handles cases where different records have different fields
-            block_fields = {k for block in blocks for k in block}
-            if new_fields := block_fields - fieldnames_set:
-                logger.warning(f"New fields found not in schema: {new_fields}")
-                fieldnames_set |= new_fields
+            with open_batch_writer(
+                output_file,
+                sorted_fieldnames(fieldnames_set),
+                integer_fields=integer_fields,
+            ) as writer:
+                for batch in batched(blocks, BATCH_SIZE):
+                    writer.write(batch)
 
-            # Sort fieldnames for consistent output
-            fieldnames = sorted(fieldnames_set, key=lambda x: x.lower())
+            logger.info(f"Data saved to {writer.output_file} successfully")
+        except Exception as e:
+            logger.error(f"Failed to save data to {output_file}: {e}", exc_info=True)
+            raise
 
+    @staticmethod
+    def _transform(decoder_instance, blocks, file_path: Path):
+        """Apply the decoder transform function, if any, to a list of blocks"""
+        if (
+            hasattr(decoder_instance, "transform_func")
+            and decoder_instance.transform_func is not None
+        ):
             try:
-                import pandas as pd
-                import pyarrow
-
-                df = pd.DataFrame(blocks, columns=fieldnames, dtype="string")
-                df.astype("category", copy=False).to_parquet(
-                    output_file.with_suffix(".parquet"), index=False
-                )
-            except ImportError:
+                blocks = decoder_instance.transform_func(blocks)
+                logger.debug(f"Applied transform function for {file_path}")
+            except Exception as e:
                 logger.warning(
-                    "Pandas or PyArrow not available, falling back to CSV.GZ"
+                    f"Failed to apply transform function for {file_path}: {e}"
                 )
-                # Write to gzipped CSV
-                with gzip_module.open(
-                    output_file.with_suffix(".csv.gz"),
-                    "wt",
-                    encoding="utf-8",
-                    newline="",
-                ) as f:
-                    writer = csv.DictWriter(f, fieldnames=fieldnames)
-                    writer.writeheader()
-                    writer.writerows(blocks)
-
-            logger.info(f"Data saved to {output_file} successfully")
-        except Exception as e:
-            logger.error(f"Failed to save data to {output_file}: {e}", exc_info=True)
+                # Continue without transformation
+        return blocks
+
+    @staticmethod
+    def _fieldnames(decoder_instance) -> Set[str] | None:
+        """Get fieldnames from decoder if available"""
+        if hasattr(decoder_instance, "FIELDNAMES"):
+            return decoder_instance.FIELDNAMES
+        elif hasattr(decoder_instance, "fieldnames"):
+            return decoder_instance.fieldnames
+        return None
+
+    @staticmethod
+    def _supports_columns(decoder_instance) -> bool:
+        """Whether the decoder can fill a columnar sink directly.
+
+        Decoders with a record transform function still need the records as dicts,
+        unless they also provide it as `transform_columns`.
+        """
+        return (
+            hasattr(decoder_instance, "stream_columns")
+            and bool(CDRFileManager._fieldnames(decoder_instance))
+            and (
+                getattr(decoder_instance, "transform_func", None) is None
+                or hasattr(decoder_instance, "transform_columns")
+            )
+        )
+
+    @staticmethod
+    def _stream_columns(
+        decoder_instance,
+        output_file: Path,
+        batch_size: int,
+        pbar_position: int | None = None,
+        show_progress: bool = True,
+        output_format: str = "parquet",
+    ) -> int:
+        """Decode straight into per-column buffers and save them batch by batch.
+
+        The decoder `transform_columns`, if any, is applied to each batch, with its
+        `TRANSFORM_FIELDS` buffered as extra columns. Returns the number of records
+        saved.
+        """
+        fieldnames = sorted_fieldnames(CDRFileManager._fieldnames(decoder_instance))
+        transform = getattr(decoder_instance, "transform_columns", None)
+        sink = ColumnarBuilder(
+            fieldnames, getattr(decoder_instance, "TRANSFORM_FIELDS", ())
+        )
+        integer_fields = getattr(decoder_instance, "INTEGER_FIELDS", ())
+        writer = None
+        try:
+            for n_rows in decoder_instance.stream_columns(
+                sink, pbar_position=pbar_position, show_progress=show_progress
+            ):
+                if n_rows >= batch_size:
+                    if writer is None:
+                        writer = open_batch_writer(
+                            output_file, fieldnames, output_format, integer_fields
+                        )
+                    if transform is not None:
+                        transform(sink)
+                    writer.write_columns(sink)
+                    sink.clear()
+            if len(sink):
+                if writer is None:
+                    writer = open_batch_writer(
+                        output_file, fieldnames, output_format, integer_fields
+                    )
+                if transform is not None:
+                    transform(sink)
+                writer.write_columns(sink)
+                sink.clear()
+        except BaseException:
+            if writer is not None:
+                writer.abort()
             raise
 
+        if writer is None:
+            return 0
+        writer.close()
+        logger.info(
+            f"Data saved to {writer.output_file} successfully ({writer.batches} batches)"
+        )
+        return writer.records
+
+    @staticmethod
+    def _stream(
+        decoder_instance,
+        file_path: Path,
+        output_file: Path,
+        batch_size: int,
+        pbar_position: int | None = None,
+        show_progress: bool = True,
+        output_format: str = "parquet",
+    ) -> int:
+        """Decode and save the file batch by batch, without materializing all records.
+
+        The columns are fixed by the decoder schema (FIELDNAMES), so every output file
+        has the same columns in the same order. Returns the number of records saved.
+        """
+        if hasattr(decoder_instance, "stream"):
+            records = decoder_instance.stream(
+                pbar_position=pbar_position, show_progress=show_progress
+            )
+        else:
+            records = iter(
+                decoder_instance.process(
+                    pbar_position=pbar_position, show_progress=show_progress
+                )
+            )
+
+        writer = None
+        try:
+            for blocks in batched(records, batch_size):
+                blocks = CDRFileManager._transform(decoder_instance, blocks, file_path)
+                if writer is None:
+                    # Without a schema, the first batch defines the columns
+                    fieldnames_set = CDRFileManager._fieldnames(decoder_instance) or {
+                        k for block in blocks for k in block
+                    }
+                    writer = open_batch_writer(
+                        output_file,
+                        sorted_fieldnames(fieldnames_set),
+                        output_format,
+                        getattr(decoder_instance, "INTEGER_FIELDS", ()),
+                    )
+                writer.write(blocks)
+                del blocks
+        except BaseException:
+            if writer is not None:
+                writer.abort()
+            raise
+
+        if writer is None:
+            return 0
+        writer.close()
+        logger.info(
+            f"Data saved to {writer.output_file} successfully ({writer.batches} batches)"
+        )
+        return writer.records
+
     @staticmethod
     def decode_file(
         file_path: Path,
@@ -269,12 +486,184 @@ class CDRFileManager:
         output_path: Path | None = None,
         pbar_position: int | None = None,
         show_progress: bool = True,
+        batch_size: int | None = BATCH_SIZE,
+        handoff_dir: Path | None = None,
+        cache_dir: Path | None = None,
+        threaded_inflate: bool = False,
+    ):
+        """Decode a file, saving it to output_path or returning the records.
+
+        Without output_path the records are returned in "blocks". When handoff_dir is
+        given instead, they are written there as an Arrow IPC stream, returned as
+        "ipc_file", so a worker process doesn't need to pickle them to the parent.
+        With cache_dir, the decompressed data is read from (or saved to) the cache.
+        With threaded_inflate, gzip is inflated by a background thread.
+        """
+        output_format = "parquet"
+        if output_path is not None:
+            output_file = output_path / f"{file_path.stem}.csv"
+        elif handoff_dir is not None and batch_size:
+            output_file = handoff_dir / f"{file_path.stem}.csv"
+            output_format = "arrow"
+        else:
+            output_file = None
+        cache = (
+            DecompressedCache(cache_dir, threaded_inflate)
+            if cache_dir is not None
+            else None
+        )
+        imsi_cache = imsi_cache_info()
+        result = CDRFileManager._decode(
+            file_path,
+            decoder,
+            BufferManager(file_path, cache, threaded_inflate),
+            output_file,
+            pbar_position,
+            show_progress,
+            batch_size,
+            output_format,
+        )
+        result["imsi_cache"] = CDRFileManager._imsi_stats(imsi_cache)
+        return result
+
+    @staticmethod
+    def decode_chunk(
+        chunk: Chunk,
+        decoder,
+        batch_size: int = BATCH_SIZE,
+        output_format: str = "parquet",
+    ):
+        """Decode a byte range of a decompressed file into its part file.
+
+        Like the whole file, the range is decoded up to its first undecodable
+        record: the result is then "stopped", with the offset of that record in the
+        file as "stopped_at", and the later chunks must be dropped.
+        """
+        imsi_cache = imsi_cache_info()
+        result = CDRFileManager._decode(
+            chunk.file,
+            decoder,
+            MappedBufferManager(chunk.raw_file, chunk.start, chunk.stop),
+            chunk.output_file,
+            None,
+            False,
+            batch_size,
+            output_format,
+        )
+        result["part"] = chunk.index
+        if result.get("stopped_at") is not None:
+            result["stopped"] = True
+            result["stopped_at"] += chunk.start
+        result["imsi_cache"] = CDRFileManager._imsi_stats(imsi_cache)
+        return result
+
+    @staticmethod
+    def _imsi_stats(before) -> Tuple[int, int]:
+        """IMSI cache hits and misses since the `imsi_cache_info()` before"""
+        after = imsi_cache_info()
+        return after.hits - before.hits, after.misses - before.misses
+
+    @staticmethod
+    def plan_chunks(
+        file_path: Path,
+        decoder,
+        chunks_dir: Path,
+        chunk_size: int = CHUNK_SIZE,
+        cache_dir: Path | None = None,
+        threaded_inflate: bool = False,
+    ):
+        """Decompress a file to disk and split it in ranges at record boundaries.
+
+        With cache_dir the decompressed copy lives in the cache and is kept.
+        """
+        cached = cache_dir is not None
+        raw_file = chunks_dir / f"{file_path.stem}.raw"
+        try:
+            if cached:
+                raw_file = DecompressedCache(cache_dir, threaded_inflate).get(file_path)
+            else:
+                decompress_to(file_path, raw_file, threaded_inflate)
+            buffer_manager = MappedBufferManager(raw_file)
+            try:
+                offsets = decoder(buffer_manager).record_boundaries()
+            finally:
+                buffer_manager.close()
+            ranges = split_ranges(offsets, chunk_size)
+            logger.info(
+                f"Split {file_path} in {len(ranges)} chunks of {len(offsets) - 1} records"
+            )
+            return {
+                "file": file_path,
+                "raw_file": raw_file,
+                "cached": cached,
+                "ranges": ranges,
+                "status": "success",
+            }
+        except Exception as e:
+            if not cached:
+                raw_file.unlink(missing_ok=True)
+            error_details = traceback.format_exc()
+            logger.error(f"Failed to split {file_path}: {e}\n{error_details}")
+            return {
+                "file": file_path,
+                "error": str(e),
+                "traceback": error_details,
+                "status": "failed",
+                "blocks": None,
+            }
+
+    @staticmethod
+    def _decode(
+        file_path: Path,
+        decoder,
+        buffer_manager,
+        output_file: Path | None = None,
+        pbar_position: int | None = None,
+        show_progress: bool = True,
+        batch_size: int | None = BATCH_SIZE,
+        output_format: str = "parquet",
     ):
         blocks = []
-        buffer_manager = BufferManager(file_path)
         decoder_instance = decoder(buffer_manager)
 
         try:
+            # Streaming mode: records flow from the decoder to disk in batches
+            if output_file is not None and batch_size:
+                if CDRFileManager._supports_columns(decoder_instance):
+                    counter = CDRFileManager._stream_columns(
+                        decoder_instance,
+                        output_file,
+                        batch_size,
+                        pbar_position=pbar_position,
+                        show_progress=show_progress,
+                        output_format=output_format,
+                    )
+                else:
+                    counter = CDRFileManager._stream(
+                        decoder_instance,
+                        file_path,
+                        output_file,
+                        batch_size,
+                        pbar_position=pbar_position,
+                        show_progress=show_progress,
+                        output_format=output_format,
+                    )
+                if counter == 0:
+                    logger.warning(f"No records found in {file_path}")
+                result = {
+                    "file": file_path,
+                    "records": counter,
+                    "status": "success",
+                    "fieldnames": CDRFileManager._fieldnames(decoder_instance),
+                    "blocks": None,
+                    "stopped_at": getattr(decoder_instance, "stopped_at", None),
+                }
+                if output_format == "arrow" and counter:
+                    result["ipc_file"] = output_file.with_suffix(
+                        ArrowIpcBatchWriter.suffix
+                    )
+                return result
+
             blocks = decoder_instance.process(
                 pbar_position=pbar_position, show_progress=show_progress
             )
@@ -285,33 +674,22 @@ class CDRFileManager:
                     "records": 0,
                     "status": "success",
                     "blocks": None,
+                    "stopped_at": getattr(decoder_instance, "stopped_at", None),
                 }
 
             # Apply transform function if provided
-            if (
-                hasattr(decoder_instance, "transform_func")
-                and decoder_instance.transform_func is not None
-            ):
-                try:
-                    blocks = decoder_instance.transform_func(blocks)
-                    logger.debug(f"Applied transform function for {file_path}")
-                except Exception as e:
-                    logger.warning(
-                        f"Failed to apply transform function for {file_path}: {e}"
-                    )
-                    # Continue without transformation
+            blocks = CDRFileManager._transform(decoder_instance, blocks, file_path)
 
-            # Get fieldnames from decoder if available
-            fieldnames_set = None
-            if hasattr(decoder_instance, "FIELDNAMES"):
-                fieldnames_set = decoder_instance.FIELDNAMES
-            elif hasattr(decoder_instance, "fieldnames"):
-                fieldnames_set = decoder_instance.fieldnames
+            fieldnames_set = CDRFileManager._fieldnames(decoder_instance)
 
-            # Save to disk if output_path is provided
-            if output_path is not None:
-                output_file = output_path / f"{file_path.stem}.csv"
-                CDRFileManager._save(blocks, output_file, fieldnames_set)
+            # Save to disk if output_file is provided
+            if output_file is not None:
+                CDRFileManager._save(
+                    blocks,
+                    output_file,
+                    fieldnames_set,
+                    getattr(decoder_instance, "INTEGER_FIELDS", ()),
+                )
 
             return {
                 "file": file_path,
@@ -319,8 +697,9 @@ class CDRFileManager:
                 "status": "success",
                 "fieldnames": fieldnames_set,
                 "blocks": blocks
-                if output_path is None
+                if output_file is None
                 else None,  # Return blocks for in-memory processing
+                "stopped_at": getattr(decoder_instance, "stopped_at", None),
             }
 
         except Exception as e:
@@ -343,9 +722,17 @@ class CDRFileManager:
             gc.collect()
 
     def decode_files_sequential(self):
-        """Decode all files sequentially with hierarchical progress bars and return results"""
+        """Decode all files sequentially with hierarchical progress bars and return results
+
+        Without an output path, the records are returned as "table" through the
+        same Arrow IPC handoff as `decode_files_parallel`, so the results have the
+        same shape whatever the number of workers.
+        """
         results = []
         logger.info(f"Starting sequential processing of {len(self.gz_files)} files")
+        configure_imsi_cache(self.imsi_cache_size)
+        if self.handoff and self.handoff_dir is None:
+            self.handoff_dir = Path(tempfile.mkdtemp(prefix="teleparser_handoff_"))
 
         # Master progress bar for files (position 0)
         with tqdm(
@@ -361,12 +748,18 @@ class CDRFileManager:
                 pbar_files.set_postfix_str(f"{file_path.name}", refresh=True)
 
                 try:
-                    result = self.decode_file(
-                        file_path=file_path,
-                        decoder=self.decoder,
-                        output_path=self.output_path,
-                        pbar_position=1,  # Nested progress bar at position 1
-                        show_progress=True,
+                    result = self._attach(
+                        self.decode_file(
+                            file_path=file_path,
+                            decoder=self.decoder,
+                            output_path=self.output_path,
+                            pbar_position=1,  # Nested progress bar at position 1
+                            show_progress=True,
+                            batch_size=self.batch_size,
+                            handoff_dir=self.handoff_dir,
+                            cache_dir=self.cache_dir,
+                            threaded_inflate=self.threaded_inflate,
+                        )
                     )
                     self.processed_files.add(file_path)
                     results.append(result)
@@ -400,76 +793,259 @@ class CDRFileManager:
         return results
 
     def decode_files_parallel(self, workers: int):
-        """Decode files using parallel processing with multiple CPU cores"""
+        """Decode files using parallel processing with multiple CPU cores.
+
+        Large files of splittable decoders are decompressed, indexed and decoded in
+        chunks by several workers, so a single big file doesn't leave them idle.
+        Without an output path, the workers write their records to Arrow IPC files
+        that the parent memory maps and returns as "table", instead of pickling
+        the records back.
+        """
         cpu_count = os.cpu_count() or 1
-        max_workers = max(1, min(workers, cpu_count, len(self.gz_files)))
+        split_files = {f for f in self.gz_files if self.should_split(f)}
+        # Chunks of a large file can keep more workers busy than there are files
+        max_tasks = len(self.gz_files) if not split_files else workers
+        max_workers = max(1, min(workers, cpu_count, max_tasks))
         logger.info(
             f"Starting parallel processing with {max_workers} workers for {len(self.gz_files)} files"
+            + (f" ({len(split_files)} split in chunks)" if split_files else "")
         )
+        if self.handoff and self.handoff_dir is None:
+            self.handoff_dir = Path(tempfile.mkdtemp(prefix="teleparser_handoff_"))
+        if split_files:
+            self.chunks_dir = (self.output_path or self.handoff_dir) / "temp_chunks"
+            self.chunks_dir.mkdir(parents=True, exist_ok=True)
+        output_format = "arrow" if self.handoff else "parquet"
+
         results = []
-        with ProcessPoolExecutor(max_workers=max_workers) as executor:
-            future_to_file = {
-                executor.submit(
-                    CDRFileManager.decode_file,
-                    file_path,
-                    self.decoder,
-                    self.output_path,
-                    None,  # pbar_position: not used in parallel mode
-                    False,  # show_progress: disabled in parallel to avoid overlap
-                ): file_path
-                for file_path in self.gz_files
-            }
-            for future in tqdm(
-                concurrent.futures.as_completed(future_to_file),
-                total=len(future_to_file),
+        chunk_results: Dict[Path, list] = {}
+        chunk_counts: Dict[Path, int] = {}
+        raw_files: Dict[Path, Path] = {}
+        with (
+            ProcessPoolExecutor(
+                max_workers=max_workers,
+                initializer=configure_imsi_cache,
+                initargs=(self.imsi_cache_size,),
+            ) as executor,
+            tqdm(
+                total=len(self.gz_files),
                 desc="🔄 Processing files (parallel)",
                 unit="file",
                 colour="green",
-            ):
-                file_path = future_to_file[future]
-                try:
-                    result = future.result()
-                    if "records" in result:
-                        logger.info(
-                            f"Successfully processed {file_path}: {result['records']} records"
-                        )
-                    else:
+            ) as pbar_files,
+        ):
+            pending = {}
+            for file_path in self.gz_files:
+                if file_path in split_files:
+                    future = executor.submit(
+                        CDRFileManager.plan_chunks,
+                        file_path,
+                        self.decoder,
+                        self.chunks_dir,
+                        self.chunk_size,
+                        self.cache_dir,
+                        self.threaded_inflate,
+                    )
+                    pending[future] = ("plan", file_path)
+                else:
+                    future = executor.submit(
+                        CDRFileManager.decode_file,
+                        file_path,
+                        self.decoder,
+                        self.output_path,
+                        None,  # pbar_position: not used in parallel mode
+                        False,  # show_progress: disabled in parallel to avoid overlap
+                        self.batch_size,
+                        self.handoff_dir,
+                        self.cache_dir,
+                        self.threaded_inflate,
+                    )
+                    pending[future] = ("file", file_path)
+
+            while pending:
+                done, _ = concurrent.futures.wait(
+                    pending, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+                for future in done:
+                    kind, file_path = pending.pop(future)
+                    try:
+                        result = self._attach(future.result())
+                    except Exception as exc:
+                        error_details = traceback.format_exc()
                         logger.error(
-                            f"Failed to process {file_path}: {result.get('error', 'Unknown error')}"
-                        )
-                    if "traceback" in result:
-                        logger.debug(
-                            f"Traceback for {file_path}:\n{result['traceback']}"
+                            f"Exception processing result for {file_path}: {str(exc)}\n{error_details}"
                         )
-                    results.append(result)
-                except Exception as exc:
-                    error_details = traceback.format_exc()
-                    logger.error(
-                        f"Exception processing result for {file_path}: {str(exc)}\n{error_details}"
-                    )
-                    results.append(
-                        {
+                        result = {
                             "file": file_path,
                             "error": str(exc),
                             "traceback": error_details,
                             "status": "failed",
                             "blocks": None,
                         }
-                    )
-                gc.collect()
+
+                    if kind == "plan" and result["status"] == "success":
+                        if not result["cached"]:
+                            raw_files[file_path] = result["raw_file"]
+                        chunks = self._chunks(file_path, result)
+                        chunk_counts[file_path] = len(chunks)
+                        chunk_results[file_path] = []
+                        for chunk in chunks:
+                            future = executor.submit(
+                                CDRFileManager.decode_chunk,
+                                chunk,
+                                self.decoder,
+                                self.batch_size,
+                                output_format,
+                            )
+                            pending[future] = ("chunk", file_path)
+                        if chunks:
+                            continue
+                    elif kind == "chunk":
+                        chunk_results[file_path].append(result)
+                        if len(chunk_results[file_path]) < chunk_counts[file_path]:
+                            continue
+
+                    if file_path in chunk_results:
+                        result = self._merge_chunks(
+                            file_path, chunk_results.pop(file_path)
+                        )
+                    if raw_file := raw_files.pop(file_path, None):
+                        raw_file.unlink(missing_ok=True)
+
+                    self._log_result(file_path, result)
+                    results.append(result)
+                    pbar_files.update(1)
+                    gc.collect()
         return results
 
+    @staticmethod
+    def _attach(result: Dict[str, Any]) -> Dict[str, Any]:
+        """Memory map the Arrow IPC file handed over by a worker as "table".
+
+        The file is removed right away, the mapping keeps the data reachable.
+        """
+        if (ipc_file := result.pop("ipc_file", None)) is not None:
+            result["table"] = read_ipc_table(ipc_file)
+            with suppress(OSError):
+                ipc_file.unlink()
+        return result
+
+    def _parts_dir(self, file_path: Path) -> Path:
+        return self.output_path / f"{file_path.stem}{output_suffix()}"
+
+    def _chunks(self, file_path: Path, plan: Dict[str, Any]) -> List[Chunk]:
+        """Chunks of a split file, a single chunk is saved directly as the output file"""
+        ranges = plan["ranges"]
+        if self.output_path is None:
+            output_files = [
+                self.handoff_dir / f"{file_path.stem}.{part_name(i, '.csv')}"
+                for i in range(len(ranges))
+            ]
+        elif len(ranges) == 1:
+            output_files = [self.output_path / f"{file_path.stem}.csv"]
+        else:
+            parts_dir = self._parts_dir(file_path)
+            temp_dir = parts_dir.with_name(f".{parts_dir.name}.tmp")
+            if temp_dir.exists():
+                shutil.rmtree(temp_dir)
+            temp_dir.mkdir()
+            output_files = [temp_dir / part_name(i, ".csv") for i in range(len(ranges))]
+        return [
+            Chunk(file_path, plan["raw_file"], i, start, stop, output_file)
+            for i, ((start, stop), output_file) in enumerate(zip(ranges, output_files))
+        ]
+
+    def _merge_chunks(self, file_path: Path, results: List[Dict[str, Any]]):
+        """Combine the results of the chunks of a file and publish its part files"""
+        results.sort(key=lambda r: r.get("part", 0))
+        if failed := [r for r in results if r.get("status") == "failed"]:
+            if self.output_path is not None:
+                parts_dir = self._parts_dir(file_path)
+                temp_dir = parts_dir.with_name(f".{parts_dir.name}.tmp")
+                if temp_dir.exists():
+                    shutil.rmtree(temp_dir)
+            return {
+                "file": file_path,
+                "error": f"{len(failed)} of {len(results)} chunks failed: {failed[0].get('error')}",
+                "traceback": failed[0].get("traceback", ""),
+                "status": "failed",
+                "blocks": None,
+            }
+
+        # Decoding the file as a whole stops at its first undecodable record
+        stop = next((i for i, r in enumerate(results) if r.get("stopped")), None)
+        if stop is not None and stop + 1 < len(results):
+            results, dropped = results[: stop + 1], results[stop + 1 :]
+            logger.warning(
+                f"Undecodable record at offset {results[-1]['stopped_at']} of "
+                f"{file_path}, dropped the {len(dropped)} chunks after it"
+            )
+            if self.output_path is not None:
+                parts_dir = self._parts_dir(file_path)
+                temp_dir = parts_dir.with_name(f".{parts_dir.name}.tmp")
+                for r in dropped:
+                    for part_file in temp_dir.glob(f"{part_name(r['part'], '')}.*"):
+                        part_file.unlink()
+
+        result = {
+            "file": file_path,
+            "records": sum(r.get("records", 0) for r in results),
+            "status": "success",
+            "fieldnames": next((r.get("fieldnames") for r in results), None),
+            "blocks": None,
+            "chunks": len(results),
+            "imsi_cache": tuple(
+                map(sum, zip(*(r.get("imsi_cache", (0, 0)) for r in results)))
+            ),
+        }
+        if self.output_path is None:
+            import pyarrow as pa
+
+            if tables := [r["table"] for r in results if "table" in r]:
+                # Zero-copy: the chunks of the tables stay memory mapped
+                result["table"] = pa.concat_tables(tables)
+            return result
+
+        parts_dir = self._parts_dir(file_path)
+        temp_dir = parts_dir.with_name(f".{parts_dir.name}.tmp")
+        if temp_dir.exists():
+            finalize_parts(temp_dir, parts_dir)
+            logger.info(f"Data saved to {parts_dir} in {len(results)} parts")
+        return result
+
+    @staticmethod
+    def _log_result(file_path: Path, result: Dict[str, Any]):
+        if "records" in result:
+            logger.info(
+                f"Successfully processed {file_path}: {result['records']} records"
+            )
+        else:
+            logger.error(
+                f"Failed to process {file_path}: {result.get('error', 'Unknown error')}"
+            )
+        if "traceback" in result:
+            logger.debug(f"Traceback for {file_path}:\n{result['traceback']}")
+
 
 def display_summary(results, total_time, output_path):
     success_count = sum(r.get("status") == "success" for r in results)
     failed_count = sum(r.get("status") == "failed" for r in results)
     total_records = sum(r.get("records", 0) for r in results)
+    imsi_hits = sum(r.get("imsi_cache", (0, 0))[0] for r in results)
+    imsi_lookups = imsi_hits + sum(r.get("imsi_cache", (0, 0))[1] for r in results)
+    imsi_hit_rate = (
+        f"{imsi_hits / imsi_lookups:.1%} ({imsi_hits}/{imsi_lookups})"
+        if imsi_lookups
+        else None
+    )
 
     # Log summary information
     logger.info("Processing Summary:")
     logger.info(f"Files processed successfully: {success_count}")
     logger.info(f"Files failed: {failed_count}")
     logger.info(f"Total records processed: {total_records}")
+    if imsi_hit_rate:
+        logger.info(f"IMSI cache hit rate: {imsi_hit_rate}")
 
     if output_path is not None:
         logger.info(f"Output directory: {output_path}")
@@ -484,6 +1060,8 @@ def display_summary(results, total_time, output_path):
     print(f"✅ Files processed successfully: {success_count}")
     print(f"❌ Files failed: {failed_count}")
     print(f"📄 Total records processed: {total_records}")
+    if imsi_hit_rate:
+        print(f"🗂️ IMSI cache hit rate: {imsi_hit_rate}")
 
     if output_path is not None:
         print(f"📦 Output directory: {output_path}")
@@ -503,23 +1081,42 @@ def main(
     reprocess: bool = False,
     log_level: int = logging.INFO,
     max_count: int | None = None,
+    batch_size: int | None = BATCH_SIZE,
+    chunk_size: int | None = CHUNK_SIZE,
+    cache_dir: Path | None = None,
+    threaded_inflate: bool = False,
+    imsi_cache_size: int = IMSI_CACHE_SIZE,
 ):
     # Set up logging to file and console
     global logger
     logger = setup_logging(output_path, log_level)
 
     logger.info(
-        f"Starting teleparser with input: {input_path}, output: {output_path}, type: {cdr_type}, workers: {workers}, reprocess: {reprocess}, max_count: {max_count}"
+        f"Starting teleparser with input: {input_path}, output: {output_path}, type: {cdr_type}, workers: {workers}, reprocess: {reprocess}, max_count: {max_count}, batch_size: {batch_size}, chunk_size: {chunk_size}, cache_dir: {cache_dir}, threaded_inflate: {threaded_inflate}, imsi_cache_size: {imsi_cache_size}"
     )
     try:
         manager = CDRFileManager(
-            input_path, output_path, cdr_type, reprocess, max_count
+            input_path,
+            output_path,
+            cdr_type,
+            reprocess,
+            max_count,
+            batch_size,
+            chunk_size,
+            cache_dir,
+            threaded_inflate,
+            imsi_cache_size,
+            workers,
         )
         file_count = len(manager.gz_files)
         logger.info(f"[blue]Started processing of {file_count} files...[/blue]")
 
         start = perf_counter()
-        if workers <= 1 or file_count == 1:
+        # A single file still benefits from multiple cores when it can be split
+        single_file = file_count == 1 and not any(
+            manager.should_split(f) for f in manager.gz_files
+        )
+        if workers <= 1 or single_file:
             logger.info("Using single-core processing mode")
             results = manager.decode_files_sequential()
         else:
@@ -621,6 +1218,45 @@ Se --saida não for especificado, os resultados são processados em memória e n
         help="Número máximo de arquivos para processar. Padrão: None (processar todos)",
     )
 
+    parser.add_argument(
+        "-l",
+        "--lote",
+        type=int,
+        default=BATCH_SIZE,
+        help=f"Número de registros por lote (row group) gravado incrementalmente na saída. 0 desativa a gravação incremental (padrão: {BATCH_SIZE})",
+    )
+
+    parser.add_argument(
+        "-b",
+        "--bloco-mb",
+        type=int,
+        default=CHUNK_SIZE // (1024 * 1024),
+        help=f"Tamanho em MB dos blocos de dados descomprimidos de um arquivo grande processados em paralelo. 0 desativa a divisão de arquivos (padrão: {CHUNK_SIZE // (1024 * 1024)})",
+    )
+
+    parser.add_argument(
+        "-c",
+        "--cache",
+        type=str,
+        default=None,
+        help="Diretório de cache dos arquivos descomprimidos. Arquivos reprocessados são lidos do cache via mmap, sem descomprimir de novo (padrão: None, sem cache)",
+    )
+
+    parser.add_argument(
+        "-d",
+        "--descompressao-thread",
+        action="store_true",
+        default=False,
+        help="Descomprimir o gzip em uma thread separada, em paralelo com a decodificação (padrão: False)",
+    )
+
+    parser.add_argument(
+        "--cache-imsi",
+        type=int,
+        default=IMSI_CACHE_SIZE,
+        help=f"Número de IMSIs decodificados mantidos em cache (LRU) por processo, a taxa de acerto é exibida no resumo. 0 desativa o cache (padrão: {IMSI_CACHE_SIZE})",
+    )
+
     args = parser.parse_args()
 
     # Convert entrada to Path
@@ -644,6 +1280,11 @@ Se --saida não for especificado, os resultados são processados em memória e n
             args.reprocessar,
             numeric_level,
             args.max_arquivos,
+            args.lote,
+            args.bloco_mb * 1024 * 1024,
+            Path(args.cache) if args.cache is not None else None,
+            args.descompressao_thread,
+            args.cache_imsi,
         )
     except Exception as e:
         # At this point, logger might not be initialized yet, so we print to console
@@ -0,0 +1,270 @@
+"""Incremental writers for decoded CDR records.
+
+Records are consumed in batches as the decoders yield them, so the peak memory
+of a worker is bounded by the batch size instead of the size of the input file.
+Each batch becomes one Parquet row group (or a chunk of rows in the CSV.GZ
+fallback when pyarrow is not installed).
+"""
+
+import csv
+import gzip
+import logging
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Set
+
+from teleparser.columnar import ColumnarBuilder, arrow_schema
+
+logger = logging.getLogger("teleparser")
+
+# Default number of records per row group
+BATCH_SIZE = 100_000
+
+
+def batched(records: Iterable[Dict[str, Any]], size: int) -> Iterator[List[dict]]:
+    """Group an iterable of records into lists of at most `size` records"""
+    batch = []
+    for record in records:
+        batch.append(record)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def sorted_fieldnames(fieldnames_set: Set[str]) -> List[str]:
+    """Column order used by every output file"""
+    return sorted(fieldnames_set, key=lambda x: x.lower())
+
+
+class BatchWriter:
+    """Base class for incremental writers.
+
+    The output is written to a temporary file which is only renamed to its final
+    name when the writer is closed without errors, so an interrupted run never
+    leaves a partial file that would be skipped as already processed.
+    """
+
+    suffix = ""
+
+    def __init__(
+        self,
+        output_file: Path,
+        fieldnames: List[str],
+        integer_fields: Iterable[str] = (),
+    ):
+        self.output_file = output_file.with_suffix(self.suffix)
+        self.temp_file = self.output_file.with_name(f".{self.output_file.name}.tmp")
+        self.fieldnames = fieldnames
+        # Columns written as integers where the format has types, see arrow_schema
+        self.integer_fields = frozenset(integer_fields)
+        self.records = 0
+        self.batches = 0
+        self._fields = set(fieldnames)
+        # Fields outside of the schema already logged for this file
+        self.dropped: Set[str] = set()
+
+    def _warn_dropped(self, fields: Set[str]):
+        """Log, once per file, the fields outside of the schema whose values are dropped"""
+        if new := fields - self.dropped:
+            self.dropped |= new
+            logger.warning(
+                f"Fields not in the schema of {self.output_file} dropped: {sorted(new)}"
+            )
+
+    def write(self, blocks: List[Dict[str, Any]]):
+        """Write a batch of records, the fields outside of the schema are dropped"""
+        self._warn_dropped({k for block in blocks for k in block} - self._fields)
+        self._write(blocks)
+        self.records += len(blocks)
+        self.batches += 1
+
+    def write_columns(self, builder: ColumnarBuilder):
+        """Write the rows buffered in a columnar builder, which must share the schema"""
+        self._warn_dropped(builder.unknown)
+        self._write_columns(builder)
+        self.records += len(builder)
+        self.batches += 1
+
+    def _write(self, blocks: List[Dict[str, Any]]):
+        raise NotImplementedError
+
+    def _write_columns(self, builder: ColumnarBuilder):
+        raise NotImplementedError
+
+    def _close(self):
+        raise NotImplementedError
+
+    def close(self):
+        self._close()
+        self.temp_file.replace(self.output_file)
+
+    def abort(self):
+        """Discard the partial output"""
+        try:
+            self._close()
+        finally:
+            self.temp_file.unlink(missing_ok=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+class ParquetBatchWriter(BatchWriter):
+    """Write each batch of records as a Parquet row group.
+
+    The Arrow schema is fixed up front from the field names, so every file has the
+    same columns in the same order. Values are stored as dictionary encoded
+    strings (read back as categories by pandas), or int64 for the integer fields,
+    built directly from the records without an intermediate DataFrame.
+    """
+
+    suffix = ".parquet"
+
+    def __init__(
+        self,
+        output_file: Path,
+        fieldnames: List[str],
+        integer_fields: Iterable[str] = (),
+    ):
+        import pyarrow.parquet as pq
+
+        super().__init__(output_file, fieldnames, integer_fields)
+        self.schema = arrow_schema(fieldnames, self.integer_fields)
+        self._writer = pq.ParquetWriter(self.temp_file, self.schema)
+
+    def to_table(self, blocks: List[Dict[str, Any]]):
+        """Convert a batch of records to an Arrow table with the writer schema"""
+        builder = ColumnarBuilder(self.fieldnames)
+        builder.extend(blocks)
+        return builder.to_table(self.schema)
+
+    def _write(self, blocks: List[Dict[str, Any]]):
+        self._writer.write_table(self.to_table(blocks))
+
+    def _write_columns(self, builder: ColumnarBuilder):
+        self._writer.write_table(builder.to_table(self.schema))
+
+    def _close(self):
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+
+class ArrowIpcBatchWriter(BatchWriter):
+    """Write each batch of records as a record batch of an Arrow IPC stream.
+
+    Used to hand decoded data from a worker process to the parent: the parent
+    memory maps the file and reads the table without copying or unpickling it.
+    """
+
+    suffix = ".arrow"
+
+    def __init__(
+        self,
+        output_file: Path,
+        fieldnames: List[str],
+        integer_fields: Iterable[str] = (),
+    ):
+        import pyarrow as pa
+
+        super().__init__(output_file, fieldnames, integer_fields)
+        self.schema = arrow_schema(fieldnames, self.integer_fields)
+        self._sink = pa.OSFile(str(self.temp_file), "wb")
+        # The stream format allows a new dictionary per batch, the file format doesn't
+        self._writer = pa.ipc.new_stream(self._sink, self.schema)
+
+    def _write(self, blocks: List[Dict[str, Any]]):
+        builder = ColumnarBuilder(self.fieldnames)
+        builder.extend(blocks)
+        self._write_columns(builder)
+
+    def _write_columns(self, builder: ColumnarBuilder):
+        self._writer.write_table(builder.to_table(self.schema))
+
+    def _close(self):
+        if self._writer is not None:
+            self._writer.close()
+            self._sink.close()
+            self._writer = None
+
+
+class CsvBatchWriter(BatchWriter):
+    """Append each batch of records to a gzipped CSV file"""
+
+    suffix = ".csv.gz"
+
+    def __init__(
+        self,
+        output_file: Path,
+        fieldnames: List[str],
+        integer_fields: Iterable[str] = (),
+    ):
+        super().__init__(output_file, fieldnames, integer_fields)
+        self._file = gzip.open(self.temp_file, "wt", encoding="utf-8", newline="")
+        self._writer = csv.DictWriter(
+            self._file, fieldnames=fieldnames, extrasaction="ignore"
+        )
+        self._writer.writeheader()
+
+    def _write(self, blocks: List[Dict[str, Any]]):
+        self._writer.writerows(blocks)
+
+    def _write_columns(self, builder: ColumnarBuilder):
+        self._writer.writerows(builder.rows())
+
+    def _close(self):
+        if not self._file.closed:
+            self._file.close()
+
+
+def open_batch_writer(
+    output_file: Path,
+    fieldnames: List[str],
+    output_format: str = "parquet",
+    integer_fields: Iterable[str] = (),
+) -> BatchWriter:
+    """Open a Parquet writer, falling back to CSV.GZ when pyarrow is unavailable.
+
+    With output_format="arrow" an Arrow IPC file is written instead, which
+    requires pyarrow. The integer_fields are int64 columns, see `arrow_schema`.
+    """
+    if output_format == "arrow":
+        return ArrowIpcBatchWriter(output_file, fieldnames, integer_fields)
+    try:
+        return ParquetBatchWriter(output_file, fieldnames, integer_fields)
+    except ImportError:
+        logger.warning("PyArrow not available, falling back to CSV.GZ")
+        return CsvBatchWriter(output_file, fieldnames, integer_fields)
+
+
+def read_ipc_table(ipc_file: Path):
+    """Memory map an Arrow IPC stream written by ArrowIpcBatchWriter.
+
+    The table references the mapped pages, no data is copied. The file can be
+    deleted right after on POSIX systems, the mapping stays valid until the table
+    is released.
+    """
+    import pyarrow as pa
+
+    with pa.memory_map(str(ipc_file), "r") as source:
+        return pa.ipc.open_stream(source).read_all()
+
+
+def arrow_available() -> bool:
+    try:
+        import pyarrow.parquet  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def output_suffix() -> str:
+    """Suffix of the files written by `open_batch_writer`"""
+    return ParquetBatchWriter.suffix if arrow_available() else CsvBatchWriter.suffix
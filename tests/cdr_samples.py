@@ -0,0 +1,103 @@
+"""Builders of synthetic CDR data for the tests, no real samples are shipped."""
+
+
+def tlv(tag: int, value: bytes) -> bytes:
+    """BER TLV with a single byte tag and a short or long form length"""
+    length = len(value)
+    if length < 0x80:
+        return bytes([tag, length]) + value
+    length_bytes = length.to_bytes((length.bit_length() + 7) // 8, "big")
+    return bytes([tag, 0x80 | len(length_bytes)]) + length_bytes + value
+
+
+def voz_record(call_id: int, sequence: int) -> bytes:
+    """singleDataRecord > transit > callIdentificationNumber, recordSequenceNumber"""
+    call_module = tlv(0x81, call_id.to_bytes(3, "big")) + tlv(
+        0x82, bytes([sequence % 256])
+    )
+    return tlv(0xA0, tlv(0xA0, call_module))
+
+
+def context_tlv(number: int, value: bytes, constructed: bool = False) -> bytes:
+    """Context-specific TLV, with the high tag number form for numbers over 30"""
+    first = 0x80 | (0x20 if constructed else 0)
+    if number < 31:
+        return tlv(first | number, value)
+    digits = []
+    while True:
+        digits.insert(0, number & 0x7F)
+        number >>= 7
+        if not number:
+            break
+    tag = bytes([first | 0x1F] + [d | 0x80 for d in digits[:-1]] + digits[-1:])
+    # tlv() writes a single byte tag, prefix the first ones
+    return tag[:-1] + tlv(tag[-1], value)
+
+
+def voz_null_record(call_id: int) -> bytes:
+    """`voz_record` whose transit ends with the NULL lastPartialOutput (tag 38)"""
+    call_module = (
+        tlv(0x81, call_id.to_bytes(3, "big"))
+        + tlv(0x82, bytes([call_id % 256]))
+        + context_tlv(38, b"")
+    )
+    return tlv(0xA0, tlv(0xA0, call_module))
+
+
+def sbc_record(sequence: int) -> bytes:
+    """IMSRecord > sCSCFRecord with scalar, CHOICE, SEQUENCE OF and SET fields"""
+    ip_address = context_tlv(0, bytes([10, 0, 0, sequence % 256]))
+    node_address = context_tlv(0, ip_address, True)
+    calling_parties = context_tlv(0, b"sip:a@x") + context_tlv(1, b"tel:+5561")
+    subscription = tlv(
+        0x31, context_tlv(0, b"\x00") + context_tlv(1, f"55619{sequence}".encode())
+    )
+    members = (
+        context_tlv(0, b"\x3f")
+        + context_tlv(4, node_address, True)
+        + context_tlv(5, f"session-{sequence}".encode())
+        + context_tlv(6, calling_parties, True)
+        + context_tlv(9, bytes.fromhex("240315102030") + b"-" + bytes.fromhex("0300"))
+        + context_tlv(16, sequence.to_bytes(2, "big", signed=True))
+        + context_tlv(17, b"\x03")
+        + context_tlv(31, subscription, True)
+        + context_tlv(36, b"\x02")
+    )
+    return context_tlv(63, members, True)
+
+
+def avp(code: int, value: bytes, flags: int = 0x40) -> bytes:
+    """Diameter AVP without vendor id, padded to 4 bytes"""
+    length = 8 + len(value)
+    padding = b"\x00" * (-length % 4)
+    return (
+        code.to_bytes(4, "big")
+        + bytes([flags])
+        + length.to_bytes(3, "big")
+        + value
+        + padding
+    )
+
+
+def diameter_message(avps: bytes, hop_by_hop: int = 0) -> bytes:
+    """Accounting-Request message preceded by the 2 byte record prefix"""
+    header = (
+        bytes([1])
+        + (20 + len(avps)).to_bytes(3, "big")
+        + bytes([0x80])
+        + b"\x00\x01\x0f"  # Accounting command code 271
+        + (3).to_bytes(4, "big")
+        + hop_by_hop.to_bytes(4, "big")
+        + hop_by_hop.to_bytes(4, "big")
+    )
+    return b"\x00\x00" + header + avps
+
+
+def volte_message(sequence: int) -> bytes:
+    """Message with Session-Id, Accounting-Record-Type and Accounting-Record-Number"""
+    return diameter_message(
+        avp(263, f"scscf{sequence % 3}.example;{sequence}".encode())
+        + avp(480, (2).to_bytes(4, "big"))
+        + avp(485, sequence.to_bytes(4, "big")),
+        sequence,
+    )
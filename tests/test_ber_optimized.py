@@ -7,12 +7,15 @@ import pytest
 
 from teleparser.buffer import BufferManager, MemoryBufferManager
 from teleparser.decoders.ericsson import (
+    EricssonVoz,
     ericsson_voz_decoder,
     ericsson_voz_decoder_optimized,
 )
 from teleparser.decoders.ericsson.ber import BerDecoder
 from teleparser.decoders.ericsson.ber_optimized import BerDecoderOptimized
 
+from cdr_samples import tlv, voz_null_record
+
 
 class TestMemoryBufferManager:
     """Test the MemoryBufferManager class."""
@@ -87,6 +90,68 @@ class TestBerDecoderOptimized:
         assert len(tag_bytes) > 1
         assert bytes_read > 1
     
+    def test_read_tag_number(self):
+        """Test reading tag numbers without building the tag bytes."""
+        assert BerDecoderOptimized.read_tag_number(memoryview(b"\xa5\x00"), 0) == (5, 1)
+        # 0x1f 0x81 0x00: 1 << 7 | 0
+        data = memoryview(b"\x00\xbf\x81\x00\x01")
+        assert BerDecoderOptimized.read_tag_number(data, 1) == (128, 3)
+        with pytest.raises(ValueError, match="Unexpected end of tag"):
+            BerDecoderOptimized.read_tag_number(memoryview(b"\x1f\x81"), 0)
+
+    def test_values_are_views(self):
+        """The parser gets views of the values, it copies what it decodes."""
+        values = []
+
+        class Parser:
+            def __init__(self, tag_number, value, schema):
+                values.append((tag_number, value))
+                self.name, self.value, self.schema = str(tag_number), {}, None
+
+        data = memoryview(b"\xa1\x06\x82\x01\x2a\xbf\x1f\x00")
+        decoder = BerDecoderOptimized(Parser, None)
+
+        assert decoder.decode(data, 0) == ({}, 8)
+        assert [type(value) for _, value in values] == [memoryview, memoryview]
+        assert [bytes(value) for _, value in values] == [data[2:8], b"\x2a"]
+
+    @pytest.mark.parametrize("constructed", [0x00, 0x20])
+    def test_constructed_bit_on_primitive_fields(self, constructed):
+        """Fields are decoded from bytes even when the TLV says constructed."""
+        # Their values are also valid TLVs, walked as children
+        exchange = tlv(0x93 | constructed, b"\x27\x02AB")
+        imsi = tlv(0x86 | constructed, bytes.fromhex("270413000010"))
+        data = bytearray(
+            tlv(0xA0, tlv(0xA0, tlv(0x81, b"\x00\x00\x01") + exchange + imsi))
+        )
+        decoder = BerDecoderOptimized(EricssonVoz, None)
+
+        record, _ = decoder.decode(memoryview(data), 0)
+
+        assert record["exchangeIdentity"] == "\x27\x02AB"
+        assert record["calledSubscriberIMSI.msin"] == "1000001"
+
+    def test_deep_nesting_without_recursion(self):
+        """Nesting and zero-length runs beyond the recursion limit are decoded."""
+
+        class Parser:
+            def __init__(self, tag_number, value, schema):
+                self.name, self.schema = f"field{tag_number}", None
+                self.value = {} if tag_number == 1 else bytes(value)
+
+        depth = 3000
+        data = b"\x82\x01\x2a"
+        for _ in range(depth):
+            header = b"\xa1\x84" + len(data).to_bytes(4, "big")
+            data = header + data
+        data = b"\x00\x00" * depth + data
+        decoder = BerDecoderOptimized(Parser, None)
+
+        assert decoder.decode(memoryview(data), 0) == (
+            {"field2": b"\x2a"},
+            len(data),
+        )
+
     def test_decode_tag(self):
         """Test decoding tag bytes."""
         tag_bytes = b"\x02"  # UNIVERSAL, primitive, tag 2 (INTEGER)
@@ -174,6 +239,23 @@ class TestDecoderComparison:
             pytest.skip(f"Both decoders handled empty file: {e}")
 
 
+    def test_trailing_null_children(self, tmp_path):
+        """A NULL last child ends its parents, the next record stays apart."""
+        test_file = tmp_path / "null.gz"
+        with gzip.open(test_file, "wb") as f:
+            f.write(b"".join(voz_null_record(i) for i in range(3)))
+
+        expected = ericsson_voz_decoder(BufferManager(test_file)).process(
+            show_progress=False
+        )
+        records = ericsson_voz_decoder_optimized(BufferManager(test_file)).process(
+            show_progress=False
+        )
+
+        assert records == expected
+        assert [r["callIdentificationNumber"] for r in records] == [0, 1, 2]
+        assert "tAC" not in records[0]
+
 class TestMemoryviewPerformance:
     """Performance-related tests for memoryview."""
     
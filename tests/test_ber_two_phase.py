@@ -1,21 +1,30 @@
 """Tests for the two-phase BER decoder implementation."""
 
 import gzip
+import random
 import tempfile
 from pathlib import Path
 import pytest
 
 from teleparser.buffer import MemoryBufferManager
+from teleparser.chunks import pool_workers
 from teleparser.decoders.ericsson.ber_two_phase import (
-    BerDecoderTwoPhase, TLVTriple, ericsson_voz_decoder_two_phase
+    BerDecoderTwoPhase,
+    MALFORMED,
+    TLVTriple,
 )
+from teleparser.decoders.ericsson import ber_two_phase, ericsson_voz_decoder_two_phase
 from teleparser.decoders.ericsson.ber_optimized import BerDecoderOptimized
 from teleparser.decoders.ericsson.voz import EricssonVoz
+from teleparser.decoders import sbc
+from teleparser.main import CDRFileManager
+
+from cdr_samples import context_tlv, sbc_record, tlv, voz_null_record, voz_record
 
 
 class TestTLVTriple:
     """Test the TLVTriple data structure."""
-    
+
     def test_tlv_triple_creation(self):
         """Test basic TLVTriple creation and attributes."""
         tlv = TLVTriple(
@@ -26,9 +35,9 @@ class TestTLVTriple:
             value_length=5,
             depth=0,
             parent_idx=-1,
-            tlv_start=8
+            tlv_start=8,
         )
-        
+
         assert tlv.tag_class == 0
         assert tlv.constructed is False
         assert tlv.tag_number == 2
@@ -41,152 +50,145 @@ class TestTLVTriple:
 
 class TestBerDecoderTwoPhase:
     """Test the two-phase BER decoder."""
-    
+
     @pytest.fixture
     def sample_ber_data(self):
         """Create sample BER-encoded data for testing."""
         # Simple BER structures that should be parseable
         # SEQUENCE (0x30) containing INTEGERs (0x02) and OCTET STRINGs (0x04)
         return (
-            b'\\x30\\x10'  # SEQUENCE, length 16
-            b'\\x02\\x01\\x01'  # INTEGER 1
-            b'\\x02\\x01\\x02'  # INTEGER 2
-            b'\\x04\\x04test'  # OCTET STRING "test"
-            b'\\x02\\x02\\x03\\xe8'  # INTEGER 1000
+            b"\x30\x10"  # SEQUENCE, length 16
+            b"\x02\x01\x01"  # INTEGER 1
+            b"\x02\x01\x02"  # INTEGER 2
+            b"\x04\x04test"  # OCTET STRING "test"
+            b"\x02\x02\x03\xe8"  # INTEGER 1000
         )
-    
+
     @pytest.fixture
     def test_file(self, tmp_path, sample_ber_data):
         """Create a temporary gzipped test file."""
         test_file = tmp_path / "test.gz"
-        
+
         with gzip.open(test_file, "wb") as f:
             f.write(sample_ber_data)
-        
+
         return test_file
-    
+
     @pytest.fixture
     def decoder(self, test_file):
         """Create a two-phase decoder instance."""
         buffer_manager = MemoryBufferManager(test_file)
         return BerDecoderTwoPhase(
-            parser=EricssonVoz,
-            buffer_manager=buffer_manager,
-            n_workers=2
+            parser=EricssonVoz, buffer_manager=buffer_manager, n_workers=2
         )
-    
+
     def test_extract_tlv_structure_basic(self, decoder, sample_ber_data):
         """Test basic TLV structure extraction."""
         data = memoryview(sample_ber_data)
         tlvs = decoder.extract_tlv_structure(data)
-        
+
         # Should have at least a few TLVs
         assert len(tlvs) >= 4
-        
+
         # First should be the SEQUENCE
         first_tlv = tlvs[0]
         assert first_tlv.tag_number == 16  # SEQUENCE tag (0x30 & 0x1F = 16)
         assert first_tlv.constructed is True
         assert first_tlv.depth == 0
         assert first_tlv.parent_idx == -1
-        
+
         # Should have child TLVs with depth > 0
         child_tlvs = [tlv for tlv in tlvs if tlv.depth > 0]
         assert len(child_tlvs) >= 3
-    
+
     def test_extract_tlv_structure_empty_data(self, decoder):
         """Test TLV extraction with empty data."""
-        data = memoryview(b'')
+        data = memoryview(b"")
         tlvs = decoder.extract_tlv_structure(data)
-        
+
         assert tlvs == []
-    
+
     def test_extract_tlv_structure_malformed_data(self, decoder):
         """Test TLV extraction with malformed data."""
         # Incomplete TLV (tag without length/value)
-        data = memoryview(b'\\x02')
+        data = memoryview(b"\\x02")
         tlvs = decoder.extract_tlv_structure(data)
-        
+
         # Should handle gracefully and return empty or partial results
         assert isinstance(tlvs, list)
-    
+
     def test_get_schema_for_tlv(self, decoder, sample_ber_data):
         """Test schema resolution for TLVs."""
         data = memoryview(sample_ber_data)
         tlvs = decoder.extract_tlv_structure(data)
-        
+
         if tlvs:
             schema = decoder.get_schema_for_tlv(tlvs, 0)
             # For now, should return None (simplified implementation)
             assert schema is None
-    
-    def test_interpret_tlv_batch_basic(self, decoder, sample_ber_data):
-        """Test basic TLV batch interpretation."""
+
+    def test_interpret_records_basic(self, decoder, sample_ber_data):
+        """Test phase 2 over the records of an index."""
         data = memoryview(sample_ber_data)
-        tlvs = decoder.extract_tlv_structure(data)
-        
-        if len(tlvs) > 1:
-            # Test interpreting first few TLVs
-            results = decoder.interpret_tlv_batch(tlvs, data, 0, min(3, len(tlvs)))
-            
-            # Results should be a dictionary
-            assert isinstance(results, dict)
-            # Might be empty if parsing fails, but should not crash
-    
+        tlvs = decoder.build_index(data)
+
+        records = ber_two_phase.interpret_records(decoder.parser, tlvs, data)
+
+        # The SEQUENCE is not a CallDataRecord, the range ends at it
+        assert records == [None]
+
     def test_parallel_interpret_basic(self, decoder, sample_ber_data):
         """Test parallel interpretation of TLVs."""
         data = memoryview(sample_ber_data)
         tlvs = decoder.extract_tlv_structure(data)
-        
+
         records = decoder.parallel_interpret(tlvs, data)
-        
+
         # Should return a list of records
         assert isinstance(records, list)
         # Might be empty if parsing fails, but should not crash
-    
+
     def test_parse_blocks_integration(self, decoder):
         """Test the complete parse_blocks integration."""
         try:
             records = list(decoder.parse_blocks())
-            
+
             # Should return a list (might be empty if parsing fails)
             assert isinstance(records, list)
-            
+
             # If we have records, they should be dictionaries
             for record in records:
                 assert isinstance(record, dict)
-                
+
         except Exception as e:
             # Some parsing failures are expected with synthetic data
             # Just ensure it doesn't crash catastrophically
             assert isinstance(e, (KeyError, ValueError, AttributeError))
-    
+
     def test_process_with_progress(self, decoder):
         """Test the process method with progress bar."""
         try:
             records = decoder.process(show_progress=False)
-            
+
             assert isinstance(records, list)
-            
+
         except Exception as e:
             # Some parsing failures are expected
             assert isinstance(e, (KeyError, ValueError, AttributeError))
-    
+
     def test_different_worker_counts(self, test_file):
         """Test decoder with different worker counts."""
         buffer_manager = MemoryBufferManager(test_file)
-        
+
         for n_workers in [1, 2, 4]:
             decoder = BerDecoderTwoPhase(
-                parser=EricssonVoz,
-                buffer_manager=buffer_manager,
-                n_workers=n_workers
+                parser=EricssonVoz, buffer_manager=buffer_manager, n_workers=n_workers
             )
-            
+
             try:
                 records = decoder.process(show_progress=False)
                 assert isinstance(records, list)
-                
+
             except Exception as e:
                 # Parsing might fail, but shouldn't crash
                 assert isinstance(e, (KeyError, ValueError, AttributeError))
@@ -194,111 +196,314 @@ class TestBerDecoderTwoPhase:
 
 class TestEricssonVozDecoderTwoPhase:
     """Test the convenience function for creating VOZ decoders."""
-    
-    def test_decoder_creation(self, tmp_path):
+
+    def test_decoder_creation(self, tmp_path, monkeypatch):
         """Test creating a VOZ decoder through the convenience function."""
+        monkeypatch.setattr("os.cpu_count", lambda: 8)
         # Create a minimal test file
         test_file = tmp_path / "test.gz"
         with gzip.open(test_file, "wb") as f:
-            f.write(b'\\x30\\x03\\x02\\x01\\x00')  # Minimal SEQUENCE with INTEGER
-        
+            f.write(b"\\x30\\x03\\x02\\x01\\x00")  # Minimal SEQUENCE with INTEGER
+
         buffer_manager = MemoryBufferManager(test_file)
         decoder = ericsson_voz_decoder_two_phase(buffer_manager, n_workers=2)
-        
+
         assert isinstance(decoder, BerDecoderTwoPhase)
         assert decoder.n_workers == 2
         assert decoder.parser == EricssonVoz
-    
+
     def test_decoder_default_workers(self, tmp_path):
         """Test decoder creation with default worker count."""
         test_file = tmp_path / "test.gz"
         with gzip.open(test_file, "wb") as f:
-            f.write(b'\\x30\\x03\\x02\\x01\\x00')
-        
+            f.write(b"\\x30\\x03\\x02\\x01\\x00")
+
         buffer_manager = MemoryBufferManager(test_file)
         decoder = ericsson_voz_decoder_two_phase(buffer_manager)
-        
-        assert decoder.n_workers == 4  # Default
+
+        assert decoder.n_workers == pool_workers()  # Default
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_manager_caps_workers(self, tmp_path, workers, monkeypatch):
+        """The workers asked for also cap the pool of a sequential run."""
+        monkeypatch.setattr("os.cpu_count", lambda: 8)
+        test_file = tmp_path / "test.gz"
+        with gzip.open(test_file, "wb") as f:
+            f.write(b"\x30\x03\x02\x01\x00")
+
+        manager = CDRFileManager(
+            test_file, None, "ericsson_voz_two_phase", False, workers=workers
+        )
+        decoder = manager.decoder(MemoryBufferManager(test_file))
+
+        assert decoder.n_workers == workers
 
 
 class TestTwoPhasePerformance:
     """Performance-related tests."""
-    
+
     def test_large_synthetic_data(self, tmp_path):
         """Test with larger synthetic data to verify performance characteristics."""
         # Create a larger test file
         basic_record = (
-            b'\\x30\\x10'  # SEQUENCE, length 16
-            b'\\x02\\x01\\x01'  # INTEGER 1
-            b'\\x02\\x01\\x02'  # INTEGER 2
-            b'\\x04\\x04test'  # OCTET STRING "test"
-            b'\\x02\\x02\\x03\\xe8'  # INTEGER 1000
+            b"\\x30\\x10"  # SEQUENCE, length 16
+            b"\\x02\\x01\\x01"  # INTEGER 1
+            b"\\x02\\x01\\x02"  # INTEGER 2
+            b"\\x04\\x04test"  # OCTET STRING "test"
+            b"\\x02\\x02\\x03\\xe8"  # INTEGER 1000
         )
-        
+
         # Repeat the record many times
         large_data = basic_record * 100
-        
+
         test_file = tmp_path / "large_test.gz"
         with gzip.open(test_file, "wb") as f:
             f.write(large_data)
-        
+
         buffer_manager = MemoryBufferManager(test_file)
         decoder = ericsson_voz_decoder_two_phase(buffer_manager, n_workers=2)
-        
+
         import time
+
         start_time = time.perf_counter()
-        
+
         try:
             records = decoder.process(show_progress=False)
             end_time = time.perf_counter()
-            
+
             parse_time = end_time - start_time
-            
+
             # Should complete reasonably quickly (within 10 seconds)
             assert parse_time < 10.0
-            
+
             # Should return a list
             assert isinstance(records, list)
-            
+
         except Exception as e:
             # Parsing might fail with synthetic data, but should not hang or crash
             end_time = time.perf_counter()
             parse_time = end_time - start_time
-            
+
             # Even failures should be quick
             assert parse_time < 10.0
             assert isinstance(e, (KeyError, ValueError, AttributeError))
-    
+
     def test_zero_copy_behavior(self, tmp_path):
         """Test that memoryview slicing is zero-copy."""
         # This test verifies that the TLV extraction doesn't copy large amounts of data
-        large_data = b'\\x30\\x05\\x02\\x01\\x00\\x00\\x00' + b'\\x00' * 10000
-        
+        large_data = b"\\x30\\x05\\x02\\x01\\x00\\x00\\x00" + b"\\x00" * 10000
+
         test_file = tmp_path / "zero_copy_test.gz"
         with gzip.open(test_file, "wb") as f:
             f.write(large_data)
-        
+
         buffer_manager = MemoryBufferManager(test_file)
         decoder = BerDecoderTwoPhase(
-            parser=EricssonVoz,
-            buffer_manager=buffer_manager,
-            n_workers=1
+            parser=EricssonVoz, buffer_manager=buffer_manager, n_workers=1
         )
-        
+
         with buffer_manager.open():
             data = buffer_manager.get_memoryview()
-            
+
             # Extract TLV structure - this should be fast even with large data
             import time
+
             start_time = time.perf_counter()
-            
+
             tlvs = decoder.extract_tlv_structure(data)
-            
+
             end_time = time.perf_counter()
             extract_time = end_time - start_time
-            
+
             # Should be very fast for structure extraction (under 0.1 seconds)
             assert extract_time < 0.1
-            
+
             # Should have found at least one TLV
-            assert len(tlvs) >= 1
\ No newline at end of file
+            assert len(tlvs) >= 1
+
+
+class TestParityWithOptimized:
+    """The two-phase decoder gives the same records as BerDecoderOptimized."""
+
+    @staticmethod
+    def write(tmp_path, data):
+        file_path = tmp_path / "parity.gz"
+        with gzip.open(file_path, "wb") as f:
+            f.write(data)
+        return file_path
+
+    @staticmethod
+    def decode_both(file_path, parser, fieldnames=None, **options):
+        optimized = BerDecoderOptimized(
+            parser, MemoryBufferManager(file_path), fieldnames
+        ).process(show_progress=False)
+        two_phase = BerDecoderTwoPhase(
+            parser, MemoryBufferManager(file_path), fieldnames, **options
+        ).process(show_progress=False)
+        return optimized, two_phase
+
+    @pytest.mark.parametrize("n_workers", [1, 2])
+    def test_voz_records(self, tmp_path, n_workers):
+        file_path = self.write(tmp_path, b"".join(voz_record(i, i) for i in range(50)))
+
+        optimized, two_phase = self.decode_both(
+            file_path, EricssonVoz, n_workers=n_workers, records_per_task=7
+        )
+
+        assert len(two_phase) == 50
+        assert two_phase == optimized
+
+    @pytest.mark.parametrize("n_workers", [1, 2])
+    def test_nested_sbc_records(self, tmp_path, n_workers):
+        file_path = self.write(tmp_path, b"".join(sbc_record(i) for i in range(30)))
+
+        optimized, two_phase = self.decode_both(
+            file_path,
+            sbc.SbcTLV,
+            sbc.fieldnames(),
+            n_workers=n_workers,
+            records_per_task=4,
+        )
+
+        assert len(two_phase) == 30
+        assert two_phase == optimized
+        assert two_phase[3]["nodeAddress.iPAddress.iPBinV4Address"] == "0a000003"
+
+    @pytest.mark.parametrize("n_workers", [1, 2])
+    def test_trailing_null_children(self, tmp_path, n_workers):
+        # Each transit ends with a NULL field, the next record is a root again
+        file_path = self.write(
+            tmp_path,
+            b"".join(voz_null_record(i) + voz_record(i, i) for i in range(10)),
+        )
+
+        optimized, two_phase = self.decode_both(
+            file_path, EricssonVoz, n_workers=n_workers, records_per_task=3
+        )
+
+        assert len(two_phase) == 20
+        assert two_phase == optimized
+
+    def test_records_are_yielded_range_by_range(self, tmp_path, monkeypatch):
+        file_path = self.write(tmp_path, b"".join(voz_record(i, i) for i in range(20)))
+        interpreted = []
+        original = ber_two_phase.interpret_records
+
+        def interpret_records(parser, tlvs, *args):
+            interpreted.append(len(tlvs))
+            return original(parser, tlvs, *args)
+
+        monkeypatch.setattr(ber_two_phase, "interpret_records", interpret_records)
+        decoder = BerDecoderTwoPhase(
+            EricssonVoz, MemoryBufferManager(file_path), n_workers=1, records_per_task=5
+        )
+        records = decoder.stream(show_progress=False)
+
+        assert next(records)["callIdentificationNumber"] == 0
+        assert len(interpreted) == 1
+        assert len(list(records)) == 19
+        assert len(interpreted) == 4
+
+    def test_unknown_tags(self, tmp_path):
+        # An unknown nested tag is skipped, an unknown record ends the file
+        call_module = tlv(0x81, b"\x00\x00\x07") + context_tlv(62, b"\x01")
+        unknown_field = tlv(0xA0, tlv(0xA0, call_module))
+        unknown_record = tlv(0xBE, tlv(0x81, b"\x01"))
+        file_path = self.write(
+            tmp_path,
+            voz_record(1, 1)
+            + unknown_field
+            + voz_record(2, 2)
+            + unknown_record
+            + voz_record(3, 3),
+        )
+
+        optimized, two_phase = self.decode_both(
+            file_path, EricssonVoz, n_workers=2, records_per_task=1
+        )
+
+        assert len(two_phase) == 3
+        assert two_phase == optimized
+
+    def test_get_schema_for_nested_tlv(self, tmp_path):
+        data = memoryview(sbc_record(1))
+        decoder = BerDecoderTwoPhase(sbc.SbcTLV, None, sbc.fieldnames())
+        tlvs = decoder.extract_tlv_structure(data)
+        # IMSRecord > nodeAddress > iPAddress > iPBinV4Address
+        leaf = next(i for i, t in enumerate(tlvs) if t.depth == 3 and t.tag_number == 0)
+
+        schema = decoder.get_schema_for_tlv(tlvs, leaf, data)
+
+        assert schema is sbc.record_table()[63].table[4].table[0].table
+        assert decoder.get_schema_for_tlv(tlvs, 0, data) is None
+
+    def test_malformed_tlv_is_an_error_when_decoded(self, tmp_path):
+        truncated = voz_record(2, 2)[:-1]
+        data = memoryview(voz_record(1, 1) + truncated)
+        tlvs = BerDecoderTwoPhase(EricssonVoz, None).extract_tlv_structure(data)
+
+        assert [t.depth for t in tlvs] == [0, 1, 2, 2, 0]
+        assert tlvs[-1].value_length == MALFORMED
+
+        file_path = self.write(tmp_path, voz_record(1, 1) + truncated)
+        for decoder in (BerDecoderOptimized, BerDecoderTwoPhase):
+            with pytest.raises(ValueError):
+                decoder(EricssonVoz, MemoryBufferManager(file_path)).process(
+                    show_progress=False
+                )
+
+    def test_malformed_children_of_skipped_tlv(self, tmp_path):
+        # The children of an unknown constructed TLV aren't read by either decoder
+        unknown = context_tlv(62, b"\x81\x7f\x00", True)
+        record = tlv(0xA0, tlv(0xA0, tlv(0x81, b"\x00\x00\x07") + unknown))
+        file_path = self.write(tmp_path, record + voz_record(2, 2))
+
+        optimized, two_phase = self.decode_both(file_path, EricssonVoz, n_workers=1)
+
+        assert len(two_phase) == 2
+        assert two_phase == optimized
+
+    @staticmethod
+    def outcome(decoder, parser, file_path, fieldnames=None, **options):
+        """Records of the file, or None if the decoder raises"""
+        try:
+            return decoder(
+                parser, MemoryBufferManager(file_path), fieldnames, **options
+            ).process(show_progress=False)
+        except Exception:
+            return None
+
+    @pytest.mark.parametrize("seed", range(12))
+    def test_corrupted_records(self, tmp_path, seed):
+        # Two random bytes changed: children overflowing their parent, unknown
+        # tags, truncated TLVs...
+        rng = random.Random(seed)
+        data = bytearray(b"".join(voz_record(i, i) for i in range(30)))
+        for _ in range(2):
+            data[rng.randrange(len(data))] = rng.randrange(256)
+        file_path = self.write(tmp_path, bytes(data))
+
+        optimized = self.outcome(BerDecoderOptimized, EricssonVoz, file_path)
+
+        for n_workers in (1, 2):
+            two_phase = self.outcome(
+                BerDecoderTwoPhase,
+                EricssonVoz,
+                file_path,
+                n_workers=n_workers,
+                records_per_task=4,
+            )
+            assert two_phase == optimized
+
+    def test_child_overflowing_its_parent(self, tmp_path):
+        # The last field of the first record claims a byte of the second one
+        first = bytearray(voz_record(1, 1))
+        first[-2] += 1
+        file_path = self.write(tmp_path, bytes(first) + voz_record(2, 2))
+
+        optimized, two_phase = self.decode_both(
+            file_path, EricssonVoz, n_workers=2, records_per_task=1
+        )
+
+        assert len(two_phase) == 2
+        assert two_phase == optimized
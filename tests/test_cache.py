@@ -0,0 +1,134 @@
+"""Tests for the decompressed input cache."""
+
+import gzip
+import os
+
+import pytest
+
+import teleparser.buffer
+from teleparser.buffer import (
+    BufferManager,
+    DecompressedCache,
+    MappedBufferManager,
+    MemoryBufferManager,
+    memory_buffer,
+)
+from teleparser.decoders.ericsson import (
+    ericsson_voz_decoder,
+    ericsson_voz_decoder_optimized,
+)
+from teleparser.main import CDRFileManager
+
+from cdr_samples import voz_record
+
+
+@pytest.fixture
+def gz_file(tmp_path):
+    file_path = tmp_path / "voz_sample.gz"
+    with gzip.open(file_path, "wb") as f:
+        f.write(b"".join(voz_record(i, i) for i in range(10)))
+    return file_path
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return DecompressedCache(tmp_path / "cache")
+
+
+@pytest.fixture
+def decompressions(monkeypatch):
+    calls = []
+    decompress_to = teleparser.buffer.decompress_to
+
+    def counting_decompress_to(file_path, raw_file, *args):
+        calls.append(file_path)
+        return decompress_to(file_path, raw_file, *args)
+
+    monkeypatch.setattr(teleparser.buffer, "decompress_to", counting_decompress_to)
+    return calls
+
+
+class TestDecompressedCache:
+    def test_decompresses_once(self, gz_file, cache, decompressions):
+        first = cache.get(gz_file)
+        second = cache.get(gz_file)
+
+        assert first == second
+        assert len(decompressions) == 1
+        assert first.read_bytes() == gzip.decompress(gz_file.read_bytes())
+
+    def test_changed_input_replaces_entry(self, gz_file, cache, decompressions):
+        first = cache.get(gz_file)
+        with gzip.open(gz_file, "wb") as f:
+            f.write(voz_record(1, 1))
+        stat = gz_file.stat()
+        os.utime(gz_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        second = cache.get(gz_file)
+
+        assert second != first
+        assert len(decompressions) == 2
+        assert second.read_bytes() == voz_record(1, 1)
+        assert list(cache.cache_dir.iterdir()) == [second]
+
+
+class TestCachedBuffers:
+    def test_memory_buffer_maps_cached_copy(self, gz_file, cache):
+        assert isinstance(memory_buffer(BufferManager(gz_file)), MemoryBufferManager)
+
+        buffer_manager = memory_buffer(BufferManager(gz_file, cache))
+
+        assert isinstance(buffer_manager, MappedBufferManager)
+        assert buffer_manager.file_path == cache.path(gz_file)
+
+    def test_decoders_read_cached_copy(self, gz_file, cache):
+        expected = ericsson_voz_decoder_optimized(BufferManager(gz_file)).process(
+            show_progress=False
+        )
+
+        optimized = ericsson_voz_decoder_optimized(BufferManager(gz_file, cache))
+        legacy = ericsson_voz_decoder(BufferManager(gz_file, cache))
+
+        assert optimized.process(show_progress=False) == expected
+        assert legacy.process(show_progress=False) == expected
+
+    def test_decode_file_fills_cache(self, gz_file, tmp_path, decompressions):
+        cache_dir = tmp_path / "cache"
+        for _ in range(2):
+            result = CDRFileManager.decode_file(
+                gz_file,
+                ericsson_voz_decoder_optimized,
+                None,
+                show_progress=False,
+                cache_dir=cache_dir,
+            )
+            assert result["records"] == 10
+
+        assert len(decompressions) == 1
+        assert len(list(cache_dir.glob("voz_sample-*.raw"))) == 1
+
+    def test_split_file_uses_cached_copy(self, gz_file, tmp_path):
+        pytest.importorskip("pyarrow")
+        cache_dir = tmp_path / "cache"
+        entries = []
+        for output in ("output_1", "output_2"):
+            manager = CDRFileManager(
+                gz_file,
+                tmp_path / output,
+                "ericsson_voz_optimized",
+                reprocess=False,
+                chunk_size=4 * len(voz_record(0, 0)),
+                cache_dir=cache_dir,
+            )
+            results = manager.decode_files_parallel(workers=2)
+            manager.cleanup()
+            assert results[0]["records"] == 10
+            assert results[0]["chunks"] == 3
+            # The cached copy is kept after the run
+            (raw_file,) = cache_dir.glob("*.raw")
+            entries.append(
+                (raw_file, raw_file.stat().st_ino, raw_file.stat().st_mtime_ns)
+            )
+
+        # The second run reused the same entry, no new decompression
+        assert entries[0] == entries[1]
@@ -0,0 +1,288 @@
+"""Tests for the intra-file parallelism: record boundaries, ranges and part files."""
+
+import gzip
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from teleparser.buffer import MappedBufferManager, decompress_to
+from teleparser.chunks import pool_workers, split_ranges
+from teleparser.decoders.ericsson import (
+    ericsson_volte_decoder_optimized,
+    ericsson_voz_decoder_optimized,
+)
+from teleparser.main import CDRFileManager
+
+from cdr_samples import tlv, volte_message, voz_record
+
+N_RECORDS = 300
+
+
+@pytest.fixture
+def raw_file(tmp_path):
+    file_path = tmp_path / "voz_sample.raw"
+    file_path.write_bytes(b"".join(voz_record(i, i) for i in range(10)))
+    return file_path
+
+
+@pytest.fixture
+def input_dir(tmp_path):
+    input_dir = tmp_path / "input"
+    input_dir.mkdir()
+    with gzip.open(input_dir / "voz_large.gz", "wb") as f:
+        f.write(b"".join(voz_record(i, i) for i in range(N_RECORDS)))
+    return input_dir
+
+
+class TestSplitRanges:
+    def test_ranges_are_cut_at_boundaries(self):
+        offsets = [0, 10, 20, 30, 40, 45]
+        assert split_ranges(offsets, 20) == [(0, 20), (20, 40), (40, 45)]
+
+    def test_records_larger_than_chunk(self):
+        offsets = [0, 100, 150]
+        assert split_ranges(offsets, 10) == [(0, 100), (100, 150)]
+
+    def test_single_range(self):
+        assert split_ranges([0, 10, 20], 1000) == [(0, 20)]
+
+    def test_no_records(self):
+        assert split_ranges([0], 10) == []
+
+
+class TestPoolWorkers:
+    def test_no_nested_pool_in_workers(self):
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            assert executor.submit(pool_workers).result() == 1
+        assert pool_workers() == (os.cpu_count() or 1)
+
+    def test_limit(self, monkeypatch):
+        monkeypatch.setattr(os, "cpu_count", lambda: 8)
+
+        assert pool_workers(1) == 1
+        assert pool_workers(4) == 4
+        assert pool_workers(16) == 8
+        assert pool_workers(None) == 8
+
+
+class TestRecordBoundaries:
+    def test_offsets_match_record_sizes(self, raw_file):
+        record_size = len(voz_record(0, 0))
+        decoder = ericsson_voz_decoder_optimized(MappedBufferManager(raw_file))
+
+        offsets = decoder.record_boundaries()
+
+        assert list(offsets) == [i * record_size for i in range(11)]
+
+    def test_zero_length_header_belongs_to_next_record(self, tmp_path):
+        file_path = tmp_path / "padded.raw"
+        file_path.write_bytes(voz_record(1, 1) + b"\x00\x00" + voz_record(2, 2))
+        record_size = len(voz_record(0, 0))
+        decoder = ericsson_voz_decoder_optimized(MappedBufferManager(file_path))
+
+        assert list(decoder.record_boundaries()) == [
+            0,
+            record_size,
+            2 * record_size + 2,
+        ]
+
+    def test_truncated_record(self, tmp_path):
+        file_path = tmp_path / "truncated.raw"
+        file_path.write_bytes(voz_record(1, 1) + tlv(0xA0, b"\x00" * 10)[:-3])
+        decoder = ericsson_voz_decoder_optimized(MappedBufferManager(file_path))
+
+        with pytest.raises(ValueError, match="Unexpected end of data"):
+            decoder.record_boundaries()
+
+
+class TestVolteBoundaries:
+    # A 22 byte prefix and header with an invalid version, skipped by `blocks`
+    INVALID = b"\x00\x00" + bytes([2]) + b"\x00" * 19
+
+    def test_offsets_follow_the_block_walk(self, tmp_path):
+        messages = [volte_message(i) for i in range(4)]
+        file_path = tmp_path / "volte.raw"
+        file_path.write_bytes(messages[0] + self.INVALID + b"".join(messages[1:]))
+        decoder = ericsson_volte_decoder_optimized(MappedBufferManager(file_path))
+
+        offsets = list(decoder.record_boundaries())
+
+        sizes = [len(messages[0]), len(self.INVALID)] + [len(m) for m in messages[1:]]
+        assert offsets == [sum(sizes[:i]) for i in range(len(sizes) + 1)]
+
+    def test_ranges_decode_the_same_blocks(self, tmp_path):
+        file_path = tmp_path / "volte.raw"
+        file_path.write_bytes(
+            b"".join(volte_message(i) + self.INVALID * (i % 2) for i in range(20))
+        )
+        whole = ericsson_volte_decoder_optimized(MappedBufferManager(file_path))
+        expected = whole.process(show_progress=False)
+
+        records = []
+        for start, stop in split_ranges(whole.record_boundaries(), 300):
+            buffer_manager = MappedBufferManager(file_path, start, stop)
+            records += ericsson_volte_decoder_optimized(buffer_manager).process(
+                show_progress=False
+            )
+            buffer_manager.close()
+
+        assert records == expected
+        assert [r["Accounting-Record-Number"] for r in records] == list(range(20))
+
+
+class TestMappedBufferManager:
+    def test_range_decodes_only_its_records(self, raw_file):
+        record_size = len(voz_record(0, 0))
+        buffer_manager = MappedBufferManager(raw_file, 2 * record_size, 5 * record_size)
+        decoder = ericsson_voz_decoder_optimized(buffer_manager)
+
+        records = decoder.process(show_progress=False)
+        buffer_manager.close()
+
+        assert [r["recordSequenceNumber"] for r in records] == [2, 3, 4]
+
+    def test_decompress_to(self, tmp_path):
+        gz_file = tmp_path / "sample.gz"
+        with gzip.open(gz_file, "wb") as f:
+            f.write(b"abc" * 1000)
+
+        size = decompress_to(gz_file, tmp_path / "sample.raw")
+
+        assert size == 3000
+        assert (tmp_path / "sample.raw").read_bytes() == b"abc" * 1000
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["sample.gz", "sample.raw"]
+
+
+class TestChunkedDecoding:
+    def test_single_file_is_split_in_ordered_parts(self, input_dir, tmp_path):
+        pq = pytest.importorskip("pyarrow.parquet")
+        output = tmp_path / "output"
+        record_size = len(voz_record(0, 0))
+        manager = CDRFileManager(
+            input_dir,
+            output,
+            "ericsson_voz_optimized",
+            reprocess=False,
+            chunk_size=100 * record_size,
+        )
+
+        results = manager.decode_files_parallel(workers=2)
+        manager.cleanup()
+
+        assert len(results) == 1
+        assert results[0]["status"] == "success"
+        assert results[0]["records"] == N_RECORDS
+        assert results[0]["chunks"] == 3
+
+        parts_dir = output / "voz_large.parquet"
+        assert sorted(p.name for p in parts_dir.iterdir()) == [
+            "part-00000.parquet",
+            "part-00001.parquet",
+            "part-00002.parquet",
+        ]
+        table = pq.read_table(parts_dir)
+        call_ids = [
+            int(v) for v in table.column("callIdentificationNumber").to_pylist()
+        ]
+        assert call_ids == list(range(N_RECORDS))
+        assert not (output / "temp_chunks").exists()
+
+        # Split outputs are recognized as already processed
+        del manager.gz_files
+        assert manager.gz_files == []
+
+    def test_small_files_are_not_split(self, input_dir, tmp_path):
+        manager = CDRFileManager(
+            input_dir, tmp_path / "output", "ericsson_voz_optimized", reprocess=False
+        )
+        assert manager.splittable
+        assert not manager.should_split(input_dir / "voz_large.gz")
+
+        manager.chunk_size = 0
+        assert not manager.splittable
+
+    def test_unsplittable_decoder(self, input_dir, tmp_path):
+        manager = CDRFileManager(
+            input_dir, tmp_path / "output", "ericsson_voz", reprocess=False
+        )
+        assert not manager.splittable
+
+    def test_corrupted_file_leaves_no_output(self, tmp_path):
+        input_dir = tmp_path / "input"
+        input_dir.mkdir()
+        with gzip.open(input_dir / "voz_bad.gz", "wb") as f:
+            f.write(b"".join(voz_record(i, i) for i in range(N_RECORDS)))
+            f.write(tlv(0xA0, b"\x00" * 10)[:-3])
+        output = tmp_path / "output"
+        manager = CDRFileManager(
+            input_dir, output, "ericsson_voz_optimized", reprocess=False, chunk_size=256
+        )
+
+        results = manager.decode_files_parallel(workers=2)
+        manager.cleanup()
+
+        assert results[0]["status"] == "failed"
+        assert [p.name for p in output.iterdir() if p.name != "logs"] == []
+
+    @pytest.mark.parametrize("handoff", [False, True])
+    def test_undecodable_record_stops_the_file(self, tmp_path, handoff):
+        pytest.importorskip("pyarrow")
+        input_dir = tmp_path / "input"
+        input_dir.mkdir()
+        # Record 100 has an unknown root tag, the file is decoded up to it
+        records = [voz_record(i, i) for i in range(N_RECORDS)]
+        records[100] = tlv(0xA5, records[100][2:])
+        with gzip.open(input_dir / "voz_bad.gz", "wb") as f:
+            f.write(b"".join(records))
+        output = None if handoff else tmp_path / "output"
+        sequential = CDRFileManager(
+            input_dir, output, "ericsson_voz_optimized", reprocess=False
+        )
+        expected = sequential.decode_files_sequential()[0]
+        if output is not None:
+            (output / "voz_bad.parquet").unlink()
+        manager = CDRFileManager(
+            input_dir, output, "ericsson_voz_optimized", reprocess=False, chunk_size=256
+        )
+
+        results = manager.decode_files_parallel(workers=2)
+        manager.cleanup()
+
+        assert expected["records"] == 100
+        assert results[0]["status"] == "success"
+        assert results[0]["records"] == 100
+        if handoff:
+            table = results[0]["table"]
+        else:
+            import pyarrow.parquet as pq
+
+            table = pq.read_table(output / "voz_bad.parquet")
+        call_ids = [
+            int(v) for v in table.column("callIdentificationNumber").to_pylist()
+        ]
+        assert call_ids == list(range(100))
+
+    def test_volte_file_is_split(self, tmp_path):
+        pq = pytest.importorskip("pyarrow.parquet")
+        input_dir = tmp_path / "input"
+        input_dir.mkdir()
+        with gzip.open(input_dir / "volte_large.gz", "wb") as f:
+            f.write(b"".join(volte_message(i) for i in range(N_RECORDS)))
+        output = tmp_path / "output"
+        manager = CDRFileManager(
+            input_dir, output, "ericsson_volte", reprocess=False, chunk_size=4096
+        )
+
+        results = manager.decode_files_parallel(workers=2)
+        manager.cleanup()
+
+        assert results[0]["status"] == "success"
+        assert results[0]["records"] == N_RECORDS
+        assert results[0]["chunks"] > 1
+        table = pq.read_table(output / "volte_large.parquet")
+        numbers = table.column("Accounting-Record-Number").to_pylist()
+        assert [int(v) for v in numbers] == list(range(N_RECORDS))
+        # The vendor enrichment still runs on every chunk
+        assert set(table.column("Type").to_pylist()) == {"IMS"}
+        assert set(table.column("Accounting-Record-Type").to_pylist()) == {"START"}
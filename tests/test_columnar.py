@@ -0,0 +1,157 @@
+"""Tests for the columnar record builder and the decoders columnar path."""
+
+import gzip
+
+import pytest
+
+from teleparser.buffer import MemoryBufferManager
+from teleparser.columnar import ColumnarBuilder, arrow_schema
+from teleparser.decoders.ericsson import ericsson_voz_decoder_optimized
+from teleparser.decoders.ericsson.volte_final import EricssonVolteFinal
+from teleparser.main import CDRFileManager
+
+from cdr_samples import avp, voz_record
+
+
+@pytest.fixture
+def voz_file(tmp_path):
+    file_path = tmp_path / "voz_sample.gz"
+    with gzip.open(file_path, "wb") as f:
+        f.write(voz_record(5, 7) + voz_record(6, 8) + voz_record(7, 9))
+    return file_path
+
+
+class TestColumnarBuilder:
+    def test_rows_are_padded_with_nulls(self):
+        builder = ColumnarBuilder(["a", "b", "c"])
+        builder.add("a", 1)
+        builder.end_row()
+        builder.add("b", "x")
+        builder.end_row()
+        builder.end_row()
+
+        assert len(builder) == 3
+        assert builder.column(0) == [1, None, None]
+        assert builder.column(1) == [None, "x", None]
+        assert builder.column(2) is None
+        assert list(builder.rows()) == [{"a": 1}, {"b": "x"}, {}]
+
+    def test_repeated_field_keeps_last_value(self):
+        builder = ColumnarBuilder(["a"])
+        builder.add("a", 1)
+        builder.add("a", 2)
+        builder.end_row()
+
+        assert builder.column(0) == [2]
+
+    def test_unknown_fields_are_dropped(self):
+        builder = ColumnarBuilder(["a"])
+        builder.add_record({"a": 1, "z": 2})
+
+        assert builder.unknown == {"z"}
+        assert list(builder.rows()) == [{"a": 1}]
+
+    def test_discard_row(self):
+        builder = ColumnarBuilder(["a", "b"])
+        builder.add_record({"a": 1})
+        builder.add("a", 2)
+        builder.add("b", 3)
+        builder.discard_row()
+
+        assert len(builder) == 1
+        assert list(builder.rows()) == [{"a": 1}]
+
+    def test_extra_columns_are_not_output(self):
+        pytest.importorskip("pyarrow")
+        builder = ColumnarBuilder(["a"], extra=["hidden"])
+        builder.add_record({"a": 1, "hidden": 2})
+
+        assert not builder.unknown
+        assert builder.get_column("hidden") == [2]
+        assert list(builder.rows()) == [{"a": 1}]
+        assert builder.to_table().column_names == ["a"]
+
+    def test_set_column(self):
+        builder = ColumnarBuilder(["a", "b"])
+        builder.extend([{"a": 1}, {"a": 2}])
+
+        builder.set_column("b", ["x", None])
+        builder.set_column("a", None)
+
+        assert list(builder.rows()) == [{"b": "x"}, {}]
+        with pytest.raises(ValueError):
+            builder.set_column("a", [1])
+
+    def test_to_table(self):
+        pa = pytest.importorskip("pyarrow")
+        builder = ColumnarBuilder(["a", "b"])
+        builder.extend([{"a": 1}, {"a": True}])
+
+        table = builder.to_table()
+
+        assert table.column_names == ["a", "b"]
+        assert table.schema.field("a").type == pa.dictionary(pa.int32(), pa.string())
+        assert table.column("a").to_pylist() == ["1", "True"]
+        assert table.column("b").to_pylist() == [None, None]
+
+    def test_integer_fields(self, caplog):
+        pa = pytest.importorskip("pyarrow")
+        builder = ColumnarBuilder(["a", "b"])
+        builder.extend([{"a": 1, "b": 1}, {"a": "01", "b": "01"}, {}])
+
+        table = builder.to_table(arrow_schema(["a", "b"], integer_fields=["a"]))
+
+        assert table.schema.field("a").type == pa.int64()
+        # Values which aren't integers are nulls, and logged
+        assert table.column("a").to_pylist() == [1, None, None]
+        assert table.column("b").to_pylist() == ["1", "01", None]
+        assert [r.getMessage() for r in caplog.records] == [
+            "1 values of the integer column a written as nulls, such as '01'"
+        ]
+
+
+class TestDecoderColumns:
+    def test_ber_columns_match_records(self, voz_file):
+        records = ericsson_voz_decoder_optimized(MemoryBufferManager(voz_file)).process(
+            show_progress=False
+        )
+
+        decoder = ericsson_voz_decoder_optimized(MemoryBufferManager(voz_file))
+        builder = ColumnarBuilder(sorted(decoder.FIELDNAMES))
+        assert list(decoder.parse_columns(builder)) == [1, 2, 3]
+
+        assert list(builder.rows()) == records
+        assert records[1]["callIdentificationNumber"] == 6
+
+    def test_volte_block_into_matches_parse_block(self):
+        block = (
+            avp(263, b"host.example;1;2")
+            + avp(480, (2).to_bytes(4, "big"))
+            + avp(485, (7).to_bytes(4, "big"))
+        )
+        row = {}
+        EricssonVolteFinal.parse_block_into(block, row.__setitem__)
+
+        assert row == EricssonVolteFinal.parse_block(block)
+        assert row["Accounting-Record-Number"] == 7
+
+    def test_decode_file_uses_columns(self, voz_file, tmp_path):
+        pq = pytest.importorskip("pyarrow.parquet")
+        output = tmp_path / "output"
+        output.mkdir()
+
+        result = CDRFileManager.decode_file(
+            voz_file,
+            ericsson_voz_decoder_optimized,
+            output,
+            show_progress=False,
+            batch_size=2,
+        )
+
+        assert result["status"] == "success"
+        assert result["records"] == 3
+        parquet_file = pq.ParquetFile(output / "voz_sample.parquet")
+        assert parquet_file.metadata.num_row_groups == 2
+        table = parquet_file.read()
+        assert table.column("recordSequenceNumber").to_pylist() == ["7", "8", "9"]
+        assert table.column("CallModule").to_pylist() == ["transit"] * 3
@@ -0,0 +1,143 @@
+"""Tests for the function-based decoders of the Ericsson Voz datatypes."""
+
+import gzip
+import inspect
+import random
+
+import pytest
+
+from teleparser.decoders.ericsson import datatypes as dt
+from teleparser.decoders.ericsson import ericsson_voz_decoder_optimized, modules
+from teleparser.main import CDRFileManager
+
+from cdr_samples import tlv
+
+
+def schema_datatypes():
+    """Primitive datatypes used by the module dicts"""
+    datatypes = set()
+    for schema in vars(modules).values():
+        if not isinstance(schema, dict) or not all(isinstance(k, int) for k in schema):
+            continue
+        datatypes.update(
+            mapping["type"]
+            for mapping in schema.values()
+            if not isinstance(mapping["type"], dict)
+        )
+    return sorted(datatypes, key=lambda datatype: datatype.__name__)
+
+
+def outcome(decode, octets):
+    try:
+        return decode(octets)
+    except Exception as e:
+        return type(e)
+
+
+def random_octets(rng):
+    octets = [0x00, 0x01, 0x05, 0x09, 0x12, 0x23, 0x59, 0x91, 0xF1, 0xFF]
+    for size in list(range(10)) * 10 + [16, 20]:
+        yield bytes(rng.choice(octets + [rng.randrange(256)]) for _ in range(size))
+
+
+class TestDecoderFor:
+    @pytest.mark.parametrize("datatype", schema_datatypes(), ids=lambda d: d.__name__)
+    def test_same_value_as_the_class(self, datatype):
+        decode = dt.decoder_for(datatype)
+        rng = random.Random(datatype.__name__)
+
+        for octets in random_octets(rng):
+            assert outcome(decode, octets) == outcome(
+                lambda o: datatype(o).value, octets
+            ), octets.hex()
+
+    def test_hot_datatypes_have_functions(self):
+        for datatype in (dt.AddressString, dt.Time, dt.Date, dt.IMSI, dt.Bool):
+            decode = dt.decoder_for(datatype)
+            assert inspect.isfunction(decode)
+            assert decode.__qualname__ != "decoder_for.<locals>.decode"
+
+    def test_families(self):
+        assert dt.decoder_for(dt.CallIDNumber) is dt.decoder_for(dt.FaultCode)
+        assert dt.decoder_for(dt.ChargedParty)(b"\x00") == dt.ChargedParty.VALUES[0]
+
+    def test_register(self, monkeypatch):
+        monkeypatch.setitem(dt.DECODERS, dt.IMEI, bytes.hex)
+
+        assert dt.decoder_for(dt.IMEI)(b"\x01\x02") == "0102"
+
+    def test_fallback_builds_the_datatype(self):
+        decode = dt.decoder_for(dt.ErrorRatio)
+
+        assert decode(b"\x05\x01") == dt.ErrorRatio(b"\x05\x01").value
+
+    def test_compiled_schema_uses_the_functions(self):
+        transit = modules.CALL_DATA_RECORD[0].table[0].table
+
+        assert transit[9].decode is dt.decoder_for(dt.Time)
+
+
+class TestTBCD:
+    def test_digits_low_nibble_first(self):
+        assert dt.tbcd_digits(b"\x21\x43\xf5") == "12345F"
+        assert dt.tbcd_digits(b"\xa1") == "1A"
+        assert dt.TBCDString(b"\x21\xcb").digits == ["1", "2", "B", "C"]
+
+    def test_digits_match_the_nibbles(self):
+        hex_digits = "0123456789ABCDEF"
+        for octet in range(256):
+            digits = hex_digits[octet & 0x0F] + hex_digits[octet >> 4]
+            assert dt.tbcd_digits(bytes([octet])) == digits
+
+
+@pytest.fixture
+def imsi_cache():
+    dt.configure_imsi_cache()
+    yield
+    dt.configure_imsi_cache()
+
+
+class TestIMSICache:
+    IMSI = bytes.fromhex("27f00312345678f9")
+
+    def test_repeated_imsis_are_hits(self, imsi_cache):
+        decode = dt.decoder_for(dt.IMSI)
+
+        values = [decode(self.IMSI) for _ in range(3)]
+
+        assert values[0] == dt.IMSI(self.IMSI).value
+        assert values[0] is values[2]
+        assert dt.imsi_cache_info()[:2] == (2, 1)
+
+    def test_size_zero_disables_the_cache(self, imsi_cache):
+        dt.configure_imsi_cache(0)
+        decode = dt.decoder_for(dt.IMSI)
+
+        assert decode(self.IMSI) == decode(self.IMSI) == dt.IMSI(self.IMSI).value
+        assert dt.imsi_cache_info()[:2] == (0, 2)
+
+    def test_cache_is_bounded(self, imsi_cache):
+        dt.configure_imsi_cache(2)
+        decode = dt.decoder_for(dt.IMSI)
+
+        for msin in range(5):
+            decode(self.IMSI[:-1] + bytes([msin]))
+
+        assert dt.imsi_cache_info().currsize == 2
+
+    def test_decode_file_reports_hits_and_misses(self, tmp_path, imsi_cache):
+        imsis = [self.IMSI, self.IMSI[:-1] + b"\x01", self.IMSI] * 2
+        data = b"".join(
+            tlv(0xA0, tlv(0xA0, tlv(0x81, bytes([i])) + tlv(0x86, imsi)))
+            for i, imsi in enumerate(imsis)
+        )
+        file_path = tmp_path / "voz_imsi.gz"
+        with gzip.open(file_path, "wb") as f:
+            f.write(data)
+
+        result = CDRFileManager.decode_file(
+            file_path, ericsson_voz_decoder_optimized, show_progress=False
+        )
+
+        assert result["records"] == 6
+        assert result["imsi_cache"] == (4, 2)
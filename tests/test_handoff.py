@@ -0,0 +1,118 @@
+"""Tests for the Arrow IPC handoff of in-memory results between processes."""
+
+import gzip
+
+import pytest
+
+from teleparser.decoders.ericsson import ericsson_voz_decoder_optimized
+from teleparser.main import CDRFileManager
+from teleparser.writer import read_ipc_table
+
+from cdr_samples import voz_record
+
+pa = pytest.importorskip("pyarrow")
+
+
+def write_voz(file_path, start, stop):
+    with gzip.open(file_path, "wb") as f:
+        f.write(b"".join(voz_record(i, i) for i in range(start, stop)))
+
+
+@pytest.fixture
+def input_dir(tmp_path):
+    input_dir = tmp_path / "input"
+    input_dir.mkdir()
+    write_voz(input_dir / "voz_a.gz", 0, 50)
+    write_voz(input_dir / "voz_b.gz", 50, 80)
+    return input_dir
+
+
+def call_ids(table):
+    return [int(v) for v in table.column("callIdentificationNumber").to_pylist()]
+
+
+class TestHandoff:
+    def test_decode_file_writes_ipc_stream(self, input_dir, tmp_path):
+        handoff_dir = tmp_path / "handoff"
+        handoff_dir.mkdir()
+
+        result = CDRFileManager.decode_file(
+            input_dir / "voz_a.gz",
+            ericsson_voz_decoder_optimized,
+            None,
+            show_progress=False,
+            batch_size=20,
+            handoff_dir=handoff_dir,
+        )
+
+        assert result["blocks"] is None
+        assert result["ipc_file"] == handoff_dir / "voz_a.arrow"
+        table = read_ipc_table(result["ipc_file"])
+        assert table.num_rows == 50
+        assert call_ids(table) == list(range(50))
+
+    def test_without_handoff_dir_blocks_are_returned(self, input_dir):
+        result = CDRFileManager.decode_file(
+            input_dir / "voz_a.gz",
+            ericsson_voz_decoder_optimized,
+            None,
+            show_progress=False,
+        )
+
+        assert "ipc_file" not in result
+        assert len(result["blocks"]) == 50
+
+    def test_parallel_results_are_attached_as_tables(self, input_dir):
+        manager = CDRFileManager(
+            input_dir, None, "ericsson_voz_optimized", reprocess=False, chunk_size=0
+        )
+
+        results = manager.decode_files_parallel(workers=2)
+        handoff_dir = manager.handoff_dir
+
+        by_file = {r["file"].name: r for r in results}
+        assert call_ids(by_file["voz_a.gz"]["table"]) == list(range(50))
+        assert call_ids(by_file["voz_b.gz"]["table"]) == list(range(50, 80))
+        assert all(r["blocks"] is None for r in results)
+        # The IPC files are unlinked as soon as they are mapped
+        assert list(handoff_dir.iterdir()) == []
+
+        manager.cleanup()
+        assert not handoff_dir.exists()
+        # The mapped tables outlive the files
+        assert by_file["voz_b.gz"]["table"].num_rows == 30
+
+    def test_split_file_chunks_are_concatenated(self, input_dir):
+        record_size = len(voz_record(0, 0))
+        manager = CDRFileManager(
+            input_dir,
+            None,
+            "ericsson_voz_optimized",
+            reprocess=False,
+            chunk_size=10 * record_size,
+        )
+
+        results = manager.decode_files_parallel(workers=2)
+        manager.cleanup()
+
+        by_file = {r["file"].name: r for r in results}
+        assert by_file["voz_a.gz"]["chunks"] == 5
+        assert by_file["voz_a.gz"]["records"] == 50
+        assert call_ids(by_file["voz_a.gz"]["table"]) == list(range(50))
+        assert call_ids(by_file["voz_b.gz"]["table"]) == list(range(50, 80))
+
+    def test_sequential_results_are_attached_as_tables(self, input_dir):
+        manager = CDRFileManager(
+            input_dir, None, "ericsson_voz_optimized", reprocess=False, chunk_size=0
+        )
+
+        results = manager.decode_files_sequential()
+        handoff_dir = manager.handoff_dir
+        manager.cleanup()
+
+        # Same shape as the results of decode_files_parallel
+        by_file = {r["file"].name: r for r in results}
+        assert call_ids(by_file["voz_a.gz"]["table"]) == list(range(50))
+        assert call_ids(by_file["voz_b.gz"]["table"]) == list(range(50, 80))
+        assert all(r["blocks"] is None for r in results)
+        assert not handoff_dir.exists()
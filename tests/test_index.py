@@ -0,0 +1,54 @@
+"""Tests for the structure-of-arrays index of the two-phase decoders."""
+
+import pickle
+
+import pytest
+
+from teleparser.decoders.ericsson.ber_two_phase import (
+    BerDecoderTwoPhase,
+    TLVIndex,
+    TLVTriple,
+)
+from teleparser.decoders.ericsson.voz import EricssonVoz
+
+from cdr_samples import voz_record
+
+
+@pytest.fixture
+def index():
+    data = memoryview(b"".join(voz_record(i, i) for i in range(3)))
+    return BerDecoderTwoPhase(EricssonVoz, None).build_index(data)
+
+
+class TestArrayIndex:
+    def test_rows(self, index):
+        assert len(index) == 12
+        assert index[1] == TLVTriple(2, True, 0, 4, 8, 1, 0, 2)
+        assert index[-1] == index[11]
+        assert index[0].constructed is True
+        with pytest.raises(IndexError):
+            index[12]
+
+    def test_columns(self, index):
+        assert list(index.parent_idx[:4]) == [-1, 0, 1, 1]
+        assert list(index.depth[:4]) == [0, 1, 2, 2]
+        assert index.nbytes == 12 * sum(c.itemsize for c in index.columns)
+
+    def test_slice(self, index):
+        second = index[4:8]
+
+        assert isinstance(second, TLVIndex)
+        assert list(second) == list(index)[4:8]
+
+    def test_from_rows(self, index):
+        assert TLVIndex.from_rows(list(index)) == index
+        assert index == list(index)
+        assert TLVIndex() == []
+
+    def test_pickle(self, index):
+        assert pickle.loads(pickle.dumps(index)) == index
+
+    def test_save_and_load(self, index, tmp_path):
+        index.save(tmp_path / "voz.idx")
+
+        assert TLVIndex.load(tmp_path / "voz.idx") == index
@@ -0,0 +1,89 @@
+"""Tests for the background-thread gzip inflate front end."""
+
+import gzip
+import os
+
+import pytest
+
+from teleparser.buffer import (
+    BufferManager,
+    ThreadedGzipReader,
+    memory_buffer,
+    open_gzip,
+)
+from teleparser.decoders.ericsson import ericsson_voz_decoder
+
+from cdr_samples import voz_record
+
+DATA = os.urandom(4096) * 300 + bytes(range(256)) * 1000
+
+
+@pytest.fixture
+def multi_member(tmp_path):
+    file_path = tmp_path / "multi.gz"
+    half = len(DATA) // 2
+    file_path.write_bytes(
+        gzip.compress(DATA[:half]) + gzip.compress(DATA[half:]) + b"\x00" * 16
+    )
+    return file_path
+
+
+class TestThreadedGzipReader:
+    def test_same_data_as_gzip(self, multi_member):
+        with open_gzip(multi_member, threaded=True) as f:
+            data = f.read()
+
+        assert data == DATA
+        assert data == gzip.open(multi_member).read()
+
+    def test_small_reads(self, multi_member):
+        with open_gzip(multi_member, threaded=True) as f:
+            head = f.read(1) + f.read(2) + f.read(1000)
+
+        assert head == DATA[:1003]
+
+    def test_empty_file(self, tmp_path):
+        file_path = tmp_path / "empty.gz"
+        file_path.write_bytes(gzip.compress(b""))
+
+        with open_gzip(file_path, threaded=True) as f:
+            assert f.read() == b""
+
+    def test_truncated_file(self, tmp_path):
+        file_path = tmp_path / "truncated.gz"
+        file_path.write_bytes(gzip.compress(DATA)[:-100])
+
+        with pytest.raises(EOFError):
+            with open_gzip(file_path, threaded=True) as f:
+                f.read()
+
+    def test_close_before_end_stops_the_thread(self, multi_member):
+        reader = ThreadedGzipReader(multi_member, block_size=1024, queue_size=1)
+        assert reader.read(10) == DATA[:10]
+
+        reader.close()
+
+        assert not reader._thread.is_alive()
+
+
+class TestThreadedBuffers:
+    def test_decoder_reads_threaded_buffer(self, tmp_path):
+        file_path = tmp_path / "voz.gz"
+        with gzip.open(file_path, "wb") as f:
+            f.write(b"".join(voz_record(i, i) for i in range(20)))
+
+        expected = ericsson_voz_decoder(BufferManager(file_path)).process(
+            show_progress=False
+        )
+        records = ericsson_voz_decoder(BufferManager(file_path, threaded=True)).process(
+            show_progress=False
+        )
+
+        assert records == expected
+        assert len(records) == 20
+
+    def test_memory_buffer_keeps_the_option(self, multi_member):
+        buffer_manager = memory_buffer(BufferManager(multi_member, threaded=True))
+
+        assert buffer_manager.threaded
+        assert bytes(buffer_manager.get_memoryview()) == DATA
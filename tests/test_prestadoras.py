@@ -0,0 +1,40 @@
+"""Tests for the carrier table loaded from the prestadoras.csv resource."""
+
+import pytest
+
+from teleparser.prestadoras import PRESTADORAS, Prestadora, Prestadoras, carrier_key
+
+
+class TestPrestadoras:
+    def test_loaded_on_first_lookup(self):
+        carriers = Prestadoras()
+        assert carriers._carriers is None
+
+        carrier = carriers.get(("00", "724"))
+
+        assert carrier == Prestadora(
+            nome="CLARO S.A.", cnpj="40432544000147", mnc="00", mcc="724"
+        )
+        assert carriers._carriers is not None
+
+    def test_two_and_three_digit_mncs_are_different_carriers(self):
+        assert PRESTADORAS[("12", "405")].nome == "Reliance Infocomm Ltd, Kolkata"
+        assert PRESTADORAS[("012", "405")].nome == (
+            "Reliance Infocomm Ltd, Andhra Pradesh"
+        )
+        assert carrier_key("12", "405") != carrier_key("012", "405")
+
+    @pytest.mark.parametrize(
+        "key", [("0F", "724"), ("1", "724"), ("", ""), (5, 724), ("99", "999")]
+    )
+    def test_missing_keys(self, key):
+        assert PRESTADORAS.get(key) is None
+        with pytest.raises(KeyError):
+            PRESTADORAS[key]
+
+    def test_mapping(self):
+        assert len(PRESTADORAS) == len(list(PRESTADORAS))
+        for mnc, mcc in PRESTADORAS:
+            carrier = PRESTADORAS[(mnc, mcc)]
+            assert (carrier.mnc, carrier.mcc) == (mnc, mcc)
+            assert carrier.nome and carrier.pais
@@ -0,0 +1,143 @@
+"""Tests for the SBC (IMS-R8-2009-03) specification and decoder."""
+
+import gzip
+import subprocess
+import sys
+
+import pytest
+
+from teleparser.buffer import BufferManager, MappedBufferManager
+from teleparser.columnar import ColumnarBuilder
+from teleparser.decoders import sbc
+from teleparser.main import CDRFileManager
+
+from cdr_samples import context_tlv, sbc_record
+
+
+class TestSpecification:
+    def test_not_loaded_on_import(self):
+        code = (
+            "import teleparser.decoders.sbc as sbc; "
+            "print(sbc.specification.cache_info().currsize)"
+        )
+        completed = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        assert completed.stdout.strip() == "0"
+
+    def test_module_attribute(self):
+        from teleparser.decoders.sbc import SPECIFICATION
+
+        assert SPECIFICATION is sbc.specification()
+        types = SPECIFICATION["IMS-R8-2009-03"]["types"]
+        assert types["AGCFRecord"]["type"] == "SET"
+        assert types["ACRInterimLost"]["values"][1] == ["yes", 1]
+
+    def test_unknown_attribute(self):
+        with pytest.raises(AttributeError):
+            sbc.SPECIFICATIONS
+
+
+@pytest.fixture
+def sbc_file(tmp_path):
+    file_path = tmp_path / "sbc_sample.gz"
+    with gzip.open(file_path, "wb") as f:
+        f.write(b"".join(sbc_record(i) for i in range(20)))
+    return file_path
+
+
+class TestSbcDecoder:
+    def test_record(self, sbc_file):
+        records = sbc.sbc_decoder(BufferManager(sbc_file)).process(show_progress=False)
+
+        assert len(records) == 20
+        assert records[1] == {
+            "IMSRecord": "sCSCFRecord",
+            "recordType": "sCSCFRecord",
+            "nodeAddress.iPAddress.iPBinV4Address": "0a000001",
+            "session-Id": "session-1",
+            "list-Of-Calling-Party-Address.sIP-URI": "sip:a@x",
+            "list-Of-Calling-Party-Address.tEL-URI": "tel:+5561",
+            "serviceRequestTimeStamp": "2024-03-15T10:20:30-03:00",
+            "recordSequenceNumber": 1,
+            "causeForRecordClosing": "timeLimit",
+            "list-of-subscription-ID.subscriptionIDType": "eND-USER-E164",
+            "list-of-subscription-ID.subscriptionIDData": "556191",
+            "ims-3gpp-Session-Priority": 2,
+        }
+
+    def test_fields_are_in_the_schema(self, sbc_file):
+        decoder = sbc.sbc_decoder(BufferManager(sbc_file))
+        builder = ColumnarBuilder(sorted(decoder.FIELDNAMES))
+
+        assert list(decoder.parse_columns(builder))[-1] == 20
+        assert not builder.unknown
+        assert list(builder.rows()) == decoder.process(show_progress=False)
+
+    def test_record_boundaries(self, tmp_path):
+        raw_file = tmp_path / "sbc_sample.raw"
+        raw_file.write_bytes(b"".join(sbc_record(i) for i in range(5)))
+        record_size = len(sbc_record(0))
+
+        offsets = sbc.sbc_decoder(MappedBufferManager(raw_file)).record_boundaries()
+
+        assert list(offsets) == [i * record_size for i in range(6)]
+
+    def test_unknown_record_stops_the_file(self, tmp_path):
+        file_path = tmp_path / "sbc_unknown.gz"
+        with gzip.open(file_path, "wb") as f:
+            f.write(sbc_record(0) + context_tlv(100, b"\x00", True) + sbc_record(1))
+
+        records = sbc.sbc_decoder(BufferManager(file_path)).process(show_progress=False)
+
+        assert len(records) == 1
+
+    def test_decode_file(self, sbc_file):
+        result = CDRFileManager.decode_file(
+            sbc_file, sbc.sbc_decoder, show_progress=False
+        )
+
+        assert result["records"] == 20
+        assert result["fieldnames"] == sbc.fieldnames()
+
+
+class TestCompiledSpecification:
+    def test_tables_are_shared_by_type_and_prefix(self):
+        table = sbc.record_table()
+        scscf, pcscf = table[63].table, table[64].table
+
+        assert table[63].value == "sCSCFRecord"
+        assert scscf[4].name == "nodeAddress"
+        assert scscf[4].table is pcscf[4].table
+
+    def test_untagged_choice_members_have_no_name(self):
+        ip_address = sbc.record_table()[63].table[4].table[0]
+
+        assert ip_address.name == "nodeAddress.iPAddress"
+        assert ip_address.table[0].name == "nodeAddress.iPAddress.iPBinV4Address"
+        assert ip_address.table[2].name == "nodeAddress.iPAddress.iPTextV4Address"
+
+    def test_unknown_tag(self):
+        with pytest.raises(KeyError):
+            sbc.SbcTLV(62, b"", None)
+
+
+class TestHandlers:
+    def test_named_integer(self):
+        decode = sbc.named_integer({0: "zero"})
+
+        assert decode(b"\x00") == "zero"
+        assert decode(b"\xff") == -1
+
+    def test_bit_string(self):
+        decode = sbc.bit_string({0: "basic", 2: "online-charging", 9: "unused"})
+
+        assert decode(b"\x03\xa0") == "basic,online-charging"
+        assert sbc.bit_string({})(b"\x00\x80") == "0080"
+
+    @pytest.mark.parametrize(
+        "octets", [b"\x24\x03\x15\x10\x20\x30+\x00", bytes(9), b"\x2a" * 9]
+    )
+    def test_invalid_timestamp_is_hex(self, octets):
+        assert sbc.timestamp(octets) == octets.hex()
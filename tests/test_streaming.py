@@ -0,0 +1,196 @@
+"""Tests for the streaming (batched) output pipeline."""
+
+import gzip
+
+import pytest
+
+from teleparser.main import CDRFileManager
+from teleparser.writer import batched, sorted_fieldnames
+
+
+class FakeDecoder:
+    """Minimal decoder yielding a fixed number of records."""
+
+    FIELDNAMES = {"a", "B", "c"}
+    transform_func = None
+    n_records = 5
+
+    def __init__(self, buffer_manager):
+        self.buffer_manager = buffer_manager
+        self.streamed = False
+
+    def stream(self, pbar_position=None, show_progress=True):
+        self.streamed = True
+        for i in range(self.n_records):
+            yield {"a": i, "B": f"b{i}"} if i % 2 else {"c": True}
+
+    def process(self, pbar_position=None, show_progress=True):
+        return list(self.stream(pbar_position, show_progress))
+
+
+@pytest.fixture
+def gz_file(tmp_path):
+    file_path = tmp_path / "input" / "cdr_sample.gz"
+    file_path.parent.mkdir()
+    with gzip.open(file_path, "wb") as f:
+        f.write(b"")
+    return file_path
+
+
+class TestBatched:
+    def test_batches_have_bounded_size(self):
+        batches = list(batched(range(7), 3))
+        assert batches == [[0, 1, 2], [3, 4, 5], [6]]
+
+    def test_empty_iterable(self):
+        assert list(batched([], 3)) == []
+
+    def test_sorted_fieldnames_is_case_insensitive(self):
+        assert sorted_fieldnames({"b", "A", "c"}) == ["A", "b", "c"]
+
+
+class TestStreamingDecodeFile:
+    def test_row_groups_follow_batch_size(self, gz_file, tmp_path):
+        pq = pytest.importorskip("pyarrow.parquet")
+        output = tmp_path / "output"
+        output.mkdir()
+
+        result = CDRFileManager.decode_file(
+            gz_file, FakeDecoder, output, show_progress=False, batch_size=2
+        )
+
+        assert result["status"] == "success"
+        assert result["records"] == 5
+        assert result["blocks"] is None
+
+        parquet_file = pq.ParquetFile(output / "cdr_sample.parquet")
+        assert parquet_file.metadata.num_rows == 5
+        assert parquet_file.metadata.num_row_groups == 3
+        assert parquet_file.schema_arrow.names == ["a", "B", "c"]
+
+        table = parquet_file.read()
+        assert table.column("a").to_pylist() == [None, "1", None, "3", None]
+        assert table.column("B").to_pylist() == [None, "b1", None, "b3", None]
+        assert table.column("c").to_pylist() == ["True", None, "True", None, "True"]
+
+    def test_schema_is_fixed_by_fieldnames(self, gz_file, tmp_path):
+        pa = pytest.importorskip("pyarrow")
+        pq = pytest.importorskip("pyarrow.parquet")
+        output = tmp_path / "output"
+        output.mkdir()
+
+        class PartialDecoder(FakeDecoder):
+            def stream(self, pbar_position=None, show_progress=True):
+                yield {"a": 1}
+                yield {"B": "b"}
+
+        CDRFileManager.decode_file(
+            gz_file, PartialDecoder, output, show_progress=False, batch_size=1
+        )
+
+        schema = pq.ParquetFile(output / "cdr_sample.parquet").schema_arrow
+        assert schema.names == ["a", "B", "c"]
+        assert all(
+            field.type == pa.dictionary(pa.int32(), pa.string()) for field in schema
+        )
+
+    def test_failed_transform_keeps_the_file(self, gz_file, tmp_path, caplog):
+        pq = pytest.importorskip("pyarrow.parquet")
+        output = tmp_path / "output"
+        output.mkdir()
+
+        class UnknownFieldDecoder(FakeDecoder):
+            def stream(self, pbar_position=None, show_progress=True):
+                yield {"a": 1}
+                yield {"a": 2, "unknown": "x"}
+                yield {"a": 3, "unknown": "y"}
+
+            @staticmethod
+            def transform_func(blocks):
+                # Would have moved "unknown" to a schema column
+                raise KeyError("unknown")
+
+        result = CDRFileManager.decode_file(
+            gz_file, UnknownFieldDecoder, output, show_progress=False, batch_size=1
+        )
+
+        # The untransformed field is dropped, not the file
+        assert result["records"] == 3
+        table = pq.read_table(output / "cdr_sample.parquet")
+        assert table.column("a").to_pylist() == ["1", "2", "3"]
+        dropped = [r for r in caplog.records if "dropped" in r.getMessage()]
+        assert len(dropped) == 1
+
+    def test_unknown_column_is_dropped_with_a_warning(self, gz_file, tmp_path, caplog):
+        pq = pytest.importorskip("pyarrow.parquet")
+        output = tmp_path / "output"
+        output.mkdir()
+
+        class UnknownColumnDecoder(FakeDecoder):
+            def stream_columns(self, sink, pbar_position=None, show_progress=True):
+                for i in range(3):
+                    sink.add("a", i)
+                    sink.add("unknown", "x")
+                    sink.end_row()
+                    yield sink.n_rows
+
+        result = CDRFileManager.decode_file(
+            gz_file, UnknownColumnDecoder, output, show_progress=False, batch_size=1
+        )
+
+        assert result["records"] == 3
+        table = pq.read_table(output / "cdr_sample.parquet")
+        assert table.column("a").to_pylist() == ["0", "1", "2"]
+        dropped = [r for r in caplog.records if "unknown" in r.getMessage()]
+        assert len(dropped) == 1
+
+    def test_no_partial_file_left_on_failure(self, gz_file, tmp_path):
+        pytest.importorskip("pyarrow")
+        output = tmp_path / "output"
+        output.mkdir()
+
+        class FailingDecoder(FakeDecoder):
+            def stream(self, pbar_position=None, show_progress=True):
+                yield {"a": 1}
+                yield {"a": 2}
+                raise ValueError("corrupted block")
+
+        result = CDRFileManager.decode_file(
+            gz_file, FailingDecoder, output, show_progress=False, batch_size=1
+        )
+
+        assert result["status"] == "failed"
+        assert list(output.iterdir()) == []
+
+    def test_empty_file_writes_nothing(self, gz_file, tmp_path):
+        output = tmp_path / "output"
+        output.mkdir()
+
+        class EmptyDecoder(FakeDecoder):
+            n_records = 0
+
+        result = CDRFileManager.decode_file(
+            gz_file, EmptyDecoder, output, show_progress=False
+        )
+
+        assert result["records"] == 0
+        assert list(output.iterdir()) == []
+
+    def test_save_uses_the_same_schema(self, tmp_path):
+        pq = pytest.importorskip("pyarrow.parquet")
+        output_file = tmp_path / "cdr_sample.csv"
+
+        CDRFileManager._save([{"a": 1}, {"c": False}], output_file, {"a", "B", "c"})
+
+        table = pq.read_table(tmp_path / "cdr_sample.parquet")
+        assert table.column_names == ["a", "B", "c"]
+        assert table.column("a").to_pylist() == ["1", None]
+        assert table.column("c").to_pylist() == [None, "False"]
+
+    def test_in_memory_mode_returns_blocks(self, gz_file):
+        result = CDRFileManager.decode_file(
+            gz_file, FakeDecoder, None, show_progress=False, batch_size=2
+        )
+
+        assert result["records"] == 5
+        assert len(result["blocks"]) == 5
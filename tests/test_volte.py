@@ -0,0 +1,586 @@
+"""Tests for the VoLTE (Diameter) decoders."""
+
+import gzip
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+
+from datetime import timedelta
+
+import pytest
+
+from teleparser.buffer import BufferManager, MappedBufferManager, MemoryBufferManager
+from teleparser.columnar import ColumnarBuilder
+from teleparser.decoders.ericsson import (
+    ericsson_volte_decoder_auto,
+    ericsson_volte_decoder_epoch,
+    ericsson_volte_decoder_optimized,
+    volte_engine,
+    volte_final,
+)
+from teleparser.decoders.ericsson.volte import (
+    AVP_DB,
+    TYPE_GROUPED,
+    VOLTE_FIELDS,
+    EricssonVolte,
+)
+from teleparser.decoders.ericsson.volte_engine import (
+    PROCESSES,
+    SERIAL,
+    THREADED,
+    VolteEngine,
+    choose_execution,
+)
+from teleparser.decoders.ericsson.volte_final import (
+    AVP_PARSED,
+    AVP_RESYNC,
+    AVP_TABLE,
+    AVP_UNKNOWN,
+    NTP_EPOCH,
+    EricssonVolteFinal,
+    flag_mask,
+    parse_time,
+    parse_time_epoch,
+)
+from teleparser.decoders.ericsson.volte_optimized import EricssonVolteOptimized
+from teleparser.decoders.ericsson.volte_parallel import EricssonVolteParallel
+from teleparser.decoders.ericsson.volte_pooled import EricssonVoltePooled
+from teleparser.decoders.ericsson.volte_two_phase import EricssonVolteTwoPhase
+
+from teleparser.main import DECODERS, CDRFileManager
+
+from cdr_samples import avp, diameter_message, volte_message
+
+
+class TestAvpTable:
+    @pytest.mark.parametrize("expected", [None, "", "V", "M", "P", "VM", "VMP"])
+    def test_flag_mask_matches_validate_flags(self, expected):
+        mask, required = flag_mask(expected)
+
+        for flags in range(256):
+            assert (flags & mask == required) == EricssonVolteFinal.validate_flags_fast(
+                flags, expected
+            )
+
+    def test_every_code_is_compiled(self):
+        assert AVP_TABLE.keys() == AVP_DB.keys()
+        for code, entry in AVP_TABLE.items():
+            assert entry.name == AVP_DB[code].avp
+            assert (entry.parse is None) == (AVP_DB[code].type == TYPE_GROUPED)
+
+    @pytest.mark.parametrize(
+        "avp_type, value, expected",
+        [
+            (volte_final.TYPE_UTF8_STRING, b"abc\x00\x00", "abc"),
+            (volte_final.TYPE_OCTET_STRING, b"\xff\xfe", "fffe"),
+            (
+                volte_final.TYPE_TIME,
+                (3_913_056_000).to_bytes(4, "big"),
+                "2024-01-01 00:00:00",
+            ),
+            (volte_final.TYPE_ENUMERATED, b"\xff\xff\xff\xfe", -2),
+            (volte_final.TYPE_UNSIGNED_32, b"\xff\xff\xff\xfe", 4294967294),
+            (volte_final.TYPE_UNSIGNED_64, b"\x00" * 7 + b"\x05", 5),
+            (volte_final.TYPE_UNSIGNED_64, b"\x05", "05"),
+            (volte_final.TYPE_ADDRESS, b"\x00\x01\x0a\x00\x00\x01", "10.0.0.1"),
+            (volte_final.TYPE_ADDRESS, b"\x00\x02" + bytes(15) + b"\x01", "::1"),
+            (volte_final.TYPE_ADDRESS, b"\x00\x01ab", "\x00\x01ab"),
+            (99, b"\x01\x02", "0102"),
+        ],
+    )
+    def test_value_parsers(self, avp_type, value, expected):
+        assert EricssonVolteFinal.parse_simple_value_fast(value, avp_type) == expected
+
+
+class TestEricssonVolteFinal:
+    def test_messages(self, tmp_path):
+        file_path = tmp_path / "volte.raw"
+        file_path.write_bytes(b"".join(volte_message(i) for i in range(3)))
+
+        records = EricssonVolteFinal(MappedBufferManager(file_path)).process(
+            show_progress=False
+        )
+
+        assert records == [
+            {
+                "Session-Id": f"scscf{i}.example;{i}",
+                "Accounting-Record-Type": 2,
+                "Accounting-Record-Number": i,
+            }
+            for i in range(3)
+        ]
+
+    def test_flags_and_size_are_checked(self, tmp_path):
+        file_path = tmp_path / "volte.raw"
+        file_path.write_bytes(
+            diameter_message(
+                # Reserved flag bit, then a wrong size for an Unsigned32
+                avp(480, (2).to_bytes(4, "big"), flags=0x41)
+                + avp(485, (7).to_bytes(8, "big"))
+                + avp(263, b"session")
+            )
+        )
+
+        records = EricssonVolteFinal(MappedBufferManager(file_path)).process(
+            show_progress=False
+        )
+
+        assert records == [{"Session-Id": "session"}]
+
+
+class TestAvpWalk:
+    @staticmethod
+    def walk(avps: bytes):
+        stats = Counter()
+        return EricssonVolteFinal.parse_block(avps, stats), stats
+
+    def test_unknown_avp_is_skipped_by_its_length(self):
+        # Longer than the 100 bytes searched byte by byte
+        record, stats = self.walk(
+            avp(99999, bytes(range(150)), flags=0x00) + avp(263, b"session")
+        )
+
+        assert record == {"Session-Id": "session"}
+        assert stats == {AVP_UNKNOWN: 1, AVP_PARSED: 1}
+
+    def test_padding_is_skipped(self):
+        record, stats = self.walk(avp(263, b"abcde") + avp(485, (7).to_bytes(4, "big")))
+
+        assert record == {"Session-Id": "abcde", "Accounting-Record-Number": 7}
+        assert stats == {AVP_PARSED: 2}
+
+    def test_unpadded_avp(self):
+        unpadded = avp(263, b"abcde")[:13]
+        record, _ = self.walk(unpadded + avp(485, (7).to_bytes(4, "big")))
+
+        assert record == {"Session-Id": "abcde", "Accounting-Record-Number": 7}
+
+    def test_corrupt_header_is_resynchronized(self):
+        # Length past the end of the block
+        corrupt = (12345).to_bytes(4, "big") + b"\x40\xff\xff\xff"
+        record, stats = self.walk(corrupt + b"\x01\x02" + avp(263, b"session"))
+
+        assert record == {"Session-Id": "session"}
+        assert stats == {AVP_RESYNC: 1, AVP_PARSED: 1}
+
+    def test_grouped_children_are_counted(self):
+        subscription = avp(450, (0).to_bytes(4, "big")) + avp(444, b"5561")
+        record, stats = self.walk(avp(443, subscription))
+
+        assert record == {"Subscription-Id-Type": 0, "Subscription-Id-Data": "5561"}
+        assert stats == {AVP_PARSED: 3}
+
+    def test_decoder_counts_the_file(self, tmp_path):
+        file_path = tmp_path / "volte.raw"
+        file_path.write_bytes(b"".join(volte_message(i) for i in range(3)))
+        decoder = EricssonVolteFinal(MappedBufferManager(file_path))
+
+        decoder.process(show_progress=False)
+
+        assert decoder.avp_stats == {AVP_PARSED: 9}
+
+
+class TestTimeFormat:
+    @pytest.mark.parametrize(
+        "seconds", [0, 59, 86_399, 86_400, 3_913_056_000, 3_913_142_399, 2**32 - 1]
+    )
+    def test_cached_date_matches_strftime(self, seconds):
+        expected = (NTP_EPOCH + timedelta(seconds=seconds)).strftime(
+            "%Y-%m-%d %H:%M:%S"
+        )
+
+        assert parse_time(seconds.to_bytes(4, "big")) == expected
+
+    def test_epoch(self):
+        # 2024-01-01 00:00:00 UTC
+        assert parse_time_epoch((3_913_056_000).to_bytes(4, "big")) == 1_704_067_200
+        assert parse_time_epoch(b"\x01") == "01"
+
+    def test_epoch_decoder(self, tmp_path):
+        file_path = tmp_path / "volte.raw"
+        file_path.write_bytes(
+            diameter_message(
+                avp(263, b"session") + avp(55, (3_913_056_000).to_bytes(4, "big"))
+            )
+        )
+
+        text = EricssonVolteFinal(MappedBufferManager(file_path))
+        epoch = ericsson_volte_decoder_epoch(MappedBufferManager(file_path))
+
+        assert text.process(show_progress=False) == [
+            {"Session-Id": "session", "Event-Timestamp": "2024-01-01 00:00:00"}
+        ]
+        assert epoch.process(show_progress=False) == [
+            {"Session-Id": "session", "Event-Timestamp": 1_704_067_200}
+        ]
+
+    @pytest.mark.parametrize("execution", [None, SERIAL])
+    def test_epoch_columns_are_integers(self, tmp_path, execution):
+        pa = pytest.importorskip("pyarrow")
+        pq = pytest.importorskip("pyarrow.parquet")
+        file_path = tmp_path / "volte.gz"
+        with gzip.open(file_path, "wb") as f:
+            f.write(
+                diameter_message(
+                    avp(263, b"session") + avp(55, (3_913_056_000).to_bytes(4, "big"))
+                )
+            )
+        output = tmp_path / "output"
+        output.mkdir()
+        if execution is None:
+            decoder = ericsson_volte_decoder_epoch
+        else:
+
+            def decoder(buffer_manager):
+                return VolteEngine(
+                    buffer_manager, time_format="epoch", execution=execution
+                )
+
+        result = CDRFileManager.decode_file(
+            file_path, decoder, output, show_progress=False
+        )
+
+        assert result["status"] == "success"
+        table = pq.read_table(output / "volte.parquet")
+        assert table.schema.field("Event-Timestamp").type == pa.int64()
+        assert table.schema.field("SIP-Request-Timestamp").type == pa.int64()
+        assert table.column("Event-Timestamp").to_pylist() == [1_704_067_200]
+        assert table.schema.field("Session-Id").type != pa.int64()
+
+    def test_unknown_time_format(self, tmp_path):
+        file_path = tmp_path / "volte.raw"
+        file_path.write_bytes(volte_message(0))
+
+        with pytest.raises(ValueError):
+            EricssonVolteFinal(MappedBufferManager(file_path), time_format="iso")
+
+
+class TestVendorInfo:
+    RECORDS = [
+        {"Session-Id": "pcscf1.example;1", "Accounting-Record-Type": 1},
+        {"Session-Id": "scscf1.example;2", "Accounting-Record-Type": 2},
+        {"Session-Id": "tas1.example;3", "Accounting-Record-Type": 3},
+        {"Session-Id": "tas1.example;4", "Vendor-Id": 2011},
+        {"Session-Id": "other", "Accounting-Record-Type": "4.0", "Type": "x"},
+        {"Accounting-Record-Type": 9},
+    ]
+
+    def columns(self, records):
+        builder = ColumnarBuilder(
+            sorted(EricssonVolte.FIELDNAMES), EricssonVolte.TRANSFORM_FIELDS
+        )
+        builder.extend(records)
+        EricssonVolte.transform_columns(builder)
+        return list(builder.rows())
+
+    def test_insert_vendor_info(self):
+        records = EricssonVolte.insert_vendor_info([dict(r) for r in self.RECORDS])
+
+        assert [(r["Vendor"], r["Type"]) for r in records] == [
+            ("ERICSSON", "SBG"),
+            ("ERICSSON", "IMS"),
+            ("ERICSSON", "TAS"),
+            ("HUAWEI", "TAS"),
+            ("", "x"),
+            ("", ""),
+        ]
+        assert [r["Accounting-Record-Type"] for r in records] == [
+            "EVENT",
+            "START",
+            "INTERIM",
+            "UNKNOWN",
+            "STOP",
+            "UNKNOWN",
+        ]
+        assert records[0]["Origin-Host"] == "pcscf1.example"
+        assert records[5]["Origin-Host"] == ""
+        assert "Vendor-Id" not in records[3]
+
+    def test_columns_match_records(self):
+        records = EricssonVolte.insert_vendor_info([dict(r) for r in self.RECORDS])
+
+        assert self.columns(self.RECORDS) == records
+
+    def test_unmapped_types_are_logged_once(self, caplog):
+        self.columns(self.RECORDS)
+
+        warnings = [r for r in caplog.records if r.levelname == "WARNING"]
+        assert len(warnings) == 1
+        assert "in 2 records" in warnings[0].getMessage()
+
+    def test_decode_file_uses_columns(self, tmp_path):
+        pq = pytest.importorskip("pyarrow.parquet")
+        file_path = tmp_path / "volte.gz"
+        with gzip.open(file_path, "wb") as f:
+            f.write(b"".join(volte_message(i) for i in range(5)))
+        output = tmp_path / "output"
+        output.mkdir()
+        decoder = EricssonVolteFinal(BufferManager(file_path))
+        records = decoder.transform_func(decoder.process(show_progress=False))
+
+        assert CDRFileManager._supports_columns(decoder)
+        result = CDRFileManager.decode_file(
+            file_path,
+            ericsson_volte_decoder_optimized,
+            output,
+            show_progress=False,
+            batch_size=2,
+        )
+
+        assert result["status"] == "success"
+        table = pq.read_table(output / "volte.parquet")
+        # Every column is written as text
+        assert [
+            {k: v for k, v in row.items() if v is not None} for row in table.to_pylist()
+        ] == [{k: str(v) for k, v in record.items()} for record in records]
+
+
+class TestFieldnames:
+    def test_every_avp_is_a_column(self):
+        names = {
+            avp_def.avp for avp_def in AVP_DB.values() if avp_def.type != TYPE_GROUPED
+        }
+
+        assert names - VOLTE_FIELDS == {"Vendor-Id"}
+        assert {"Vendor", "Type", "Origin-Host"} <= VOLTE_FIELDS
+
+    @pytest.mark.parametrize(
+        "cdr_type", ["ericsson_volte", "ericsson_volte_epoch", "ericsson_volte_auto"]
+    )
+    def test_fields_outside_the_first_outputs_are_written(self, tmp_path, cdr_type):
+        pq = pytest.importorskip("pyarrow.parquet")
+        file_path = tmp_path / "volte.gz"
+        with gzip.open(file_path, "wb") as f:
+            f.write(
+                diameter_message(
+                    avp(263, b"session") + avp(363, (1024).to_bytes(8, "big"))
+                )
+            )
+        output = tmp_path / "output"
+        output.mkdir()
+
+        result = CDRFileManager.decode_file(
+            file_path, DECODERS[cdr_type], output, show_progress=False
+        )
+
+        assert result["status"] == "success"
+        table = pq.read_table(output / "volte.parquet")
+        assert table.column("Accounting-Input-Octets").to_pylist() == ["1024"]
+
+
+def auto_execution(file_path):
+    """n_workers and execution of the auto VoLTE decoder, run in a pool worker"""
+    engine = ericsson_volte_decoder_auto(MappedBufferManager(file_path))
+    return engine.n_workers, engine.execution
+
+
+class TestVolteEngine:
+    @pytest.fixture
+    def file_path(self, tmp_path):
+        file_path = tmp_path / "volte.raw"
+        file_path.write_bytes(
+            b"".join(volte_message(i) for i in range(7))
+            + diameter_message(
+                avp(263, b"session")
+                + avp(55, (3_913_056_000).to_bytes(4, "big"))
+                + avp(443, avp(450, (0).to_bytes(4, "big")) + avp(444, b"5561"))
+            )
+        )
+        return file_path
+
+    @pytest.mark.parametrize("walker", ["strict", "reference"])
+    @pytest.mark.parametrize("execution", ["serial", "threaded", "processes"])
+    def test_matches_original(self, file_path, walker, execution):
+        expected = EricssonVolte(MappedBufferManager(file_path)).process(
+            show_progress=False
+        )
+        engine = VolteEngine(
+            MappedBufferManager(file_path),
+            walker=walker,
+            execution=execution,
+            n_workers=2,
+            messages_per_task=3,
+        )
+
+        assert engine.process(show_progress=False) == expected
+
+    def test_processes_get_offsets_of_the_mapped_file(self, file_path, monkeypatch):
+        submitted = []
+
+        class RecordingExecutor(ThreadPoolExecutor):
+            def submit(self, fn, *args):
+                submitted.append(args)
+                return super().submit(fn, *args)
+
+        monkeypatch.setattr(volte_engine, "ProcessPoolExecutor", RecordingExecutor)
+        expected = EricssonVolte(MappedBufferManager(file_path)).process(
+            show_progress=False
+        )
+        skipped = len(volte_message(0))
+        engine = VolteEngine(
+            MappedBufferManager(file_path, skipped),
+            execution="processes",
+            n_workers=2,
+            messages_per_task=3,
+        )
+
+        assert engine.process(show_progress=False) == expected[1:]
+        assert [args[:3] for args in submitted] == [
+            (file_path, skipped + start, skipped + stop)
+            for start, stop in engine.spans()
+        ]
+
+    def test_processes_over_data_in_memory(self, file_path, tmp_path, monkeypatch):
+        gz_file = tmp_path / "volte.gz"
+        gz_file.write_bytes(gzip.compress(file_path.read_bytes()))
+        expected = EricssonVolte(MappedBufferManager(file_path)).process(
+            show_progress=False
+        )
+        shared_files = []
+        shared_file = VolteEngine.shared_file
+
+        def recording_shared_file(engine):
+            with shared_file(engine) as (raw_file, base):
+                shared_files.append(raw_file)
+                yield raw_file, base
+
+        monkeypatch.setattr(
+            VolteEngine, "shared_file", contextmanager(recording_shared_file)
+        )
+        engine = VolteEngine(
+            MemoryBufferManager(gz_file),
+            execution="processes",
+            n_workers=2,
+            messages_per_task=3,
+        )
+
+        assert engine.process(show_progress=False) == expected
+        # The data is written once to a temporary file, removed afterwards
+        assert len(shared_files) == 1
+        assert not shared_files[0].exists()
+
+    @pytest.mark.parametrize("execution", ["serial", "threaded"])
+    def test_columns_match_records(self, file_path, execution):
+        engine = VolteEngine(
+            MappedBufferManager(file_path),
+            execution=execution,
+            n_workers=2,
+            messages_per_task=3,
+        )
+        sink = ColumnarBuilder(sorted(engine.FIELDNAMES))
+
+        for _ in engine.parse_columns(sink):
+            pass
+
+        assert list(sink.rows()) == engine.process(show_progress=False)
+
+    def test_stats_are_merged(self, file_path):
+        engine = VolteEngine(
+            MappedBufferManager(file_path),
+            execution="threaded",
+            n_workers=2,
+            messages_per_task=3,
+        )
+
+        engine.process(show_progress=False)
+
+        assert engine.avp_stats == {AVP_PARSED: 7 * 3 + 5}
+
+    def test_boundaries_match_final(self, file_path):
+        engine = VolteEngine(MappedBufferManager(file_path), messages_per_task=3)
+        final = EricssonVolteFinal(MappedBufferManager(file_path))
+
+        assert engine.record_boundaries() == final.record_boundaries()
+        assert [start for start, _ in engine.spans()] == [
+            engine.record_boundaries()[i] for i in (0, 3, 6)
+        ]
+
+    def test_spans_are_submitted_as_workers_finish(self, file_path):
+        expected = EricssonVolte(MappedBufferManager(file_path)).process(
+            show_progress=False
+        )
+        engine = VolteEngine(
+            MappedBufferManager(file_path),
+            execution="threaded",
+            n_workers=1,
+            messages_per_task=1,
+        )
+
+        assert len(engine.spans()) == 8
+        assert engine.process(show_progress=False) == expected
+
+    def test_auto_is_serial_in_pool_workers(self, file_path, monkeypatch):
+        monkeypatch.setattr(volte_engine, "PROCESS_MIN_SIZE", 0)
+        monkeypatch.setattr(os, "cpu_count", lambda: 4)
+
+        assert auto_execution(file_path) == (4, PROCESSES)
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            n_workers, execution = executor.submit(auto_execution, file_path).result()
+        assert (n_workers, execution) == (1, SERIAL)
+
+    def test_auto_is_serial_with_one_worker(self, file_path, monkeypatch):
+        monkeypatch.setattr(volte_engine, "PROCESS_MIN_SIZE", 0)
+        monkeypatch.setattr(os, "cpu_count", lambda: 4)
+        manager = CDRFileManager(
+            file_path, None, "ericsson_volte_auto", False, workers=1
+        )
+
+        engine = manager.decoder(MappedBufferManager(file_path))
+
+        assert (engine.n_workers, engine.execution) == (1, SERIAL)
+
+    @pytest.mark.parametrize(
+        "variant, execution",
+        [
+            (EricssonVolteOptimized, SERIAL),
+            (EricssonVoltePooled, SERIAL),
+            (EricssonVolteParallel, PROCESSES),
+            (EricssonVolteTwoPhase, THREADED),
+        ],
+    )
+    def test_variants_are_engines(self, file_path, variant, execution):
+        expected = EricssonVolte(MappedBufferManager(file_path)).process(
+            show_progress=False
+        )
+        decoder = variant(MappedBufferManager(file_path))
+
+        assert isinstance(decoder, VolteEngine)
+        assert decoder.execution == execution
+        assert decoder.process(show_progress=False) == expected
+
+    @pytest.mark.parametrize(
+        "header, error",
+        [
+            (b"\x00\x00\x02", "version"),
+            (volte_message(1)[:7] + b"\x00\x01\x10", "Command-Code"),
+        ],
+    )
+    @pytest.mark.parametrize("walker", ["strict", "reference"])
+    def test_invalid_header_is_skipped(self, tmp_path, header, error, walker):
+        file_path = tmp_path / "volte.raw"
+        invalid = header + volte_message(1)[len(header) :]
+        file_path.write_bytes(volte_message(0) + invalid + volte_message(2))
+        final = EricssonVolteFinal(MappedBufferManager(file_path))
+        engine = VolteEngine(MappedBufferManager(file_path), walker=walker)
+
+        # The original decoder stops the file, the engine skips the header
+        with pytest.raises(ValueError, match=error):
+            EricssonVolte(MappedBufferManager(file_path)).process(show_progress=False)
+        records = engine.process(show_progress=False)
+        assert records == final.process(show_progress=False)
+        assert records[0]["Accounting-Record-Number"] == 0
+
+    def test_choose_execution(self):
+        size = volte_engine.PROCESS_MIN_SIZE
+
+        assert choose_execution(size, 4) == PROCESSES
+        assert choose_execution(size - 1, 4) == SERIAL
+        assert choose_execution(size, 1) == SERIAL
+
+    @pytest.mark.parametrize(
+        "option", [{"walker": "fast"}, {"time_format": "iso"}, {"execution": "gpu"}]
+    )
+    def test_unknown_option(self, file_path, option):
+        with pytest.raises(ValueError):
+            VolteEngine(MappedBufferManager(file_path), **option)
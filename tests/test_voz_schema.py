@@ -0,0 +1,134 @@
+"""Tests for the compiled Ericsson Voz schema tables."""
+
+import gzip
+
+import pytest
+
+from teleparser.decoders.ericsson import modules
+from teleparser.decoders.ericsson.voz import EricssonVoz
+from teleparser.main import DECODERS, CDRFileManager
+
+from cdr_samples import context_tlv, tlv
+
+# Octets decoded by at least one of them for each datatype of the schema
+CANDIDATE_OCTETS = [b""] + [
+    bytes([byte]) * size for size in range(1, 33) for byte in (0x01, 0x12, 0x91, 0x00)
+]
+# Leaves whose datatype fails on any value (CarrierInfo, C7CHTMessage and
+# ChargeAreaCode), never output
+UNDECODABLE = {
+    "originatingCarrier",
+    "terminatingCarrier",
+    "c7FirstCHTMessage",
+    "c7SecondCHTMessage",
+    "entryPOICA",
+    "exitPOICA",
+    "originatingChargeArea",
+    "terminatingChargeArea",
+}
+
+
+def schema_leaves(table, seen=None):
+    """Primitive entries of a compiled table and its children, each table once"""
+    seen = set() if seen is None else seen
+    if id(table) in seen:
+        return
+    seen.add(id(table))
+    for entry in table:
+        if entry is None:
+            continue
+        if entry.decode is None:
+            yield from schema_leaves(entry.table, seen)
+        else:
+            yield entry
+
+
+class TestCompiledSchema:
+    def test_tables_are_indexed_by_tag_number(self):
+        transit = modules.CALL_DATA_RECORD[0].table[0].table
+
+        assert len(transit) == max(modules.Transit) + 1
+        for tag_number, entry in enumerate(transit):
+            if tag_number not in modules.Transit:
+                assert entry is None
+            elif entry.decode is not None:
+                assert entry.name == modules.Transit[tag_number]["name"]
+
+    def test_shared_modules_are_compiled_once(self):
+        transit = modules.CALL_DATA_RECORD[0].table[0].table
+
+        assert transit[51].table is transit[52].table
+        assert transit[51].name == "camelTDPData"
+        assert transit[51].value == "bCSMTDPData1"
+
+    def test_constructed_entries_without_tag_are_left_out(self):
+        in_outgoing_call = modules.compile_schema(modules.INOutgoingCall)
+
+        assert in_outgoing_call[5] is None
+
+    def test_parser_decodes_like_the_datatypes(self):
+        transit = modules.CALL_DATA_RECORD[0].table[0].table
+        value = b"\x01\x02\x03"
+
+        tlv = EricssonVoz(1, value, transit)
+
+        assert tlv.name == "callIdentificationNumber"
+        assert tlv.value == modules.Transit[1]["type"](value).value
+        assert tlv.schema == ()
+
+    @pytest.mark.parametrize("tag_number", [62, 500])
+    def test_unknown_tag(self, tag_number):
+        transit = modules.CALL_DATA_RECORD[0].table[0].table
+
+        with pytest.raises(KeyError):
+            EricssonVoz(tag_number, b"\x00", transit)
+
+
+class TestFieldnames:
+    def test_every_decoded_leaf_is_a_column(self):
+        output, undecodable = set(), set()
+        for entry in schema_leaves(modules.CALL_DATA_RECORD):
+            decoded = False
+            for octets in CANDIDATE_OCTETS:
+                try:
+                    value = entry.decode(octets)
+                except Exception:
+                    continue
+                decoded = True
+                if isinstance(value, dict):
+                    output.update(f"{entry.name}.{key}" for key in value)
+                else:
+                    output.add(entry.name)
+            if not decoded:
+                undecodable.add(entry.name)
+
+        assert undecodable == UNDECODABLE
+        assert output - modules.CALL_DATA_RECORD_FIELDS == set()
+
+    @pytest.mark.parametrize(
+        "cdr_type",
+        [
+            "ericsson_voz",
+            "ericsson_voz_optimized",
+            "ericsson_voz_windowed",
+            "ericsson_voz_two_phase",
+        ],
+    )
+    def test_fields_outside_the_first_outputs_are_written(self, tmp_path, cdr_type):
+        pq = pytest.importorskip("pyarrow.parquet")
+        # transit > callIdentificationNumber, redirectingDropBackNumber
+        call_module = tlv(0x81, b"\x00\x00\x01") + context_tlv(32, b"\x91\x21\x43")
+        file_path = tmp_path / "voz.gz"
+        with gzip.open(file_path, "wb") as f:
+            f.write(tlv(0xA0, tlv(0xA0, call_module)))
+        output = tmp_path / "output"
+        output.mkdir()
+
+        result = CDRFileManager.decode_file(
+            file_path, DECODERS[cdr_type], output, show_progress=False
+        )
+
+        assert result["status"] == "success"
+        table = pq.read_table(output / "voz.parquet")
+        assert table.column("redirectingDropBackNumber.digits").to_pylist() == ["1234"]
+        assert table.column("redirectingDropBackNumber.ton").to_pylist() == ["Unknown"]
@@ -0,0 +1,102 @@
+"""Tests for the BER decoder over a sliding window of the stream."""
+
+import gzip
+
+import pytest
+
+from teleparser.buffer import BufferManager
+from teleparser.columnar import ColumnarBuilder
+from teleparser.decoders.ericsson import (
+    EricssonVoz,
+    ericsson_voz_decoder_optimized,
+)
+from teleparser.decoders.ericsson.ber_windowed import BerDecoderWindowed
+
+from cdr_samples import tlv, voz_record
+
+RECORD_SIZE = len(voz_record(0, 0))
+
+
+def write_gz(file_path, data):
+    with gzip.open(file_path, "wb") as f:
+        f.write(data)
+    return file_path
+
+
+def windowed(file_path, window_size):
+    return BerDecoderWindowed(
+        EricssonVoz, BufferManager(file_path), window_size=window_size
+    )
+
+
+@pytest.fixture
+def voz_file(tmp_path):
+    data = b"".join(voz_record(i, i) + b"\x00\x00" * (i % 3 == 0) for i in range(50))
+    return write_gz(tmp_path / "voz_sample.gz", data)
+
+
+class TestBerDecoderWindowed:
+    @pytest.mark.parametrize(
+        "window_size", [1, 7, RECORD_SIZE, 3 * RECORD_SIZE + 5, 1 << 20]
+    )
+    def test_same_records_as_optimized(self, voz_file, window_size):
+        expected = ericsson_voz_decoder_optimized(BufferManager(voz_file)).process(
+            show_progress=False
+        )
+
+        records = windowed(voz_file, window_size).process(show_progress=False)
+
+        assert records == expected
+        assert [r["callIdentificationNumber"] for r in records] == list(range(50))
+
+    def test_columns_match_records(self, voz_file):
+        decoder = windowed(voz_file, 100)
+        builder = ColumnarBuilder(sorted(decoder.FIELDNAMES))
+
+        assert list(decoder.parse_columns(builder))[-1] == 50
+        assert list(builder.rows()) == decoder.process(show_progress=False)
+
+    def test_trailing_padding(self, tmp_path):
+        file_path = write_gz(tmp_path / "padded.gz", voz_record(1, 1) + b"\x00" * 8)
+
+        records = windowed(file_path, 16).process(show_progress=False)
+
+        assert len(records) == 1
+
+    def test_truncated_record(self, tmp_path):
+        file_path = write_gz(
+            tmp_path / "truncated.gz", voz_record(1, 1) + tlv(0xA0, b"\x00" * 10)[:-3]
+        )
+
+        with pytest.raises(ValueError, match="Unexpected end of data"):
+            windowed(file_path, 16).process(show_progress=False)
+
+    def test_window_is_bounded(self, voz_file):
+        decoder = windowed(voz_file, 2 * RECORD_SIZE)
+        sizes = []
+
+        def decode(data, position):
+            sizes.append(len(data))
+            return decoder.decode(data, position)
+
+        assert len(list(decoder.records(decode))) == 50
+        assert max(sizes) < 4 * RECORD_SIZE
+
+    @pytest.mark.parametrize("window_size", [1, 7, RECORD_SIZE, 1 << 20])
+    def test_tlv_past_its_record(self, tmp_path, window_size):
+        # recordSequenceNumber claims 3 bytes, running into the next record
+        overrun = voz_record(1, 1)[:-2] + b"\x03" + voz_record(1, 1)[-1:]
+        file_path = write_gz(
+            tmp_path / "overrun.gz",
+            overrun + b"".join(voz_record(i, i) for i in range(2, 6)),
+        )
+
+        def outcome(decoder):
+            try:
+                return decoder.process(show_progress=False)
+            except Exception as e:
+                return type(e)
+
+        expected = outcome(ericsson_voz_decoder_optimized(BufferManager(file_path)))
+
+        assert outcome(windowed(file_path, window_size)) == expected